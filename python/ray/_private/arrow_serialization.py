@@ -37,6 +37,7 @@ def _register_custom_datasets_serializers(serialization_context):
 
     # Register all custom serializers required by Datasets.
     _register_arrow_data_serializer(serialization_context)
+    _register_arrow_fast_path_serializer(serialization_context)
     _register_arrow_json_readoptions_serializer(serialization_context)
     _register_arrow_json_parseoptions_serializer(serialization_context)
 
@@ -112,6 +113,127 @@ def _register_arrow_data_serializer(serialization_context):
     serialization_context._register_cloudpickle_reducer(pa.Table, _arrow_table_reduce)
 
 
+def _register_arrow_fast_path_serializer(serialization_context):
+    """Register a fast-path serializer for Arrow Tables, serializing the (truncated)
+    data buffers of the columns out-of-band, like `_arrow_table_reduce` does, but the
+    array metadata with msgpack rather than pickle.
+
+    Tables with extension types are left to `_arrow_table_reduce`, as these can't be
+    restored from their IPC schema unless registered in the deserializing process.
+    """
+    if os.environ.get(RAY_DISABLE_CUSTOM_ARROW_DATA_SERIALIZATION, "0") == "1":
+        return
+
+    import pyarrow as pa
+
+    from ray._private.serialization import _get_type_name
+
+    serialization_context._register_fast_path_serializer(
+        _get_type_name(pa.Table),
+        "arrow_table",
+        _serialize_arrow_table_fast_path,
+        _deserialize_arrow_table_fast_path,
+    )
+
+
+def _serialize_arrow_table_fast_path(t: "pyarrow.Table", buffer_callback):
+    """Serialize an Arrow Table to a msgpack-serializable header, passing the schema,
+    the types of the (nested) arrays and their data buffers to `buffer_callback`.
+
+    Returns None if the table isn't supported.
+    """
+    import pyarrow as pa
+
+    if any(_contains_extension_type(type_) for type_ in t.schema.types):
+        return None
+
+    types = []
+    buffers = []
+
+    def to_header(payload: "PicklableArrayPayload"):
+        types.append(payload.type)
+        buffers.extend(buf for buf in payload.buffers if buf is not None)
+        return [
+            len(types) - 1,
+            payload.length,
+            payload.null_count,
+            payload.offset,
+            [buf is not None for buf in payload.buffers],
+            [to_header(child) for child in payload.children],
+        ]
+
+    try:
+        columns = [
+            [to_header(_array_to_array_payload(chunk)) for chunk in column.chunks]
+            for column in t.columns
+        ]
+    except Exception:
+        # E.g., dense unions, which `_arrow_table_reduce` falls back to IPC for.
+        return None
+
+    buffer_callback(t.schema.serialize())
+    types_schema = pa.schema([pa.field(str(i), type_) for i, type_ in enumerate(types)])
+    buffer_callback(types_schema.serialize())
+    for buf in buffers:
+        buffer_callback(buf)
+    return columns
+
+
+def _deserialize_arrow_table_fast_path(columns, buffers) -> "pyarrow.Table":
+    """Restore an Arrow Table serialized by `_serialize_arrow_table_fast_path`,
+    with zero-copy views of the data buffers."""
+    import pyarrow as pa
+
+    schema = pa.ipc.read_schema(pa.py_buffer(buffers[0]))
+    types = pa.ipc.read_schema(pa.py_buffer(buffers[1])).types
+    data_buffers = iter(buffers[2:])
+
+    def from_header(header) -> PicklableArrayPayload:
+        type_index, length, null_count, offset, has_buffers, children = header
+        return PicklableArrayPayload(
+            type=types[type_index],
+            length=length,
+            buffers=[
+                pa.py_buffer(next(data_buffers)) if has_buffer else None
+                for has_buffer in has_buffers
+            ],
+            null_count=null_count,
+            offset=offset,
+            children=[from_header(child) for child in children],
+        )
+
+    return pa.Table.from_arrays(
+        [
+            pa.chunked_array([from_header(chunk).to_array() for chunk in chunks], type_)
+            for chunks, type_ in zip(columns, schema.types)
+        ],
+        schema=schema,
+    )
+
+
+def _contains_extension_type(type_: "pyarrow.DataType") -> bool:
+    """Whether the Arrow type is (or is nested with) an extension type."""
+    import pyarrow as pa
+
+    if isinstance(type_, pa.ExtensionType):
+        return True
+    if pa.types.is_struct(type_) or pa.types.is_union(type_):
+        children = [type_[i].type for i in range(type_.num_fields)]
+    elif pa.types.is_map(type_):
+        children = [type_.key_type, type_.item_type]
+    elif (
+        pa.types.is_list(type_)
+        or pa.types.is_large_list(type_)
+        or pa.types.is_fixed_size_list(type_)
+    ):
+        children = [type_.value_type]
+    elif pa.types.is_dictionary(type_):
+        children = [type_.value_type]
+    else:
+        children = []
+    return any(_contains_extension_type(child) for child in children)
+
+
 def _arrow_table_reduce(t: "pyarrow.Table"):
     """Custom reducer for Arrow Tables that works around a zero-copy slice pickling bug.
     Background:
@@ -1,23 +1,45 @@
 import abc
+import io
 import logging
 import os
 import random
 import shutil
+import threading
 import time
 import urllib
 import uuid
-from collections import namedtuple
-from typing import IO, List, Optional, Tuple, Union
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Dict, List, Optional, Tuple, Union
 
 import ray
 from ray._private.ray_constants import DEFAULT_OBJECT_PREFIX
 from ray._raylet import ObjectRef
 
-ParsedURL = namedtuple("ParsedURL", "base_url, offset, size")
+ParsedURL = namedtuple(
+    "ParsedURL", "base_url, offset, size, compression", defaults=(None,)
+)
 logger = logging.getLogger(__name__)
 
-
-def create_url_with_offset(*, url: str, offset: int, size: int) -> str:
+# Codecs spilled objects can be compressed with.
+COMPRESSION_CODECS = ("lz4", "zstd")
+# Objects smaller than this are compressed with zstd (rather than lz4) when the
+# codec is chosen automatically, as the better compression ratio outweighs the
+# lower throughput for these.
+_AUTO_COMPRESSION_ZSTD_MAX_SIZE = 16 * 1024 * 1024
+# Number and size of the samples of the objects compressed to probe their
+# compressibility.
+_COMPRESSIBILITY_PROBE_NUM_SAMPLES = 4
+_COMPRESSIBILITY_PROBE_SAMPLE_SIZE = 16 * 1024
+# Objects aren't compressed if their samples don't compress below this ratio.
+_COMPRESSIBILITY_PROBE_MAX_RATIO = 0.9
+# Max number of chunks (of distinct files) kept by the readahead of restores.
+_READAHEAD_MAX_NUM_CHUNKS = 4
+
+
+def create_url_with_offset(
+    *, url: str, offset: int, size: int, compression: Optional[str] = None
+) -> str:
     """Methods to create a URL with offset.
 
     When ray spills objects, it fuses multiple objects
@@ -38,12 +60,16 @@ def create_url_with_offset(*, url: str, offset: int, size: int) -> str:
             the first bytes of this object.
         size: Size of the object that is stored in the url.
             It is used to calculate the last offset.
+        compression: Codec the buffer of the object is compressed with, if any.
 
     Returns:
         url_with_offset stored internally to find
         objects from external storage.
     """
-    return f"{url}?offset={offset}&size={size}"
+    url_with_offset = f"{url}?offset={offset}&size={size}"
+    if compression is not None:
+        url_with_offset += f"&compression={compression}"
+    return url_with_offset
 
 
 def parse_url_with_offset(url_with_offset: str) -> Tuple[str, int, int]:
@@ -56,7 +82,7 @@ def parse_url_with_offset(url_with_offset: str) -> Tuple[str, int, int]:
         url_with_offset: url created by create_url_with_offset.
 
     Returns:
-        named tuple of base_url, offset, and size.
+        named tuple of base_url, offset, size, and compression.
     """
     parsed_result = urllib.parse.urlparse(url_with_offset)
     query_dict = urllib.parse.parse_qs(parsed_result.query)
@@ -66,7 +92,84 @@ def parse_url_with_offset(url_with_offset: str) -> Tuple[str, int, int]:
         raise ValueError(f"Failed to parse URL: {url_with_offset}")
     offset = int(query_dict["offset"][0])
     size = int(query_dict["size"][0])
-    return ParsedURL(base_url=base_url, offset=offset, size=size)
+    compression = query_dict["compression"][0] if "compression" in query_dict else None
+    return ParsedURL(
+        base_url=base_url, offset=offset, size=size, compression=compression
+    )
+
+
+def _get_compressor(codec: str) -> Callable[[memoryview], bytes]:
+    if codec == "lz4":
+        import lz4.frame
+
+        return lambda data: lz4.frame.compress(data, store_size=True)
+    else:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=1, write_content_size=True).compress
+
+
+def _decompress(codec: str, data: memoryview) -> bytes:
+    if codec == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    elif codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown compression codec of spilled object: {codec}")
+
+
+def _is_compressible(buf: memoryview, compress: Callable[[memoryview], bytes]):
+    """Probes whether the buffer is compressible, by compressing samples spread
+    across the buffer."""
+    sample_size = _COMPRESSIBILITY_PROBE_SAMPLE_SIZE
+    step = max(sample_size, len(buf) // _COMPRESSIBILITY_PROBE_NUM_SAMPLES)
+    samples = [buf[i : i + sample_size] for i in range(0, len(buf), step)]
+    compressed_size = sum(len(compress(sample)) for sample in samples)
+    return compressed_size < _COMPRESSIBILITY_PROBE_MAX_RATIO * sum(map(len, samples))
+
+
+_io_metrics = None
+
+
+def _record_io_metrics(
+    operation: str, raw_bytes: int, stored_bytes: int, duration_s: float
+):
+    """Records the bytes of the objects spilled or restored (before and after
+    compression) and the time spent, from which the throughput and the compression
+    ratio of spilling are derived."""
+    global _io_metrics
+    try:
+        if _io_metrics is None:
+            from ray.util.metrics import Counter
+
+            _io_metrics = (
+                Counter(
+                    "spill_manager_io_raw_bytes",
+                    description="Bytes of the objects spilled or restored.",
+                    tag_keys=("Operation",),
+                ),
+                Counter(
+                    "spill_manager_io_stored_bytes",
+                    description=(
+                        "Bytes of the objects spilled or restored as stored in "
+                        "the external storage (i.e., after compression)."
+                    ),
+                    tag_keys=("Operation",),
+                ),
+                Counter(
+                    "spill_manager_io_seconds",
+                    description="Time spent spilling or restoring objects.",
+                    tag_keys=("Operation",),
+                ),
+            )
+        tags = {"Operation": operation}
+        for metric, value in zip(_io_metrics, (raw_bytes, stored_bytes, duration_s)):
+            metric.inc(value, tags=tags)
+    except Exception:
+        logger.debug("Failed to record object spilling metrics.", exc_info=True)
 
 
 class ExternalStorage(metaclass=abc.ABCMeta):
@@ -92,6 +195,11 @@ class ExternalStorage(metaclass=abc.ABCMeta):
         # NOTE(edoakes): do not access this field directly. Use the `core_worker`
         # property instead to handle initialization race conditions.
         self._core_worker: Optional["ray._raylet.CoreWorker"] = None
+        # -- Codec to compress spilled objects with ("auto" to choose it by the size
+        # of the objects), or None --
+        self._compression: Optional[str] = None
+        # -- Objects smaller than this aren't compressed --
+        self._compression_min_size = 0
 
     @property
     def core_worker(self) -> "ray._raylet.CoreWorker":
@@ -130,8 +238,36 @@ class ExternalStorage(metaclass=abc.ABCMeta):
             metadata, data_size, file_like, object_ref, owner_address
         )
 
+    def _compress(self, buf: memoryview) -> Tuple[Optional[str], memoryview]:
+        """Compresses the buffer of an object to spill, if enabled and the buffer
+        is large and compressible enough.
+
+        Returns:
+            The codec the buffer is compressed with (or None if not compressed)
+            and the (compressed) buffer.
+        """
+        if self._compression is None or len(buf) < self._compression_min_size:
+            return None, buf
+
+        codec = self._compression
+        if codec == "auto":
+            codec = "zstd" if len(buf) < _AUTO_COMPRESSION_ZSTD_MAX_SIZE else "lz4"
+        compress = _get_compressor(codec)
+        if not _is_compressible(buf, compress):
+            return None, buf
+
+        compressed = compress(buf)
+        if len(compressed) >= len(buf):
+            return None, buf
+        return codec, memoryview(compressed)
+
     def _write_multiple_objects(
-        self, f: IO, object_refs: List[ObjectRef], owner_addresses: List[str], url: str
+        self,
+        f: IO,
+        object_refs: List[ObjectRef],
+        owner_addresses: List[str],
+        url: str,
+        ray_object_pairs: Optional[List[Tuple[Optional[memoryview], bytes]]] = None,
     ) -> List[str]:
         """Fuse all given objects into a given file handle.
 
@@ -141,6 +277,8 @@ class ExternalStorage(metaclass=abc.ABCMeta):
             owner_addresses: Owner addresses for the provided objects.
             url: url where the object ref is stored
                 in the external storage.
+            ray_object_pairs: The (buffer, metadata) pairs of the objects, if
+                already fetched from the object store.
 
         Return:
             List of urls_with_offset of fused objects.
@@ -149,7 +287,10 @@ class ExternalStorage(metaclass=abc.ABCMeta):
         """
         keys = []
         offset = 0
-        ray_object_pairs = self._get_objects_from_store(object_refs)
+        raw_bytes = 0
+        start_time = time.perf_counter()
+        if ray_object_pairs is None:
+            ray_object_pairs = self._get_objects_from_store(object_refs)
         for ref, (buf, metadata), owner_address in zip(
             object_refs, ray_object_pairs, owner_addresses
         ):
@@ -158,6 +299,10 @@ class ExternalStorage(metaclass=abc.ABCMeta):
             if buf is None and len(metadata) == 0:
                 error = f"Object {ref.hex()} does not exist."
                 raise ValueError(error)
+            compression = None
+            if buf is not None and len(buf) > 0:
+                raw_bytes += len(buf)
+                compression, buf = self._compress(memoryview(buf))
             buf_len = 0 if buf is None else len(buf)
             payload = (
                 address_len.to_bytes(8, byteorder="little")
@@ -175,12 +320,13 @@ class ExternalStorage(metaclass=abc.ABCMeta):
             written_bytes = f.write(payload)
             assert written_bytes == payload_len
             url_with_offset = create_url_with_offset(
-                url=url, offset=offset, size=written_bytes
+                url=url, offset=offset, size=written_bytes, compression=compression
             )
             keys.append(url_with_offset.encode())
             offset += written_bytes
         # Necessary because pyarrow.io.NativeFile does not flush() on close().
         f.flush()
+        _record_io_metrics("Spill", raw_bytes, offset, time.perf_counter() - start_time)
         return keys
 
     def _size_check(self, address_len, metadata_len, buffer_len, obtained_data_size):
@@ -271,9 +417,28 @@ class NullStorage(ExternalStorage):
 class FileSystemStorage(ExternalStorage):
     """The class for filesystem-like external storage.
 
+    Objects spilled at once are striped across the directories (if multiple),
+    writing a file to each directory in parallel.
+
+    Args:
+        node_id: The id of the node spilling objects.
+        directory_path: Directory path(s) to spill objects to.
+        buffer_size: File buffer size to spill objects with.
+        compression: Codec to compress the spilled objects with ("lz4" or
+            "zstd"), or "auto" to use zstd for objects up to 16 MiB and lz4 for
+            larger ones. Objects whose samples don't compress well are stored
+            uncompressed.
+        compression_min_size: Objects smaller than this (in bytes) aren't
+            compressed.
+        readahead_size: If positive, restores read (at least) this many bytes
+            of the spilled files at once, keeping these in memory to restore the
+            objects fused next to the restored ones.
+
     Raises:
         ValueError: Raises directory path to
             spill objects doesn't exist.
+        ModuleNotFoundError: If the library of the compression codec isn't
+            installed.
     """
 
     def __init__(
@@ -281,6 +446,9 @@ class FileSystemStorage(ExternalStorage):
         node_id: str,
         directory_path: Union[str, List[str]],
         buffer_size: Optional[int] = None,
+        compression: Optional[str] = None,
+        compression_min_size: int = 64 * 1024,
+        readahead_size: int = 0,
     ):
         super().__init__()
 
@@ -290,6 +458,13 @@ class FileSystemStorage(ExternalStorage):
         self._current_directory_index = 0
         # -- File buffer size to spill objects --
         self._buffer_size = -1
+        # -- Single-threaded executors writing the files of each directory --
+        self._write_executors: Optional[List[ThreadPoolExecutor]] = None
+        # -- Chunks of spilled files read ahead by restores (keyed by path), as
+        # (offset, data) tuples --
+        self._readahead_size = readahead_size
+        self._readahead_chunks: Dict[str, Tuple[int, bytes]] = OrderedDict()
+        self._readahead_lock = threading.Lock()
 
         # Validation.
         assert (
@@ -303,6 +478,25 @@ class FileSystemStorage(ExternalStorage):
         if buffer_size is not None:
             assert isinstance(buffer_size, int), "buffer_size must be an integer."
             self._buffer_size = buffer_size
+        assert isinstance(readahead_size, int), "readahead_size must be an integer."
+        assert isinstance(
+            compression_min_size, int
+        ), "compression_min_size must be an integer."
+        if compression is not None:
+            assert compression == "auto" or compression in COMPRESSION_CODECS, (
+                f"compression must be one of {COMPRESSION_CODECS} or 'auto', got "
+                f"{compression}."
+            )
+            for codec in COMPRESSION_CODECS if compression == "auto" else [compression]:
+                try:
+                    _get_compressor(codec)
+                except ModuleNotFoundError as e:
+                    raise ModuleNotFoundError(
+                        f"{codec} is chosen to compress spilled objects, but its "
+                        f"library is not installed. Original error: {e}"
+                    )
+            self._compression = compression
+            self._compression_min_size = compression_min_size
 
         # Create directories.
         for path in directory_path:
@@ -323,16 +517,80 @@ class FileSystemStorage(ExternalStorage):
     def spill_objects(self, object_refs, owner_addresses) -> List[str]:
         if len(object_refs) == 0:
             return []
-        # Choose the current directory path by round robin order.
-        self._current_directory_index = (self._current_directory_index + 1) % len(
-            self._directory_paths
-        )
-        directory_path = self._directory_paths[self._current_directory_index]
+        num_stripes = min(len(object_refs), len(self._directory_paths))
+        if num_stripes == 1:
+            # Choose the current directory path by round robin order.
+            self._current_directory_index = (self._current_directory_index + 1) % len(
+                self._directory_paths
+            )
+            return self._spill_objects_to_directory(
+                self._current_directory_index, object_refs, owner_addresses
+            )
+
+        # Stripe the objects across the directories, assigning the largest objects
+        # first to the stripe with the fewest bytes.
+        ray_object_pairs = self._get_objects_from_store(object_refs)
+        sizes = [
+            (0 if buf is None else len(buf)) + len(metadata)
+            for buf, metadata in ray_object_pairs
+        ]
+        stripes = [[] for _ in range(num_stripes)]
+        stripe_sizes = [0] * num_stripes
+        for i in sorted(range(len(object_refs)), key=lambda i: -sizes[i]):
+            stripe_idx = stripe_sizes.index(min(stripe_sizes))
+            stripes[stripe_idx].append(i)
+            stripe_sizes[stripe_idx] += sizes[i]
+
+        if self._write_executors is None:
+            self._write_executors = [
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="spill_dir")
+                for _ in self._directory_paths
+            ]
+        futures = []
+        for stripe in stripes:
+            self._current_directory_index = (self._current_directory_index + 1) % len(
+                self._directory_paths
+            )
+            futures.append(
+                self._write_executors[self._current_directory_index].submit(
+                    self._spill_objects_to_directory,
+                    self._current_directory_index,
+                    [object_refs[i] for i in stripe],
+                    [owner_addresses[i] for i in stripe],
+                    [ray_object_pairs[i] for i in stripe],
+                )
+            )
+
+        keys = [None] * len(object_refs)
+        errors = []
+        for stripe, future in zip(stripes, futures):
+            try:
+                for i, key in zip(stripe, future.result()):
+                    keys[i] = key
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            # Objects are spilled all or none, hence the files of the stripes
+            # written successfully are deleted.
+            self.delete_spilled_objects([key for key in keys if key is not None])
+            raise errors[0]
+        return keys
+
+    def _spill_objects_to_directory(
+        self,
+        directory_index: int,
+        object_refs: List[ObjectRef],
+        owner_addresses: List[str],
+        ray_object_pairs: Optional[List[Tuple[Optional[memoryview], bytes]]] = None,
+    ) -> List[str]:
+        directory_path = self._directory_paths[directory_index]
 
         filename = _get_unique_spill_filename(object_refs)
         url = f"{os.path.join(directory_path, filename)}"
         with open(url, "wb", buffering=self._buffer_size) as f:
-            return self._write_multiple_objects(f, object_refs, owner_addresses, url)
+            return self._write_multiple_objects(
+                f, object_refs, owner_addresses, url, ray_object_pairs
+            )
 
     def restore_spilled_objects(
         self, object_refs: List[ObjectRef], url_with_offset_list: List[str]
@@ -345,6 +603,12 @@ class FileSystemStorage(ExternalStorage):
             parsed_result = parse_url_with_offset(url_with_offset)
             base_url = parsed_result.base_url
             offset = parsed_result.offset
+            if parsed_result.compression is not None or self._readahead_size > 0:
+                total += self._restore_spilled_object_from_memory(
+                    object_ref, parsed_result
+                )
+                continue
+            start_time = time.perf_counter()
             # Read a part of the file and recover the object.
             with open(base_url, "rb") as f:
                 f.seek(offset)
@@ -359,11 +623,81 @@ class FileSystemStorage(ExternalStorage):
                 self._put_object_to_store(
                     metadata, buf_len, f, object_ref, owner_address
                 )
+            _record_io_metrics(
+                "Restore",
+                buf_len,
+                parsed_result.size,
+                time.perf_counter() - start_time,
+            )
         return total
 
+    def _restore_spilled_object_from_memory(
+        self, object_ref: ObjectRef, parsed_result: ParsedURL
+    ) -> int:
+        """Restores the (compressed) object reading it into memory (reading ahead
+        if enabled), returning the number of bytes restored."""
+        start_time = time.perf_counter()
+        data = self._read_spilled_range(
+            parsed_result.base_url, parsed_result.offset, parsed_result.size
+        )
+        address_len, metadata_len, buf_len = (
+            int.from_bytes(data[i : i + 8], byteorder="little") for i in (0, 8, 16)
+        )
+        self._size_check(address_len, metadata_len, buf_len, parsed_result.size)
+        pos = self.HEADER_LENGTH
+        owner_address = bytes(data[pos : pos + address_len])
+        pos += address_len
+        metadata = bytes(data[pos : pos + metadata_len])
+        pos += metadata_len
+        buf = data[pos : pos + buf_len]
+        if parsed_result.compression is not None:
+            buf = _decompress(parsed_result.compression, buf)
+
+        self._put_object_to_store(
+            metadata, len(buf), io.BytesIO(buf), object_ref, owner_address
+        )
+        _record_io_metrics(
+            "Restore", len(buf), parsed_result.size, time.perf_counter() - start_time
+        )
+        return len(buf)
+
+    def _read_spilled_range(self, path: str, offset: int, size: int) -> memoryview:
+        """Reads a byte range of a spilled file, reading ahead (at least
+        `readahead_size` bytes) to restore the objects fused next to it from
+        memory."""
+        with self._readahead_lock:
+            chunk = self._readahead_chunks.get(path)
+            if chunk is not None:
+                chunk_offset, chunk_data = chunk
+                if chunk_offset <= offset and offset + size <= chunk_offset + len(
+                    chunk_data
+                ):
+                    self._readahead_chunks.move_to_end(path)
+                    start = offset - chunk_offset
+                    return memoryview(chunk_data)[start : start + size]
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(max(size, self._readahead_size))
+        if len(data) < size:
+            raise ValueError(
+                f"Spilled file {path} has {offset + len(data)} bytes, although the "
+                f"object is supposed to end at {offset + size}."
+            )
+
+        if len(data) > size:
+            with self._readahead_lock:
+                self._readahead_chunks[path] = (offset, data)
+                self._readahead_chunks.move_to_end(path)
+                while len(self._readahead_chunks) > _READAHEAD_MAX_NUM_CHUNKS:
+                    self._readahead_chunks.popitem(last=False)
+        return memoryview(data)[:size]
+
     def delete_spilled_objects(self, urls: List[str]):
         for url in urls:
             path = parse_url_with_offset(url.decode()).base_url
+            with self._readahead_lock:
+                self._readahead_chunks.pop(path, None)
             try:
                 os.remove(path)
             except FileNotFoundError:
@@ -130,6 +130,29 @@ def main(results=None):
 
     results += timeit("single client put gigabytes", put_large, 8 * 0.1)
 
+    # Serialization of common payloads (round trips through the object store).
+    payloads = {
+        "dict of numpy arrays": {f"col{i}": np.random.rand(10000) for i in range(10)},
+        "list of small scalars": list(range(1000)),
+        "list of numpy scalars": [np.float32(i) for i in range(1000)],
+        "bytes": b"x" * 1024 * 1024,
+    }
+    try:
+        import pyarrow as pa
+
+        payloads["Arrow table"] = pa.table(
+            {"id": np.arange(100000), "value": np.random.rand(100000)}
+        )
+    except ImportError:
+        pass
+
+    for name, payload in payloads.items():
+
+        def put_get_payload(payload=payload):
+            ray.get(ray.put(payload))
+
+        results += timeit(f"single client put/get {name}", put_get_payload)
+
     def small_value_batch():
         submitted = [small_value.remote() for _ in range(1000)]
         ray.get(submitted)
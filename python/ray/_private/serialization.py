@@ -2,12 +2,13 @@ import io
 import logging
 import threading
 import traceback
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     import torch
 
 import google.protobuf.message
+import msgpack
 
 import ray._private.utils
 import ray.cloudpickle as pickle
@@ -59,6 +60,33 @@ logger = logging.getLogger(__name__)
 ALLOW_OUT_OF_BAND_OBJECT_REF_SERIALIZATION = ray_constants.env_bool(
     "RAY_allow_out_of_band_object_ref_serialization", True
 )
+ENABLE_FAST_PATH_SERIALIZATION = ray_constants.env_bool(
+    "RAY_enable_fast_path_serialization", True
+)
+# Prefix of the in-band data of python objects serialized by the fast-path
+# serializers (which pickled data, starting with the PROTO opcode, can't start with).
+_FAST_PATH_MAGIC = b"\x00RAYFP1"
+# Kinds of the numpy dtypes serialized by the fast-path serializers (i.e., booleans
+# and numbers).
+_FAST_PATH_NUMPY_KINDS = "biufc"
+# Names of the numpy scalar types (`numpy.bool_` being named `bool` in numpy 2).
+_NUMPY_SCALAR_TYPE_NAMES = (
+    "bool",
+    "bool_",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+    "float16",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+)
 
 
 class DeserializationError(Exception):
@@ -110,6 +138,43 @@ def _object_ref_deserializer(binary, call_site, owner_address, object_status):
     return obj_ref
 
 
+def _get_type_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _serialize_ndarray(arr, buffer_callback):
+    if arr.dtype.kind not in _FAST_PATH_NUMPY_KINDS:
+        return None
+    if arr.flags.c_contiguous:
+        order = "C"
+    elif arr.flags.f_contiguous:
+        order = "F"
+    else:
+        return None
+    buffer_callback(pickle.pickle.PickleBuffer(arr).raw())
+    return [arr.dtype.str, list(arr.shape), order]
+
+
+def _deserialize_ndarray(header, buffers):
+    import numpy as np
+
+    dtype, shape, order = header
+    return np.frombuffer(buffers[0], dtype=dtype).reshape(shape, order=order)
+
+
+def _serialize_numpy_scalar(value, buffer_callback):
+    if value.dtype.kind not in _FAST_PATH_NUMPY_KINDS:
+        return None
+    return [value.dtype.str, value.tobytes()]
+
+
+def _deserialize_numpy_scalar(header, buffers):
+    import numpy as np
+
+    dtype, data = header
+    return np.frombuffer(data, dtype=dtype)[0]
+
+
 def _actor_handle_deserializer(serialized_obj, weak_ref):
     # If this actor handle was stored in another object, then tell the
     # core worker.
@@ -180,6 +245,21 @@ class SerializationContext:
             DynamicObjectRefGenerator, object_ref_generator_reducer
         )
 
+        # Fast-path serializers by the name of the types, and deserializers by tag.
+        self._fast_path_serializers: Dict[str, Tuple[str, Callable]] = {}
+        self._fast_path_deserializers: Dict[str, Callable] = {}
+        # Numpy types are registered by name, so that numpy isn't imported eagerly.
+        self._register_fast_path_serializer(
+            "numpy.ndarray", "ndarray", _serialize_ndarray, _deserialize_ndarray
+        )
+        for name in _NUMPY_SCALAR_TYPE_NAMES:
+            self._register_fast_path_serializer(
+                f"numpy.{name}",
+                "numpy_scalar",
+                _serialize_numpy_scalar,
+                _deserialize_numpy_scalar,
+            )
+
         serialization_addons.apply(self)
 
     def _register_cloudpickle_reducer(self, cls, reducer):
@@ -196,6 +276,31 @@ class SerializationContext:
 
         # construct a reducer
         pickle.CloudPickler.dispatch[cls] = _CloudPicklerReducer
+        # Custom serializers take precedence over the fast-path ones.
+        self._fast_path_serializers.pop(_get_type_name(cls), None)
+
+    def _register_fast_path_serializer(
+        self,
+        type_name: str,
+        tag: str,
+        serializer: Callable[[Any, Callable[[Any], None]], Any],
+        deserializer: Callable[[Any, List[Any]], Any],
+    ):
+        """Register a fast-path serializer for the objects of the given type,
+        serializing these without pickling.
+
+        Args:
+            type_name: The fully qualified name of the type (so that its module
+                needn't be imported to register it).
+            tag: The tag identifying the deserializer in the serialized data.
+            serializer: Returns a msgpack-serializable header of the object (or
+                None if the object isn't supported), passing the buffers of the
+                object to serialize out-of-band to the given callback.
+            deserializer: Returns the object given its header and its buffers
+                (zero-copy views of the serialized data).
+        """
+        self._fast_path_serializers[type_name] = (tag, serializer)
+        self._fast_path_deserializers[tag] = deserializer
 
     def is_in_band_serialization(self):
         return getattr(self._thread_local, "in_band", False)
@@ -287,7 +392,11 @@ class SerializationContext:
 
         try:
             in_band, buffers = unpack_pickle5_buffers(data)
-            if len(buffers) > 0:
+            if bytes(in_band[: len(_FAST_PATH_MAGIC)]) == _FAST_PATH_MAGIC:
+                obj = self._deserialize_fast_path_data(
+                    in_band[len(_FAST_PATH_MAGIC) :], buffers
+                )
+            elif len(buffers) > 0:
                 obj = pickle.loads(in_band, buffers=buffers)
             else:
                 obj = pickle.loads(in_band)
@@ -299,6 +408,21 @@ class SerializationContext:
                 ctx.reset_out_of_band_tensors([])
         return obj
 
+    def _deserialize_fast_path_data(self, in_band, buffers) -> List[Any]:
+        objects = []
+        buffer_index = 0
+        for tag, header, num_buffers in msgpack.unpackb(in_band):
+            deserializer = self._fast_path_deserializers.get(tag)
+            if deserializer is None:
+                raise DeserializationError(
+                    f"No fast-path deserializer is registered for '{tag}'."
+                )
+            objects.append(
+                deserializer(header, buffers[buffer_index : buffer_index + num_buffers])
+            )
+            buffer_index += num_buffers
+        return objects
+
     def _deserialize_msgpack_data(
         self, data, metadata_fields, object_id: Optional[str] = None
     ):
@@ -524,6 +648,39 @@ class SerializationContext:
             metadata, inband, writer, self.get_and_clear_contained_object_refs()
         )
 
+    def _serialize_to_fast_path(
+        self, metadata, python_objects: List[Any]
+    ) -> Optional[Pickle5SerializedObject]:
+        """Serialize the python objects with the fast-path serializers, writing a
+        compact header in-band and the buffers of the objects out-of-band, without
+        pickling.
+
+        Returns None if any of the objects isn't supported by these.
+        """
+        if not ENABLE_FAST_PATH_SERIALIZATION:
+            return None
+
+        entries = []
+        buffers = []
+        for obj in python_objects:
+            fast_path_serializer = self._fast_path_serializers.get(
+                _get_type_name(type(obj))
+            )
+            if fast_path_serializer is None:
+                return None
+            tag, serializer = fast_path_serializer
+            num_buffers = len(buffers)
+            header = serializer(obj, buffers.append)
+            if header is None:
+                return None
+            entries.append((tag, header, len(buffers) - num_buffers))
+
+        writer = Pickle5Writer()
+        for buffer in buffers:
+            writer.buffer_callback(buffer)
+        inband = _FAST_PATH_MAGIC + msgpack.packb(entries)
+        return Pickle5SerializedObject(metadata, inband, writer, set())
+
     def _serialize_to_msgpack(self, value):
         # Only RayTaskError is possible to be serialized here. We don't
         # need to deal with other exception types here.
@@ -569,9 +726,13 @@ class SerializationContext:
 
         if python_objects:
             metadata = ray_constants.OBJECT_METADATA_TYPE_PYTHON
-            pickle5_serialized_object = self._serialize_to_pickle5(
+            pickle5_serialized_object = self._serialize_to_fast_path(
                 metadata, python_objects
             )
+            if pickle5_serialized_object is None:
+                pickle5_serialized_object = self._serialize_to_pickle5(
+                    metadata, python_objects
+                )
         else:
             pickle5_serialized_object = None
 
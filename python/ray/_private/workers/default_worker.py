@@ -5,15 +5,29 @@ import os
 import sys
 import time
 
-import ray
-import ray._private.node
-import ray._private.ray_constants as ray_constants
-import ray._private.utils
-import ray.actor
-from ray._private.async_compat import try_install_uvloop
-from ray._private.parameter import RayParams
-from ray._private.ray_logging import get_worker_log_file_name
-from ray._private.runtime_env.setup_hook import load_and_execute_setup_hook
+if __name__ == "__main__" and "--worker-zygote" in sys.argv:
+    # Fork the worker from the zygote (with ray and the preload modules imported
+    # already) if running, before importing ray. See `zygote.py`.
+    import importlib.util
+
+    _spec = importlib.util.spec_from_file_location(
+        "ray_worker_zygote", os.path.join(os.path.dirname(__file__), "zygote.py")
+    )
+    _zygote = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_zygote)
+    _zygote.fork_worker_from_zygote(sys.argv)
+
+import ray  # noqa: E402
+import ray._private.node  # noqa: E402
+import ray._private.ray_constants as ray_constants  # noqa: E402
+import ray._private.utils  # noqa: E402
+import ray.actor  # noqa: E402
+from ray._private.async_compat import try_install_uvloop  # noqa: E402
+from ray._private.parameter import RayParams  # noqa: E402
+from ray._private.ray_logging import get_worker_log_file_name  # noqa: E402
+from ray._private.runtime_env.setup_hook import (  # noqa: E402
+    load_and_execute_setup_hook,
+)
 
 parser = argparse.ArgumentParser(
     description=("Parse addresses for the worker to connect to.")
@@ -183,6 +197,11 @@ parser.add_argument(
         "to import before accepting work."
     ),
 )
+parser.add_argument(
+    "--worker-zygote",
+    action="store_true",
+    help="Fork the worker from the zygote with the preload modules imported.",
+)
 parser.add_argument(
     "--enable-resource-isolation",
     type=bool,
@@ -318,6 +337,10 @@ if __name__ == "__main__":
             worker.core_worker.drain_and_exit_worker("system", error)
 
     if mode == ray.WORKER_MODE:
+        if args.worker_zygote:
+            from ray._private.workers.zygote import record_startup_time
+
+            record_startup_time(args.worker_launch_time_ms)
         worker.main_loop()
     elif mode in [ray.RESTORE_WORKER_MODE, ray.SPILL_WORKER_MODE]:
         # It is handled by another thread in the C++ core worker.
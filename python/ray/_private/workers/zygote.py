@@ -0,0 +1,380 @@
+"""Zygote of the Python workers of a node, forking new workers with ray and the
+preload modules (``RAY_preload_python_modules``) imported already.
+
+If ``RAY_worker_zygote_enabled`` is set, workers ask the zygote of their Python
+executable and runtime env to fork them (see `fork_worker_from_zygote`) before
+importing ray. The zygote is started by the first worker not finding it (which
+starts cold meanwhile), and listens on a Unix socket of the session once it has
+imported the modules. The zygote exits once the raylet (the parent of the worker
+starting it) exits, or after being idle for a while.
+
+Forked workers are children of the zygote, hence the worker processes started by
+the raylet stay alive as proxies of the forked workers until these exit, forwarding
+signals to these and exiting with their exit codes.
+
+NOTE: This module must not import ray at the module level, as workers load it
+before importing ray.
+"""
+import argparse
+import hashlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+# Environment variable marking the workers forked from the zygote.
+FORKED_WORKER_ENV_VAR = "RAY_WORKER_ZYGOTE_FORKED"
+# Ray environment variables set per worker, and only read after importing ray
+# (hence these don't have to match the ones of the zygote).
+_PER_WORKER_RAY_ENV_VARS = {"RAY_JOB_ID", "RAY_RAYLET_PID", FORKED_WORKER_ENV_VAR}
+# The zygote exits after this long without forked workers alive.
+_ZYGOTE_IDLE_TIMEOUT_S = 600
+# Signals forwarded to the forked workers by the worker processes they replace.
+_FORWARDED_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGUSR1)
+# Boundaries (in ms) of the histogram of the startup times of the workers.
+_STARTUP_TIME_BOUNDARIES_MS = [100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+# Hooks run in the forked workers right after forking.
+_after_fork_hooks: List[Callable[[], None]] = []
+
+
+def register_after_fork_hook(hook: Callable[[], None]):
+    """Register a hook run in the workers forked from the zygote, to reinitialize
+    state that mustn't be shared across these (like seeds of random generators)."""
+    _after_fork_hooks.append(hook)
+
+
+def _reseed_random_generators():
+    # NOTE: The `random` module reseeds itself after forking already.
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed()
+    if "torch" in sys.modules:
+        sys.modules["torch"].seed()
+
+
+register_after_fork_hook(_reseed_random_generators)
+
+
+def get_zygote_socket_path(argv: List[str]) -> Optional[str]:
+    """Returns the path of the socket of the zygote of the worker with the given
+    arguments, or None if not available."""
+    object_store_name = _get_arg(argv, "--object-store-name")
+    if object_store_name is None:
+        return None
+
+    # Workers are only forked from the zygotes of the same Python environment,
+    # runtime env and preload modules. Since the environment of the forked workers
+    # is only replaced after the zygote imported ray, these must have the same Ray
+    # environment variables as well (many of which are read upon importing ray).
+    ray_env_vars = sorted(
+        (name, value)
+        for name, value in os.environ.items()
+        if name.startswith("RAY_") and name not in _PER_WORKER_RAY_ENV_VARS
+    )
+    key = json.dumps(
+        [
+            sys.executable,
+            os.environ.get("PYTHONPATH"),
+            _get_arg(argv, "--runtime-env-hash"),
+            _get_arg(argv, "--worker-preload-modules"),
+            ray_env_vars,
+        ]
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(os.path.dirname(object_store_name), f"worker_zygote_{digest}")
+
+
+def fork_worker_from_zygote(argv: List[str]):
+    """Fork the worker with the given arguments from its zygote, if available.
+
+    If forked, this waits for the forked worker to exit and exits with its exit
+    code. Otherwise, this returns (starting the zygote if not running), and the
+    worker is started cold.
+    """
+    if not hasattr(socket, "send_fds") or os.environ.get(FORKED_WORKER_ENV_VAR):
+        return
+    socket_path = get_zygote_socket_path(argv)
+    if socket_path is None:
+        return
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        _start_zygote(socket_path, argv)
+        return
+
+    try:
+        request = {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}
+        # The forked worker writes to the stdout and stderr of this process.
+        _send_message(sock, request, fds=[0, 1, 2])
+        pid = _recv_message(sock)["pid"]
+    except (OSError, TypeError, KeyError):
+        sock.close()
+        return
+
+    for signum in _FORWARDED_SIGNALS:
+        signal.signal(signum, lambda signum, frame: _kill(pid, signum))
+
+    try:
+        exit_code = _recv_message(sock)["exit_code"]
+    except (OSError, TypeError, KeyError):
+        # The zygote died, so wait for the forked worker to exit (or die).
+        while _kill(pid, 0):
+            time.sleep(1)
+        exit_code = 1
+    os._exit(exit_code)
+
+
+def record_startup_time(worker_launch_time_ms: int):
+    """Record the time from the raylet launching the worker to the worker being
+    ready to execute tasks, by whether the worker was forked or started cold."""
+    from ray.util.metrics import Histogram
+
+    Histogram(
+        "worker_startup_time_ms",
+        description=(
+            "Time from the raylet launching Python workers to these being ready to "
+            "execute tasks, by whether these were forked from the zygote."
+        ),
+        boundaries=_STARTUP_TIME_BOUNDARIES_MS,
+        tag_keys=("StartMode",),
+    ).observe(
+        time.time() * 1000 - worker_launch_time_ms,
+        tags={"StartMode": "fork" if os.environ.get(FORKED_WORKER_ENV_VAR) else "cold"},
+    )
+
+
+def _start_zygote(socket_path: str, argv: List[str]):
+    # The lock file makes sure that the zygote is started once (by the first
+    # worker not finding it).
+    try:
+        os.close(os.open(f"{socket_path}.lock", os.O_CREAT | os.O_EXCL))
+    except OSError:
+        return
+
+    sockets_dir = os.path.dirname(socket_path)
+    log_path = os.path.join(
+        os.path.dirname(sockets_dir), "logs", f"{os.path.basename(socket_path)}.err"
+    )
+    try:
+        with open(log_path, "ab") as log_file:
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    f"--socket-path={socket_path}",
+                    f"--preload-modules={_get_arg(argv, '--worker-preload-modules')}",
+                    # Workers are started by the raylet.
+                    f"--raylet-pid={os.getppid()}",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+                start_new_session=True,
+            )
+    except OSError:
+        traceback.print_exc()
+        os.remove(f"{socket_path}.lock")
+
+
+def _is_single_threaded() -> bool:
+    if os.path.isdir("/proc/self/task"):
+        # Threads started by native code are counted as well.
+        return len(os.listdir("/proc/self/task")) == 1
+    return threading.active_count() == 1
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except (ProcessLookupError, PermissionError):
+        # The process exited (and its pid might've been reused by a process of
+        # another user).
+        return False
+
+
+def _run_zygote(socket_path: str, preload_modules: List[str], raylet_pid: int):
+    # Import the modules (and ray) once, to be shared by the forked workers.
+    import ray._private.utils
+
+    ray._private.utils.try_import_each_module(preload_modules)
+    if not _is_single_threaded():
+        # Forking processes with other threads is unsafe (e.g., with locks held
+        # by these), hence workers are started cold instead. The lock file is
+        # kept, so that workers don't start the zygote again.
+        print(
+            "The worker zygote isn't started, since threads are running after "
+            "importing the preload modules.",
+            file=sys.stderr,
+        )
+        return
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen()
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+
+    # Connections of the worker processes (by the pids of their forked workers)
+    connections: Dict[int, socket.socket] = {}
+    last_active = time.monotonic()
+    try:
+        # The zygote is in its own session, hence it isn't killed with the raylet
+        # (or by `ray stop` killing the raylet), so it exits once the raylet exits.
+        while os.path.exists(socket_path) and _is_alive(raylet_pid):
+            if connections:
+                last_active = time.monotonic()
+            elif time.monotonic() - last_active > _ZYGOTE_IDLE_TIMEOUT_S:
+                break
+
+            for _ in selector.select(timeout=1):
+                conn, _ = listener.accept()
+                try:
+                    pid = _fork_worker(conn, listener)
+                except Exception:
+                    traceback.print_exc()
+                    conn.close()
+                else:
+                    connections[pid] = conn
+
+            # Reap the forked workers, reporting their exit codes.
+            while connections:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                conn = connections.pop(pid, None)
+                if conn is not None:
+                    try:
+                        exit_code = os.waitstatus_to_exitcode(status)
+                        _send_message(conn, {"exit_code": exit_code})
+                    except OSError:
+                        pass
+                    conn.close()
+    finally:
+        listener.close()
+        for path in [socket_path, f"{socket_path}.lock"]:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _fork_worker(conn: socket.socket, listener: socket.socket) -> int:
+    request, fds = _recv_message(conn, with_fds=True)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        listener.close()
+        conn.close()
+        _run_forked_worker(request, fds)
+    for fd in fds:
+        os.close(fd)
+    _send_message(conn, {"pid": pid})
+    return pid
+
+
+def _run_forked_worker(request: Dict[str, Any], fds: List[int]):
+    exit_code = 1
+    try:
+        for target_fd, fd in enumerate(fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.environ[FORKED_WORKER_ENV_VAR] = "1"
+        sys.argv = request["argv"]
+        for hook in _after_fork_hooks:
+            hook()
+
+        runpy.run_path(sys.argv[0], run_name="__main__")
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            exit_code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _send_message(sock: socket.socket, message: Any, fds: Optional[List[int]] = None):
+    data = json.dumps(message).encode()
+    header = struct.pack("!I", len(data))
+    if fds:
+        socket.send_fds(sock, [header], fds)
+    else:
+        sock.sendall(header)
+    sock.sendall(data)
+
+
+def _recv_message(sock: socket.socket, with_fds: bool = False):
+    if with_fds:
+        header, fds, _, _ = socket.recv_fds(sock, 4, 3)
+    else:
+        header = _recv_exactly(sock, 4)
+    if len(header) < 4:
+        raise ConnectionError("The connection was closed.")
+    message = json.loads(_recv_exactly(sock, struct.unpack("!I", header)[0]))
+    return (message, fds) if with_fds else message
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("The connection was closed.")
+        data += chunk
+    return bytes(data)
+
+
+def _kill(pid: int, signum: int) -> bool:
+    try:
+        os.kill(pid, signum)
+        return True
+    except ProcessLookupError:
+        return False
+
+
+def _get_arg(argv: List[str], name: str) -> Optional[str]:
+    for i, arg in enumerate(argv):
+        if arg.startswith(f"{name}="):
+            return arg[len(name) + 1 :]
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Zygote of Python workers.")
+    parser.add_argument("--socket-path", required=True, type=str)
+    parser.add_argument("--preload-modules", required=False, type=str, default="")
+    parser.add_argument("--raylet-pid", required=True, type=int)
+    args = parser.parse_args()
+    _run_zygote(
+        args.socket_path,
+        [
+            module
+            for module in args.preload_modules.split(",")
+            if module and module != "None"
+        ],
+        args.raylet_pid,
+    )
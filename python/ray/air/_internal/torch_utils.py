@@ -1,5 +1,7 @@
+import sys
+import threading
 import warnings
-from typing import Any, Dict, List, Optional, Union, Sequence
+from typing import Any, Dict, List, Optional, Tuple, Union, Sequence
 
 import numpy as np
 import pandas as pd
@@ -374,6 +376,161 @@ def arrow_batch_to_tensors(
         )
 
 
+class TensorBufferRing:
+    """Ring of preallocated host tensors that Arrow batches are collated into.
+
+    Every slot of the ring holds a tensor per column, which is reused by the
+    following batches collated into the slot as long as these have the same shape
+    and dtype, and the tensor isn't referenced outside of the ring anymore (i.e.,
+    the batch it was returned with has been released). Values are copied into the
+    tensors directly from the Arrow buffers, without intermediate NumPy arrays.
+
+    Columns that can't be copied into the tensors (e.g., with nulls, non-numeric
+    or variable-shaped values, or with shapes differing from the buffered ones)
+    are left to the caller to convert.
+
+    NOTE: Views of the returned tensors don't keep these from being reused, hence
+    these must be cloned to be retained past the release of their batch.
+    """
+
+    def __init__(self, num_buffers: int, pin_memory: bool = False):
+        """Initialize the ring.
+
+        Args:
+            num_buffers: The number of slots of the ring.
+            pin_memory: Whether to allocate the tensors in page-locked memory, to
+                speed up their transfer to GPUs.
+        """
+        self._pin_memory = pin_memory
+        self._lock = threading.Lock()
+        self._slots: List[Dict[str, torch.Tensor]] = [{} for _ in range(num_buffers)]
+        self._next_slot = 0
+
+        # Counters since the last `pop_stats` call
+        self._num_allocations = 0
+        self._bytes_allocated = 0
+        self._bytes_copied = 0
+        self._num_fallbacks = 0
+
+    def arrow_batch_to_tensors(
+        self,
+        batch: pyarrow.Table,
+        dtypes: Optional[Union[torch.dtype, Dict[str, torch.dtype]]] = None,
+    ) -> Tuple[Dict[str, torch.Tensor], List[str]]:
+        """Copy the columns of the Arrow batch into tensors of the ring.
+
+        Args:
+            batch: PyArrow batch to convert
+            dtypes: A (dict of) Torch dtype(s) for the tensors; if None, the dtype
+                will be inferred from the Arrow data.
+
+        Returns:
+            A dictionary of column name to tensor for the columns copied into the
+            ring, and the names of the columns that weren't.
+        """
+        ndarrays: Dict[str, List[np.ndarray]] = {}
+        specs: Dict[str, Tuple[torch.Size, torch.dtype]] = {}
+        fallback_columns = []
+        for col_name in batch.column_names:
+            col_ndarrays = _get_zero_copy_ndarrays(batch.column(col_name))
+            if not col_ndarrays:
+                fallback_columns.append(col_name)
+                continue
+            dtype = dtypes[col_name] if isinstance(dtypes, dict) else dtypes
+            if dtype is None:
+                dtype = torch.from_numpy(np.empty(0, col_ndarrays[0].dtype)).dtype
+            ndarrays[col_name] = col_ndarrays
+            specs[col_name] = (
+                torch.Size((batch.num_rows, *col_ndarrays[0].shape[1:])),
+                dtype,
+            )
+
+        tensors: Dict[str, torch.Tensor] = {}
+        with self._lock:
+            slot = self._slots[self._next_slot]
+            self._next_slot = (self._next_slot + 1) % len(self._slots)
+
+            for col_name, (shape, dtype) in specs.items():
+                # Tensors are referenced by the slot (and by `getrefcount`) only,
+                # unless these are still being used. This must be checked before
+                # binding the tensor to a local variable (adding a reference).
+                in_use = col_name in slot and sys.getrefcount(slot[col_name]) > 2
+                tensor = slot.get(col_name)
+                if tensor is not None and (
+                    tensor.shape != shape or tensor.dtype != dtype
+                ):
+                    # Batches of varying shapes are left to the caller, rather than
+                    # reallocating the tensors of the ring.
+                    del ndarrays[col_name]
+                    fallback_columns.append(col_name)
+                    continue
+                if tensor is None or in_use:
+                    tensor = torch.empty(
+                        shape, dtype=dtype, pin_memory=self._pin_memory
+                    )
+                    slot[col_name] = tensor
+                    self._num_allocations += 1
+                    self._bytes_allocated += tensor.numel() * tensor.element_size()
+                tensors[col_name] = tensor
+
+            self._num_fallbacks += len(fallback_columns)
+
+        bytes_copied = 0
+        for col_name, tensor in tensors.items():
+            row_start = 0
+            for ndarray in ndarrays[col_name]:
+                row_end = row_start + len(ndarray)
+                source = convert_ndarray_to_torch_tensor(ndarray)
+                tensor[row_start:row_end].copy_(source)
+                row_start = row_end
+            bytes_copied += tensor.numel() * tensor.element_size()
+
+        with self._lock:
+            self._bytes_copied += bytes_copied
+
+        return tensors, fallback_columns
+
+    def pop_stats(self) -> Tuple[int, int, int, int]:
+        """Returns the number of tensors allocated, the bytes allocated, the bytes
+        copied into the tensors, and the number of columns left to the caller since
+        the last call (resetting these)."""
+        with self._lock:
+            stats = (
+                self._num_allocations,
+                self._bytes_allocated,
+                self._bytes_copied,
+                self._num_fallbacks,
+            )
+            self._num_allocations = 0
+            self._bytes_allocated = 0
+            self._bytes_copied = 0
+            self._num_fallbacks = 0
+        return stats
+
+
+def _get_zero_copy_ndarrays(
+    column: pyarrow.ChunkedArray,
+) -> Optional[List[np.ndarray]]:
+    """Returns zero-copy NumPy views of the (non-empty) chunks of the column, or
+    None if the values of the column aren't fixed-shape numeric ones (without
+    nulls)."""
+    from ray.air.util.tensor_extensions.arrow import (
+        get_arrow_extension_fixed_shape_tensor_types,
+    )
+
+    value_type = column.type
+    if isinstance(value_type, get_arrow_extension_fixed_shape_tensor_types()):
+        value_type = value_type.storage_type.value_type
+    if column.null_count > 0 or not (
+        pyarrow.types.is_integer(value_type) or pyarrow.types.is_floating(value_type)
+    ):
+        return None
+
+    return [
+        chunk.to_numpy(zero_copy_only=True) for chunk in column.chunks if len(chunk)
+    ]
+
+
 @torch.no_grad()
 def concat_tensors_to_device(
     tensor_sequence: Sequence[torch.Tensor],
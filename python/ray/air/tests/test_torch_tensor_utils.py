@@ -1,9 +1,10 @@
 import sys
 
+import pyarrow as pa
 import pytest
 import torch
 
-from ray.air._internal.torch_utils import move_tensors_to_device
+from ray.air._internal.torch_utils import TensorBufferRing, move_tensors_to_device
 
 
 def test_move_tensors_to_device():
@@ -66,5 +67,29 @@ def test_move_invalid_batch_type():
         move_tensors_to_device({"a": torch.ones(1), "b": [torch.ones(1)]}, device)
 
 
+def test_tensor_buffer_ring_reuse():
+    """Test that TensorBufferRing reuses the tensors of released batches only."""
+    ring = TensorBufferRing(num_buffers=1)
+
+    tensors, fallback_columns = ring.arrow_batch_to_tensors(pa.table({"a": [1, 2]}))
+    assert fallback_columns == []
+    data_ptr = tensors["a"].data_ptr()
+    assert ring.pop_stats()[0] == 1
+
+    # The tensors of released batches are reused.
+    del tensors
+    tensors, _ = ring.arrow_batch_to_tensors(pa.table({"a": [3, 4]}))
+    assert tensors["a"].data_ptr() == data_ptr
+    assert tensors["a"].tolist() == [3, 4]
+    assert ring.pop_stats()[0] == 0
+
+    # The tensors of batches still in use aren't overwritten.
+    new_tensors, _ = ring.arrow_batch_to_tensors(pa.table({"a": [5, 6]}))
+    assert new_tensors["a"].data_ptr() != data_ptr
+    assert tensors["a"].tolist() == [3, 4]
+    assert new_tensors["a"].tolist() == [5, 6]
+    assert ring.pop_stats()[0] == 1
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -117,6 +117,7 @@ RAY_PROCESSES = [
     ["ray.util.client.server", False],
     ["default_worker.py", False],  # Python worker.
     ["setup_worker.py", False],  # Python environment setup worker.
+    [os.path.join("workers", "zygote.py"), False],  # Python worker zygote.
     # For mac osx, setproctitle doesn't change the process name returned
     # by psutil but only cmdline.
     [
@@ -13,6 +13,7 @@ from ray.data._internal.block_batching.interfaces import (
 )
 from ray.data._internal.stats import DatasetStats
 from ray.data.block import Block, BlockAccessor, DataBatch
+from ray.data.collate_fn import DefaultCollateFn
 from ray.types import ObjectRef
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
@@ -180,6 +181,8 @@ def collate(
     for batch in batch_iter:
         with stats.iter_collate_batch_s.timer() if stats else nullcontext():
             collated_batch = collate_fn(batch.data)
+        if stats and isinstance(collate_fn, DefaultCollateFn):
+            collate_fn._record_stats(stats)
         yield CollatedBatch(batch.batch_idx, collated_batch)
 
 
@@ -1,7 +1,9 @@
+import copy
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from ray.data.block import Block
 from ray.data.datasource.file_based_datasource import FileBasedDatasource
+from ray.data.datasource.partitioning import PathPartitionParser
 
 if TYPE_CHECKING:
     import pyarrow
@@ -36,6 +38,48 @@ class CSVDatasource(FileBasedDatasource):
         )
         self.parse_options = arrow_csv_args.pop("parse_options", csv.ParseOptions())
         self.arrow_csv_args = arrow_csv_args
+        # The columns selected by projection pushdown, if any.
+        self._projected_columns = None
+
+    def supports_projection_pushdown(self) -> bool:
+        # Don't override columns that the user explicitly included.
+        convert_options = self.arrow_csv_args.get("convert_options")
+        return (
+            self._projected_columns is not None
+            or convert_options is None
+            or not convert_options.include_columns
+        )
+
+    def get_current_projection(self) -> Optional[List[str]]:
+        return self._projected_columns
+
+    def apply_projection(self, columns: List[str]) -> "CSVDatasource":
+        from pyarrow import csv
+
+        # Partition columns and the path column are added after the file is
+        # parsed, so they aren't columns in the CSV files.
+        non_file_columns = set()
+        if self._include_paths:
+            non_file_columns.add("path")
+        paths = self._paths()
+        if self._partitioning is not None and paths:
+            parse = PathPartitionParser(self._partitioning)
+            non_file_columns.update(parse(paths[0]))
+
+        convert_options = copy.deepcopy(
+            self.arrow_csv_args.get("convert_options", csv.ConvertOptions())
+        )
+        convert_options.include_columns = [
+            column for column in columns if column not in non_file_columns
+        ]
+
+        projected = copy.copy(self)
+        projected.arrow_csv_args = {
+            **self.arrow_csv_args,
+            "convert_options": convert_options,
+        }
+        projected._projected_columns = list(columns)
+        return projected
 
     def _read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
         import pyarrow as pa
@@ -2,6 +2,8 @@
 Module to read an iceberg table into a Ray Dataset, by using the Ray Datasource API.
 """
 
+import ast
+import copy
 import heapq
 import itertools
 import logging
@@ -80,6 +82,71 @@ def _get_read_task(
         )
 
 
+def _convert_to_iceberg_expression(node: ast.AST) -> "BooleanExpression":
+    """Convert a parsed ``Dataset.filter`` expression to a PyIceberg expression.
+
+    Raises:
+        ValueError: If the expression can't be represented in PyIceberg.
+    """
+    from pyiceberg import expressions
+
+    comparisons = {
+        ast.Eq: (expressions.EqualTo, expressions.EqualTo),
+        ast.NotEq: (expressions.NotEqualTo, expressions.NotEqualTo),
+        ast.Lt: (expressions.LessThan, expressions.GreaterThan),
+        ast.LtE: (expressions.LessThanOrEqual, expressions.GreaterThanOrEqual),
+        ast.Gt: (expressions.GreaterThan, expressions.LessThan),
+        ast.GtE: (expressions.GreaterThanOrEqual, expressions.LessThanOrEqual),
+    }
+    unary_functions = {
+        "is_null": expressions.IsNull,
+        "is_valid": expressions.NotNull,
+        "is_nan": expressions.IsNaN,
+    }
+
+    def to_column(value: ast.AST) -> Optional[str]:
+        if isinstance(value, (ast.Name, ast.Attribute)):
+            return ast.unparse(value)
+        return None
+
+    def to_literal(value: ast.AST) -> Any:
+        # `ast.literal_eval` handles negative numbers and lists of constants.
+        try:
+            return ast.literal_eval(value)
+        except ValueError as e:
+            raise ValueError(f"Unsupported literal: {ast.unparse(value)}") from e
+
+    if isinstance(node, ast.BoolOp):
+        operands = [_convert_to_iceberg_expression(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return expressions.And(*operands)
+        return expressions.Or(*operands)
+
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        op, left, right = node.ops[0], node.left, node.comparators[0]
+        if isinstance(op, ast.In) and to_column(left) is not None:
+            return expressions.In(to_column(left), set(to_literal(right)))
+        if isinstance(op, ast.NotIn) and to_column(left) is not None:
+            return expressions.NotIn(to_column(left), set(to_literal(right)))
+        if type(op) in comparisons:
+            expression_cls, flipped_expression_cls = comparisons[type(op)]
+            if to_column(left) is not None and to_column(right) is None:
+                return expression_cls(to_column(left), to_literal(right))
+            if to_column(right) is not None and to_column(left) is None:
+                return flipped_expression_cls(to_column(right), to_literal(left))
+
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in unary_functions
+        and len(node.args) == 1
+        and to_column(node.args[0]) is not None
+    ):
+        return unary_functions[node.func.id](to_column(node.args[0]))
+
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
 @DeveloperAPI
 class IcebergDatasource(Datasource):
     """
@@ -128,6 +195,8 @@ class IcebergDatasource(Datasource):
 
         self._row_filter = row_filter if row_filter is not None else AlwaysTrue()
         self._selected_fields = selected_fields
+        # The filter expressions pushed down by the optimizer.
+        self._pushed_predicates: Tuple[str, ...] = ()
 
         if snapshot_id:
             self._scan_kwargs["snapshot_id"] = snapshot_id
@@ -178,6 +247,64 @@ class IcebergDatasource(Datasource):
         # task
         return sum(task.file.file_size_in_bytes for task in self.plan_files)
 
+    def supports_projection_pushdown(self) -> bool:
+        return True
+
+    def get_current_projection(self) -> Optional[List[str]]:
+        if "*" in self._selected_fields:
+            return None
+        return list(self._selected_fields)
+
+    def apply_projection(self, columns: List[str]) -> "IcebergDatasource":
+        column_names = {field.name for field in self.table.schema().fields}
+        if not set(columns).issubset(column_names):
+            # Let the downstream operator raise the error for unknown columns.
+            return self
+
+        # The planned files don't depend on the selected fields, so the projected
+        # datasource can share the cached table and scan plan.
+        projected = copy.copy(self)
+        projected._selected_fields = tuple(columns)
+        return projected
+
+    def supports_predicate_pushdown(self) -> bool:
+        return True
+
+    def apply_predicate(self, expression: str) -> "IcebergDatasource":
+        from pyiceberg.expressions import And
+        from pyiceberg.expressions.parser import parse
+
+        from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+            ExpressionEvaluator,
+        )
+
+        if expression in self._pushed_predicates:
+            return self
+
+        # Convert each conjunct separately, so that the parts PyIceberg can't
+        # express are left to the `Filter` operator.
+        iceberg_filters = []
+        for conjunct in ExpressionEvaluator.get_conjuncts(expression):
+            try:
+                node = ast.parse(conjunct, mode="eval").body
+                iceberg_filters.append(_convert_to_iceberg_expression(node))
+            except ValueError:
+                logger.debug(f"Can't push '{conjunct}' into the Iceberg scan.")
+        if not iceberg_filters:
+            return self
+
+        row_filter = self._row_filter
+        if isinstance(row_filter, str):
+            row_filter = parse(row_filter)
+
+        # PyIceberg uses the row filter to prune data files with partition values
+        # and column statistics when planning the scan, so the cached plan is stale.
+        filtered = copy.copy(self)
+        filtered._row_filter = And(row_filter, *iceberg_filters)
+        filtered._pushed_predicates = self._pushed_predicates + (expression,)
+        filtered._plan_files = None
+        return filtered
+
     @staticmethod
     def _distribute_tasks_into_equal_chunks(
         plan_files: Iterable["FileScanTask"], n_chunks: int
@@ -1,5 +1,6 @@
+import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
@@ -44,6 +45,8 @@ class LanceDatasource(Datasource):
         if filter is not None:
             self.scanner_options["filter"] = filter
         self.storage_options = storage_options
+        # The filter expressions pushed down by the optimizer.
+        self._pushed_predicates: Tuple[str, ...] = ()
         self.lance_ds = lance.dataset(uri=uri, storage_options=storage_options)
 
         match = []
@@ -63,7 +66,10 @@ class LanceDatasource(Datasource):
                 continue
 
             fragment_ids = [f.metadata.id for f in fragments]
-            num_rows = sum(f.count_rows() for f in fragments)
+            # If there is a filter, the resulting row count is unknown.
+            num_rows = None
+            if self.scanner_options.get("filter") is None:
+                num_rows = sum(f.count_rows() for f in fragments)
             input_files = [
                 data_file.path() for f in fragments for data_file in f.data_files()
             ]
@@ -97,6 +103,57 @@ class LanceDatasource(Datasource):
         # TODO(chengsu): Add memory size estimation to improve auto-tune of parallelism.
         return None
 
+    def supports_projection_pushdown(self) -> bool:
+        return True
+
+    def get_current_projection(self) -> Optional[List[str]]:
+        return self.scanner_options.get("columns")
+
+    def apply_projection(self, columns: List[str]) -> "LanceDatasource":
+        if not set(columns).issubset(self.lance_ds.schema.names):
+            # Let the downstream operator raise the error for unknown columns.
+            return self
+
+        projected = copy.copy(self)
+        projected.scanner_options = {**self.scanner_options, "columns": list(columns)}
+        return projected
+
+    def supports_predicate_pushdown(self) -> bool:
+        # We can only combine the pushed filter with an existing filter if both are
+        # PyArrow expressions.
+        return not isinstance(self.scanner_options.get("filter"), str)
+
+    def apply_predicate(self, expression: str) -> "LanceDatasource":
+        from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+            ExpressionEvaluator,
+        )
+
+        if expression in self._pushed_predicates:
+            return self
+
+        column_names = set(self.lance_ds.schema.names)
+        conjuncts = [
+            conjunct
+            for conjunct in ExpressionEvaluator.get_conjuncts(expression)
+            if ExpressionEvaluator.get_referenced_columns(conjunct).issubset(
+                column_names
+            )
+        ]
+        if not conjuncts:
+            return self
+
+        lance_filter = ExpressionEvaluator.get_filters(
+            ExpressionEvaluator.join_conjuncts(conjuncts)
+        )
+        existing_filter = self.scanner_options.get("filter")
+        if existing_filter is not None:
+            lance_filter = existing_filter & lance_filter
+
+        filtered = copy.copy(self)
+        filtered.scanner_options = {**self.scanner_options, "filter": lance_filter}
+        filtered._pushed_predicates = self._pushed_predicates + (expression,)
+        return filtered
+
 
 def _read_fragments_with_retry(
     fragment_ids,
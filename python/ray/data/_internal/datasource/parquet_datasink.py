@@ -1,4 +1,5 @@
 import logging
+import math
 import posixpath
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
@@ -29,6 +30,8 @@ class ParquetDatasink(_FileDatasink):
         arrow_parquet_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         arrow_parquet_args: Optional[Dict[str, Any]] = None,
         min_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
+        sort_within_files_by: Optional[List[str]] = None,
         filesystem: Optional["pyarrow.fs.FileSystem"] = None,
         try_create_dir: bool = True,
         open_stream_args: Optional[Dict[str, Any]] = None,
@@ -45,6 +48,8 @@ class ParquetDatasink(_FileDatasink):
         self.arrow_parquet_args_fn = arrow_parquet_args_fn
         self.arrow_parquet_args = arrow_parquet_args
         self.min_rows_per_file = min_rows_per_file
+        self.target_file_size_bytes = target_file_size_bytes
+        self.sort_within_files_by = sort_within_files_by
         self.partition_cols = partition_cols
 
         super().__init__(
@@ -74,9 +79,12 @@ class ParquetDatasink(_FileDatasink):
             block for block in blocks if BlockAccessor.for_block(block).num_rows() > 0
         ]
 
-        filename = self.filename_provider.get_filename_for_block(
-            blocks[0], ctx.task_idx, 0
-        )
+        def get_filename(file_idx: int) -> str:
+            return self.filename_provider.get_filename_for_block(
+                blocks[0], ctx.task_idx, file_idx
+            )
+
+        filename = get_filename(0)
         write_kwargs = _resolve_kwargs(
             self.arrow_parquet_args_fn, **self.arrow_parquet_args
         )
@@ -90,12 +98,12 @@ class ParquetDatasink(_FileDatasink):
                 output_schema = user_schema
 
             if not self.partition_cols:
-                self._write_single_file(
-                    self.path, tables, filename, output_schema, write_kwargs
+                self._write_files(
+                    self.path, tables, get_filename, output_schema, write_kwargs
                 )
             else:  # partition writes
                 self._write_partition_files(
-                    tables, filename, output_schema, write_kwargs
+                    tables, get_filename, output_schema, write_kwargs
                 )
 
         logger.debug(f"Writing {filename} file to {self.path}.")
@@ -108,6 +116,49 @@ class ParquetDatasink(_FileDatasink):
             max_backoff_s=WRITE_FILE_RETRY_MAX_BACKOFF_SECONDS,
         )
 
+    def _write_files(
+        self,
+        path: str,
+        tables: List["pyarrow.Table"],
+        get_filename: Callable[[int], str],
+        output_schema: "pyarrow.Schema",
+        write_kwargs: Dict[str, Any],
+    ) -> None:
+        for file_idx, file_tables in enumerate(self._split_into_files(tables)):
+            self._write_single_file(
+                path, file_tables, get_filename(file_idx), output_schema, write_kwargs
+            )
+
+    def _split_into_files(
+        self, tables: List["pyarrow.Table"]
+    ) -> List[List["pyarrow.Table"]]:
+        """Splits the tables into the ones to write to every file, sorting the rows
+        (by ``sort_within_files_by``) and targeting ``target_file_size_bytes``."""
+        if self.target_file_size_bytes is None and not self.sort_within_files_by:
+            return [tables]
+
+        table = concat(tables, promote_types=False)
+        if self.sort_within_files_by:
+            # NOTE: Sorting the rows within files narrows the ranges of the values
+            #       (min/max statistics) of their row groups, allowing readers to
+            #       skip more of them when filtering.
+            table = table.sort_by(
+                [(column, "ascending") for column in self.sort_within_files_by]
+            )
+
+        if (
+            self.target_file_size_bytes is None
+            or table.nbytes <= self.target_file_size_bytes
+        ):
+            return [[table]]
+
+        num_files = math.ceil(table.nbytes / self.target_file_size_bytes)
+        rows_per_file = math.ceil(table.num_rows / num_files)
+        return [
+            [table.slice(offset, rows_per_file)]
+            for offset in range(0, table.num_rows, rows_per_file)
+        ]
+
     def _write_single_file(
         self,
         path: str,
@@ -120,6 +171,7 @@ class ParquetDatasink(_FileDatasink):
 
         # We extract 'row_group_size' for write_table() and
         # keep the rest for ParquetWriter()
+        write_kwargs = dict(write_kwargs)
         row_group_size = write_kwargs.pop("row_group_size", None)
 
         write_path = posixpath.join(path, filename)
@@ -132,7 +184,7 @@ class ParquetDatasink(_FileDatasink):
     def _write_partition_files(
         self,
         tables: List["pyarrow.Table"],
-        filename: str,
+        get_filename: Callable[[int], str],
         output_schema: "pyarrow.Schema",
         write_kwargs: Dict[str, Any],
     ) -> None:
@@ -165,10 +217,10 @@ class ParquetDatasink(_FileDatasink):
             )
             write_path = posixpath.join(self.path, partition_path)
             self._create_dir(write_path)
-            self._write_single_file(
+            self._write_files(
                 write_path,
                 [group_table],
-                filename,
+                get_filename,
                 output_schema,
                 write_kwargs,
             )
@@ -1,3 +1,4 @@
+import copy
 import logging
 import warnings
 from dataclasses import dataclass
@@ -10,6 +11,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -18,6 +20,7 @@ import numpy as np
 
 import ray
 import ray.cloudpickle as cloudpickle
+from ray.data._internal.file_metadata_cache import get_file_metadata_cache
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import (
@@ -204,10 +207,19 @@ class ParquetDatasource(Datasource):
             retryable_errors=DataContext.get_current().retried_io_errors,
         )
 
+        # Listings and footer metadata of the files are cached (if enabled) across
+        # reads. The input paths are then expanded (through the cache) up front,
+        # rather than by PyArrow's `ParquetDataset`.
+        file_metadata_cache = get_file_metadata_cache(filesystem)
+
         # HACK: PyArrow's `ParquetDataset` errors if input paths contain non-parquet
         # files. To avoid this, we expand the input paths with the default metadata
         # provider and then apply the partition filter or file extensions.
-        if partition_filter is not None or file_extensions is not None:
+        if (
+            partition_filter is not None
+            or file_extensions is not None
+            or file_metadata_cache is not None
+        ):
             default_meta_provider = DefaultFileMetadataProvider()
             expanded_paths, _ = map(
                 list, zip(*default_meta_provider.expand_paths(paths, filesystem))
@@ -277,12 +289,20 @@ class ParquetDatasource(Datasource):
                     "scheduling_strategy"
                 ] = DataContext.get_current().scheduling_strategy
 
-            self._metadata = (
-                meta_provider.prefetch_file_metadata(
-                    pq_ds.fragments, **prefetch_remote_args
+            def prefetch_file_metadata(fragments):
+                return meta_provider.prefetch_file_metadata(
+                    fragments, **prefetch_remote_args
                 )
-                or []
-            )
+
+            if file_metadata_cache is not None:
+                self._metadata = (
+                    file_metadata_cache.get_parquet_metadata(
+                        pq_ds.fragments, prefetch_file_metadata
+                    )
+                    or []
+                )
+            else:
+                self._metadata = prefetch_file_metadata(pq_ds.fragments) or []
         except OSError as e:
             _handle_read_os_error(e, paths)
 
@@ -304,6 +324,12 @@ class ParquetDatasource(Datasource):
         self._file_metadata_shuffler = None
         self._include_paths = include_paths
         self._partitioning = partitioning
+        self._projected_columns = columns
+        # The fraction of the on-disk bytes that we expect to read after column
+        # projection is pushed down by the optimizer.
+        self._projected_size_fraction = 1.0
+        # The filter expressions pushed down by the optimizer.
+        self._pushed_predicates: Tuple[str, ...] = ()
         if shuffle == "files":
             self._file_metadata_shuffler = np.random.default_rng()
         elif isinstance(shuffle, FileShuffleConfig):
@@ -333,7 +359,7 @@ class ParquetDatasource(Datasource):
         total_size = 0
         for file_metadata in self._metadata:
             total_size += file_metadata.total_byte_size
-        return total_size * self._encoding_ratio
+        return total_size * self._encoding_ratio * self._projected_size_fraction
 
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
         # NOTE: We override the base class FileBasedDatasource.get_read_tasks()
@@ -383,7 +409,11 @@ class ParquetDatasource(Datasource):
                 meta.num_rows = None
 
             if meta.size_bytes is not None:
-                meta.size_bytes = int(meta.size_bytes * self._encoding_ratio)
+                meta.size_bytes = int(
+                    meta.size_bytes
+                    * self._encoding_ratio
+                    * self._projected_size_fraction
+                )
 
             (
                 block_udf,
@@ -434,6 +464,191 @@ class ParquetDatasource(Datasource):
     def supports_distributed_reads(self) -> bool:
         return self._supports_distributed_reads
 
+    def supports_projection_pushdown(self) -> bool:
+        # A block UDF can add, drop, or rename columns, so we can't map the columns
+        # used downstream back to the columns in the files.
+        return self._block_udf is None
+
+    def get_current_projection(self) -> Optional[List[str]]:
+        return self._projected_columns
+
+    def apply_projection(self, columns: List[str]) -> "ParquetDatasource":
+        import pyarrow as pa
+
+        available_columns = set(self._inferred_schema.names)
+        if self._include_paths:
+            available_columns.add("path")
+        if not set(columns).issubset(available_columns):
+            # Let the downstream operator raise the error for unknown columns.
+            return self
+
+        partition_names = self._get_partition_names()
+        data_columns = [
+            column
+            for column in columns
+            if column in self._inferred_schema.names and column not in partition_names
+        ]
+        partition_columns = [column for column in columns if column in partition_names]
+
+        projected = copy.copy(self)
+        projected._projected_columns = list(columns)
+        projected._data_columns = data_columns
+        projected._partition_columns = partition_columns
+        projected._include_paths = self._include_paths and "path" in columns
+        projected._inferred_schema = pa.schema(
+            [
+                self._inferred_schema.field(column)
+                for column in columns
+                if column in self._inferred_schema.names
+            ],
+            self._inferred_schema.metadata,
+        )
+        if self._read_schema is not None:
+            projected._read_schema = pa.schema(
+                [
+                    self._read_schema.field(column)
+                    for column in data_columns
+                    if column in self._read_schema.names
+                ],
+                self._read_schema.metadata,
+            )
+
+        # Parquet footers only give us the total size of each file, so we
+        # approximate the size of the projected data by the fraction of data
+        # columns that we still read.
+        num_data_columns = len(
+            [
+                name
+                for name in self._inferred_schema.names
+                if name not in partition_names
+            ]
+        )
+        if num_data_columns > 0:
+            projected._projected_size_fraction = self._projected_size_fraction * (
+                max(len(data_columns), 1) / num_data_columns
+            )
+        return projected
+
+    def supports_predicate_pushdown(self) -> bool:
+        # A block UDF can add, drop, or rename columns, so we can't map the columns
+        # used by the filter back to the columns in the files.
+        return self._block_udf is None
+
+    def apply_predicate(self, expression: str) -> "ParquetDatasource":
+        from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+            ExpressionEvaluator,
+        )
+
+        if expression in self._pushed_predicates:
+            return self
+
+        # Split the filter into the parts that only reference partition columns,
+        # which we evaluate against the file paths to skip files, and the parts that
+        # only reference data columns, which PyArrow evaluates against row group
+        # statistics and rows while reading. Other parts are left to the `Filter`
+        # operator.
+        partition_names = self._get_partition_names()
+        data_names = set(self._inferred_schema.names) - partition_names
+        if self._include_paths:
+            data_names.discard("path")
+        partition_conjuncts, data_conjuncts = [], []
+        for conjunct in ExpressionEvaluator.get_conjuncts(expression):
+            columns = ExpressionEvaluator.get_referenced_columns(conjunct)
+            if not columns:
+                continue
+            elif columns.issubset(partition_names):
+                partition_conjuncts.append(conjunct)
+            elif columns.issubset(data_names):
+                data_conjuncts.append(conjunct)
+
+        if not partition_conjuncts and not data_conjuncts:
+            return self
+
+        filtered = copy.copy(self)
+        filtered._pushed_predicates = self._pushed_predicates + (expression,)
+
+        if partition_conjuncts:
+            partition_expression = ExpressionEvaluator.join_conjuncts(
+                partition_conjuncts
+            )
+            partition_filter = ExpressionEvaluator.get_filters(partition_expression)
+            indices = _get_paths_matching_partition_filter(
+                self._pq_paths,
+                self._partitioning,
+                partition_filter,
+                self._inferred_schema,
+            )
+            if indices is not None:
+                filtered._pq_fragments = [self._pq_fragments[i] for i in indices]
+                filtered._pq_paths = [self._pq_paths[i] for i in indices]
+                # The prefetched metadata can be shorter than the list of fragments.
+                # Because the indices are sorted, this keeps it a prefix.
+                filtered._metadata = [
+                    self._metadata[i] for i in indices if i < len(self._metadata)
+                ]
+                logger.debug(
+                    f"Partition filter '{partition_expression}' "
+                    f"pruned {len(self._pq_paths) - len(indices)} of "
+                    f"{len(self._pq_paths)} files."
+                )
+
+        if data_conjuncts:
+            data_filter = ExpressionEvaluator.get_filters(
+                ExpressionEvaluator.join_conjuncts(data_conjuncts)
+            )
+            existing_filter = self._to_batches_kwargs.get("filter")
+            if existing_filter is not None:
+                data_filter = existing_filter & data_filter
+            filtered._to_batches_kwargs = {
+                **self._to_batches_kwargs,
+                "filter": data_filter,
+            }
+
+        return filtered
+
+    def _get_partition_names(self) -> Set[str]:
+        """Return the names of the partition columns, inferred from the first path."""
+        if self._partitioning is None or not self._pq_paths:
+            return set()
+        parse = PathPartitionParser(self._partitioning)
+        return set(parse(self._pq_paths[0]))
+
+
+def _get_paths_matching_partition_filter(
+    paths: List[str],
+    partitioning: Partitioning,
+    partition_filter: "pyarrow.dataset.Expression",
+    schema: "pyarrow.Schema",
+) -> Optional[List[int]]:
+    """Return the indices of the paths whose partition values match the filter.
+
+    The filter is evaluated once over a table with one row of partition values per
+    path. Returns ``None`` if the filter can't be evaluated against the partition
+    values, in which case no paths should be pruned.
+    """
+    import pyarrow as pa
+
+    parse = PathPartitionParser(partitioning)
+    partitions = [parse(path) for path in paths]
+    field_names = {name for partition in partitions for name in partition}
+
+    index_column = "__ray_path_index"
+    try:
+        columns = {}
+        for name in field_names:
+            field_type = None
+            if name in schema.names:
+                field_type = schema.field(name).type
+            columns[name] = pa.array(
+                [partition.get(name) for partition in partitions], type=field_type
+            )
+        columns[index_column] = pa.array(range(len(paths)), type=pa.int64())
+        matching = pa.table(columns).filter(partition_filter)
+    except (ValueError, TypeError, NotImplementedError) as e:
+        logger.debug(f"Couldn't prune partitions with '{partition_filter}': {e}")
+        return None
+    return matching[index_column].to_pylist()
+
 
 def read_fragments(
     block_udf,
@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING, List, Optional
+
+import pyarrow as pa
+
+import ray
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import BlockMetadata
+from ray.data.datasource import Datasource, ReadTask
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+if TYPE_CHECKING:
+    from ray.data._internal.persist import PersistedCache
+
+
+class PersistedDatasource(Datasource):
+    """Reads the blocks of a persisted dataset back from the (node-local) Arrow IPC
+    files they were written to, memory-mapping them.
+
+    Every file is read by a single read task. Files residing on another node than
+    the one running the read task are read by a task scheduled on that node.
+    """
+
+    def __init__(self, cache: "PersistedCache"):
+        self._cache = cache
+
+    def estimate_inmemory_data_size(self) -> Optional[int]:
+        return self._cache.size_bytes
+
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        # NOTE: Files of evicted caches are re-written (re-executing the persisted
+        #       dataset), before being read.
+        files = self._cache.get_files()
+
+        read_tasks = []
+        for file in files:
+            metadata = BlockMetadata(
+                num_rows=file.num_rows,
+                size_bytes=file.size_bytes,
+                schema=self._cache.schema,
+                input_files=None,
+                exec_stats=None,
+            )
+            read_tasks.append(
+                ReadTask(
+                    lambda path=file.path, node_id=file.node_id: [
+                        _read_persisted_file(path, node_id)
+                    ],
+                    metadata,
+                )
+            )
+
+        return read_tasks
+
+
+def _read_persisted_file(path: str, node_id: str) -> pa.Table:
+    if node_id == ray.get_runtime_context().get_node_id():
+        return _read_ipc_file(path)
+
+    read_file = cached_remote_fn(_read_ipc_file).options(
+        scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=False)
+    )
+    return ray.get(read_file.remote(path))
+
+
+def _read_ipc_file(path: str) -> pa.Table:
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
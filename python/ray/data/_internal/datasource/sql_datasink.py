@@ -8,11 +8,17 @@ from ray.data.datasource.datasink import Datasink
 
 class SQLDatasink(Datasink[None]):
 
-    _MAX_ROWS_PER_WRITE = 128
+    _MAX_ROWS_PER_WRITE = 1024
 
-    def __init__(self, sql: str, connection_factory: Callable[[], Connection]):
+    def __init__(
+        self,
+        sql: str,
+        connection_factory: Callable[[], Connection],
+        max_rows_per_write: int = _MAX_ROWS_PER_WRITE,
+    ):
         self.sql = sql
         self.connection_factory = connection_factory
+        self.max_rows_per_write = max_rows_per_write
 
     def write(
         self,
@@ -21,15 +27,10 @@ class SQLDatasink(Datasink[None]):
     ) -> None:
         with _connect(self.connection_factory) as cursor:
             for block in blocks:
-                block_accessor = BlockAccessor.for_block(block)
-
-                values = []
-                for row in block_accessor.iter_rows(public_row_format=False):
-                    values.append(tuple(row.values()))
-                    assert len(values) <= self._MAX_ROWS_PER_WRITE, len(values)
-                    if len(values) == self._MAX_ROWS_PER_WRITE:
-                        cursor.executemany(self.sql, values)
-                        values = []
+                table = BlockAccessor.for_block(block).to_arrow()
 
-                if values:
-                    cursor.executemany(self.sql, values)
+                # Rows are inserted in batches, converting the columns of every
+                # batch into rows (of Python values) at once.
+                for start in range(0, table.num_rows, self.max_rows_per_write):
+                    columns = table.slice(start, self.max_rows_per_write).to_pydict()
+                    cursor.executemany(self.sql, list(zip(*columns.values())))
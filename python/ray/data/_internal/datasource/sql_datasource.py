@@ -1,9 +1,12 @@
+import datetime
+import decimal
 import logging
 import math
 from contextlib import contextmanager
 from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 from ray.data.block import Block, BlockMetadata
+from ray.data.context import DataContext
 from ray.data.datasource.datasource import Datasource, ReadTask
 
 Connection = Any  # A Python DB API2-compliant `Connection` object.
@@ -11,16 +14,45 @@ Cursor = Any  # A Python DB API2-compliant `Cursor` object.
 
 logger = logging.getLogger(__name__)
 
+# Number of rows fetched from the cursor at once.
+_FETCH_NUM_ROWS = 1024
 
-def _cursor_to_block(cursor) -> Block:
+
+def _cursor_to_blocks(cursor) -> Iterator[Block]:
+    """Streams the rows of the cursor into blocks of (about) the target max block
+    size, fetching and converting them into Arrow columns in batches."""
     import pyarrow as pa
 
-    rows = cursor.fetchall()
+    from ray.data._internal.arrow_ops.transform_pyarrow import concat
+
     # Each `column_description` is a 7-element sequence. The first element is the column
     # name. To learn more, read https://peps.python.org/pep-0249/#description.
     columns = [column_description[0] for column_description in cursor.description]
-    pydict = {column: [row[i] for row in rows] for i, column in enumerate(columns)}
-    return pa.Table.from_pydict(pydict)
+    target_max_block_size = DataContext.get_current().target_max_block_size
+
+    tables = []
+    num_bytes = 0
+    num_blocks = 0
+    while True:
+        rows = cursor.fetchmany(_FETCH_NUM_ROWS)
+        if not rows:
+            break
+
+        table = pa.Table.from_arrays(
+            [pa.array(values) for values in zip(*rows)], names=columns
+        )
+        tables.append(table)
+        num_bytes += table.nbytes
+        if target_max_block_size is not None and num_bytes >= target_max_block_size:
+            yield concat(tables, promote_types=True)
+            num_blocks += 1
+            tables = []
+            num_bytes = 0
+
+    if tables:
+        yield concat(tables, promote_types=True)
+    elif num_blocks == 0:
+        yield pa.Table.from_pydict({column: [] for column in columns})
 
 
 def _check_connection_is_dbapi2_compliant(connection) -> None:
@@ -37,7 +69,7 @@ def _check_connection_is_dbapi2_compliant(connection) -> None:
 def _check_cursor_is_dbapi2_compliant(cursor) -> None:
     # These aren't all the methods required by the specification, but it's all the ones
     # we care about.
-    for attr in "execute", "executemany", "fetchone", "fetchall", "description":
+    for attr in "execute", "executemany", "fetchone", "fetchmany", "description":
         if not hasattr(cursor, attr):
             raise ValueError(
                 "Your database connector created a `Cursor` object without a "
@@ -83,6 +115,7 @@ class SQLDatasource(Datasource):
         connection_factory: Callable[[], Connection],
         shard_hash_fn: str,
         shard_keys: Optional[List[str]] = None,
+        partition_column: Optional[str] = None,
     ):
         self.sql = sql
         if shard_keys and len(shard_keys) > 1:
@@ -91,7 +124,9 @@ class SQLDatasource(Datasource):
             self.shard_keys = f"{shard_keys[0]}"
         else:
             self.shard_keys = None
+        self.shard_key_columns = shard_keys
         self.shard_hash_fn = shard_hash_fn
+        self.partition_column = partition_column
         self.connection_factory = connection_factory
 
     def estimate_inmemory_data_size(self) -> Optional[int]:
@@ -123,10 +158,10 @@ class SQLDatasource(Datasource):
 
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
         def fallback_read_fn() -> Iterable[Block]:
-            """Read all data in a single block when sharding is not supported."""
+            """Read all data in a single task when sharding is not supported."""
             with _connect(self.connection_factory) as cursor:
                 cursor.execute(self.sql)
-                return [_cursor_to_block(cursor)]
+                yield from _cursor_to_blocks(cursor)
 
         num_rows_total = self._get_num_rows()
 
@@ -139,9 +174,22 @@ class SQLDatasource(Datasource):
         num_rows_per_block = num_rows_total // parallelism
         num_blocks_with_extra_row = num_rows_total % parallelism
 
+        if self.partition_column is not None and parallelism > 1:
+            range_queries = self._get_range_queries(parallelism)
+            if range_queries is not None:
+                return [
+                    ReadTask(
+                        self._create_read_fn(query),
+                        BlockMetadata(None, None, None, None, None),
+                    )
+                    for query in range_queries
+                ]
+
         # Check if sharding is supported by the database
-        # If not, fall back to reading all data in a single task
-        if not self.supports_sharding(parallelism):
+        # If not, fall back to paginating the data ordered by the shard keys, or to
+        # reading all data in a single task (without shard keys).
+        use_hash_sharding = self.supports_sharding(parallelism)
+        if not use_hash_sharding and (self.shard_keys is None or parallelism <= 1):
             logger.info(
                 "Sharding is not supported. "
                 "Falling back to reading all data in a single task."
@@ -149,12 +197,27 @@ class SQLDatasource(Datasource):
             metadata = BlockMetadata(None, None, None, None, None)
             return [ReadTask(fallback_read_fn, metadata)]
 
+        if not use_hash_sharding:
+            logger.info(
+                "Sharding is not supported. Falling back to sharding by "
+                f"LIMIT/OFFSET, ordered by the shard keys {self.shard_key_columns}."
+            )
+
         tasks = []
+        offset = 0
         for i in range(parallelism):
             num_rows = num_rows_per_block
             if i < num_blocks_with_extra_row:
                 num_rows += 1
-            read_fn = self._create_parallel_read_fn(i, parallelism)
+            if use_hash_sharding:
+                read_fn = self._create_parallel_read_fn(i, parallelism)
+            else:
+                read_fn = self._create_read_fn(
+                    f"SELECT * FROM ({self.sql}) as T "
+                    f"ORDER BY {', '.join(self.shard_key_columns)} "
+                    f"LIMIT {num_rows} OFFSET {offset}"
+                )
+            offset += num_rows
             metadata = BlockMetadata(
                 num_rows=num_rows,
                 size_bytes=None,
@@ -171,6 +234,46 @@ class SQLDatasource(Datasource):
             cursor.execute(f"SELECT COUNT(*) FROM ({self.sql}) as T")
             return cursor.fetchone()[0]
 
+    def _get_range_queries(self, parallelism: int) -> Optional[List[str]]:
+        """Returns queries reading ranges of the values of the partition column (as
+        evenly sized as its min and max values allow), or ``None`` if the column
+        has a single value."""
+        column = self.partition_column
+        with _connect(self.connection_factory) as cursor:
+            cursor.execute(
+                f"SELECT MIN({column}), MAX({column}) FROM ({self.sql}) as T"
+            )
+            min_value, max_value = cursor.fetchone()
+
+        if min_value is None or min_value == max_value:
+            return None
+
+        bounds = []
+        for i in range(1, parallelism):
+            bound = _interpolate(min_value, max_value, i, parallelism)
+            if bound > min_value and (not bounds or bound > bounds[-1]):
+                bounds.append(bound)
+
+        # Rows with null values of the column are read by the first query.
+        conditions = []
+        for lower, upper in zip([None] + bounds, bounds + [None]):
+            if lower is None:
+                conditions.append(
+                    f"{column} < {_to_sql_literal(upper)} OR {column} IS NULL"
+                )
+            elif upper is None:
+                conditions.append(f"{column} >= {_to_sql_literal(lower)}")
+            else:
+                conditions.append(
+                    f"{column} >= {_to_sql_literal(lower)} "
+                    f"AND {column} < {_to_sql_literal(upper)}"
+                )
+
+        return [
+            f"SELECT * FROM ({self.sql}) as T WHERE {condition}"
+            for condition in conditions
+        ]
+
     def _create_parallel_read_fn(self, task_id: int, parallelism: int):
         hash_fn = self.shard_hash_fn
         query = (
@@ -178,10 +281,38 @@ class SQLDatasource(Datasource):
             f"WHERE MOD(ABS({hash_fn}({self.shard_keys})), {parallelism}) = {task_id}"
         )
 
+        return self._create_read_fn(query)
+
+    def _create_read_fn(self, query: str):
         def read_fn() -> Iterable[Block]:
             with _connect(self.connection_factory) as cursor:
                 cursor.execute(query)
-                block = _cursor_to_block(cursor)
-                return [block]
+                yield from _cursor_to_blocks(cursor)
 
         return read_fn
+
+
+def _interpolate(min_value: Any, max_value: Any, i: int, n: int) -> Any:
+    """Returns the value at ``i / n`` of the range between the min and max values of
+    a numeric or timestamp column."""
+    if isinstance(min_value, bool) or not isinstance(
+        min_value, (int, float, decimal.Decimal, datetime.date)
+    ):
+        raise ValueError(
+            "Partition column has to be numeric or a timestamp, but got values of "
+            f"type {type(min_value).__name__}."
+        )
+
+    if isinstance(min_value, (int, decimal.Decimal)):
+        # NOTE: Integers are interpolated exactly (to not lose precision of large
+        #       values, like 64-bit ids).
+        return min_value + (max_value - min_value) * i // n
+    return min_value + (max_value - min_value) * i / n
+
+
+def _to_sql_literal(value: Any) -> str:
+    if isinstance(value, datetime.datetime):
+        return f"'{value.isoformat(sep=' ')}'"
+    if isinstance(value, datetime.date):
+        return f"'{value.isoformat()}'"
+    return repr(value) if isinstance(value, float) else str(value)
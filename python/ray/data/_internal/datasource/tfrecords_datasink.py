@@ -1,10 +1,13 @@
+import logging
+import posixpath
 import struct
-from typing import TYPE_CHECKING, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 
-from .tfrecords_datasource import _get_single_true_type
-from ray.data._internal.util import _check_import
+from .tfrecords_datasource import _get_index_path, _get_single_true_type
+from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.util import _check_import, call_with_retry
 from ray.data.block import BlockAccessor
 from ray.data.datasource.file_datasink import BlockBasedFileDatasink
 
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
     import tensorflow as tf
     from tensorflow_metadata.proto.v0 import schema_pb2
 
+logger = logging.getLogger(__name__)
+
 
 class TFRecordDatasink(BlockBasedFileDatasink):
     def __init__(
@@ -20,6 +25,7 @@ class TFRecordDatasink(BlockBasedFileDatasink):
         path: str,
         *,
         tf_schema: Optional["schema_pb2.Schema"] = None,
+        write_index: bool = False,
         file_format: str = "tar",
         **file_datasink_kwargs,
     ):
@@ -28,8 +34,40 @@ class TFRecordDatasink(BlockBasedFileDatasink):
         _check_import(self, module="crc32c", package="crc32c")
 
         self.tf_schema = tf_schema
+        self.write_index = write_index
+
+    def write_block(self, block: BlockAccessor, block_index: int, ctx: TaskContext):
+        # Record offsets of compressed files don't allow splitting the files.
+        if not self.write_index or self.open_stream_args.get("compression"):
+            return super().write_block(block, block_index, ctx)
+
+        filename = self.filename_provider.get_filename_for_block(
+            block, ctx.task_idx, block_index
+        )
+        write_path = posixpath.join(self.path, filename)
+
+        def write_block_to_path():
+            with self.open_output_stream(write_path) as file:
+                offsets = self._write_records(block, file)
+            # Write the index along with the file (see `_get_index_path`).
+            with self.open_output_stream(_get_index_path(write_path)) as file:
+                file.write(np.array(offsets, dtype="<u8").tobytes())
+
+        logger.debug(f"Writing {write_path} file (and its index).")
+        call_with_retry(
+            write_block_to_path,
+            description=f"write '{write_path}'",
+            match=self._data_context.retried_io_errors,
+        )
 
     def write_block_to_file(self, block: BlockAccessor, file: "pyarrow.NativeFile"):
+        self._write_records(block, file)
+
+    def _write_records(
+        self, block: BlockAccessor, file: "pyarrow.NativeFile"
+    ) -> List[int]:
+        """Writes the rows of the block to the file as records, returning the
+        offsets of the records followed by the size of the file."""
         arrow_table = block.to_arrow()
 
         # It seems like TFRecords are typically row-based,
@@ -40,8 +78,11 @@ class TFRecordDatasink(BlockBasedFileDatasink):
         examples = _convert_arrow_table_to_examples(arrow_table, self.tf_schema)
 
         # Write each example to the arrow file in the TFRecord format.
+        offsets = [0]
         for example in examples:
-            _write_record(file, example)
+            offsets.append(offsets[-1] + _write_record(file, example))
+
+        return offsets
 
 
 def _convert_arrow_table_to_examples(
@@ -183,7 +224,8 @@ def _value_to_feature(
 def _write_record(
     file: "pyarrow.NativeFile",
     example: "tf.train.Example",
-) -> None:
+) -> int:
+    """Writes the example as a record, returning the number of bytes written."""
     record = example.SerializeToString()
     length = len(record)
     length_bytes = struct.pack("<Q", length)
@@ -191,6 +233,7 @@ def _write_record(
     file.write(_masked_crc(length_bytes))
     file.write(record)
     file.write(_masked_crc(record))
+    return length + 16
 
 
 def _masked_crc(data: bytes) -> bytes:
@@ -1,14 +1,37 @@
 import logging
+import math
+import posixpath
 import struct
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 import pyarrow
 
+import ray
 from ray.air.util.tensor_extensions.arrow import pyarrow_table_from_pydict
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.util import RetryingContextManager, iterate_with_retry
 from ray.data.aggregate import AggregateFn
-from ray.data.block import Block
-from ray.data.datasource.file_based_datasource import FileBasedDatasource
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data.datasource.datasource import ReadTask
+from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
+    _add_partitions,
+    _unwrap_s3_serialization_workaround,
+    _wrap_s3_serialization_workaround,
+)
+from ray.data.datasource.partitioning import PathPartitionParser
 from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
@@ -39,16 +62,41 @@ class TFXReadOptions:
     auto_infer_schema: bool = True
 
 
+# Number of records decoded into a single table at once (see
+# `_convert_examples_to_table`).
+_DECODE_BATCH_SIZE = 1024
+
+# Record offsets of the (indexed) TFRecord files read by this process, keyed by
+# the paths and the sizes of the files.
+_record_offsets_cache: Dict[Tuple[str, int], np.ndarray] = {}
+
+
+@dataclass(frozen=True)
+class _TFRecordFileFragment:
+    """Byte range of a TFRecord file read by a single read task."""
+
+    path: str
+    # Offset of the first record of the range
+    offset: int
+    # Number of records of the range, or ``None`` if the whole file is read
+    num_records: Optional[int]
+    size_bytes: int
+
+
 class TFRecordDatasource(FileBasedDatasource):
     """TFRecord datasource, for reading and writing TFRecord files."""
 
     _FILE_EXTENSIONS = ["tfrecords"]
+    # Minimum size of the byte ranges that large (indexed) TFRecord files are split
+    # into, to avoid splitting files into many small read tasks.
+    _MIN_FILE_SPLIT_SIZE_BYTES = 32 * 1024 * 1024
 
     def __init__(
         self,
         paths: Union[str, List[str]],
         tf_schema: Optional["schema_pb2.Schema"] = None,
         tfx_read_options: Optional["TFXReadOptions"] = None,
+        build_index: bool = False,
         **file_based_datasource_kwargs,
     ):
         """
@@ -57,12 +105,224 @@ class TFRecordDatasource(FileBasedDatasource):
                 the schema of the underlying Dataset.
             tfx_read_options: Optional options for enabling reading tfrecords
                 using tfx-bsl.
+            build_index: Whether to index large TFRecord files missing index files
+                by scanning them (once per process), so that these can be split
+                into multiple read tasks as well.
 
         """
         super().__init__(paths, **file_based_datasource_kwargs)
 
         self._tf_schema = tf_schema
         self._tfx_read_options = tfx_read_options
+        self._build_index = build_index
+
+    def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+        paths = self._paths()
+        file_sizes = self._file_sizes()
+
+        # Files are only split if there are fewer files than read tasks.
+        if (
+            self._tfx_read_options
+            or len(paths) >= parallelism
+            or any(file_size is None for file_size in file_sizes)
+        ):
+            return super().get_read_tasks(parallelism)
+
+        fragments = self._split_files(paths, file_sizes, parallelism)
+        if len(fragments) == len(paths):
+            return super().get_read_tasks(parallelism)
+
+        if self._file_metadata_shuffler is not None:
+            fragments = [
+                fragments[i]
+                for i in self._file_metadata_shuffler.permutation(len(fragments))
+            ]
+
+        filesystem = _wrap_s3_serialization_workaround(self._filesystem)
+        open_stream_args = self._open_stream_args or {}
+        partitioning = self._partitioning
+
+        def read_fragments(
+            read_fragments: List[_TFRecordFileFragment],
+        ) -> Iterable[Block]:
+            fs = _unwrap_s3_serialization_workaround(filesystem)
+
+            for fragment in read_fragments:
+                partitions: Dict[str, str] = {}
+                if partitioning is not None:
+                    partitions = PathPartitionParser(partitioning)(fragment.path)
+
+                with RetryingContextManager(
+                    self._open_fragment(fs, fragment, **open_stream_args),
+                    context=self._data_context,
+                ) as f:
+                    for block in iterate_with_retry(
+                        lambda: self._default_read_stream(
+                            f, fragment.path, num_records=fragment.num_records
+                        ),
+                        description="read stream iteratively",
+                        match=self._data_context.retried_io_errors,
+                    ):
+                        if partitions:
+                            block = _add_partitions(block, partitions)
+                        if self._include_paths:
+                            block_accessor = BlockAccessor.for_block(block)
+                            block = block_accessor.fill_column("path", fragment.path)
+                        yield block
+
+        def create_read_task_fn(task_fragments):
+            def read_task_fn():
+                yield from read_fragments(task_fragments)
+
+            return read_task_fn
+
+        read_tasks = []
+        for indices in np.array_split(
+            np.arange(len(fragments)), min(parallelism, len(fragments))
+        ):
+            task_fragments = [fragments[i] for i in indices]
+            num_records = [fragment.num_records for fragment in task_fragments]
+            meta = BlockMetadata(
+                num_rows=None if None in num_records else sum(num_records),
+                size_bytes=sum(fragment.size_bytes for fragment in task_fragments),
+                schema=self._schema,
+                input_files=list(
+                    dict.fromkeys(fragment.path for fragment in task_fragments)
+                ),
+                exec_stats=None,
+            )
+            read_tasks.append(ReadTask(create_read_task_fn(task_fragments), meta))
+
+        return read_tasks
+
+    def _split_files(
+        self, paths: List[str], file_sizes: List[int], parallelism: int
+    ) -> List[_TFRecordFileFragment]:
+        """Splits the (indexed) files larger than the target size of the read tasks
+        into byte ranges of whole records."""
+        target_size = max(
+            sum(file_sizes) / parallelism, self._MIN_FILE_SPLIT_SIZE_BYTES
+        )
+        record_offsets = self._get_record_offsets(
+            [
+                (path, file_size)
+                for path, file_size in zip(paths, file_sizes)
+                if file_size > target_size and not self._is_compressed(path)
+            ]
+        )
+
+        fragments = []
+        for path, file_size in zip(paths, file_sizes):
+            offsets = record_offsets.get(path)
+            if offsets is None:
+                fragments.append(_TFRecordFileFragment(path, 0, None, file_size))
+                continue
+
+            num_ranges = math.ceil(file_size / target_size)
+            # Indices of the first records of the ranges (and of the end of file).
+            bounds = np.append(
+                np.unique(
+                    np.searchsorted(
+                        offsets[:-1], np.arange(num_ranges) * file_size / num_ranges
+                    )
+                ),
+                len(offsets) - 1,
+            )
+            for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                fragments.append(
+                    _TFRecordFileFragment(
+                        path,
+                        int(offsets[start]),
+                        end - start,
+                        int(offsets[end] - offsets[start]),
+                    )
+                )
+
+        return fragments
+
+    def _get_record_offsets(
+        self, files: List[Tuple[str, int]]
+    ) -> Dict[str, np.ndarray]:
+        """Returns the record offsets of the indexed files (read from their index
+        files or, if ``build_index``, built by scanning the files)."""
+        from pyarrow.fs import FileType
+
+        record_offsets = {}
+        uncached_files = [
+            (path, file_size)
+            for path, file_size in files
+            if (path, file_size) not in _record_offsets_cache
+        ]
+
+        index_infos = self._filesystem.get_file_info(
+            [_get_index_path(path) for path, _ in uncached_files]
+        )
+        unindexed_files = []
+        for (path, file_size), index_info in zip(uncached_files, index_infos):
+            if index_info.type == FileType.File:
+                with self._filesystem.open_input_stream(index_info.path) as f:
+                    record_offsets[path] = np.frombuffer(f.read(), dtype="<u8")
+            else:
+                unindexed_files.append((path, file_size))
+
+        if self._build_index and unindexed_files:
+            filesystem = _wrap_s3_serialization_workaround(self._filesystem)
+            build_record_offsets = cached_remote_fn(_build_record_offsets)
+            for (path, _), offsets in zip(
+                unindexed_files,
+                ray.get(
+                    [
+                        build_record_offsets.remote(filesystem, path)
+                        for path, _ in unindexed_files
+                    ]
+                ),
+            ):
+                record_offsets[path] = offsets
+
+        for path, file_size in uncached_files:
+            offsets = record_offsets.get(path)
+            if offsets is None:
+                continue
+            if len(offsets) == 0 or offsets[-1] != file_size:
+                logger.warning(
+                    f"Ignoring index of TFRecord file {path}, since it doesn't "
+                    "match the file (the file might have been modified)."
+                )
+                del record_offsets[path]
+                continue
+            _record_offsets_cache[(path, file_size)] = offsets
+
+        return {
+            path: _record_offsets_cache[(path, file_size)]
+            for path, file_size in files
+            if (path, file_size) in _record_offsets_cache
+        }
+
+    def _is_compressed(self, path: str) -> bool:
+        if (self._open_stream_args or {}).get("compression") is not None:
+            return True
+        try:
+            pyarrow.Codec.detect(path)
+            return True
+        except (ValueError, TypeError):
+            return path.endswith(".snappy")
+
+    def _open_fragment(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        fragment: _TFRecordFileFragment,
+        **open_args: Any,
+    ) -> "pyarrow.NativeFile":
+        if fragment.num_records is None:
+            return self._open_input_source(filesystem, fragment.path, **open_args)
+
+        buffer_size = open_args.get("buffer_size")
+        if buffer_size is None:
+            buffer_size = self._data_context.streaming_read_buffer_size
+
+        file = filesystem.open_input_file(fragment.path)
+        file.seek(fragment.offset)
+        return pyarrow.BufferedInputStream(file, buffer_size)
 
     def _read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
         if self._tfx_read_options:
@@ -71,12 +331,16 @@ class TFRecordDatasource(FileBasedDatasource):
             yield from self._default_read_stream(f, path)
 
     def _default_read_stream(
-        self, f: "pyarrow.NativeFile", path: str
+        self,
+        f: "pyarrow.NativeFile",
+        path: str,
+        num_records: Optional[int] = None,
     ) -> Iterator[Block]:
         import tensorflow as tf
         from google.protobuf.message import DecodeError
 
-        for record in _read_records(f, path):
+        examples = []
+        for record in _read_records(f, path, num_records=num_records):
             example = tf.train.Example()
             try:
                 example.ParseFromString(record)
@@ -87,9 +351,13 @@ class TFRecordDatasource(FileBasedDatasource):
                     f"file contains a message type other than `tf.train.Example`: {e}"
                 )
 
-            yield pyarrow_table_from_pydict(
-                _convert_example_to_dict(example, self._tf_schema)
-            )
+            examples.append(example)
+            if len(examples) == _DECODE_BATCH_SIZE:
+                yield _convert_examples_to_table(examples, self._tf_schema)
+                examples = []
+
+        if examples:
+            yield _convert_examples_to_table(examples, self._tf_schema)
 
     def _tfx_read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
         import tensorflow as tf
@@ -149,26 +417,66 @@ class TFRecordDatasource(FileBasedDatasource):
         return relative_path
 
 
-def _convert_example_to_dict(
-    example: "tf.train.Example",
+def _convert_examples_to_table(
+    examples: List["tf.train.Example"],
     tf_schema: Optional["schema_pb2.Schema"],
-) -> Dict[str, pyarrow.Array]:
-    record = {}
+) -> pyarrow.Table:
+    """Converts a batch of examples into a table, building every column from the
+    values of all the examples at once."""
+    import pyarrow as pa
+
     schema_dict = {}
     # Convert user-specified schema into dict for convenient mapping
     if tf_schema is not None:
         for schema_feature in tf_schema.feature:
             schema_dict[schema_feature.name] = schema_feature.type
 
-    for feature_name, feature in example.features.feature.items():
-        if tf_schema is not None and feature_name not in schema_dict:
-            raise ValueError(
-                f"Found extra unexpected feature {feature_name} "
-                f"not in specified schema: {tf_schema}"
+    # Values of the features of every example (`None` if the example is missing
+    # the feature), and the types of the values (`None` if not known).
+    values: Dict[str, List[Optional[List[Any]]]] = {}
+    types: Dict[str, Optional[pa.DataType]] = {}
+    for i, example in enumerate(examples):
+        for feature_name, feature in example.features.feature.items():
+            if tf_schema is not None and feature_name not in schema_dict:
+                raise ValueError(
+                    f"Found extra unexpected feature {feature_name} "
+                    f"not in specified schema: {tf_schema}"
+                )
+            if feature_name not in values:
+                values[feature_name] = [None] * i
+                types[feature_name] = None
+
+            value, type_ = _get_feature_values(feature, schema_dict.get(feature_name))
+            values[feature_name].append(value)
+            if type_ is not None:
+                types[feature_name] = type_
+
+        for feature_values in values.values():
+            if len(feature_values) == i:
+                feature_values.append(None)
+
+    columns = {}
+    for feature_name, feature_values in values.items():
+        type_ = types[feature_name]
+        if (
+            schema_dict.get(feature_name) is None
+            and type_ is not None
+            and all(value is None or len(value) <= 1 for value in feature_values)
+        ):
+            # Use the values themselves if the features contain single values (and
+            # empty values are missing ones). This is to give better user
+            # experience when writing preprocessing UDF on these single-value lists.
+            columns[feature_name] = pa.array(
+                [value[0] if value else None for value in feature_values], type=type_
+            )
+        else:
+            # If no type is known, set the type to null for now; later, the type is
+            # inferred from other batches which have non-empty values.
+            columns[feature_name] = pa.array(
+                feature_values, type=pa.list_(type_ or pa.null())
             )
-        schema_feature_type = schema_dict.get(feature_name)
-        record[feature_name] = _get_feature_value(feature, schema_feature_type)
-    return record
+
+    return pyarrow_table_from_pydict(columns)
 
 
 def _get_single_true_type(dct) -> str:
@@ -180,10 +488,12 @@ def _get_single_true_type(dct) -> str:
     return next(filtered_types, None)
 
 
-def _get_feature_value(
+def _get_feature_values(
     feature: "tf.train.Feature",
     schema_feature_type: Optional["schema_pb2.FeatureType"] = None,
-) -> pyarrow.Array:
+) -> Tuple[List[Any], Optional[pyarrow.DataType]]:
+    """Returns the values of the feature along with their type (or ``None`` if the
+    feature is empty and no type is specified in the user-provided schema)."""
     import pyarrow as pa
 
     underlying_feature_type = {
@@ -231,22 +541,14 @@ def _get_feature_value(
         type_ = pa.int64()
     else:
         value = []
-        type_ = pa.null()
+        type_ = None
     value = list(value)
-    if len(value) == 1 and schema_feature_type is None:
-        # Use the value itself if the features contains a single value.
-        # This is to give better user experience when writing preprocessing UDF on
-        # these single-value lists.
-        value = value[0]
-    else:
+    if len(value) == 0 and schema_feature_type is None:
         # If the feature value is empty and no type is specified in the user-provided
-        # schema, set the type to null for now to allow pyarrow to construct a valid
-        # Array; later, infer the type from other records which have non-empty values
-        # for the feature.
-        if len(value) == 0:
-            type_ = pa.null()
-        type_ = pa.list_(type_)
-    return pa.array([value], type=type_)
+        # schema, leave the type unknown for now; later, infer the type from other
+        # records which have non-empty values for the feature.
+        type_ = None
+    return value, type_
 
 
 # Adapted from https://github.com/vahidk/tfrecord/blob/74b2d24a838081356d993ec0e147eaf59ccd4c84/tfrecord/reader.py#L16-L96  # noqa: E501
@@ -275,9 +577,10 @@ def _get_feature_value(
 def _read_records(
     file: "pyarrow.NativeFile",
     path: str,
+    num_records: Optional[int] = None,
 ) -> Iterable[memoryview]:
     """
-    Read records from TFRecord file.
+    Read records from TFRecord file (up to ``num_records`` records, if specified).
 
     A TFRecord file contains a sequence of records. The file can only be read
     sequentially. Each record is stored in the following formats:
@@ -293,7 +596,7 @@ def _read_records(
     crc_bytes = bytearray(4)
     datum_bytes = bytearray(1024 * 1024)
     row_count = 0
-    while True:
+    while num_records is None or row_count < num_records:
         try:
             # Read "length" field.
             num_length_bytes_read = file.readinto(length_bytes)
@@ -349,6 +652,31 @@ def _read_records(
             raise RuntimeError(error_message) from e
 
 
+def _get_index_path(path: str) -> str:
+    """Returns the path of the index file of the TFRecord file.
+
+    The index file holds the offsets of the records of the file (followed by the
+    size of the file) as little-endian uint64s. The name of the index file is
+    prefixed with a dot, so that it's skipped when reading the directory.
+    """
+    dirname, basename = posixpath.split(path)
+    return posixpath.join(dirname, f".{basename}.index")
+
+
+def _build_record_offsets(filesystem: "pyarrow.fs.FileSystem", path: str) -> np.ndarray:
+    """Builds the index of the TFRecord file by scanning its records (see
+    `_get_index_path`)."""
+    filesystem = _unwrap_s3_serialization_workaround(filesystem)
+
+    offsets = [0]
+    with filesystem.open_input_stream(path) as f:
+        for record in _read_records(f, path):
+            # Length (8 bytes), its CRC (4 bytes), data, and its CRC (4 bytes).
+            offsets.append(offsets[-1] + len(record) + 16)
+
+    return np.array(offsets, dtype="<u8")
+
+
 def _cast_large_list_to_list(batch: pyarrow.Table):
     """
     This function transform pyarrow.large_list into list and pyarrow.large_binary into
@@ -3,12 +3,15 @@ from typing import TYPE_CHECKING
 import ray
 from .backpressure_policy import BackpressurePolicy
 from .concurrency_cap_backpressure_policy import ConcurrencyCapBackpressurePolicy
+from .consumption_rate_backpressure_policy import ConsumptionRateBackpressurePolicy
 
 if TYPE_CHECKING:
     from ray.data._internal.execution.streaming_executor_state import Topology
 
 # Default enabled backpressure policies and its config key.
 # Use `DataContext.set_config` to config it.
+# NOTE: `ConsumptionRateBackpressurePolicy` is opt-in, and could be enabled by
+# adding it to the list of policies.
 ENABLED_BACKPRESSURE_POLICIES = [
     ConcurrencyCapBackpressurePolicy,
 ]
@@ -27,6 +30,7 @@ def get_backpressure_policies(topology: "Topology"):
 __all__ = [
     "BackpressurePolicy",
     "ConcurrencyCapBackpressurePolicy",
+    "ConsumptionRateBackpressurePolicy",
     "ENABLED_BACKPRESSURE_POLICIES_CONFIG_KEY",
     "get_backpressure_policies",
 ]
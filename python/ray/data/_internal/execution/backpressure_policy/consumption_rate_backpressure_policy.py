@@ -0,0 +1,171 @@
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import ray
+from .backpressure_policy import BackpressurePolicy
+from ray.data._internal.execution.operators.map_operator import MapOperator
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+logger = logging.getLogger(__name__)
+
+
+class ConsumptionRateBackpressurePolicy(BackpressurePolicy):
+    """A backpressure policy that keeps the object store memory buffered between
+    an operator and its downstream operators near a target derived from the rate
+    at which the downstream operators consume it.
+
+    For every operator whose outputs are consumed by map operators, the policy
+    tracks the rate (in bytes per second) at which the downstream operators submit
+    inputs to their tasks. The data buffered in between is comprised of
+
+        - The operator's output queue
+        - The downstream operators' internal input queues
+        - The outputs of the operator's running tasks that haven't been taken yet
+
+    New tasks of the operator are only launched while the buffered data, plus the
+    expected output of one more task, doesn't exceed the amount of data the
+    downstream operators consume in `target_buffer_seconds` (but no less than
+    `min_buffer_bytes`). This way fast producers (e.g. reads) don't fill up the
+    object store ahead of slow consumers (e.g. GPU inference), while slow consumers
+    still have enough data buffered not to go idle.
+
+    NOTE: Operators consumed by non-map operators (for ex, all-to-all ones) aren't
+    backpressured by this policy, since their consumption doesn't free buffered data.
+
+    Both parameters can be configured with `DataContext.set_config` (see
+    `TARGET_BUFFER_SECONDS_CONFIG_KEY` and `MIN_BUFFER_BYTES_CONFIG_KEY`).
+    """
+
+    TARGET_BUFFER_SECONDS_CONFIG_KEY = (
+        "backpressure_policies.consumption_rate.target_buffer_seconds"
+    )
+    MIN_BUFFER_BYTES_CONFIG_KEY = (
+        "backpressure_policies.consumption_rate.min_buffer_bytes"
+    )
+
+    DEFAULT_TARGET_BUFFER_SECONDS = 10.0
+
+    # Min interval between subsequent samples of the consumption rate.
+    RATE_SAMPLE_INTERVAL_S = 1.0
+    # Weight of the latest sample in the (exponentially) smoothed consumption rate.
+    RATE_SMOOTHING_FACTOR = 0.5
+
+    def __init__(self, topology: "Topology"):
+        self._topology = topology
+
+        data_context = ray.data.DataContext.get_current()
+        self._target_buffer_seconds: float = data_context.get_config(
+            self.TARGET_BUFFER_SECONDS_CONFIG_KEY, self.DEFAULT_TARGET_BUFFER_SECONDS
+        )
+        # NOTE: By default at least 2 blocks are allowed to be buffered
+        self._min_buffer_bytes: int = data_context.get_config(
+            self.MIN_BUFFER_BYTES_CONFIG_KEY,
+            2 * (data_context.target_max_block_size or 0),
+        )
+
+        self._downstream_ops: Dict["PhysicalOperator", List[MapOperator]] = {}
+        self._consumption_rates: Dict[MapOperator, _ByteRate] = {}
+
+        for op in topology:
+            downstream_ops = op.output_dependencies
+            if downstream_ops and all(
+                isinstance(dep, MapOperator) for dep in downstream_ops
+            ):
+                self._downstream_ops[op] = list(downstream_ops)
+                for downstream_op in downstream_ops:
+                    self._consumption_rates[downstream_op] = _ByteRate(
+                        sample_interval_s=self.RATE_SAMPLE_INTERVAL_S,
+                        smoothing_factor=self.RATE_SMOOTHING_FACTOR,
+                    )
+
+        logger.debug(
+            "ConsumptionRateBackpressurePolicy initialized with: "
+            f"target_buffer_seconds={self._target_buffer_seconds}, "
+            f"min_buffer_bytes={self._min_buffer_bytes}, "
+            f"backpressured_ops={[op.name for op in self._downstream_ops]}"
+        )
+
+    def can_add_input(self, op: "PhysicalOperator") -> bool:
+        downstream_ops = self._downstream_ops.get(op)
+        if downstream_ops is None:
+            return True
+
+        now = time.monotonic()
+        consumption_rate = 0.0
+        for downstream_op in downstream_ops:
+            rate = self._consumption_rates[downstream_op]
+            rate.update(downstream_op.metrics.bytes_inputs_of_submitted_tasks, now)
+            consumption_rate += rate.get() or 0.0
+
+        # NOTE: Downstream operators not running any tasks are waiting for inputs
+        #       (for ex, to assemble a batch), and hence must not be starved
+        if all(
+            downstream_op.metrics.num_tasks_running == 0
+            for downstream_op in downstream_ops
+        ):
+            return True
+
+        buffered_bytes = self.get_buffered_bytes(op)
+        target_buffered_bytes = max(
+            self._min_buffer_bytes, consumption_rate * self._target_buffer_seconds
+        )
+        expected_task_output_bytes = op.metrics.average_bytes_outputs_per_task or 0
+
+        return buffered_bytes + expected_task_output_bytes <= target_buffered_bytes
+
+    def get_buffered_bytes(self, op: "PhysicalOperator") -> int:
+        """Returns the size (in bytes) of the outputs of the operator that haven't
+        been consumed by its downstream operators yet."""
+        buffered_bytes = self._topology[op].outqueue_memory_usage()
+        buffered_bytes += op.metrics.obj_store_mem_internal_outqueue
+        buffered_bytes += op.metrics.obj_store_mem_pending_task_outputs or 0
+
+        for downstream_op in self._downstream_ops.get(op, []):
+            buffered_bytes += downstream_op.metrics.obj_store_mem_internal_inqueue
+
+        return buffered_bytes
+
+
+class _ByteRate:
+    """Exponentially smoothed rate (per second) of a monotonically increasing
+    byte counter."""
+
+    def __init__(self, *, sample_interval_s: float, smoothing_factor: float):
+        self._sample_interval_s = sample_interval_s
+        self._smoothing_factor = smoothing_factor
+
+        self._last_sample_time: Optional[float] = None
+        self._last_num_bytes: int = 0
+        self._rate: Optional[float] = None
+
+    def update(self, num_bytes: int, now: float):
+        if self._last_sample_time is None:
+            self._last_sample_time = now
+            self._last_num_bytes = num_bytes
+            return
+
+        elapsed = now - self._last_sample_time
+        if elapsed < self._sample_interval_s:
+            return
+
+        sample = (num_bytes - self._last_num_bytes) / elapsed
+        if self._rate is None:
+            self._rate = sample
+        else:
+            self._rate = (
+                self._smoothing_factor * sample
+                + (1 - self._smoothing_factor) * self._rate
+            )
+
+        self._last_sample_time = now
+        self._last_num_bytes = num_bytes
+
+    def get(self) -> Optional[float]:
+        """Returns the rate, or None if it hasn't been sampled yet."""
+        return self._rate
@@ -1,9 +1,30 @@
+from typing import Optional
+
 from .bundle_queue import BundleQueue
 from .fifo_bundle_queue import FIFOBundleQueue
+from .largest_first_bundle_queue import LargestFirstBundleQueue
+from .locality_aware_bundle_queue import LocalityAwareBundleQueue
+from .ordered_lookahead_bundle_queue import OrderedLookaheadBundleQueue
+from ray.data.context import BundleQueueType
 
 
-def create_bundle_queue() -> BundleQueue:
-    return FIFOBundleQueue()
+def create_bundle_queue(
+    queue_type: BundleQueueType = BundleQueueType.FIFO,
+    *,
+    lookahead: Optional[int] = None,
+) -> BundleQueue:
+    queue_type = BundleQueueType(queue_type)
+    if queue_type == BundleQueueType.FIFO:
+        return FIFOBundleQueue()
+    elif queue_type == BundleQueueType.LOCALITY_AWARE:
+        return LocalityAwareBundleQueue()
+    elif queue_type == BundleQueueType.LARGEST_FIRST:
+        return LargestFirstBundleQueue()
+    elif queue_type == BundleQueueType.ORDERED_LOOKAHEAD:
+        assert lookahead is not None, "Lookahead is required for ORDERED_LOOKAHEAD"
+        return OrderedLookaheadBundleQueue(lookahead)
+    else:
+        raise ValueError(f"Unsupported bundle queue type: {queue_type}")
 
 
 __all__ = ["BundleQueue", "create_bundle_queue"]
@@ -1,8 +1,8 @@
 import abc
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
 
 if TYPE_CHECKING:
-    from ray.data._internal.execution.interfaces import RefBundle
+    from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
 
 
 class BundleQueue(abc.ABC):
@@ -38,6 +38,19 @@ class BundleQueue(abc.ABC):
         """
         ...
 
+    def peek_for_locations(
+        self, node_ids: Sequence["NodeIdStr"]
+    ) -> Optional["RefBundle"]:
+        """Return the bundle to be processed next on one of the provided nodes,
+        without removing it.
+
+        Nodes are ordered by preference (most preferred first). By default, the
+        locations are ignored and the head of the queue is returned.
+
+        If the queue is empty, return `None`.
+        """
+        return self.peek()
+
     @abc.abstractmethod
     def remove(self, bundle: "RefBundle"):
         """Remove a bundle from the queue."""
@@ -60,3 +73,7 @@ class BundleQueue(abc.ABC):
         This method is used for testing.
         """
         ...
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return queue-level stats (reported as the operator's extra metrics)."""
+        return {}
@@ -31,6 +31,8 @@ class FIFOBundleQueue(BundleQueue):
 
         self._nbytes = 0
         self._num_bundles = 0
+        # Number of bundles removed ahead of the bundles added before them.
+        self._num_reordered_bundles = 0
 
     def __len__(self) -> int:
         return self._num_bundles
@@ -88,6 +90,9 @@ class FIFOBundleQueue(BundleQueue):
         if not self._bundle_to_nodes[bundle]:
             del self._bundle_to_nodes[bundle]
 
+        if node is not self._head:
+            self._num_reordered_bundles += 1
+
         # Case 2: The bundle is the only element in the queue.
         if self._head is self._tail:
             self._head = None
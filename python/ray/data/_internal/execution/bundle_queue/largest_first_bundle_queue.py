@@ -0,0 +1,122 @@
+import heapq
+import itertools
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .bundle_queue import BundleQueue
+from .fifo_bundle_queue import FIFOBundleQueue
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces import RefBundle
+
+
+class LargestFirstBundleQueue(BundleQueue):
+    """A bundle queue that returns the largest (in bytes) bundle first.
+
+    Bundles of the same size are returned in the order they were added. Processing
+    the largest bundles first avoids large bundles (received late) becoming
+    stragglers when the bundle sizes are heterogeneous.
+    """
+
+    def __init__(self):
+        # Bundles in the order they were added. Used to remove bundles and to
+        # track the number of bundles removed out of order.
+        self._queue = FIFOBundleQueue()
+        # Max-heap of (negated size in bytes, insertion index, bundle) entries.
+        #
+        # NOTE: Entries of removed bundles are removed from the heap lazily: entries
+        #       of a bundle are skipped while there are more of them in the heap than
+        #       instances of the bundle in the queue. Since all entries of the same
+        #       bundle have the same size, it doesn't matter which ones are skipped.
+        self._heap: List[Tuple[int, int, "RefBundle"]] = []
+        self._num_heap_entries: Dict["RefBundle", int] = defaultdict(int)
+        self._num_instances: Dict["RefBundle", int] = defaultdict(int)
+        self._insertion_index = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __contains__(self, bundle: "RefBundle") -> bool:
+        return bundle in self._queue
+
+    def add(self, bundle: "RefBundle") -> None:
+        self._queue.add(bundle)
+        heapq.heappush(
+            self._heap, (-bundle.size_bytes(), next(self._insertion_index), bundle)
+        )
+        self._num_heap_entries[bundle] += 1
+        self._num_instances[bundle] += 1
+
+    def pop(self) -> "RefBundle":
+        """Return the largest bundle in the queue."""
+        bundle = self.peek()
+        if bundle is None:
+            raise IndexError("You can't pop from an empty queue")
+
+        self.remove(bundle)
+
+        return bundle
+
+    def peek(self) -> Optional["RefBundle"]:
+        """Return the largest bundle in the queue without removing it."""
+        while self._heap:
+            _, _, bundle = self._heap[0]
+            if self._num_heap_entries[bundle] <= self._num_instances.get(bundle, 0):
+                return bundle
+            # Skip the entry of the removed bundle.
+            heapq.heappop(self._heap)
+            self._num_heap_entries[bundle] -= 1
+            if not self._num_heap_entries[bundle]:
+                del self._num_heap_entries[bundle]
+
+        return None
+
+    def remove(self, bundle: "RefBundle"):
+        """Remove a bundle from the queue."""
+        self._queue.remove(bundle)
+
+        self._num_instances[bundle] -= 1
+        if not self._num_instances[bundle]:
+            del self._num_instances[bundle]
+
+        if not self._queue:
+            self._heap.clear()
+            self._num_heap_entries.clear()
+        elif len(self._heap) > 2 * len(self._queue):
+            self._compact()
+
+        return bundle
+
+    def _compact(self):
+        """Drop the heap entries of the removed bundles."""
+        num_remaining = dict(self._num_instances)
+        heap = []
+        for entry in self._heap:
+            bundle = entry[2]
+            if num_remaining.get(bundle, 0) > 0:
+                num_remaining[bundle] -= 1
+                heap.append(entry)
+
+        heapq.heapify(heap)
+        self._heap = heap
+        self._num_heap_entries = defaultdict(int, self._num_instances)
+
+    def clear(self):
+        self._queue.clear()
+        self._heap.clear()
+        self._num_heap_entries.clear()
+        self._num_instances.clear()
+
+    def estimate_size_bytes(self) -> int:
+        return self._queue.estimate_size_bytes()
+
+    def is_empty(self):
+        return (
+            self._queue.is_empty()
+            and not self._heap
+            and not self._num_heap_entries
+            and not self._num_instances
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"num_reordered_bundles": self._queue._num_reordered_bundles}
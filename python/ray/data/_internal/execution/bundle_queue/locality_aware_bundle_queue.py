@@ -0,0 +1,78 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+from .fifo_bundle_queue import FIFOBundleQueue
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
+
+
+def get_preferred_location(bundle: "RefBundle") -> Optional["NodeIdStr"]:
+    """Return the node holding the largest number of bytes of the bundle, or `None`
+    if the locations of the bundle's blocks are unknown."""
+    locs = bundle.get_preferred_object_locations()
+    if not locs:
+        return None
+    return max(locs, key=locs.get)
+
+
+class LocalityAwareBundleQueue(FIFOBundleQueue):
+    """A bundle queue that prefers bundles whose blocks are on the provided nodes.
+
+    The head of the queue (see `peek` and `pop`) is the same as for the
+    `FIFOBundleQueue`, while `peek_for_locations` returns the first bundle (in the
+    order bundles were added) whose preferred location is the most preferred of the
+    provided nodes, falling back to the less preferred nodes and then to the head of
+    the queue.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Bundles (mapped to the number of their instances in the queue) by their
+        # preferred location, in the order they were added. Bundles with unknown
+        # locations aren't tracked.
+        self._bundles_by_location: Dict[
+            "NodeIdStr", Dict["RefBundle", int]
+        ] = defaultdict(dict)
+
+    def add(self, bundle: "RefBundle") -> None:
+        super().add(bundle)
+
+        node_id = get_preferred_location(bundle)
+        if node_id is not None:
+            bundles = self._bundles_by_location[node_id]
+            bundles[bundle] = bundles.get(bundle, 0) + 1
+
+    def peek_for_locations(
+        self, node_ids: Sequence["NodeIdStr"]
+    ) -> Optional["RefBundle"]:
+        for node_id in node_ids:
+            bundles = self._bundles_by_location.get(node_id)
+            if bundles:
+                return next(iter(bundles))
+
+        return self.peek()
+
+    def remove(self, bundle: "RefBundle"):
+        bundle = super().remove(bundle)
+
+        node_id = get_preferred_location(bundle)
+        if node_id is not None:
+            bundles = self._bundles_by_location[node_id]
+            bundles[bundle] -= 1
+            if not bundles[bundle]:
+                del bundles[bundle]
+            if not bundles:
+                del self._bundles_by_location[node_id]
+
+        return bundle
+
+    def clear(self):
+        super().clear()
+        self._bundles_by_location.clear()
+
+    def is_empty(self):
+        return super().is_empty() and not self._bundles_by_location
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"num_reordered_bundles": self._num_reordered_bundles}
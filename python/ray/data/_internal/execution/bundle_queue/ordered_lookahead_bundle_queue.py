@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+from .fifo_bundle_queue import FIFOBundleQueue
+from .locality_aware_bundle_queue import get_preferred_location
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
+
+
+class OrderedLookaheadBundleQueue(FIFOBundleQueue):
+    """A bundle queue that follows a first-in-first-out policy, except for allowing
+    bundles local to the provided nodes to skip ahead of at most `lookahead - 1`
+    other bundles.
+
+    Unlike the `LocalityAwareBundleQueue`, this bounds how far bundles can be
+    reordered (and hence, for operators preserving the order of their outputs, the
+    number of outputs buffered while waiting for the preceding ones).
+    """
+
+    def __init__(self, lookahead: int):
+        super().__init__()
+
+        if lookahead < 1:
+            raise ValueError(f"Lookahead must be positive (got {lookahead})")
+
+        self._lookahead = lookahead
+
+    def peek_for_locations(
+        self, node_ids: Sequence["NodeIdStr"]
+    ) -> Optional["RefBundle"]:
+        """Return the first of the `lookahead` bundles at the head of the queue whose
+        preferred location is one of the provided nodes, or the head of the queue if
+        there is none."""
+        node_ids = set(node_ids)
+
+        node = self._head
+        for _ in range(self._lookahead):
+            if node is None:
+                break
+            if get_preferred_location(node.value) in node_ids:
+                return node.value
+            node = node.next
+
+        return self.peek()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"num_reordered_bundles": self._num_reordered_bundles}
@@ -15,7 +15,13 @@ class OutputIterator(Iterator[RefBundle], ABC):
     """
 
     @abstractmethod
-    def get_next(self, output_split_idx: Optional[int] = None) -> RefBundle:
+    def get_next(
+        self,
+        output_split_idx: Optional[int] = None,
+        *,
+        steal: bool = False,
+        block: bool = True,
+    ) -> Optional[RefBundle]:
         """Can be used to pull outputs by a specified output index.
 
         This is used to support the streaming_split() API, where the output of a
@@ -24,6 +30,10 @@ class OutputIterator(Iterator[RefBundle], ABC):
         Args:
             output_split_idx: The output split index to get results for. This arg is
                 only allowed for iterators created by `Dataset.streaming_split()`.
+            steal: Whether to take an output of another split (the one with the
+                most outputs queued) if there's none of the given split available.
+            block: Whether to block until an output is available. If ``False``,
+                ``None`` is returned if there's none available.
 
         Raises:
             StopIteration: If there are no more outputs to return.
@@ -70,10 +70,19 @@ def execute_to_legacy_bundle_iterator(
                 exec_stats=None,
             )
 
-        def get_next(self, output_split_idx: Optional[int] = None) -> RefBundle:
+        def get_next(
+            self,
+            output_split_idx: Optional[int] = None,
+            *,
+            steal: bool = False,
+            block: bool = True,
+        ) -> Optional[RefBundle]:
             try:
-                bundle = self._base_iterator.get_next(output_split_idx)
-                self._collect_metadata(bundle)
+                bundle = self._base_iterator.get_next(
+                    output_split_idx, steal=steal, block=block
+                )
+                if bundle is not None:
+                    self._collect_metadata(bundle)
                 return bundle
             except StopIteration:
                 # Once the iterator is completely exhausted, we are done
@@ -2,8 +2,19 @@ import logging
 import time
 import uuid
 import warnings
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import ray
 from ray.actor import ActorHandle
@@ -135,7 +146,17 @@ class ActorPoolMapOperator(MapOperator):
             self.data_context._enable_actor_pool_on_exit_hook,
         )
         # A queue of bundles awaiting dispatch to actors.
-        self._bundle_queue = create_bundle_queue()
+        self._bundle_queue = create_bundle_queue(
+            self.data_context.actor_pool_bundle_queue_type,
+            lookahead=self.data_context.actor_pool_bundle_queue_lookahead,
+        )
+        # Indices of the tasks that will process the queued bundles, assigned in the
+        # order bundles are received (rather than dispatched), so that the order of
+        # the outputs is preserved regardless of the bundle queue type.
+        self._queued_bundles_task_indices: Dict[RefBundle, Deque[int]] = defaultdict(
+            deque
+        )
+        self._next_queued_bundle_task_idx = 0
         # Cached actor class.
         self._cls = None
         # Whether no more submittable bundles will be added.
@@ -230,6 +251,10 @@ class ActorPoolMapOperator(MapOperator):
 
     def _add_bundled_input(self, bundle: RefBundle):
         self._bundle_queue.add(bundle)
+        self._queued_bundles_task_indices[bundle].append(
+            self._next_queued_bundle_task_idx
+        )
+        self._next_queued_bundle_task_idx += 1
         self._metrics.on_input_queued(bundle)
         # Try to dispatch all bundles in the queue, including this new bundle.
         self._dispatch_tasks()
@@ -243,20 +268,29 @@ class ActorPoolMapOperator(MapOperator):
             * a new worker has been created.
         """
         while self._bundle_queue:
-            # Pick an actor from the pool.
+            # Pick the next bundle and an actor from the pool.
             if self._actor_locality_enabled:
-                actor = self._actor_pool.pick_actor(self._bundle_queue.peek())
+                # NOTE: Locality-aware bundle queues prefer bundles local to the
+                #       least loaded actors available
+                bundle = self._bundle_queue.peek_for_locations(
+                    self._actor_pool.get_available_actor_locations()
+                )
+                actor = self._actor_pool.pick_actor(bundle)
             else:
+                bundle = self._bundle_queue.peek()
                 actor = self._actor_pool.pick_actor()
             if actor is None:
                 # No actors available for executing the next task.
                 break
             # Submit the map task.
-            bundle = self._bundle_queue.pop()
+            self._bundle_queue.remove(bundle)
             self._metrics.on_input_dequeued(bundle)
+            task_index = self._queued_bundles_task_indices[bundle].popleft()
+            if not self._queued_bundles_task_indices[bundle]:
+                del self._queued_bundles_task_indices[bundle]
             input_blocks = [block for block, _ in bundle.blocks]
             ctx = TaskContext(
-                task_idx=self._next_data_task_idx,
+                task_idx=task_index,
                 op_name=self.name,
                 target_max_block_size=self.actual_target_max_block_size,
             )
@@ -280,7 +314,10 @@ class ActorPoolMapOperator(MapOperator):
             from functools import partial
 
             self._submit_data_task(
-                gen, bundle, partial(_task_done_callback, actor_to_return=actor)
+                gen,
+                bundle,
+                partial(_task_done_callback, actor_to_return=actor),
+                task_index=task_index,
             )
 
     def _refresh_actor_cls(self):
@@ -393,6 +430,8 @@ class ActorPoolMapOperator(MapOperator):
             res["locality_misses"] = self._actor_pool._locality_misses
         res["pending_actors"] = self._actor_pool.num_pending_actors()
         res["restarting_actors"] = self._actor_pool.num_restarting_actors()
+        for name, value in self._bundle_queue.get_stats().items():
+            res[f"bundle_queue_{name}"] = value
         return res
 
     @staticmethod
@@ -725,15 +764,7 @@ class _ActorPool(AutoscalingActorPool):
             # Actor pool is empty or all actors are still pending.
             return None
 
-        # Filter out actors that are invalid, i.e. actors with number of tasks in
-        # flight >= _max_tasks_in_flight or actor_state is not ALIVE.
-        valid_actors = [
-            actor
-            for actor in self._running_actors
-            if self._running_actors[actor].num_tasks_in_flight
-            < self._max_tasks_in_flight
-            and not self._running_actors[actor].is_restarting
-        ]
+        valid_actors = self._get_valid_actors()
 
         if not valid_actors:
             # All actors are at capacity or actor state is not ALIVE.
@@ -759,6 +790,28 @@ class _ActorPool(AutoscalingActorPool):
 
         return target_actor
 
+    def get_available_actor_locations(self) -> List[NodeIdStr]:
+        """Returns the (distinct) locations of the actors that can accept new tasks,
+        ordered by the number of tasks in flight at the least loaded actor on each
+        location."""
+        actors = sorted(
+            self._get_valid_actors(),
+            key=lambda actor: self._running_actors[actor].num_tasks_in_flight,
+        )
+        locations = (self._running_actors[actor].actor_location for actor in actors)
+        return list(dict.fromkeys(locations))
+
+    def _get_valid_actors(self) -> List[ActorHandle]:
+        # Filter out actors that are invalid, i.e. actors with number of tasks in
+        # flight >= _max_tasks_in_flight or actor_state is not ALIVE.
+        return [
+            actor
+            for actor in self._running_actors
+            if self._running_actors[actor].num_tasks_in_flight
+            < self._max_tasks_in_flight
+            and not self._running_actors[actor].is_restarting
+        ]
+
     def _rank_actors(
         self,
         actors: List[ActorHandle],
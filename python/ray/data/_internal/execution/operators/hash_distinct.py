@@ -0,0 +1,294 @@
+import pickle
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from ray.data import DataContext
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.hash_shuffle import (
+    BlockTransformer,
+    HashShuffleOperator,
+    HashShufflingOperatorBase,
+    PartitionShardStore,
+    StatefulShuffleAggregation,
+)
+from ray.data._internal.table_block import TableBlockAccessor
+from ray.data.block import Block, BlockType
+
+# Column holding (128-bit) fingerprints of the key columns of the rows, which the
+# rows are hash-partitioned (and deduplicated) by.
+FINGERPRINT_COLUMN_NAME = "__ray_distinct_fingerprint"
+
+# Keys of the (independent) 64-bit hashes making up the fingerprints.
+_FINGERPRINT_HASH_KEYS = ("0123456789123456", "ray-data-distinc")
+# Hash of null values (of any column).
+_NULL_HASH = np.uint64(0x6E756C6C6E756C6C)
+
+
+class DistinctShuffleAggregation(StatefulShuffleAggregation):
+    """Aggregation dropping the rows of the partitions with duplicate fingerprints.
+
+    Without ordering, only the rows with fingerprints not seen before (in the
+    partition) are kept as the shards are accepted, such that aggregation only
+    holds the distinct rows along with the set of their fingerprints.
+
+    With ordering (``order_by``), the rows of every partition are sorted by the
+    ``order_by`` column upon finalization, keeping the first row of every
+    fingerprint (i.e., the one with the lowest or, if ``descending``, the highest
+    value of the column).
+    """
+
+    def __init__(
+        self,
+        aggregator_id: int,
+        *,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        spill_threshold_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        super().__init__(aggregator_id)
+
+        self._order_by = order_by
+        self._descending = descending
+
+        # Fingerprints of the rows kept so far (keyed by partition index)
+        self._seen_fingerprints: DefaultDict[int, Set[bytes]] = defaultdict(set)
+        # Shards of individual partitions (keyed by partition index)
+        self._partition_shards = PartitionShardStore(
+            spill_threshold_bytes=spill_threshold_bytes,
+            spill_dir=spill_dir,
+        )
+
+    def accept(self, input_seq_id: int, partition_id: int, partition_shard: Block):
+        assert input_seq_id == 0, (
+            f"Distinct is unary stateful aggregation, got sequence "
+            f"index of {input_seq_id}"
+        )
+
+        if self._order_by is None:
+            is_new = _filter_unseen(
+                _get_fingerprints(partition_shard),
+                self._seen_fingerprints[partition_id],
+            )
+            if not is_new.all():
+                partition_shard = partition_shard.filter(pa.array(is_new))
+
+        self._partition_shards.add(partition_id, partition_shard)
+
+    def finalize(self, partition_id: int) -> Block:
+        block = self._partition_shards.build(partition_id)
+
+        if self._order_by is not None:
+            block = _drop_duplicates(block, self._order_by, self._descending)
+
+        if FINGERPRINT_COLUMN_NAME in block.column_names:
+            block = block.drop_columns([FINGERPRINT_COLUMN_NAME])
+
+        return block
+
+    def clear(self, partition_id: int):
+        self._partition_shards.clear(partition_id)
+        self._seen_fingerprints.pop(partition_id, None)
+
+
+class HashDistinctOperator(HashShufflingOperatorBase):
+    """Operator dropping duplicate rows (by the values of the key columns).
+
+    Rows are fingerprinted (and deduplicated within every block) prior to being
+    hash-partitioned by their fingerprints, such that all the duplicates of a row
+    are deduplicated by the same aggregator (see `DistinctShuffleAggregation`).
+    """
+
+    def __init__(
+        self,
+        input_op: PhysicalOperator,
+        data_context: DataContext,
+        *,
+        key_columns: Optional[Tuple[str]],
+        num_partitions: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        aggregator_ray_remote_args_override: Optional[Dict[str, Any]] = None,
+    ):
+        spill_threshold_bytes: Optional[
+            int
+        ] = data_context.hash_shuffle_aggregator_spill_threshold_bytes
+        spill_dir: Optional[str] = data_context.hash_shuffle_aggregator_spill_dir
+
+        super().__init__(
+            name=(
+                f"Distinct("
+                f"key_columns={key_columns}, "
+                f"num_partitions={num_partitions}"
+                f")"
+            ),
+            input_ops=[input_op],
+            data_context=data_context,
+            key_columns=[(FINGERPRINT_COLUMN_NAME,)],
+            num_partitions=num_partitions,
+            aggregator_ray_remote_args_override=aggregator_ray_remote_args_override,
+            partition_aggregation_factory=(
+                lambda aggregator_id, target_partition_ids: DistinctShuffleAggregation(
+                    aggregator_id,
+                    order_by=order_by,
+                    descending=descending,
+                    spill_threshold_bytes=spill_threshold_bytes,
+                    spill_dir=spill_dir,
+                )
+            ),
+            input_block_transformer=_create_fingerprinting_transformer(
+                key_columns, order_by, descending
+            ),
+        )
+
+    def _get_default_num_cpus_per_partition(self) -> int:
+        """
+        CPU allocation for aggregating actors of Distinct operator is the same as
+        for the Shuffle operator (see `HashShuffleOperator`).
+        """
+        return 0.0625
+
+    def _get_operator_num_cpus_per_partition_override(self) -> int:
+        return (
+            self.data_context.hash_shuffle_operator_actor_num_cpus_per_partition_override
+        )
+
+    @classmethod
+    def _estimate_aggregator_memory_allocation(
+        cls,
+        *,
+        num_aggregators: int,
+        num_partitions: int,
+        partition_byte_size_estimate: int,
+    ) -> int:
+        # NOTE: Deduplicated partitions are at most as large as the shuffled ones
+        return HashShuffleOperator._estimate_aggregator_memory_allocation(
+            num_aggregators=num_aggregators,
+            num_partitions=num_partitions,
+            partition_byte_size_estimate=partition_byte_size_estimate,
+        )
+
+
+def _create_fingerprinting_transformer(
+    key_columns: Optional[Tuple[str]], order_by: Optional[str], descending: bool
+) -> BlockTransformer:
+    """Method creates input block transformer appending fingerprints of the key
+    columns (all columns, if not specified) to the block, and dropping duplicate
+    rows of the block (to reduce amount of bytes shuffled)"""
+
+    def _fingerprint(block: Block) -> Block:
+        table: pa.Table = TableBlockAccessor.try_convert_block_type(
+            block, block_type=BlockType.ARROW
+        )
+
+        fingerprints = _compute_fingerprints(
+            table, list(key_columns) if key_columns else table.column_names
+        )
+        table = table.append_column(
+            FINGERPRINT_COLUMN_NAME,
+            pa.Array.from_buffers(
+                pa.binary(16),
+                len(fingerprints),
+                [None, pa.py_buffer(fingerprints.tobytes())],
+            ),
+        )
+
+        return _drop_duplicates(table, order_by, descending)
+
+    return _fingerprint
+
+
+def _compute_fingerprints(table: pa.Table, columns: List[str]) -> np.ndarray:
+    """Returns 128-bit fingerprints (as 16-byte strings) of the values of the columns
+    of every row (nulls being equal to each other)."""
+    hashes = [
+        _hash_columns(table, columns, hash_key) for hash_key in _FINGERPRINT_HASH_KEYS
+    ]
+    return np.ascontiguousarray(np.stack(hashes, axis=1)).view("S16").ravel()
+
+
+def _hash_columns(table: pa.Table, columns: List[str], hash_key: str) -> np.ndarray:
+    import pandas as pd
+
+    combined = np.zeros(table.num_rows, dtype=np.uint64)
+    for column_name in columns:
+        column = table.column(column_name)
+        if pa.types.is_nested(column.type) or isinstance(column.type, pa.ExtensionType):
+            # Nested values (like lists and tensors) are hashed by their pickled
+            # representations.
+            values = pd.Series(
+                [pickle.dumps(value) for value in column.to_pylist()], dtype=object
+            )
+            hashes = pd.util.hash_pandas_object(
+                values, index=False, hash_key=hash_key
+            ).to_numpy()
+        else:
+            # NOTE: Only valid values are hashed, since converting columns with
+            #       nulls to Pandas changes their types (e.g., from integers to
+            #       floats), and hence the hashes of their values.
+            hashes = np.full(table.num_rows, _NULL_HASH, dtype=np.uint64)
+            is_valid = column.is_valid().to_numpy()
+            hashes[is_valid] = pd.util.hash_pandas_object(
+                column.drop_null().to_pandas(), index=False, hash_key=hash_key
+            ).to_numpy()
+
+        # Combine the hashes of the columns (as `boost::hash_combine` does).
+        combined ^= (
+            hashes
+            + np.uint64(0x9E3779B97F4A7C15)
+            + (combined << np.uint64(6))
+            + (combined >> np.uint64(2))
+        )
+
+    return combined
+
+
+def _get_fingerprints(table: pa.Table) -> np.ndarray:
+    fingerprints = table.column(FINGERPRINT_COLUMN_NAME).combine_chunks()
+    if len(fingerprints) == 0:
+        return np.empty(0, dtype="S16")
+
+    return np.frombuffer(
+        fingerprints.buffers()[1],
+        dtype="S16",
+        count=len(fingerprints),
+        offset=fingerprints.offset * 16,
+    )
+
+
+def _filter_unseen(fingerprints: np.ndarray, seen: Set[bytes]) -> np.ndarray:
+    """Returns whether every fingerprint is the first occurrence of a fingerprint
+    not seen before, adding these to the seen ones."""
+    is_new = np.zeros(len(fingerprints), dtype=bool)
+
+    _, first_indices = np.unique(fingerprints, return_index=True)
+    for idx, fingerprint in zip(
+        first_indices.tolist(), fingerprints[first_indices].tolist()
+    ):
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            is_new[idx] = True
+
+    return is_new
+
+
+def _drop_duplicates(
+    table: pa.Table, order_by: Optional[str], descending: bool
+) -> pa.Table:
+    """Keeps the first row of every fingerprint, by the ``order_by`` column (if
+    provided) or by the order of the rows."""
+    import pyarrow.compute as pc
+
+    if order_by is not None:
+        order = "descending" if descending else "ascending"
+        # NOTE: Sorting is stable, hence ties are kept in the order of the rows
+        table = table.take(pc.sort_indices(table, sort_keys=[(order_by, order)]))
+
+    _, first_indices = np.unique(_get_fingerprints(table), return_index=True)
+    if len(first_indices) == table.num_rows:
+        return table
+
+    return table.take(pa.array(np.sort(first_indices)))
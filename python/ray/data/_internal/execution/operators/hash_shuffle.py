@@ -3,7 +3,11 @@ import functools
 import itertools
 import logging
 import math
+import os
+import shutil
+import tempfile
 import threading
+import weakref
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import (
@@ -13,8 +17,11 @@ from typing import (
     DefaultDict,
     Deque,
     Dict,
+    Hashable,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -24,6 +31,7 @@ import pyarrow as pa
 
 import ray
 from ray import ObjectRef
+from ray._raylet import ObjectRefGenerator
 from ray.actor import ActorHandle
 from ray.data import DataContext, ExecutionOptions, ExecutionResources
 from ray.data._internal.arrow_block import ArrowBlockBuilder
@@ -79,6 +87,13 @@ class StatefulShuffleAggregation(abc.ABC):
 
         - After successful finalization aggregation's `clear` method will be invoked
          to clear any accumulated state to release resources.
+
+    NOTE: When skewed partitions are split across multiple aggregators (see
+          `HashShufflingOperatorBase`), aggregation might receive shards of the
+          partitions it hasn't been assigned. Shards of the other (replicated)
+          input sequences are moved out of the partition's own aggregator using
+          `export` and accepted by every aggregator of the split partition right
+          before its finalization.
     """
 
     def __init__(self, aggregator_id: int):
@@ -105,6 +120,131 @@ class StatefulShuffleAggregation(abc.ABC):
               partition."""
         raise NotImplementedError()
 
+    def export(self, input_seq_id: int, partition_id: int) -> Block:
+        """Removes shards accumulated for the partition (identified by partition-id)
+        of the input sequence (identified by input-id), returning them combined into
+        a single block.
+
+        NOTE: This method is only invoked for operators splitting skewed
+              partitions."""
+        raise NotImplementedError()
+
+
+class PartitionShardStore:
+    """Storage for partition shards accumulated by `StatefulShuffleAggregation`
+    prior to finalization.
+
+    Shards are grouped by arbitrary (hashable) keys (for ex, partition ids). When
+    spill threshold is configured and total size of the shards held in memory
+    exceeds it, shards of the largest (in-memory) groups are combined and spilled
+    to local disk as Arrow IPC files, until total size drops below the threshold.
+
+    Spilled shards are read back (memory-mapped, rather than copied into the heap)
+    when the group is built.
+
+    NOTE: This class is not thread-safe
+    """
+
+    def __init__(
+        self,
+        *,
+        spill_threshold_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        self._spill_threshold_bytes = spill_threshold_bytes
+        self._spill_dir = spill_dir
+        # Directory holding files spilled by this store (created lazily upon
+        # first spill)
+        self._spill_files_dir: Optional[str] = None
+        self._next_spill_file_idx: int = 0
+
+        self._in_memory_shards: DefaultDict[Hashable, List[Block]] = defaultdict(list)
+        self._in_memory_shards_bytes: DefaultDict[Hashable, int] = defaultdict(int)
+        self._total_in_memory_bytes: int = 0
+
+        self._spilled_files: DefaultDict[Hashable, List[str]] = defaultdict(list)
+
+    def add(self, key: Hashable, shard: Block):
+        shard_size_bytes = BlockAccessor.for_block(shard).size_bytes()
+
+        self._in_memory_shards[key].append(shard)
+        self._in_memory_shards_bytes[key] += shard_size_bytes
+        self._total_in_memory_bytes += shard_size_bytes
+
+        if self._spill_threshold_bytes is None:
+            return
+
+        while self._total_in_memory_bytes > self._spill_threshold_bytes:
+            largest_key = max(
+                self._in_memory_shards_bytes, key=self._in_memory_shards_bytes.get
+            )
+
+            self._spill(largest_key)
+
+    def build(self, key: Hashable) -> Block:
+        """Combines all shards (in-memory and spilled ones) added for the key into
+        a single block."""
+        builder = ArrowBlockBuilder()
+
+        for path in self._spilled_files.get(key, []):
+            # NOTE: Spilled shards are memory-mapped to avoid copying them into
+            #       the heap
+            builder.add_block(pa.ipc.open_file(pa.memory_map(path, "r")).read_all())
+
+        for shard in self._in_memory_shards.get(key, []):
+            builder.add_block(shard)
+
+        return builder.build()
+
+    def clear(self, key: Hashable):
+        self._in_memory_shards.pop(key, None)
+        self._total_in_memory_bytes -= self._in_memory_shards_bytes.pop(key, 0)
+
+        for path in self._spilled_files.pop(key, []):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _spill(self, key: Hashable):
+        shards = self._in_memory_shards.pop(key)
+        spilled_bytes = self._in_memory_shards_bytes.pop(key)
+        self._total_in_memory_bytes -= spilled_bytes
+
+        builder = ArrowBlockBuilder()
+        for shard in shards:
+            builder.add_block(shard)
+
+        table: pa.Table = builder.build()
+
+        path = os.path.join(
+            self._get_spill_files_dir(), f"{self._next_spill_file_idx}.arrow"
+        )
+        self._next_spill_file_idx += 1
+
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        self._spilled_files[key].append(path)
+
+        logger.debug(
+            f"Spilled {len(shards)} shards ({spilled_bytes / MiB:.2f}MB) "
+            f"for {key} to {path}"
+        )
+
+    def _get_spill_files_dir(self) -> str:
+        if self._spill_files_dir is None:
+            self._spill_files_dir = tempfile.mkdtemp(
+                prefix="ray_data_shuffle_spill_", dir=self._spill_dir
+            )
+            # Clean up spilled files once the store is garbage collected
+            weakref.finalize(
+                self, shutil.rmtree, self._spill_files_dir, ignore_errors=True
+            )
+
+        return self._spill_files_dir
+
 
 class Concat(StatefulShuffleAggregation):
     """Trivial aggregation recombining dataset's individual partition
@@ -119,6 +259,8 @@ class Concat(StatefulShuffleAggregation):
         *,
         should_sort: bool,
         key_columns: Optional[Tuple[str]] = None,
+        spill_threshold_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ):
         super().__init__(aggregator_id)
 
@@ -129,25 +271,27 @@ class Concat(StatefulShuffleAggregation):
         self._should_sort = should_sort
         self._key_columns = key_columns
 
-        # Block builders for individual partitions (identified by partition index)
-        self._partition_block_builders: Dict[int, ArrowBlockBuilder] = {
-            partition_id: ArrowBlockBuilder() for partition_id in target_partition_ids
-        }
+        self._target_partition_ids = set(target_partition_ids)
+        # Shards of individual partitions (keyed by partition index)
+        self._partition_shards = PartitionShardStore(
+            spill_threshold_bytes=spill_threshold_bytes,
+            spill_dir=spill_dir,
+        )
 
     def accept(self, input_seq_id: int, partition_id: int, partition_shard: Block):
         assert input_seq_id == 0, (
             f"Concat is unary stateful aggregation, got sequence "
             f"index of {input_seq_id}"
         )
-        assert partition_id in self._partition_block_builders, (
+        assert partition_id in self._target_partition_ids, (
             f"Received shard from unexpected partition '{partition_id}' "
-            f"(expecting {self._partition_block_builders.keys()})"
+            f"(expecting {self._target_partition_ids})"
         )
 
-        self._partition_block_builders[partition_id].add_block(partition_shard)
+        self._partition_shards.add(partition_id, partition_shard)
 
     def finalize(self, partition_id: int) -> Block:
-        block = self._partition_block_builders[partition_id].build()
+        block = self._partition_shards.build(partition_id)
 
         if self._should_sort:
             block = block.sort_by([(k, "ascending") for k in self._key_columns])
@@ -155,7 +299,7 @@ class Concat(StatefulShuffleAggregation):
         return block
 
     def clear(self, partition_id: int):
-        self._partition_block_builders.pop(partition_id)
+        self._partition_shards.clear(partition_id)
 
 
 @ray.remote
@@ -167,6 +311,7 @@ def _shuffle_block(
     block_transformer: Optional[BlockTransformer] = None,
     send_empty_blocks: bool = False,
     override_partition_id: Optional[int] = None,
+    partition_aggregator_overrides: Optional[Dict[int, int]] = None,
 ) -> Tuple[BlockMetadata, Dict[int, "_PartitionStats"]]:
     """Shuffles provided block following the algorithm:
 
@@ -189,6 +334,9 @@ def _shuffle_block(
             assigned to
         block_transformer: Block transformer that will be applied to every block prior
             to shuffling
+        partition_aggregator_overrides: Map of (split) partition ids to ids of the
+            aggregators that non-empty shards of these partitions will be submitted
+            to (instead of the aggregators partitions are assigned to)
 
     Returns:
         A tuple of
@@ -256,7 +404,16 @@ def _shuffle_block(
                 partition_shard
             )
 
-        aggregator = pool.get_aggregator_for_partition(partition_id)
+        if (
+            partition_aggregator_overrides
+            and partition_id in partition_aggregator_overrides
+            and partition_shard.num_rows > 0
+        ):
+            aggregator = pool.get_aggregator(
+                partition_aggregator_overrides[partition_id]
+            )
+        else:
+            aggregator = pool.get_aggregator_for_partition(partition_id)
         # Put target partition shard into the Object Store to make sure partition shards
         # are managed t/h Object Store irrespective of their size
         partition_ref = ray.put(partition_shard)
@@ -352,6 +509,16 @@ class HashShufflingOperatorBase(PhysicalOperator):
 
     NOTE: This operator can perform hash-based shuffling for multiple sequences
           simultaneously (as required by Join operator for ex).
+
+    Skewed partitions: when `DataContext.hash_shuffle_skewed_partition_factor` is
+    set, the operator tracks sizes of the partitions as blocks are being shuffled.
+    Once partition of one of the input sequences returned by
+    `_get_splittable_input_seq_ids` grows over the factor times the average
+    partition size, its subsequent shards are spread across multiple aggregators
+    (instead of just the one partition is assigned to). Before finalization, shards
+    of the other input sequences are moved out of the partition's own aggregator and
+    replicated to every aggregator holding shards of the split partition, which
+    then finalize it independently.
     """
 
     def __init__(
@@ -422,6 +589,8 @@ class HashShufflingOperatorBase(PhysicalOperator):
         #
         # NOTE: Aggregating tasks are invariant of the # of input operators, as
         #       aggregation is assumed to always produce a single sequence
+        # NOTE: Partitions split across multiple aggregators are finalized by
+        #       multiple tasks (one per aggregator)
         self._finalizing_tasks: Dict[int, DataOpTask] = dict()
 
         # This is a workaround to be able to distribute schemas to individual
@@ -431,6 +600,20 @@ class HashShufflingOperatorBase(PhysicalOperator):
         # Id of the last partition finalization of which had already been scheduled
         self._last_finalized_partition_id: int = -1
 
+        self._skewed_partition_factor: Optional[
+            float
+        ] = data_context.hash_shuffle_skewed_partition_factor
+        # Partitions split across multiple aggregators are mapped like following
+        #   - Partition id -> (Input sequence id, [Aggregator ids])
+        #
+        # NOTE: Aggregator the partition is assigned to always comes first
+        self._split_partitions: Dict[int, Tuple[int, List[int]]] = dict()
+        # Ids of the aggregators that received shards of the split partitions
+        # (other than partition's own aggregator)
+        self._split_partitions_aggregators: DefaultDict[int, Set[int]] = defaultdict(
+            set
+        )
+
         self._output_queue: Deque[RefBundle] = deque()
 
         self._output_blocks_stats: List[BlockStats] = list()
@@ -487,6 +670,14 @@ class HashShufflingOperatorBase(PhysicalOperator):
                 else None
             )
 
+            # Shards of the split partitions are round-robin'd across aggregators
+            # these partitions are split across
+            partition_aggregator_overrides = {
+                partition_id: agg_ids[cur_shuffle_task_idx % len(agg_ids)]
+                for partition_id, (seq_id, agg_ids) in self._split_partitions.items()
+                if seq_id == input_index
+            }
+
             # Fan out provided input blocks to "shuffle" it
             #   - Block is first hash-partitioned into N partitions
             #   - Individual partitions then are submitted to the corresponding
@@ -504,12 +695,17 @@ class HashShufflingOperatorBase(PhysicalOperator):
                 block_transformer=self._input_block_transformer,
                 send_empty_blocks=should_broadcast_schemas,
                 override_partition_id=override_partition_id,
+                partition_aggregator_overrides=partition_aggregator_overrides,
             )
 
             if should_broadcast_schemas:
                 self._has_schemas_broadcasted[input_index] = True
 
-            def _on_partitioning_done():
+            def _on_partitioning_done(
+                input_index: int,
+                cur_shuffle_task_idx: int,
+                partition_aggregator_overrides: Dict[int, int],
+            ):
                 task = self._shuffling_tasks[input_index].pop(cur_shuffle_task_idx)
                 # Fetch input block and resulting partition shards block metadata and
                 # handle obtained metadata
@@ -521,6 +717,14 @@ class HashShufflingOperatorBase(PhysicalOperator):
                     task.get_waitable(), timeout=60
                 )
 
+                # Keep track of aggregators that received shards of the split
+                # partitions (to finalize them)
+                for partition_id in partition_shards_stats:
+                    if partition_id in partition_aggregator_overrides:
+                        self._split_partitions_aggregators[partition_id].add(
+                            partition_aggregator_overrides[partition_id]
+                        )
+
                 self._handle_shuffled_block_metadata(
                     input_index, input_block_metadata, partition_shards_stats
                 )
@@ -529,7 +733,12 @@ class HashShufflingOperatorBase(PhysicalOperator):
             self._shuffling_tasks[input_index][cur_shuffle_task_idx] = MetadataOpTask(
                 task_index=cur_shuffle_task_idx,
                 object_ref=input_block_partition_shards_metadata_tuple_ref,
-                task_done_callback=_on_partitioning_done,
+                task_done_callback=functools.partial(
+                    _on_partitioning_done,
+                    input_index,
+                    cur_shuffle_task_idx,
+                    partition_aggregator_overrides,
+                ),
                 task_resource_bundle=(
                     ExecutionResources.from_resource_dict(shuffle_task_resource_bundle)
                 ),
@@ -597,9 +806,11 @@ class HashShufflingOperatorBase(PhysicalOperator):
             self._output_queue.append(bundle)
             self._metrics.on_output_queued(bundle)
 
-        def _on_aggregation_done(partition_id: int, exc: Optional[Exception]):
-            if partition_id in self._finalizing_tasks:
-                self._finalizing_tasks.pop(partition_id)
+        def _on_aggregation_done(
+            task_idx: int, partition_id: int, exc: Optional[Exception]
+        ):
+            if task_idx in self._finalizing_tasks:
+                self._finalizing_tasks.pop(task_idx)
 
                 if exc:
                     logger.error(
@@ -626,9 +837,12 @@ class HashShufflingOperatorBase(PhysicalOperator):
         # Batch size is used as a lever to limit memory pressure on the nodes
         # where aggregators are run by limiting # of finalization tasks running
         # concurrently
+        #
+        # NOTE: Finalization of the split partitions might temporarily exceed
+        #       the batch size
         next_batch_size = min(
             num_remaining_partitions,
-            max_batch_size - num_running_finalizing_tasks,
+            max(0, max_batch_size - num_running_finalizing_tasks),
         )
 
         assert next_batch_size >= 0, (
@@ -656,10 +870,6 @@ class HashShufflingOperatorBase(PhysicalOperator):
         )
 
         for partition_id in target_partition_ids:
-            aggregator = self._aggregator_pool.get_aggregator_for_partition(
-                partition_id
-            )
-
             # Estimate (heap) memory requirement to execute finalization task
             # Compose shuffling task resource bundle
             finalize_task_resource_bundle = {
@@ -668,26 +878,78 @@ class HashShufflingOperatorBase(PhysicalOperator):
             }
 
             # Request finalization of the partition
-            block_gen = aggregator.finalize.options(
-                **finalize_task_resource_bundle
-            ).remote(partition_id)
-
-            self._finalizing_tasks[partition_id] = DataOpTask(
-                task_index=partition_id,
-                streaming_gen=block_gen,
-                output_ready_callback=_on_bundle_ready,
-                # TODO fix to pass in task_id into the callback
-                task_done_callback=functools.partial(
-                    _on_aggregation_done, partition_id
-                ),
-                task_resource_bundle=(
-                    ExecutionResources.from_resource_dict(finalize_task_resource_bundle)
-                ),
-            )
+            for block_gen in self._finalize_partition(
+                partition_id, finalize_task_resource_bundle
+            ):
+                cur_aggregate_task_idx = self._next_aggregate_task_idx
+                self._next_aggregate_task_idx += 1
+
+                self._finalizing_tasks[cur_aggregate_task_idx] = DataOpTask(
+                    task_index=cur_aggregate_task_idx,
+                    streaming_gen=block_gen,
+                    output_ready_callback=_on_bundle_ready,
+                    task_done_callback=functools.partial(
+                        _on_aggregation_done, cur_aggregate_task_idx, partition_id
+                    ),
+                    task_resource_bundle=(
+                        ExecutionResources.from_resource_dict(
+                            finalize_task_resource_bundle
+                        )
+                    ),
+                )
 
         # Update last finalized partition id
         self._last_finalized_partition_id = max(target_partition_ids)
 
+    def _finalize_partition(
+        self, partition_id: int, finalize_task_resource_bundle: Dict[str, Any]
+    ) -> List[ObjectRefGenerator]:
+        """Requests finalization of the partition from the aggregator(s) holding its
+        shards, returning corresponding streaming generators."""
+        aggregator = self._aggregator_pool.get_aggregator_for_partition(partition_id)
+
+        if partition_id not in self._split_partitions:
+            return [
+                aggregator.finalize.options(**finalize_task_resource_bundle).remote(
+                    partition_id
+                )
+            ]
+
+        split_input_seq_id, aggregator_ids = self._split_partitions[partition_id]
+        # NOTE: Partition's own aggregator is always finalizing the partition, since
+        #       it's holding shards of the other (replicated) input sequences
+        target_aggregators = [aggregator] + [
+            self._aggregator_pool.get_aggregator(aggregator_id)
+            for aggregator_id in aggregator_ids[1:]
+            if aggregator_id in self._split_partitions_aggregators[partition_id]
+        ]
+
+        # Move shards of the other input sequences out of the partition's own
+        # aggregator to replicate them to every aggregator finalizing it
+        replicated_input_seq_ids = tuple(
+            input_seq_id
+            for input_seq_id in range(len(self._input_dependencies))
+            if input_seq_id != split_input_seq_id
+        )
+        replicated_partition_shard_refs = [
+            aggregator.export.remote(input_seq_id, partition_id)
+            for input_seq_id in replicated_input_seq_ids
+        ]
+
+        logger.debug(
+            f"Finalizing partition {partition_id} split across "
+            f"{len(target_aggregators)} aggregators"
+        )
+
+        return [
+            target_aggregator.finalize.options(**finalize_task_resource_bundle).remote(
+                partition_id,
+                replicated_input_seq_ids,
+                *replicated_partition_shard_refs,
+            )
+            for target_aggregator in target_aggregators
+        ]
+
     def _do_shutdown(self, force: bool = False) -> None:
         self._aggregator_pool.shutdown(force=True)
         # NOTE: It's critical for Actor Pool to release actors before calling into
@@ -778,6 +1040,85 @@ class HashShufflingOperatorBase(PhysicalOperator):
                 else new_partition_shard_stats
             )
 
+        self._try_split_skewed_partitions(input_seq_id, partition_shards_stats.keys())
+
+    def _try_split_skewed_partitions(
+        self, input_seq_id: int, partition_ids: Iterable[int]
+    ):
+        """Splits provided partitions of the input sequence across multiple
+        aggregators, if these partitions are skewed (ie substantially larger than an
+        average one)."""
+        num_aggregators = self._aggregator_pool.num_aggregators
+
+        if (
+            self._skewed_partition_factor is None
+            or num_aggregators < 2
+            or input_seq_id not in self._get_splittable_input_seq_ids()
+        ):
+            return
+
+        partitions_stats = self._partitions_stats[input_seq_id]
+        total_byte_size = sum(s.byte_size for s in partitions_stats.values())
+
+        # NOTE: Partitions smaller than target block size are never split
+        skewed_partition_byte_size = max(
+            self._skewed_partition_factor * total_byte_size / self._num_partitions,
+            self.data_context.target_max_block_size or 0,
+        )
+
+        for partition_id in partition_ids:
+            partition_byte_size = partitions_stats[partition_id].byte_size
+            if partition_byte_size <= skewed_partition_byte_size:
+                continue
+
+            home_aggregator_id = self._aggregator_pool._get_aggregator_id_for_partition(
+                partition_id
+            )
+            split_input_seq_id, aggregator_ids = self._split_partitions.get(
+                partition_id, (input_seq_id, [home_aggregator_id])
+            )
+            # NOTE: Only partitions of one of the input sequences could be split
+            #       (partitions of the other ones are replicated)
+            if split_input_seq_id != input_seq_id:
+                continue
+
+            # Partition is split such that every aggregator receives no more than
+            # its fair share of the whole sequence
+            target_num_aggregators = min(
+                num_aggregators,
+                max(
+                    2,
+                    math.ceil(partition_byte_size * num_aggregators / total_byte_size),
+                ),
+            )
+
+            if target_num_aggregators <= len(aggregator_ids):
+                continue
+
+            aggregator_ids = [
+                (home_aggregator_id + i) % num_aggregators
+                for i in range(target_num_aggregators)
+            ]
+
+            logger.debug(
+                f"Splitting skewed partition {partition_id} of input sequence "
+                f"{input_seq_id} ({partition_byte_size / MiB:.2f}MB) across "
+                f"aggregators {aggregator_ids}"
+            )
+
+            self._split_partitions[partition_id] = (input_seq_id, aggregator_ids)
+
+    def _get_splittable_input_seq_ids(self) -> List[int]:
+        """Returns ids of the input sequences which partitions could be split
+        across multiple aggregators (when skewed).
+
+        NOTE: Splitting partitions of the input sequence is only possible when
+              resulting aggregation could be performed independently on each of
+              the partition's splits, given complete partitions of the other input
+              sequences
+        """
+        return []
+
     def _get_partition_stats(
         self, partition_id: int
     ) -> Dict[int, Optional[_PartitionStats]]:
@@ -879,6 +1220,11 @@ class HashShuffleOperator(HashShufflingOperatorBase):
         should_sort: bool = False,
         aggregator_ray_remote_args_override: Optional[Dict[str, Any]] = None,
     ):
+        spill_threshold_bytes: Optional[
+            int
+        ] = data_context.hash_shuffle_aggregator_spill_threshold_bytes
+        spill_dir: Optional[str] = data_context.hash_shuffle_aggregator_spill_dir
+
         super().__init__(
             name=f"Shuffle(key_columns={key_columns}, num_partitions={num_partitions})",
             input_ops=[input_op],
@@ -892,6 +1238,8 @@ class HashShuffleOperator(HashShufflingOperatorBase):
                     target_partition_ids,
                     should_sort=should_sort,
                     key_columns=key_columns,
+                    spill_threshold_bytes=spill_threshold_bytes,
+                    spill_dir=spill_dir,
                 )
             ),
         )
@@ -1009,6 +1357,9 @@ class AggregatorPool:
     def get_aggregator_for_partition(self, partition_id: int) -> ActorHandle:
         return self._aggregators[self._get_aggregator_id_for_partition(partition_id)]
 
+    def get_aggregator(self, aggregator_id: int) -> ActorHandle:
+        return self._aggregators[aggregator_id]
+
     def _allocate_partitions(self, *, num_partitions: int):
         assert num_partitions >= self._num_aggregators
 
@@ -1093,10 +1444,24 @@ class HashShuffleAggregator:
         with self._lock:
             self._agg.accept(input_seq_id, partition_id, partition_shard)
 
+    def export(self, input_seq_id: int, partition_id: int) -> Block:
+        with self._lock:
+            return self._agg.export(input_seq_id, partition_id)
+
     def finalize(
-        self, partition_id: int
+        self,
+        partition_id: int,
+        replicated_input_seq_ids: Tuple[int, ...] = (),
+        *replicated_partition_shards: Block,
     ) -> AsyncGenerator[Union[Block, BlockMetadata], None]:
         with self._lock:
+            # Accept shards of the partition replicated from other aggregator
+            # (when partition is split across multiple aggregators)
+            for input_seq_id, partition_shard in zip(
+                replicated_input_seq_ids, replicated_partition_shards
+            ):
+                self._agg.accept(input_seq_id, partition_id, partition_shard)
+
             # Finalize given partition id
             result = self._agg.finalize(partition_id)
             # Clear any remaining state (to release resources)
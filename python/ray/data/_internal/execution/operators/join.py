@@ -1,25 +1,71 @@
+import functools
 import logging
 import math
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from ray.data import DataContext
+import ray
+from ray import ObjectRef
+from ray.data import DataContext, ExecutionResources
 from ray.data._internal.arrow_block import ArrowBlockBuilder
-from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
+from ray.data._internal.execution.interfaces.physical_operator import (
+    DataOpTask,
+    MetadataOpTask,
+    OpTask,
+)
+from ray.data._internal.execution.operators.base_physical_operator import (
+    InternalQueueOperatorMixin,
+)
 from ray.data._internal.execution.operators.hash_shuffle import (
     HashShufflingOperatorBase,
+    PartitionShardStore,
     StatefulShuffleAggregation,
 )
-from ray.data._internal.logical.operators.join_operator import JoinType
+from ray.data._internal.logical.operators.join_operator import (
+    BROADCASTABLE_JOIN_TYPES,
+    JoinType,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.table_block import TableBlockAccessor
 from ray.data._internal.util import GiB
-from ray.data.block import Block
+from ray.data.block import (
+    Block,
+    BlockAccessor,
+    BlockExecStats,
+    BlockMetadata,
+    BlockStats,
+    BlockType,
+    to_stats,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 _JOIN_TYPE_TO_ARROW_JOIN_VERB_MAP = {
     JoinType.INNER: "inner",
     JoinType.LEFT_OUTER: "left outer",
     JoinType.RIGHT_OUTER: "right outer",
     JoinType.FULL_OUTER: "full outer",
+    JoinType.LEFT_SEMI: "left semi",
+    JoinType.LEFT_ANTI: "left anti",
 }
 
+# Join types only checking whether keys of the left sequence are present in the
+# right one, therefore only requiring the set of keys of the right sequence
+_KEY_SET_JOIN_TYPES = (JoinType.LEFT_SEMI, JoinType.LEFT_ANTI)
+
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +86,10 @@ class JoiningShuffleAggregation(StatefulShuffleAggregation):
 
     For actual joining Pyarrow native joining functionality is utilised, providing
     incredible performance while allowing keep the data from being deserialized.
+
+    NOTE: For semi/anti joins only (deduplicated) key columns of the right sequence
+          are retained, since only the set of its keys is necessary to produce
+          the result.
     """
 
     def __init__(
@@ -52,6 +102,8 @@ class JoiningShuffleAggregation(StatefulShuffleAggregation):
         target_partition_ids: List[int],
         left_columns_suffix: Optional[str] = None,
         right_columns_suffix: Optional[str] = None,
+        spill_threshold_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ):
         super().__init__(aggregator_id)
 
@@ -74,63 +126,97 @@ class JoiningShuffleAggregation(StatefulShuffleAggregation):
         self._left_columns_suffix: Optional[str] = left_columns_suffix
         self._right_columns_suffix: Optional[str] = right_columns_suffix
 
-        # Partition builders for the partition corresponding to
-        # left and right input sequences respectively
-        self._left_input_seq_partition_builders: Dict[int, ArrowBlockBuilder] = {
-            partition_id: ArrowBlockBuilder() for partition_id in target_partition_ids
-        }
+        self._retain_right_keys_only: bool = join_type in _KEY_SET_JOIN_TYPES
 
-        self._right_input_seq_partition_builders: Dict[int, ArrowBlockBuilder] = {
-            partition_id: ArrowBlockBuilder() for partition_id in target_partition_ids
-        }
+        self._target_partition_ids = set(target_partition_ids)
+        # Shards of the partitions corresponding to left and right input
+        # sequences (keyed by tuple of input sequence id and partition id)
+        self._partition_shards = PartitionShardStore(
+            spill_threshold_bytes=spill_threshold_bytes,
+            spill_dir=spill_dir,
+        )
 
     def accept(self, input_seq_id: int, partition_id: int, partition_shard: Block):
-        assert 0 <= input_seq_id < 2
+        self._validate_partition(input_seq_id=input_seq_id, partition_id=partition_id)
 
-        partition_builder = self._get_partition_builder(
-            input_seq_id=input_seq_id,
-            partition_id=partition_id,
-        )
+        if input_seq_id == 1 and self._retain_right_keys_only:
+            partition_shard = _get_unique_keys(
+                partition_shard, self._right_key_col_names
+            )
 
-        partition_builder.add_block(partition_shard)
+        self._partition_shards.add((input_seq_id, partition_id), partition_shard)
 
     def finalize(self, partition_id: int) -> Block:
         import pyarrow as pa
 
-        left_seq_partition: pa.Table = self._get_partition_builder(
-            input_seq_id=0, partition_id=partition_id
-        ).build()
-        right_seq_partition: pa.Table = self._get_partition_builder(
-            input_seq_id=1, partition_id=partition_id
-        ).build()
+        left_seq_partition: pa.Table = self._partition_shards.build((0, partition_id))
+        right_seq_partition: pa.Table = self._partition_shards.build((1, partition_id))
 
-        arrow_join_type = _JOIN_TYPE_TO_ARROW_JOIN_VERB_MAP[self._join_type]
-
-        joined = left_seq_partition.join(
+        return _join_tables(
+            left_seq_partition,
             right_seq_partition,
-            join_type=arrow_join_type,
-            keys=list(self._left_key_col_names),
-            right_keys=(list(self._right_key_col_names)),
-            left_suffix=self._left_columns_suffix,
-            right_suffix=self._right_columns_suffix,
+            join_type=self._join_type,
+            left_key_col_names=self._left_key_col_names,
+            right_key_col_names=self._right_key_col_names,
+            left_columns_suffix=self._left_columns_suffix,
+            right_columns_suffix=self._right_columns_suffix,
         )
 
-        return joined
-
     def clear(self, partition_id: int):
-        self._left_input_seq_partition_builders.pop(partition_id)
-        self._right_input_seq_partition_builders.pop(partition_id)
-
-    def _get_partition_builder(self, *, input_seq_id: int, partition_id: int):
-        if input_seq_id == 0:
-            partition_builder = self._left_input_seq_partition_builders[partition_id]
-        elif input_seq_id == 1:
-            partition_builder = self._right_input_seq_partition_builders[partition_id]
-        else:
+        self._partition_shards.clear((0, partition_id))
+        self._partition_shards.clear((1, partition_id))
+
+    def export(self, input_seq_id: int, partition_id: int) -> Block:
+        self._validate_partition(input_seq_id=input_seq_id, partition_id=partition_id)
+
+        block = self._partition_shards.build((input_seq_id, partition_id))
+        self._partition_shards.clear((input_seq_id, partition_id))
+
+        return block
+
+    def _validate_partition(self, *, input_seq_id: int, partition_id: int):
+        if input_seq_id not in (0, 1):
             raise ValueError(
                 f"Unexpected inpt sequence id of '{input_seq_id}' (expected 0 or 1)"
             )
-        return partition_builder
+        # NOTE: Partition id isn't validated against target partition ids, since
+        #       shards of the (split) skewed partitions could be received by any
+        #       of the aggregators
+
+
+def _join_tables(
+    left: "pa.Table",
+    right: "pa.Table",
+    *,
+    join_type: JoinType,
+    left_key_col_names: Tuple[str],
+    right_key_col_names: Tuple[str],
+    left_columns_suffix: Optional[str] = None,
+    right_columns_suffix: Optional[str] = None,
+) -> "pa.Table":
+    if join_type in _KEY_SET_JOIN_TYPES and right.num_rows == 0:
+        # NOTE: Short-circuit when there are no keys to match against: anti join
+        #       keeps every row, while semi join keeps none
+        return left if join_type == JoinType.LEFT_ANTI else left.slice(0, 0)
+
+    arrow_join_type = _JOIN_TYPE_TO_ARROW_JOIN_VERB_MAP[join_type]
+
+    return left.join(
+        right,
+        join_type=arrow_join_type,
+        keys=list(left_key_col_names),
+        right_keys=(list(right_key_col_names)),
+        left_suffix=left_columns_suffix,
+        right_suffix=right_columns_suffix,
+    )
+
+
+def _get_unique_keys(table: "pa.Table", key_col_names: Tuple[str]) -> "pa.Table":
+    """Returns table holding unique combinations of values of the key columns."""
+    if table.num_rows == 0:
+        return table.select(list(key_col_names))
+
+    return table.group_by(list(key_col_names)).aggregate([])
 
 
 class JoinOperator(HashShufflingOperatorBase):
@@ -149,6 +235,11 @@ class JoinOperator(HashShufflingOperatorBase):
         partition_size_hint: Optional[int] = None,
         aggregator_ray_remote_args_override: Optional[Dict[str, Any]] = None,
     ):
+        spill_threshold_bytes: Optional[
+            int
+        ] = data_context.hash_shuffle_aggregator_spill_threshold_bytes
+        spill_dir: Optional[str] = data_context.hash_shuffle_aggregator_spill_dir
+
         super().__init__(
             name=f"Join(num_partitions={num_partitions})",
             input_ops=[left_input_op, right_input_op],
@@ -165,11 +256,25 @@ class JoinOperator(HashShufflingOperatorBase):
                     target_partition_ids=target_partition_ids,
                     left_columns_suffix=left_columns_suffix,
                     right_columns_suffix=right_columns_suffix,
+                    spill_threshold_bytes=spill_threshold_bytes,
+                    spill_dir=spill_dir,
                 )
             ),
             aggregator_ray_remote_args_override=aggregator_ray_remote_args_override,
         )
 
+        self._join_type: JoinType = join_type
+
+    def _get_splittable_input_seq_ids(self) -> List[int]:
+        # NOTE: Partitions of one input could be split across multiple aggregators
+        #       as long as corresponding partition of the other one could be
+        #       replicated to all of them (same as broadcasting it)
+        return [
+            1 - broadcast_input_index
+            for broadcast_input_index, join_types in BROADCASTABLE_JOIN_TYPES.items()
+            if self._join_type in join_types
+        ]
+
     def _get_default_num_cpus_per_partition(self) -> int:
         """
         CPU allocation for aggregating actors of Join operator is calculated as:
@@ -239,3 +344,292 @@ class JoinOperator(HashShufflingOperatorBase):
         )
 
         return aggregator_total_memory_required
+
+
+class BroadcastJoinOperator(InternalQueueOperatorMixin, PhysicalOperator):
+    """Operator joining 2 input sequences by broadcasting one of them (expected
+    to be small) to the tasks processing the other one.
+
+    Execution proceeds as follows:
+
+        1. Blocks of the broadcast sequence are accumulated until that sequence
+        is fully ingested, at which point a single task combines them into one
+        table that is stored in the Object Store (once).
+
+        2. Every block of the probe sequence is then joined against that table
+        by a task scheduled with locality-aware scheduling strategy, so that the
+        probe sequence (expected to be large) is never shuffled and is processed
+        on the nodes that produced it.
+
+    Blocks of the probe sequence received before the broadcast table is ready
+    are queued internally.
+
+    NOTE: Since every probe task joins against the whole broadcast table
+          independently, only join types that don't need to preserve unmatched
+          rows of the broadcast sequence are supported (see
+          ``BROADCASTABLE_JOIN_TYPES``).
+    """
+
+    def __init__(
+        self,
+        data_context: DataContext,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        left_key_columns: Tuple[str],
+        right_key_columns: Tuple[str],
+        join_type: JoinType,
+        *,
+        broadcast_input_index: int = 1,
+        left_columns_suffix: Optional[str] = None,
+        right_columns_suffix: Optional[str] = None,
+    ):
+        assert (
+            broadcast_input_index in BROADCASTABLE_JOIN_TYPES
+        ), f"Broadcast input index has to be 0 or 1 (got {broadcast_input_index})"
+        assert join_type in BROADCASTABLE_JOIN_TYPES[broadcast_input_index], (
+            f"Join type {join_type} doesn't support broadcasting input "
+            f"{broadcast_input_index}"
+        )
+
+        super().__init__(
+            name=(
+                f"BroadcastJoin("
+                f"broadcast={'right' if broadcast_input_index == 1 else 'left'})"
+            ),
+            input_dependencies=[left_input_op, right_input_op],
+            data_context=data_context,
+            target_max_block_size=None,
+        )
+
+        self._broadcast_input_index: int = broadcast_input_index
+        # NOTE: For semi/anti joins only unique keys of the broadcast (right)
+        #       sequence have to be broadcast
+        self._broadcast_key_columns: Optional[Tuple[str]] = (
+            right_key_columns if join_type in _KEY_SET_JOIN_TYPES else None
+        )
+        self._join_kwargs: Dict[str, Any] = dict(
+            join_type=join_type,
+            left_key_col_names=left_key_columns,
+            right_key_col_names=right_key_columns,
+            left_columns_suffix=left_columns_suffix,
+            right_columns_suffix=right_columns_suffix,
+        )
+
+        # Bundles of the broadcast sequence (accumulated until it's fully ingested)
+        self._broadcast_input_bundles: List[RefBundle] = []
+        # Bundles of the probe sequence awaiting the broadcast table to be built
+        self._probe_input_queue: Deque[RefBundle] = deque()
+
+        self._build_task: Optional[MetadataOpTask] = None
+        self._broadcast_table_ref: Optional[ObjectRef[Block]] = None
+
+        self._next_probe_task_idx: int = 0
+        self._probe_tasks: Dict[int, DataOpTask] = dict()
+
+        self._output_queue: Deque[RefBundle] = deque()
+        self._output_blocks_stats: List[BlockStats] = list()
+
+        self._probe_task_ray_remote_args: Dict[str, Any] = {
+            "num_cpus": 1,
+            # NOTE: Broadcast table is small compared to the probe blocks, hence
+            #       locality-aware scheduling places probe tasks on the nodes
+            #       holding the probe blocks
+            "scheduling_strategy": data_context.scheduling_strategy_large_args,
+        }
+
+    def internal_queue_size(self) -> int:
+        return len(self._broadcast_input_bundles) + len(self._probe_input_queue)
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+
+        self._metrics.on_input_queued(refs)
+
+        if input_index == self._broadcast_input_index:
+            self._broadcast_input_bundles.append(refs)
+        else:
+            self._probe_input_queue.append(refs)
+            self._try_submit_probe_tasks()
+
+    def input_done(self, input_index: int) -> None:
+        if input_index == self._broadcast_input_index:
+            self._submit_build_task()
+
+        super().input_done(input_index)
+
+    def has_next(self) -> bool:
+        return len(self._output_queue) > 0
+
+    def _get_next_inner(self) -> RefBundle:
+        bundle: RefBundle = self._output_queue.popleft()
+        self._metrics.on_output_dequeued(bundle)
+
+        self._output_blocks_stats.extend(to_stats(bundle.metadata))
+
+        return bundle
+
+    def get_active_tasks(self) -> List[OpTask]:
+        build_tasks = [self._build_task] if self._build_task is not None else []
+
+        return build_tasks + list(self._probe_tasks.values())
+
+    def _submit_build_task(self):
+        assert self._build_task is None
+
+        block_refs = []
+        while self._broadcast_input_bundles:
+            bundle = self._broadcast_input_bundles.pop()
+            block_refs = bundle.block_refs + block_refs
+            self._metrics.on_input_dequeued(bundle)
+
+        build_broadcast_table = cached_remote_fn(_build_broadcast_table, num_returns=2)
+        table_ref, metadata_ref = build_broadcast_table.remote(
+            self._broadcast_key_columns, *block_refs
+        )
+
+        def _on_build_done():
+            self._build_task = None
+            # NOTE: This surfaces errors of the build task (if any)
+            metadata: BlockMetadata = ray.get(metadata_ref)
+
+            logger.debug(
+                f"Built broadcast table for {self._name} "
+                f"(rows={metadata.num_rows}, bytes={metadata.size_bytes})"
+            )
+
+            self._broadcast_table_ref = table_ref
+            self._try_submit_probe_tasks()
+
+        self._build_task = MetadataOpTask(
+            task_index=0,
+            object_ref=metadata_ref,
+            task_done_callback=_on_build_done,
+            task_resource_bundle=ExecutionResources(cpu=1),
+        )
+
+    def _try_submit_probe_tasks(self):
+        # Probing can only proceed once the broadcast table is ready
+        if self._broadcast_table_ref is None:
+            return
+
+        probe_broadcast_table = cached_remote_fn(
+            _probe_broadcast_table, num_returns="streaming"
+        )
+
+        def _on_bundle_ready(bundle: RefBundle):
+            self._output_queue.append(bundle)
+            self._metrics.on_output_queued(bundle)
+
+        def _on_probe_done(task_idx: int, exc: Optional[Exception]):
+            self._probe_tasks.pop(task_idx, None)
+
+            if exc:
+                logger.error(
+                    f"Probing broadcast table failed with: {exc}", exc_info=exc
+                )
+
+        while self._probe_input_queue:
+            bundle = self._probe_input_queue.popleft()
+            self._metrics.on_input_dequeued(bundle)
+
+            task_idx = self._next_probe_task_idx
+            self._next_probe_task_idx += 1
+
+            block_gen = probe_broadcast_table.options(
+                **self._probe_task_ray_remote_args
+            ).remote(
+                self._broadcast_table_ref,
+                self._broadcast_input_index,
+                self._join_kwargs,
+                *bundle.block_refs,
+            )
+
+            self._probe_tasks[task_idx] = DataOpTask(
+                task_index=task_idx,
+                streaming_gen=block_gen,
+                output_ready_callback=_on_bundle_ready,
+                task_done_callback=functools.partial(_on_probe_done, task_idx),
+                task_resource_bundle=ExecutionResources(cpu=1),
+            )
+
+    def _do_shutdown(self, force: bool = False) -> None:
+        super()._do_shutdown(force)
+        # Release any pending refs
+        self._broadcast_input_bundles.clear()
+        self._probe_input_queue.clear()
+        self._broadcast_table_ref = None
+        self._build_task = None
+        self._probe_tasks.clear()
+
+    def get_stats(self):
+        return {self._name: self._output_blocks_stats}
+
+    def current_processor_usage(self) -> ExecutionResources:
+        return ExecutionResources(cpu=self.num_active_tasks(), gpu=0)
+
+    def incremental_resource_usage(self) -> ExecutionResources:
+        return ExecutionResources(cpu=1, gpu=0)
+
+    def implements_accurate_memory_accounting(self) -> bool:
+        return True
+
+
+def _build_broadcast_table(
+    key_col_names: Optional[Tuple[str]], *blocks: Block
+) -> Tuple[Block, BlockMetadata]:
+    """Combines blocks of the broadcast sequence into a single (Arrow) table.
+
+    If ``key_col_names`` are provided, only unique combinations of the key columns
+    are retained.
+    """
+    builder = ArrowBlockBuilder()
+    for block in blocks:
+        block = TableBlockAccessor.try_convert_block_type(
+            block, block_type=BlockType.ARROW
+        )
+
+        if key_col_names is not None:
+            block = _get_unique_keys(block, key_col_names)
+
+        builder.add_block(block)
+
+    table = builder.build()
+
+    if key_col_names is not None and table.num_rows > 0:
+        table = _get_unique_keys(table, key_col_names)
+
+    return table, BlockAccessor.for_block(table).get_metadata()
+
+
+def _probe_broadcast_table(
+    broadcast_table: "pa.Table",
+    broadcast_input_index: int,
+    join_kwargs: Dict[str, Any],
+    *probe_blocks: Block,
+) -> Iterator[Union[Block, BlockMetadata]]:
+    """Joins every provided block of the probe sequence against the broadcast
+    table, yielding resulting blocks followed by their metadata.
+    """
+    for probe_block in probe_blocks:
+        stats = BlockExecStats.builder()
+
+        probe_table = TableBlockAccessor.try_convert_block_type(
+            probe_block, block_type=BlockType.ARROW
+        )
+
+        if broadcast_table.num_columns == 0:
+            # NOTE: Broadcast sequence is empty (and its schema is unknown), hence
+            #       inner and semi joins produce no rows, while outer and anti joins
+            #       preserve the probe block as is
+            if join_kwargs["join_type"] in (JoinType.INNER, JoinType.LEFT_SEMI):
+                continue
+
+            joined = probe_table
+        elif broadcast_input_index == 1:
+            joined = _join_tables(probe_table, broadcast_table, **join_kwargs)
+        else:
+            joined = _join_tables(broadcast_table, probe_table, **join_kwargs)
+
+        yield joined
+        yield BlockAccessor.for_block(joined).get_metadata(exec_stats=stats.build())
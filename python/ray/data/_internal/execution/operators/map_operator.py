@@ -370,14 +370,26 @@ class MapOperator(OneToOneOperator, InternalQueueOperatorMixin, ABC):
         gen: ObjectRefGenerator,
         inputs: RefBundle,
         task_done_callback: Optional[Callable[[], None]] = None,
+        task_index: Optional[int] = None,
     ):
-        """Submit a new data-handling task."""
+        """Submit a new data-handling task.
+
+        Args:
+            gen: The streaming generator of the task's outputs.
+            inputs: The input bundle of the task.
+            task_done_callback: Callback invoked once the task is done.
+            task_index: The index of the task, which determines the order of its
+                outputs (when preserving order). Defaults to the number of tasks
+                submitted so far. Operators passing the index must pass it for every
+                task, and the indices must be consecutive.
+        """
         # TODO(hchen):
         # 1. Move this to the base PhyscialOperator class.
         # 2. This method should only take a block-processing function as input,
         #    instead of a streaming generator. The logic of submitting ray tasks
         #    can also be capsulated in the base class.
-        task_index = self._next_data_task_idx
+        if task_index is None:
+            task_index = self._next_data_task_idx
         self._next_data_task_idx += 1
         self._metrics.on_task_submitted(task_index, inputs)
 
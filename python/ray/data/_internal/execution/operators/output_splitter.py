@@ -3,6 +3,8 @@ import time
 from collections import deque
 from typing import Any, Collection, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     NodeIdStr,
@@ -32,6 +34,12 @@ class OutputSplitter(InternalQueueOperatorMixin, PhysicalOperator):
     has a minimum size calculated to enable a good locality hit rate, as well as ensure
     we can satisfy the `equal` requirement.
 
+    If the `shuffle_seed` option is set, bundles are dispatched to the output splits
+    in rounds, following a random permutation of the splits per round (seeded by the
+    seed and the `epoch`), rather than to the splits with the least data so far. The
+    splits are thus reproducible for a given seed and epoch if the order of the input
+    bundles is (i.e., with `preserve_order`).
+
     OutputSplitter does not provide any ordering guarantees.
     """
 
@@ -42,6 +50,8 @@ class OutputSplitter(InternalQueueOperatorMixin, PhysicalOperator):
         equal: bool,
         data_context: DataContext,
         locality_hints: Optional[List[NodeIdStr]] = None,
+        shuffle_seed: Optional[int] = None,
+        epoch: int = 0,
     ):
         super().__init__(
             f"split({n}, equal={equal})",
@@ -58,6 +68,11 @@ class OutputSplitter(InternalQueueOperatorMixin, PhysicalOperator):
         self._num_output: List[int] = [0 for _ in range(n)]
         # The time of the overhead for the output splitter (operator level)
         self._output_splitter_overhead_time = 0
+        # Output splits left to dispatch to in the current round, if shuffling.
+        self._shuffle_rng = None
+        self._shuffle_round: List[int] = []
+        if shuffle_seed is not None:
+            self._shuffle_rng = np.random.default_rng([shuffle_seed, epoch])
 
         if locality_hints is not None:
             if n != len(locality_hints):
@@ -178,6 +193,8 @@ class OutputSplitter(InternalQueueOperatorMixin, PhysicalOperator):
             target_index = self._select_output_index()
             target_bundle = self._pop_bundle_to_dispatch(target_index)
             if self._can_safely_dispatch(target_index, target_bundle.num_rows()):
+                if self._shuffle_round:
+                    self._shuffle_round.pop(0)
                 target_bundle.output_split_idx = target_index
                 self._num_output[target_index] += target_bundle.num_rows()
                 self._output_queue.append(target_bundle)
@@ -196,6 +213,13 @@ class OutputSplitter(InternalQueueOperatorMixin, PhysicalOperator):
         self._output_splitter_overhead_time += time.perf_counter() - start_time
 
     def _select_output_index(self) -> int:
+        if self._shuffle_rng is not None:
+            if not self._shuffle_round:
+                self._shuffle_round = self._shuffle_rng.permutation(
+                    len(self._num_output)
+                ).tolist()
+            return self._shuffle_round[0]
+
         # Greedily dispatch to the consumer with the least data so far.
         i, _ = min(enumerate(self._num_output), key=lambda t: t[1])
         return i
@@ -572,10 +572,20 @@ class _ClosingIterator(OutputIterator):
     def __init__(self, executor: StreamingExecutor):
         self._executor = executor
 
-    def get_next(self, output_split_idx: Optional[int] = None) -> RefBundle:
+    def get_next(
+        self,
+        output_split_idx: Optional[int] = None,
+        *,
+        steal: bool = False,
+        block: bool = True,
+    ) -> Optional[RefBundle]:
         try:
             op, state = self._executor._output_node
-            bundle = state.get_output_blocking(output_split_idx)
+            bundle = state.get_output_blocking(
+                output_split_idx, steal=steal, block=block
+            )
+            if bundle is None:
+                return None
 
             # Update progress-bars
             if self._executor._global_info:
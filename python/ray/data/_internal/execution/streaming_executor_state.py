@@ -99,11 +99,17 @@ class OpBufferQueue:
             if ref.output_split_idx is not None:
                 self._num_per_split[ref.output_split_idx] += 1
 
-    def pop(self, output_split_idx: Optional[int] = None) -> Optional[RefBundle]:
+    def pop(
+        self, output_split_idx: Optional[int] = None, steal: bool = False
+    ) -> Optional[RefBundle]:
         """Pop a RefBundle from the queue.
         Args:
             output_split_idx: If specified, only pop a RefBundle
                 with the given output split.
+            steal: If True (and `output_split_idx` is specified), pop a RefBundle
+                of the output split with the most RefBundles queued, if there's
+                none of the given output split (and the other one has more than
+                one).
         Returns:
             A RefBundle if available, otherwise None.
         """
@@ -128,10 +134,23 @@ class OpBufferQueue:
                     while len(self._queue) > 0:
                         ref = self._queue.pop()
                         self._outputs_by_split[ref.output_split_idx].add(ref)
-            try:
-                ret = split_queue.pop()
-            except IndexError:
-                pass
+            # NOTE: Split queues are popped under the lock, as these can be popped by
+            # other output splits stealing from them.
+            with self._lock:
+                if len(split_queue) > 0:
+                    ret = split_queue.pop()
+                elif steal:
+                    victim_queue = max(
+                        (
+                            queue
+                            for split_idx, queue in self._outputs_by_split.items()
+                            if split_idx != output_split_idx
+                        ),
+                        key=len,
+                        default=None,
+                    )
+                    if victim_queue is not None and len(victim_queue) > 1:
+                        ret = victim_queue.pop()
         if ret is None:
             return None
         with self._lock:
@@ -315,9 +334,22 @@ class OpState:
 
         assert False, "Nothing to dispatch"
 
-    def get_output_blocking(self, output_split_idx: Optional[int]) -> RefBundle:
+    def get_output_blocking(
+        self,
+        output_split_idx: Optional[int],
+        steal: bool = False,
+        block: bool = True,
+    ) -> Optional[RefBundle]:
         """Get an item from this node's output queue, blocking as needed.
 
+        Args:
+            output_split_idx: If specified, only get an item of the given output
+                split.
+            steal: Whether to get an item of another output split if there's none
+                of the given one (see `OpBufferQueue.pop`).
+            block: Whether to block until an item is available. If False, None is
+                returned if there's none available.
+
         Returns:
             The RefBundle from the output queue, or an error / end of stream indicator.
 
@@ -330,9 +362,17 @@ class OpState:
             if self._exception is not None:
                 raise self._exception
             elif self._finished and not self.output_queue.has_next(output_split_idx):
-                raise StopIteration()
-            ref = self.output_queue.pop(output_split_idx)
-            if ref is not None:
+                # Items of other output splits can still be stolen.
+                ref = (
+                    self.output_queue.pop(output_split_idx, steal=True)
+                    if steal
+                    else None
+                )
+                if ref is None:
+                    raise StopIteration()
+                return ref
+            ref = self.output_queue.pop(output_split_idx, steal=steal)
+            if ref is not None or not block:
                 return ref
             time.sleep(0.01)
 
@@ -0,0 +1,327 @@
+"""Caching file listings and Parquet footer metadata across reads.
+
+Listings are cached per directory (holding the files and the subdirectories right
+under it), and are reused as long as the modification time of the directory
+doesn't change. Expanding a directory thus only stats its (cached) subdirectories,
+listing again just the directories whose entries were added or removed. For
+filesystems without directory modification times (like prefixes of object
+stores), listings are reused for ``DataContext.file_metadata_cache_ttl_s``
+seconds instead.
+
+Parquet footer metadata are cached per file, keyed by the path, the size and the
+modification time of the file (as of the listing of its directory).
+
+Entries are pickled into files of ``DataContext.file_metadata_cache_dir`` (one
+per directory and kind of entry), which can be on local disk or on a filesystem
+shared by the cluster.
+
+NOTE: Files are assumed to be replaced (rather than modified in place), since only
+modification times of the directories are checked.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import posixpath
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.datasource.parquet_meta_provider import (
+        _ParquetFileFragmentMetaData,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Granularity of modification times assumed for all filesystems (in seconds)
+_MTIME_GRANULARITY_S = 1
+
+# Size and modification time (in ns, if supported by the filesystem) of a file
+_FileStat = Tuple[int, Optional[int]]
+
+
+@dataclass
+class _DirectoryListing:
+    """Files and subdirectories right under a directory."""
+
+    # Modification time (in ns) of the directory, or ``None`` if not supported by
+    # the filesystem
+    mtime_ns: Optional[int]
+    # Time (in seconds since the epoch) the directory was listed at
+    listed_at: float
+    files: Dict[str, _FileStat]
+    # Modification times of the subdirectories (keyed by path)
+    dirs: Dict[str, Optional[int]]
+
+
+class FileMetadataCache:
+    """Cache of file listings and Parquet footer metadata of a filesystem, persisted
+    in the cache directory (see module docstring)."""
+
+    def __init__(self, cache_dir: str, filesystem_key: str, ttl_s: Optional[float]):
+        self._cache_dir = cache_dir
+        self._filesystem_key = filesystem_key
+        self._ttl_s = ttl_s
+
+        self._lock = threading.Lock()
+        # Stats of the files listed by this cache so far (keyed by path)
+        self._file_stats: Dict[str, _FileStat] = {}
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def expand_directory(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        dir_info: "pyarrow.fs.FileInfo",
+        exclude_prefixes: Optional[List[str]] = None,
+    ) -> List[Tuple[str, int]]:
+        """Returns the (path, size) tuples of the files under the directory, like
+        `_expand_directory` does."""
+        from ray.data.datasource.file_meta_provider import _filter_excluded_paths
+
+        files: Dict[str, _FileStat] = {}
+        with self._lock:
+            self._collect_files(
+                filesystem, _normalize_dir(dir_info.path), dir_info.mtime_ns, files
+            )
+            self._file_stats.update(files)
+
+        return sorted(
+            _filter_excluded_paths(
+                dir_info.path,
+                [(path, size) for path, (size, _) in files.items()],
+                exclude_prefixes,
+            )
+        )
+
+    def get_parquet_metadata(
+        self,
+        fragments: List["pyarrow.dataset.ParquetFileFragment"],
+        fetch: Callable[
+            [List["pyarrow.dataset.ParquetFileFragment"]],
+            Optional[List["_ParquetFileFragmentMetaData"]],
+        ],
+    ) -> Optional[List["_ParquetFileFragmentMetaData"]]:
+        """Returns the footer metadata of the fragments, fetching (with ``fetch``)
+        only those of the files not cached (or not listed by this cache)."""
+        with self._lock:
+            stats = [self._file_stats.get(fragment.path) for fragment in fragments]
+            footers = {
+                dir_path: self._load(dir_path, "footers") or {}
+                for dir_path in {
+                    posixpath.dirname(fragment.path)
+                    for fragment, stat in zip(fragments, stats)
+                    if stat is not None
+                }
+            }
+
+        metadata: List[Optional["_ParquetFileFragmentMetaData"]] = []
+        missing_indices = []
+        for i, (fragment, stat) in enumerate(zip(fragments, stats)):
+            footer = None
+            if stat is not None:
+                footer = footers[posixpath.dirname(fragment.path)].get(fragment.path)
+            if footer is not None and footer[0] == stat:
+                metadata.append(footer[1])
+            else:
+                metadata.append(None)
+                missing_indices.append(i)
+
+        if missing_indices:
+            fetched = fetch([fragments[i] for i in missing_indices])
+            if fetched is None or len(fetched) != len(missing_indices):
+                # Metadata of (some of) the fragments isn't available, hence these
+                # aren't cached.
+                if len(missing_indices) == len(fragments):
+                    return fetched
+                return fetch(fragments)
+
+            updated_dirs = set()
+            for i, fragment_metadata in zip(missing_indices, fetched):
+                metadata[i] = fragment_metadata
+                if stats[i] is not None:
+                    dir_path = posixpath.dirname(fragments[i].path)
+                    footers[dir_path][fragments[i].path] = (stats[i], fragment_metadata)
+                    updated_dirs.add(dir_path)
+
+            with self._lock:
+                for dir_path in updated_dirs:
+                    self._store(dir_path, "footers", footers[dir_path])
+
+        # Share the pickled schemas among the fragments (as `_dedupe_metadata` does).
+        schemas = {}
+        for fragment_metadata in metadata:
+            fragment_metadata.set_schema_pickled(
+                schemas.setdefault(
+                    fragment_metadata.schema_pickled, fragment_metadata.schema_pickled
+                )
+            )
+
+        return metadata
+
+    def _collect_files(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        mtime_ns: Optional[int],
+        files: Dict[str, _FileStat],
+    ):
+        from pyarrow.fs import FileType
+
+        listing: Optional[_DirectoryListing] = self._load(path, "listing")
+        if listing is None:
+            # Directories not listed before are listed (and cached) at once.
+            for dir_path, dir_listing in self._list(
+                filesystem, path, mtime_ns, recursive=True
+            ).items():
+                self._store(dir_path, "listing", dir_listing)
+                files.update(dir_listing.files)
+            return
+
+        if self._is_valid(listing, mtime_ns):
+            dir_mtimes = listing.dirs
+            if listing.mtime_ns is not None and dir_mtimes:
+                # Listings of the subdirectories are validated against their
+                # current modification times.
+                dir_mtimes = {
+                    info.path: info.mtime_ns
+                    for info in filesystem.get_file_info(list(dir_mtimes))
+                    if info.type == FileType.Directory
+                }
+        else:
+            listing = self._list(filesystem, path, mtime_ns, recursive=False)[path]
+            self._store(path, "listing", listing)
+            dir_mtimes = listing.dirs
+
+        files.update(listing.files)
+        for dir_path, dir_mtime_ns in dir_mtimes.items():
+            self._collect_files(filesystem, dir_path, dir_mtime_ns, files)
+
+    def _is_valid(self, listing: _DirectoryListing, mtime_ns: Optional[int]) -> bool:
+        if mtime_ns is not None:
+            # Directories listed right after being modified might be modified again
+            # without changing their modification times (as these have limited
+            # granularity), hence such listings aren't reused.
+            return (
+                listing.mtime_ns == mtime_ns
+                and listing.listed_at - mtime_ns / 1e9 > _MTIME_GRANULARITY_S
+            )
+
+        return (
+            listing.mtime_ns is None
+            and self._ttl_s is not None
+            and time.time() - listing.listed_at < self._ttl_s
+        )
+
+    @staticmethod
+    def _list(
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        mtime_ns: Optional[int],
+        *,
+        recursive: bool,
+    ) -> Dict[str, _DirectoryListing]:
+        """Lists the directory (and, if ``recursive``, its subdirectories), returning
+        the listings of the directories (keyed by path)."""
+        from pyarrow.fs import FileSelector, FileType
+
+        listed_at = time.time()
+        infos = filesystem.get_file_info(FileSelector(path, recursive=recursive))
+
+        listings = {path: _DirectoryListing(mtime_ns, listed_at, {}, {})}
+        for info in infos:
+            if info.type == FileType.Directory:
+                listings[info.path] = _DirectoryListing(
+                    info.mtime_ns, listed_at, {}, {}
+                )
+
+        for info in infos:
+            parent = listings.get(posixpath.dirname(info.path))
+            if parent is None:
+                continue
+            if info.type == FileType.Directory:
+                parent.dirs[info.path] = info.mtime_ns
+            elif info.type == FileType.File:
+                parent.files[info.path] = (info.size, info.mtime_ns)
+
+        return listings
+
+    def _get_entry_path(self, dir_path: str, kind: str) -> str:
+        digest = hashlib.sha1(f"{self._filesystem_key}:{dir_path}".encode()).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.{kind}")
+
+    def _load(self, dir_path: str, kind: str) -> Any:
+        try:
+            with open(self._get_entry_path(dir_path, kind), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(
+                f"Failed to load cached {kind} of {dir_path}, ignoring it.",
+                exc_info=True,
+            )
+            return None
+
+    def _store(self, dir_path: str, kind: str, entry: Any):
+        # Entries are written atomically, as the cache directory can be shared by
+        # concurrent readers (and writers).
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, self._get_entry_path(dir_path, kind))
+        except Exception:
+            logger.warning(f"Failed to cache {kind} of {dir_path}.", exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+_caches: Dict[Tuple[str, str, Optional[float]], FileMetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_file_metadata_cache(
+    filesystem: "pyarrow.fs.FileSystem",
+) -> Optional[FileMetadataCache]:
+    """Returns the file metadata cache of the filesystem, or ``None`` if
+    ``DataContext.file_metadata_cache_dir`` isn't set."""
+    ctx = DataContext.get_current()
+    if ctx.file_metadata_cache_dir is None:
+        return None
+
+    key = (
+        ctx.file_metadata_cache_dir,
+        _get_filesystem_key(filesystem),
+        ctx.file_metadata_cache_ttl_s,
+    )
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = FileMetadataCache(*key)
+        return _caches[key]
+
+
+def _get_filesystem_key(filesystem: "pyarrow.fs.FileSystem") -> str:
+    from pyarrow.fs import PyFileSystem
+
+    from ray.data._internal.util import RetryingPyFileSystem
+
+    if isinstance(filesystem, RetryingPyFileSystem):
+        filesystem = filesystem.unwrap()
+    if isinstance(filesystem, PyFileSystem):
+        # E.g., fsspec filesystems (wrapped by `FSSpecHandler`)
+        handler = filesystem.handler
+        return f"py:{type(getattr(handler, 'fs', handler)).__name__}"
+
+    return filesystem.type_name
+
+
+def _normalize_dir(path: str) -> str:
+    return path.rstrip("/") or path
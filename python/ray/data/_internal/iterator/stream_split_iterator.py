@@ -4,12 +4,16 @@ import time
 from dataclasses import replace
 from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+
 import ray
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
 from ray.data._internal.execution.legacy_compat import execute_to_legacy_bundle_iterator
 from ray.data._internal.execution.operators.output_splitter import OutputSplitter
+from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import DatasetStats
-from ray.data.block import Block, BlockMetadata
+from ray.data.block import Block, BlockAccessor, BlockMetadata
 from ray.data.context import DataContext
 from ray.data.iterator import DataIterator
 from ray.types import ObjectRef
@@ -26,6 +30,9 @@ logger = logging.getLogger(__name__)
 
 BLOCKED_CLIENT_WARN_TIMEOUT = 30
 
+# Max number of blocks returned by a `SplitCoordinator.get` call.
+MAX_BLOCKS_PER_GET = 8
+
 
 class _DatasetWrapper:
     # A temporary workaround for https://github.com/ray-project/ray/issues/52549
@@ -43,6 +50,9 @@ class StreamSplitDataIterator(DataIterator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        shuffle_seed: Optional[int] = None,
+        shuffle_window_blocks: Optional[int] = None,
+        start_epoch: int = 0,
     ) -> List["StreamSplitDataIterator"]:
         """Create a split iterator from the given base Dataset and options.
 
@@ -54,10 +64,26 @@ class StreamSplitDataIterator(DataIterator):
             scheduling_strategy=NodeAffinitySchedulingStrategy(
                 ray.get_runtime_context().get_node_id(), soft=False
             ),
-        ).remote(_DatasetWrapper(base_dataset), n, equal, locality_hints)
+        ).remote(
+            _DatasetWrapper(base_dataset),
+            n,
+            equal,
+            locality_hints,
+            shuffle_seed,
+            start_epoch,
+        )
 
         return [
-            StreamSplitDataIterator(base_dataset, coord_actor, i, n) for i in range(n)
+            StreamSplitDataIterator(
+                base_dataset,
+                coord_actor,
+                i,
+                n,
+                equal=equal,
+                shuffle_seed=shuffle_seed,
+                shuffle_window_blocks=shuffle_window_blocks,
+            )
+            for i in range(n)
         ]
 
     def __init__(
@@ -66,36 +92,93 @@ class StreamSplitDataIterator(DataIterator):
         coord_actor: ray.actor.ActorHandle,
         output_split_idx: int,
         world_size: int,
+        equal: bool = False,
+        shuffle_seed: Optional[int] = None,
+        shuffle_window_blocks: Optional[int] = None,
     ):
         self._base_dataset = base_dataset
         self._coord_actor = coord_actor
         self._output_split_idx = output_split_idx
         self._world_size = world_size
+        self._equal = equal
+        self._shuffle_seed = shuffle_seed
+        self._shuffle_window_blocks = shuffle_window_blocks
         self._iter_stats = DatasetStats(metadata={}, parent=None)
 
     def _to_ref_bundle_iterator(
         self,
     ) -> Tuple[Iterator[RefBundle], Optional[DatasetStats], bool]:
-        def gen_blocks() -> Iterator[RefBundle]:
-            cur_epoch = ray.get(
-                self._coord_actor.start_epoch.remote(self._output_split_idx)
-            )
+        def gen_blocks(cur_epoch: int) -> Iterator[RefBundle]:
             future: ObjectRef[
-                Optional[ObjectRef[Block]]
-            ] = self._coord_actor.get.remote(cur_epoch, self._output_split_idx)
+                List[Tuple[ObjectRef[Block], BlockMetadata]]
+            ] = self._coord_actor.get.remote(
+                cur_epoch, self._output_split_idx, MAX_BLOCKS_PER_GET
+            )
             while True:
-                block_ref_and_md: Optional[
-                    Tuple[ObjectRef[Block], BlockMetadata]
-                ] = ray.get(future)
-                if not block_ref_and_md:
+                blocks: List[Tuple[ObjectRef[Block], BlockMetadata]] = ray.get(future)
+                if not blocks:
                     break
                 else:
                     future = self._coord_actor.get.remote(
-                        cur_epoch, self._output_split_idx
+                        cur_epoch, self._output_split_idx, MAX_BLOCKS_PER_GET
                     )
-                    yield RefBundle(blocks=(block_ref_and_md,), owns_blocks=False)
+                    for block_ref_and_md in blocks:
+                        yield RefBundle(blocks=(block_ref_and_md,), owns_blocks=False)
+
+        def gen_epoch() -> Iterator[RefBundle]:
+            cur_epoch = ray.get(
+                self._coord_actor.start_epoch.remote(
+                    self._output_split_idx, ray.get_runtime_context().get_node_id()
+                )
+            )
+            if self._shuffle_seed is not None and self._shuffle_window_blocks:
+                yield from self._shuffle_in_windows(gen_blocks(cur_epoch), cur_epoch)
+            else:
+                yield from gen_blocks(cur_epoch)
+
+        return gen_epoch(), self._iter_stats, False
+
+    def _shuffle_in_windows(
+        self, bundles: Iterator[RefBundle], epoch: int
+    ) -> Iterator[RefBundle]:
+        """Shuffles the rows across every window of `shuffle_window_blocks` blocks
+        (seeded by the shuffle seed, the epoch, the split and the window index).
+
+        Windows are shuffled by tasks on the node of this iterator, which the blocks
+        are fetched to anyway, yielding blocks of the same numbers of rows.
+        """
+        shuffle_window = cached_remote_fn(_shuffle_window)
+        scheduling_strategy = NodeAffinitySchedulingStrategy(
+            ray.get_runtime_context().get_node_id(), soft=True
+        )
 
-        return gen_blocks(), self._iter_stats, False
+        def shuffle(
+            window: List[Tuple[ObjectRef[Block], BlockMetadata]], window_idx: int
+        ) -> RefBundle:
+            seed = np.random.SeedSequence(
+                [self._shuffle_seed, epoch, self._output_split_idx, window_idx]
+            ).generate_state(1)[0]
+            block_refs = shuffle_window.options(
+                num_cpus=0,
+                num_returns=len(window),
+                scheduling_strategy=scheduling_strategy,
+            ).remote(int(seed), *[block_ref for block_ref, _ in window])
+            if len(window) == 1:
+                block_refs = [block_refs]
+            # Shuffled blocks have the same numbers of rows as the input ones.
+            metadata = [replace(meta, exec_stats=None) for _, meta in window]
+            return RefBundle(blocks=tuple(zip(block_refs, metadata)), owns_blocks=False)
+
+        window = []
+        window_idx = 0
+        for bundle in bundles:
+            window.extend(bundle.blocks)
+            if len(window) >= self._shuffle_window_blocks:
+                yield shuffle(window, window_idx)
+                window = []
+                window_idx += 1
+        if window:
+            yield shuffle(window, window_idx)
 
     def stats(self) -> str:
         """Implements DataIterator."""
@@ -120,6 +203,28 @@ class StreamSplitDataIterator(DataIterator):
         """Returns the number of splits total."""
         return self._world_size
 
+    def resize(self, n: int) -> List["StreamSplitDataIterator"]:
+        """Returns `n` iterators splitting the subsequent epochs of the dataset, for
+        elastic training.
+
+        This must be called between epochs. The returned iterators replace all the
+        iterators of the current splits, which can't be used anymore. Epochs are
+        numbered on from the current ones. Locality hints aren't carried over,
+        since splits are routed to the nodes the iterators are consumed on anyway.
+        """
+        next_epoch = ray.get(self._coord_actor.get_next_epoch.remote())
+        ray.kill(self._coord_actor)
+
+        return StreamSplitDataIterator.create(
+            self._base_dataset,
+            n,
+            self._equal,
+            None,
+            shuffle_seed=self._shuffle_seed,
+            shuffle_window_blocks=self._shuffle_window_blocks,
+            start_epoch=next_epoch,
+        )
+
     def _get_dataset_tag(self):
         return f"{self._base_dataset.get_dataset_id()}_split_{self._output_split_idx}"
 
@@ -130,6 +235,12 @@ class SplitCoordinator:
 
     This actor runs a streaming executor locally on its main thread. Clients can
     retrieve results via actor calls running on other threads.
+
+    Blocks are routed to the splits on the nodes holding them, by the locality hints
+    if provided, or otherwise by the nodes the clients start the epochs on. Unless
+    `equal` (or shuffling), clients run out of blocks steal the blocks queued for
+    the client with the most blocks queued, such that slow clients don't hold up
+    the others within an epoch.
     """
 
     def __init__(
@@ -138,17 +249,24 @@ class SplitCoordinator:
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        shuffle_seed: Optional[int] = None,
+        start_epoch: int = 0,
     ):
         dataset = dataset_wrapper._dataset
         # Set current DataContext.
         self._data_context = dataset.context
         ray.data.DataContext._set_current(self._data_context)
+        if shuffle_seed is not None:
+            # Splits are only reproducible if the order of the blocks is.
+            self._data_context.execution_options.preserve_order = True
         if self._data_context.execution_options.locality_with_output is True:
             self._data_context.execution_options.locality_with_output = locality_hints
             logger.info(f"Auto configuring locality_with_output={locality_hints}")
         self._base_dataset = dataset
         self._n = n
         self._equal = equal
+        # Reproducible splits (of shuffled datasets) don't allow stealing blocks.
+        self._steal = not equal and shuffle_seed is None
         self._locality_hints = locality_hints
         self._lock = threading.RLock()
         self._executor = None
@@ -156,12 +274,15 @@ class SplitCoordinator:
         # Guarded by self._lock.
         self._next_bundle: Dict[int, RefBundle] = {}
         self._unfinished_clients_in_epoch = n
-        self._cur_epoch = -1
+        self._cur_epoch = start_epoch - 1
+        # Nodes the clients started the last epochs on.
+        self._client_node_ids: List[Optional[NodeIdStr]] = [None] * n
 
         # Add a new stats field to track coordinator overhead
         self._coordinator_overhead_s = 0.0
 
         def gen_epochs():
+            epoch = start_epoch
             while True:
                 self._executor = self._base_dataset._plan.create_executor()
 
@@ -171,7 +292,9 @@ class SplitCoordinator:
                         n,
                         equal,
                         self._data_context,
-                        locality_hints,
+                        self._get_locality_hints(),
+                        shuffle_seed=shuffle_seed,
+                        epoch=epoch,
                     )
 
                 output_iterator = execute_to_legacy_bundle_iterator(
@@ -180,6 +303,7 @@ class SplitCoordinator:
                     dag_rewrite=add_split_op,
                 )
                 yield output_iterator
+                epoch += 1
 
         self._next_epoch = gen_epochs()
         self._output_iterator = None
@@ -198,21 +322,37 @@ class SplitCoordinator:
 
         return stats
 
-    def start_epoch(self, split_idx: int) -> str:
+    def start_epoch(self, split_idx: int, node_id: Optional[NodeIdStr] = None) -> str:
         """Called to start an epoch.
 
+        Args:
+            split_idx: The index of the split of the client.
+            node_id: The node the client consumes the split on, which the blocks of
+                the split are preferably routed to.
+
         Returns:
             UUID for the epoch, which must be used when accessing results via get().
         """
+        if node_id is not None:
+            with self._lock:
+                self._client_node_ids[split_idx] = node_id
 
         # Wait for all clients to arrive at the barrier before starting a new epoch.
         epoch_id = self._barrier(split_idx)
         return epoch_id
 
+    def get_next_epoch(self) -> int:
+        """Returns the index of the epoch to be started next."""
+        return self._cur_epoch + 1
+
     def get(
-        self, epoch_id: int, output_split_idx: int
-    ) -> Optional[Tuple[ObjectRef[Block], BlockMetadata]]:
-        """Blocking get operation.
+        self, epoch_id: int, output_split_idx: int, max_num_blocks: int = 1
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Blocking get operation, returning up to `max_num_blocks` blocks.
+
+        This blocks until the first block is available only, returning the other
+        blocks only if these are available already. An empty list is returned at the
+        end of the epoch.
 
         This is intended to be called concurrently from multiple clients.
         """
@@ -222,35 +362,50 @@ class SplitCoordinator:
                 "Invalid iterator: the dataset has moved on to another epoch."
             )
 
+        blocks = []
+        with self._lock:
+            next_bundle = self._next_bundle.pop(output_split_idx, None)
         try:
-            # Ensure there is at least one bundle.
-            with self._lock:
-                if output_split_idx in self._next_bundle:
-                    next_bundle = self._next_bundle[output_split_idx]
-                else:
-                    next_bundle = None
-
-            # Fetch next bundle if needed.
-            while next_bundle is None or not next_bundle.blocks:
-                # This is a BLOCKING call, so do it outside the lock.
-                next_bundle = self._output_iterator.get_next(output_split_idx)
-
-            block = next_bundle.blocks[-1]
-            next_bundle = replace(next_bundle, blocks=next_bundle.blocks[:-1])
-
-            # Accumulate any remaining blocks in next_bundle map as needed.
-            with self._lock:
-                self._next_bundle[output_split_idx] = next_bundle
-                if not next_bundle.blocks:
-                    del self._next_bundle[output_split_idx]
+            while len(blocks) < max_num_blocks:
+                if next_bundle is None or not next_bundle.blocks:
+                    # This is a BLOCKING call (for the first block), so do it outside
+                    # the lock. Blocks are only stolen from other clients if there's
+                    # none to return otherwise.
+                    next_bundle = self._output_iterator.get_next(
+                        output_split_idx,
+                        steal=self._steal and not blocks,
+                        block=not blocks,
+                    )
+                    if next_bundle is None:
+                        break
+                    continue
 
-            return block
+                blocks.append(next_bundle.blocks[-1])
+                next_bundle = replace(next_bundle, blocks=next_bundle.blocks[:-1])
         except StopIteration:
-            return None
+            pass
         finally:
+            # Accumulate any remaining blocks in next_bundle map as needed.
+            if next_bundle is not None and next_bundle.blocks:
+                with self._lock:
+                    self._next_bundle[output_split_idx] = next_bundle
             # Track overhead time in the instance variable
             self._coordinator_overhead_s += time.perf_counter() - start_time
 
+        return blocks
+
+    def _get_locality_hints(self) -> Optional[List[NodeIdStr]]:
+        if self._locality_hints is not None:
+            return self._locality_hints
+
+        with self._lock:
+            node_ids = list(self._client_node_ids)
+        # Routing blocks by locality only pays off if the clients are on multiple
+        # nodes.
+        if None in node_ids or len(set(node_ids)) < 2:
+            return None
+        return node_ids
+
     def _barrier(self, split_idx: int) -> int:
         """Arrive and block until the start of the given epoch."""
 
@@ -292,3 +447,24 @@ class SplitCoordinator:
 
         assert self._output_iterator is not None
         return starting_epoch + 1
+
+
+def _shuffle_window(seed: int, *blocks: Block) -> Union[Block, Tuple[Block, ...]]:
+    """Shuffles the rows across the blocks, returning blocks of the same numbers of
+    rows as the input ones."""
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    shuffled = BlockAccessor.for_block(builder.build()).random_shuffle(seed)
+
+    accessor = BlockAccessor.for_block(shuffled)
+    outputs = []
+    start = 0
+    for block in blocks:
+        end = start + BlockAccessor.for_block(block).num_rows()
+        outputs.append(accessor.slice(start, end, copy=True))
+        start = end
+
+    if len(outputs) == 1:
+        return outputs[0]
+    return tuple(outputs)
@@ -167,3 +167,33 @@ class Aggregate(AbstractAllToAll):
         self._aggs = aggs
         self._num_partitions = num_partitions
         self._batch_format = batch_format
+
+
+class Distinct(AbstractAllToAll):
+    """Logical operator for distinct."""
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        keys: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        num_partitions: Optional[int] = None,
+    ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            keys: The columns rows are compared by, or None to compare them by all
+                the columns.
+            order_by: The column by which the first row of the duplicates is kept,
+                or None to keep any of them.
+            descending: Whether to keep the row with the highest value of the
+                ``order_by`` column (rather than the lowest).
+            num_partitions: The number of partitions the rows are hash-partitioned
+                into (and number of output blocks).
+        """
+        super().__init__("Distinct", input_op, num_outputs=num_partitions)
+        self._keys = keys
+        self._order_by = order_by
+        self._descending = descending
+        self._num_partitions = num_partitions
@@ -13,6 +13,22 @@ class JoinType(Enum):
     LEFT_OUTER = "left_outer"
     RIGHT_OUTER = "right_outer"
     FULL_OUTER = "full_outer"
+    LEFT_SEMI = "left_semi"
+    LEFT_ANTI = "left_anti"
+
+
+# Join types for which the input at the given index can be broadcast. The broadcast
+# input is joined against every block of the other input independently, so
+# unmatched rows can only be preserved for the other (non-broadcast) input.
+BROADCASTABLE_JOIN_TYPES = {
+    0: (JoinType.INNER, JoinType.RIGHT_OUTER),
+    1: (
+        JoinType.INNER,
+        JoinType.LEFT_OUTER,
+        JoinType.LEFT_SEMI,
+        JoinType.LEFT_ANTI,
+    ),
+}
 
 
 class Join(NAry):
@@ -31,13 +47,15 @@ class Join(NAry):
         right_columns_suffix: Optional[str] = None,
         partition_size_hint: Optional[int] = None,
         aggregator_ray_remote_args: Optional[Dict[str, Any]] = None,
+        broadcast: Optional[bool] = None,
     ):
         """
         Args:
             left_input_op: The input operator at left hand side.
             right_input_op: The input operator at right hand side.
             join_type: The kind of join that should be performed, one of (“inner”,
-               “left_outer”, “right_outer”, “full_outer”).
+               “left_outer”, “right_outer”, “full_outer”, “left_semi”,
+               “left_anti”).
             left_key_columns: The columns from the left Dataset that should be used as
               keys of the join operation.
             right_key_columns: The columns from the right Dataset that should be used as
@@ -46,6 +64,10 @@ class Join(NAry):
               avg expected size of the resulting partition (in bytes)
             num_partitions: Total number of expected blocks outputted by this
                 operator.
+            broadcast: Whether to broadcast one of the inputs instead of
+                hash-shuffling both of them. If ``None``, an input is broadcast if
+                its estimated size doesn't exceed
+                ``DataContext.broadcast_join_threshold_bytes``.
         """
 
         try:
@@ -56,6 +78,15 @@ class Join(NAry):
                 f"Supported join types are: {', '.join(jt.value for jt in JoinType)}."
             )
 
+        if broadcast and not any(
+            join_type_enum in join_types
+            for join_types in BROADCASTABLE_JOIN_TYPES.values()
+        ):
+            raise ValueError(
+                f"Join type '{join_type}' doesn't support broadcasting, because "
+                f"unmatched rows of both inputs have to be preserved."
+            )
+
         super().__init__(left_input_op, right_input_op, num_outputs=num_partitions)
 
         self._left_key_columns = left_key_columns
@@ -67,6 +98,48 @@ class Join(NAry):
 
         self._partition_size_hint = partition_size_hint
         self._aggregator_ray_remote_args = aggregator_ray_remote_args
+        self._broadcast = broadcast
+
+    def get_broadcast_input_index(
+        self, broadcast_threshold_bytes: Optional[int]
+    ) -> Optional[int]:
+        """Returns the index of the input that should be broadcast, or ``None`` if
+        both inputs should be hash-shuffled instead.
+
+        Args:
+            broadcast_threshold_bytes: Max estimated size of an input for it to be
+                broadcast automatically (when broadcasting isn't explicitly
+                requested or disabled).
+        """
+        if self._broadcast is False:
+            return None
+
+        # NOTE: Right input is preferred, since it's conventionally the smaller one
+        candidate_input_idxs = [
+            input_idx
+            for input_idx in (1, 0)
+            if self._join_type in BROADCASTABLE_JOIN_TYPES[input_idx]
+        ]
+
+        if self._broadcast:
+            return candidate_input_idxs[0]
+
+        if broadcast_threshold_bytes is None:
+            return None
+
+        input_sizes = {}
+        for input_idx in candidate_input_idxs:
+            metadata = self._input_dependencies[input_idx].aggregate_output_metadata()
+            if (
+                metadata.size_bytes is not None
+                and metadata.size_bytes <= broadcast_threshold_bytes
+            ):
+                input_sizes[input_idx] = metadata.size_bytes
+
+        if not input_sizes:
+            return None
+
+        return min(input_sizes, key=input_sizes.get)
 
     @staticmethod
     def _validate_schemas(
@@ -229,6 +229,7 @@ class Filter(AbstractUDFMap):
         fn_constructor_args: Optional[Iterable[Any]] = None,
         fn_constructor_kwargs: Optional[Dict[str, Any]] = None,
         filter_expr: Optional["pa.dataset.Expression"] = None,
+        filter_expr_str: Optional[str] = None,
         compute: Optional[ComputeStrategy] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
@@ -237,6 +238,9 @@ class Filter(AbstractUDFMap):
         if not ((fn is None) ^ (filter_expr is None)):
             raise ValueError("Exactly one of 'fn' or 'filter_expr' must be provided")
         self._filter_expr = filter_expr
+        # The expression string that `filter_expr` was parsed from, if any. The
+        # optimizer uses it to push the filter into datasources.
+        self._filter_expr_str = filter_expr_str
 
         super().__init__(
             "Filter",
@@ -1,3 +1,4 @@
+import copy
 import functools
 from typing import Any, Dict, Optional, Union
 
@@ -46,6 +47,22 @@ class Read(AbstractMap):
         """
         return self._detected_parallelism
 
+    def with_datasource(self, datasource: Datasource) -> "Read":
+        """Return a copy of this operator that reads from ``datasource`` instead.
+
+        The copy has no output dependencies. Optimizer rules use this method to
+        replace the datasource without modifying an operator that might be shared
+        by multiple datasets.
+        """
+        assert self._datasource_or_legacy_reader is self._datasource
+        new_op = copy.copy(self)
+        new_op._datasource = datasource
+        new_op._datasource_or_legacy_reader = datasource
+        new_op._output_dependencies = []
+        # The cached metadata describes the original datasource.
+        new_op.__dict__.pop("_cached_output_metadata", None)
+        return new_op
+
     def aggregate_output_metadata(self) -> BlockMetadata:
         """A ``BlockMetadata`` that represents the aggregate metadata of the outputs.
 
@@ -14,7 +14,14 @@ from ray.data._internal.logical.rules.inherit_batch_format import InheritBatchFo
 from ray.data._internal.logical.rules.inherit_target_max_block_size import (
     InheritTargetMaxBlockSizeRule,
 )
+from ray.data._internal.logical.rules.join_key_filter_propagation import (
+    JoinKeyFilterPropagationRule,
+)
 from ray.data._internal.logical.rules.operator_fusion import FuseOperators
+from ray.data._internal.logical.rules.predicate_pushdown import PredicatePushdownRule
+from ray.data._internal.logical.rules.projection_pushdown import (
+    ProjectionPushdownRule,
+)
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 from ray.data._internal.logical.rules.set_read_parallelism import SetReadParallelismRule
 from ray.data._internal.logical.rules.zero_copy_map_fusion import (
@@ -26,6 +33,9 @@ _LOGICAL_RULESET = Ruleset(
     [
         ReorderRandomizeBlocksRule,
         InheritBatchFormatRule,
+        JoinKeyFilterPropagationRule,
+        PredicatePushdownRule,
+        ProjectionPushdownRule,
     ]
 )
 
@@ -0,0 +1,116 @@
+import copy
+import logging
+from typing import List
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.join_operator import Join, JoinType
+from ray.data._internal.logical.operators.map_operator import Filter, Project
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+
+logger = logging.getLogger(__name__)
+
+
+# Join types for which filters on the key columns of the input at the given index
+# can be propagated to the other input: rows of the other input whose keys don't
+# pass the filters can only be joined with rows that were filtered out, and the
+# other input's unmatched rows aren't preserved.
+_PROPAGATING_JOIN_TYPES = {
+    0: (JoinType.INNER, JoinType.LEFT_OUTER, JoinType.LEFT_SEMI, JoinType.LEFT_ANTI),
+    1: (JoinType.INNER, JoinType.RIGHT_OUTER, JoinType.LEFT_SEMI),
+}
+
+
+class JoinKeyFilterPropagationRule(Rule):
+    """Rule for propagating expression filters on join keys across a ``Join``.
+
+    When an input of a ``Join`` is filtered with ``Dataset.filter(expr=...)`` and a
+    conjunct of the filter only reads key columns, the same conjunct (reading the
+    corresponding key columns) is applied to the other input, if that doesn't
+    change the result of the join (see ``_PROPAGATING_JOIN_TYPES``). For example,
+    ``events.filter(expr="user_id < 100").join(users, "inner", on=("user_id",))``
+    filters ``users`` as well, so that less data is shuffled, and the filter can be
+    pushed into the datasource of ``users`` by ``PredicatePushdownRule``.
+
+    The rule never modifies operators in place, because they may be shared by
+    multiple datasets.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = plan.dag._apply_transform(self._try_propagate_filters)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _try_propagate_filters(self, op: LogicalOperator) -> LogicalOperator:
+        if not isinstance(op, Join):
+            return op
+
+        from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+            ExpressionEvaluator,
+        )
+
+        key_columns = [op._left_key_columns, op._right_key_columns]
+        conjuncts = [
+            _get_filter_conjuncts(input_op) for input_op in op.input_dependencies
+        ]
+
+        new_input_ops = list(op.input_dependencies)
+        for input_idx, other_idx in [(0, 1), (1, 0)]:
+            if op._join_type not in _PROPAGATING_JOIN_TYPES[input_idx]:
+                continue
+
+            names = dict(zip(key_columns[input_idx], key_columns[other_idx]))
+            propagated_conjuncts = []
+            for conjunct in conjuncts[input_idx]:
+                propagated = ExpressionEvaluator.rename_columns(conjunct, names)
+                if (
+                    propagated is not None
+                    and propagated not in conjuncts[other_idx]
+                    and propagated not in propagated_conjuncts
+                ):
+                    propagated_conjuncts.append(propagated)
+
+            if propagated_conjuncts:
+                expression = ExpressionEvaluator.join_conjuncts(propagated_conjuncts)
+                logger.debug(f"Propagating filter '{expression}' across {op.name}.")
+                # The filter reads from a copy of the input, since constructing it
+                # appends it to the output dependencies of its input.
+                input_op = copy.copy(op.input_dependencies[other_idx])
+                input_op._output_dependencies = []
+                new_input_ops[other_idx] = Filter(
+                    input_op,
+                    filter_expr=ExpressionEvaluator.get_filters(expression),
+                    filter_expr_str=expression,
+                )
+
+        if new_input_ops == op.input_dependencies:
+            return op
+
+        op_copy = copy.copy(op)
+        op_copy._input_dependencies = new_input_ops
+        op_copy._output_dependencies = []
+        # Only the new filters are wired to the copy (see `_apply_transform`).
+        op_copy._wire_output_deps(
+            [
+                input_op
+                for input_op in new_input_ops
+                if input_op not in op.input_dependencies
+            ]
+        )
+        return op_copy
+
+
+def _get_filter_conjuncts(op: LogicalOperator) -> List[str]:
+    """Returns conjuncts of the expression filters that every output row of ``op``
+    passes, looking through operators that don't change column values."""
+    from ray.data._internal.planner.plan_expression.expression_evaluator import (
+        ExpressionEvaluator,
+    )
+
+    conjuncts = []
+    while isinstance(op, (Filter, Limit)) or (
+        isinstance(op, Project) and not op.cols_rename
+    ):
+        if isinstance(op, Filter):
+            if op._filter_expr_str:
+                conjuncts += ExpressionEvaluator.get_conjuncts(op._filter_expr_str)
+        op = op.input_dependency
+    return conjuncts
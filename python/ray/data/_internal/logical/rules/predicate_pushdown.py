@@ -0,0 +1,71 @@
+import logging
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Filter, Project
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.rules.projection_pushdown import copy_with_input
+
+logger = logging.getLogger(__name__)
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing expression filters into the datasource of a Read operator.
+
+    When a ``Filter`` created with ``Dataset.filter(expr=...)`` is downstream of a
+    ``Read`` operator, and only ``Project`` operators that select (but don't rename)
+    columns are in between, we pass the filter expression to the datasource. The
+    datasource uses it to skip data that can't match, for example by pruning
+    partitions based on their paths, or by skipping row groups based on their
+    statistics.
+
+    Datasources are allowed to apply the expression partially, so the ``Filter``
+    operator is kept in the plan and still filters every row. The rule never
+    modifies operators or datasources in place, because they may be shared by
+    multiple datasets.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = plan.dag._apply_transform(self._try_push_predicate)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _try_push_predicate(self, op: LogicalOperator) -> LogicalOperator:
+        if not isinstance(op, Filter) or not op._filter_expr_str:
+            return op
+
+        ops_between_read_and_filter: List[LogicalOperator] = []
+        upstream_op = op.input_dependency
+        while isinstance(upstream_op, Project) and not upstream_op.cols_rename:
+            ops_between_read_and_filter.append(upstream_op)
+            upstream_op = upstream_op.input_dependency
+
+        if not isinstance(upstream_op, Read):
+            return op
+
+        new_read_op = self._create_filtered_read(upstream_op, op._filter_expr_str)
+        if new_read_op is None:
+            return op
+
+        # Rebuild the chain of operators on top of the new Read operator, using
+        # copies so that the original DAG is left untouched.
+        input_op = new_read_op
+        for upstream_op in reversed(ops_between_read_and_filter):
+            input_op = copy_with_input(upstream_op, input_op)
+        return copy_with_input(op, input_op)
+
+    @staticmethod
+    def _create_filtered_read(read_op: Read, expression: str) -> Optional[Read]:
+        datasource = read_op._datasource
+        # Legacy readers are created before optimization, so we can't change the
+        # data they read.
+        if read_op._datasource_or_legacy_reader is not datasource:
+            return None
+        if not datasource.supports_predicate_pushdown():
+            return None
+
+        filtered_datasource = datasource.apply_predicate(expression)
+        if filtered_datasource is datasource:
+            return None
+
+        logger.debug(f"Pushing predicate '{expression}' into {read_op.name}.")
+        return read_op.with_datasource(filtered_datasource)
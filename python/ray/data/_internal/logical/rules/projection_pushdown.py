@@ -0,0 +1,141 @@
+import copy
+import logging
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Filter, Project
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.read_operator import Read
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing column selections into the datasource of a Read operator.
+
+    When a ``Project`` operator that selects columns is downstream of a ``Read``
+    operator, and only column-preserving operators (``Limit``, expression
+    ``Filter``, and other ``Project`` operators) are in between, we compute the
+    columns the ``Project`` and the filters need from the ``Read`` and ask the
+    datasource to only read those columns. For example,
+    ``Read[ReadParquet] -> Project`` reads only the selected columns from the files
+    instead of decoding full tables and dropping columns afterwards.
+
+    The ``Project`` operator is kept in the plan, because it still determines the
+    column order and applies renames. The rule never modifies operators or
+    datasources in place, because they may be shared by multiple datasets.
+
+    Only ``Project`` operators (i.e., ``Dataset.select_columns`` and
+    ``Dataset.rename_columns``) are pushed down. ``Dataset.drop_columns`` is
+    planned as a ``MapBatches`` operator running a UDF, whose output columns
+    depend on the schema of its input, so the columns it drops are still read.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = plan.dag._apply_transform(self._try_push_projection)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _try_push_projection(self, op: LogicalOperator) -> LogicalOperator:
+        if not isinstance(op, Project) or not op.cols:
+            return op
+
+        # Walk up the DAG, translating the required column names through renames,
+        # until we reach the operator that produces the columns.
+        columns = list(op.cols)
+        ops_between_read_and_project: List[LogicalOperator] = []
+        upstream_op = op.input_dependency
+        while isinstance(upstream_op, (Limit, Project)) or (
+            isinstance(upstream_op, Filter) and upstream_op._filter_expr_str
+        ):
+            if isinstance(upstream_op, Project):
+                columns = self._columns_before_project(upstream_op, columns)
+                if columns is None:
+                    return op
+            elif isinstance(upstream_op, Filter):
+                from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+                    ExpressionEvaluator,
+                )
+
+                filter_columns = ExpressionEvaluator.get_referenced_columns(
+                    upstream_op._filter_expr_str
+                )
+                columns += sorted(filter_columns - set(columns))
+            ops_between_read_and_project.append(upstream_op)
+            upstream_op = upstream_op.input_dependency
+
+        if not isinstance(upstream_op, Read):
+            return op
+
+        new_read_op = self._create_projected_read(upstream_op, columns)
+        if new_read_op is None:
+            return op
+
+        # Rebuild the chain of operators on top of the new Read operator, using
+        # copies so that the original DAG is left untouched.
+        input_op = new_read_op
+        for upstream_op in reversed(ops_between_read_and_project):
+            input_op = copy_with_input(upstream_op, input_op)
+        return copy_with_input(op, input_op)
+
+    @staticmethod
+    def _columns_before_project(op: Project, columns: List[str]) -> Optional[List[str]]:
+        """Map column names after ``op`` to column names before ``op``.
+
+        Returns ``None`` if ``op`` doesn't output all of ``columns``.
+        """
+        if op.cols_rename:
+            original_names = {new: old for old, new in op.cols_rename.items()}
+            renamed_columns = set(op.cols_rename)
+            columns_before = []
+            for column in columns:
+                if column in original_names:
+                    columns_before.append(original_names[column])
+                elif column in renamed_columns:
+                    # The column was renamed to something else, so it doesn't
+                    # exist after this operator.
+                    return None
+                else:
+                    columns_before.append(column)
+            columns = columns_before
+        if op.cols and not set(columns).issubset(op.cols):
+            return None
+        return columns
+
+    @staticmethod
+    def _create_projected_read(read_op: Read, columns: List[str]) -> Optional[Read]:
+        datasource = read_op._datasource
+        # Legacy readers are created before optimization, so we can't change the
+        # columns they read.
+        if read_op._datasource_or_legacy_reader is not datasource:
+            return None
+        if not datasource.supports_projection_pushdown():
+            return None
+
+        current_projection = datasource.get_current_projection()
+        if current_projection is not None and list(current_projection) == columns:
+            # The projection was already pushed down.
+            return None
+
+        projected_datasource = datasource.apply_projection(columns)
+        if projected_datasource is datasource:
+            return None
+
+        logger.debug(
+            f"Pushing projection {columns} into {read_op.name}, which previously "
+            f"read {current_projection if current_projection is not None else 'all'} "
+            "columns."
+        )
+        return read_op.with_datasource(projected_datasource)
+
+
+def copy_with_input(op: LogicalOperator, input_op: LogicalOperator) -> LogicalOperator:
+    """Return a shallow copy of a single-input ``op`` that reads from ``input_op``.
+
+    The copy is appended to the output dependencies of ``input_op`` and has no output
+    dependencies of its own.
+    """
+    op_copy = copy.copy(op)
+    op_copy._input_dependencies = [input_op]
+    op_copy._output_dependencies = []
+    input_op._output_dependencies.append(op_copy)
+    return op_copy
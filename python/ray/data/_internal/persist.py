@@ -0,0 +1,294 @@
+"""Persisting datasets to node-local disk (see ``Dataset.persist``).
+
+Blocks of persisted datasets are written (by the tasks producing them) to Arrow
+IPC files on the local disk of the nodes running these tasks, and are read back
+(memory-mapped) by every subsequent execution of the persisted dataset.
+
+Persisted datasets of the same job are tracked by a (driver-side) registry, which
+evicts the least recently used ones once their total size exceeds
+``DataContext.persist_max_bytes``. Files of the evicted datasets are deleted, and
+re-written (re-executing the original dataset) upon their next execution.
+"""
+import collections
+import enum
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+
+import ray
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.util import GiB
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+if TYPE_CHECKING:
+    from ray.data.dataset import Dataset
+
+logger = logging.getLogger(__name__)
+
+
+class StorageLevel(str, enum.Enum):
+    """Where ``Dataset.persist`` stores the blocks of the dataset.
+
+    - DISK: Arrow IPC files on the local disk of the nodes producing the blocks
+    - MEMORY: the object store (same as ``Dataset.materialize``)
+    """
+
+    DISK = "disk"
+    MEMORY = "memory"
+
+
+@dataclass(frozen=True)
+class PersistedFile:
+    """An Arrow IPC file holding a block of a persisted dataset."""
+
+    path: str
+    node_id: str
+    num_rows: int
+    size_bytes: int
+
+
+class PersistedCache:
+    """Files holding the blocks of a persisted dataset.
+
+    Args:
+        dataset: The dataset to persist (re-executed to re-write the files once
+            they're evicted).
+        cache_dir: The (node-local) directory to write the files into.
+    """
+
+    def __init__(self, dataset: "Dataset", cache_dir: str):
+        self._dataset = dataset
+        self._cache_dir = cache_dir
+        # Files holding the blocks, or None if they're not written (or evicted).
+        self._files: Optional[List[PersistedFile]] = None
+        self._schema: Optional[pa.Schema] = None
+        # Serializes writes of the files (of this cache only), which execute the
+        # dataset and hence aren't done holding the lock of the registry.
+        self._write_lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(file.size_bytes for file in self._files or [])
+
+    @property
+    def schema(self) -> Optional[pa.Schema]:
+        return self._schema
+
+    @property
+    def is_persisted(self) -> bool:
+        return self._files is not None
+
+    def get_files(self) -> List[PersistedFile]:
+        """Returns the files holding the blocks, writing them first if they're not
+        written (or have been evicted)."""
+        with self._write_lock:
+            with _registry.lock:
+                files = self._files
+                if files is not None:
+                    _registry.touch(self)
+                    return files
+
+            files, schema = self._write()
+
+            with _registry.lock:
+                self._files = files
+                if schema is not None:
+                    self._schema = schema
+                _registry.add(self)
+
+            return files
+
+    def evict(self):
+        """Deletes the files holding the blocks (from all the nodes)."""
+        # NOTE: This doesn't acquire the write lock, since caches are evicted by
+        #       the registry (holding its lock) when adding other caches.
+        with _registry.lock:
+            if self._files is None:
+                return
+
+            node_ids = {file.node_id for file in self._files}
+            self._files = None
+            _registry.remove(self._cache_dir)
+
+        _delete_cache_dir(self._cache_dir, node_ids)
+
+    def _write(self) -> Tuple[List[PersistedFile], Optional[pa.Schema]]:
+        """Executes the dataset, writing its blocks to files, and returns the files
+        with the schema of the blocks."""
+        cache_dir = self._cache_dir
+
+        def write_block(table: pa.Table) -> pa.Table:
+            return _write_ipc_file(table, cache_dir)
+
+        rows = self._dataset.map_batches(
+            write_block,
+            batch_size=None,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+        ).take_all()
+
+        files = [
+            PersistedFile(
+                path=row["path"],
+                node_id=row["node_id"],
+                num_rows=row["num_rows"],
+                size_bytes=row["size_bytes"],
+            )
+            for row in rows
+        ]
+        schema = None
+        if rows:
+            schema = pa.ipc.read_schema(pa.py_buffer(rows[0]["schema"]))
+
+        size_bytes = sum(file.size_bytes for file in files)
+        logger.debug(
+            f"Persisted {len(files)} blocks ({size_bytes / GiB:.2f}GB) "
+            f"into {self._cache_dir}"
+        )
+        return files, schema
+
+    def __deepcopy__(self, memo) -> "PersistedCache":
+        # Copies of the persisted dataset (and its plan) share the same files.
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._write_lock = threading.Lock()
+
+
+class _PersistedCacheRegistry:
+    """Tracks the persisted caches of the job (in the order they were last used),
+    evicting the least recently used ones to keep their total size within
+    ``DataContext.persist_max_bytes``."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        # Weak references to the caches (by their directories), from the least to
+        # the most recently used.
+        self._caches: Dict[str, weakref.ref] = collections.OrderedDict()
+
+    def add(self, cache: PersistedCache):
+        from ray.data.context import DataContext
+
+        with self.lock:
+            self._caches[cache._cache_dir] = weakref.ref(cache)
+            self._caches.move_to_end(cache._cache_dir)
+
+            max_bytes = DataContext.get_current().persist_max_bytes
+            if max_bytes is None:
+                return
+
+            for cache_ref in list(self._caches.values())[:-1]:
+                if self.total_size_bytes() <= max_bytes:
+                    break
+                lru_cache = cache_ref()
+                if lru_cache is not None:
+                    logger.debug(
+                        "Evicting persisted dataset of "
+                        f"{lru_cache.size_bytes / GiB:.2f}GB"
+                    )
+                    lru_cache.evict()
+
+    def touch(self, cache: PersistedCache):
+        with self.lock:
+            if cache._cache_dir in self._caches:
+                self._caches.move_to_end(cache._cache_dir)
+
+    def remove(self, cache_dir: str):
+        with self.lock:
+            self._caches.pop(cache_dir, None)
+
+    def total_size_bytes(self) -> int:
+        with self.lock:
+            caches = [cache_ref() for cache_ref in self._caches.values()]
+            return sum(cache.size_bytes for cache in caches if cache is not None)
+
+
+_registry = _PersistedCacheRegistry()
+
+
+def persist_dataset(dataset: "Dataset") -> "Dataset":
+    """Executes the dataset, writing its blocks to node-local disk, and returns a
+    dataset reading them back."""
+    from ray.data._internal.datasource.persisted_datasource import (
+        PersistedDatasource,
+    )
+    from ray.data.context import DataContext
+    from ray.data.read_api import read_datasource
+
+    persist_dir = DataContext.get_current().persist_dir or tempfile.gettempdir()
+    cache_dir = os.path.join(
+        persist_dir,
+        f"ray_data_persist_{ray.get_runtime_context().get_job_id()}",
+        uuid.uuid4().hex,
+    )
+
+    cache = PersistedCache(dataset, cache_dir)
+    files = cache.get_files()
+    # Delete the files once the cache (i.e., all the datasets reading it) is
+    # garbage collected.
+    weakref.finalize(cache, _cleanup_cache, cache_dir)
+
+    return read_datasource(
+        PersistedDatasource(cache), override_num_blocks=max(len(files), 1)
+    )
+
+
+def _write_ipc_file(table: pa.Table, cache_dir: str) -> pa.Table:
+    """Writes the block to an Arrow IPC file in the (local) cache directory, and
+    returns a single-row table describing the file."""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{uuid.uuid4().hex}.arrow")
+
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    return pa.table(
+        {
+            "path": [path],
+            "node_id": [ray.get_runtime_context().get_node_id()],
+            "num_rows": [table.num_rows],
+            "size_bytes": [os.path.getsize(path)],
+            "schema": [table.schema.serialize().to_pybytes()],
+        }
+    )
+
+
+def _delete_cache_dir(cache_dir: str, node_ids: Iterable[str]):
+    """Deletes the cache directory from the nodes (without waiting for it)."""
+    if not ray.is_initialized():
+        return
+
+    delete_dir = cached_remote_fn(_delete_local_dir, num_cpus=0)
+    for node_id in node_ids:
+        delete_dir.options(
+            scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=True)
+        ).remote(cache_dir)
+
+
+def _delete_local_dir(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _cleanup_cache(cache_dir: str):
+    _registry.remove(cache_dir)
+    if ray.is_initialized():
+        # The nodes holding the files might've changed as the files got
+        # re-written, hence deleting them from all the nodes.
+        _delete_cache_dir(
+            cache_dir, [node["NodeID"] for node in ray.nodes() if node["Alive"]]
+        )
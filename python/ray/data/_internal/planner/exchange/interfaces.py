@@ -33,6 +33,14 @@ class ExchangeTaskSpec:
     MAP_SUB_PROGRESS_BAR_NAME = "Shuffle Map"
     REDUCE_SUB_PROGRESS_BAR_NAME = "Shuffle Reduce"
 
+    # Whether `reduce` is a generator yielding any number of blocks (each followed
+    # by its metadata), instead of returning a single block and its metadata.
+    REDUCE_YIELDS_BLOCKS = False
+    # Whether `reduce` takes the references to the map outputs (as a single list),
+    # fetching these itself, instead of the map outputs (resolved by Ray before the
+    # reduce task starts). Only supported along with `REDUCE_YIELDS_BLOCKS`.
+    REDUCE_FETCHES_INPUTS = False
+
     def __init__(self, map_args: List[Any] = None, reduce_args: List[Any] = None):
         self._map_args = map_args or []
         self._reduce_args = reduce_args or []
@@ -10,7 +10,8 @@ from ray.data._internal.planner.exchange.interfaces import (
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import convert_bytes_to_human_readable_str
-from ray.data.block import to_stats
+from ray.data.block import Block, BlockMetadata, to_stats
+from ray.types import ObjectRef
 
 logger = logging.getLogger(__name__)
 
@@ -111,40 +112,104 @@ class PullBasedShuffleTaskScheduler(ExchangeTaskScheduler):
         if _debug_limit_execution_to_num_blocks is not None:
             output_num_blocks = _debug_limit_execution_to_num_blocks
             logger.debug(f"Limiting execution to {output_num_blocks} reduce tasks")
-        shuffle_reduce_out = [
-            shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2).remote(
-                *self._exchange_spec._reduce_args,
-                *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
+        if self._exchange_spec.REDUCE_YIELDS_BLOCKS:
+            output, new_metadata = self._execute_streaming_reduce(
+                shuffle_reduce,
+                shuffle_map_out,
+                input_num_blocks,
+                output_num_blocks,
+                reduce_ray_remote_args,
+                reduce_bar,
+                input_owned,
             )
-            for j in range(output_num_blocks)
-        ]
+            # Release map task outputs from the Ray object store.
+            del shuffle_map_out
+        else:
+            shuffle_reduce_out = [
+                shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2).remote(
+                    *self._exchange_spec._reduce_args,
+                    *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
+                )
+                for j in range(output_num_blocks)
+            ]
+
+            # Release map task outputs from the Ray object store.
+            del shuffle_map_out
+
+            new_blocks, new_metadata = [], []
+            if shuffle_reduce_out:
+                new_blocks, new_metadata = zip(*shuffle_reduce_out)
+            new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
+
+            output = []
+            for block, meta in zip(new_blocks, new_metadata):
+                output.append(
+                    RefBundle(
+                        [
+                            (
+                                block,
+                                meta,
+                            )
+                        ],
+                        owns_blocks=input_owned,
+                    )
+                )
 
-        # Release map task outputs from the Ray object store.
-        del shuffle_map_out
+        self.warn_on_high_local_memory_store_usage()
 
-        new_blocks, new_metadata = [], []
-        if shuffle_reduce_out:
-            new_blocks, new_metadata = zip(*shuffle_reduce_out)
-        new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
+        stats = {
+            "map": to_stats(shuffle_map_metadata),
+            "reduce": to_stats(new_metadata),
+        }
 
-        self.warn_on_high_local_memory_store_usage()
+        return (output, stats)
+
+    def _execute_streaming_reduce(
+        self,
+        shuffle_reduce,
+        shuffle_map_out: List[List[ObjectRef[Block]]],
+        input_num_blocks: int,
+        output_num_blocks: int,
+        reduce_ray_remote_args: Dict[str, Any],
+        reduce_bar,
+        input_owned: bool,
+    ) -> Tuple[List[RefBundle], List[BlockMetadata]]:
+        """Run reduce tasks that yield any number of blocks, each followed by its
+        metadata, and bundle the blocks of every reduce task together."""
+        shuffle_reduce_gens = []
+        for j in range(output_num_blocks):
+            map_out = [shuffle_map_out[i][j] for i in range(input_num_blocks)]
+            if self._exchange_spec.REDUCE_FETCHES_INPUTS:
+                # Nested references aren't resolved by Ray, so that the reduce
+                # task fetches the map outputs itself.
+                map_out = [map_out]
+            shuffle_reduce_gens.append(
+                shuffle_reduce.options(
+                    **reduce_ray_remote_args, num_returns="streaming"
+                ).remote(*self._exchange_spec._reduce_args, *map_out)
+            )
+
+        # Collect the references to the yielded blocks and metadata, while the
+        # reduce tasks run.
+        block_refs_per_task, metadata_refs_per_task = [], []
+        for gen in shuffle_reduce_gens:
+            refs = list(gen)
+            block_refs_per_task.append(refs[0::2])
+            metadata_refs_per_task.append(refs[1::2])
+
+        new_metadata = reduce_bar.fetch_until_complete(
+            [ref for refs in metadata_refs_per_task for ref in refs]
+        )
 
         output = []
-        for block, meta in zip(new_blocks, new_metadata):
+        offset = 0
+        for block_refs in block_refs_per_task:
+            metadata = new_metadata[offset : offset + len(block_refs)]
+            offset += len(block_refs)
             output.append(
                 RefBundle(
-                    [
-                        (
-                            block,
-                            meta,
-                        )
-                    ],
+                    list(zip(block_refs, metadata)),
                     owns_blocks=input_owned,
                 )
             )
-        stats = {
-            "map": to_stats(shuffle_map_metadata),
-            "reduce": to_stats(new_metadata),
-        }
-
-        return (output, stats)
+        return output, new_metadata
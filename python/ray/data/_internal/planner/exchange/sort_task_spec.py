@@ -1,14 +1,25 @@
-from typing import TYPE_CHECKING, List, Optional, Tuple, TypeVar, Union
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
+import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.table_block import TableBlockAccessor
 from ray.data._internal.util import NULL_SENTINEL
-from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.block import (
+    Block,
+    BlockAccessor,
+    BlockExecStats,
+    BlockMetadata,
+    BlockType,
+)
 from ray.types import ObjectRef
 
 T = TypeVar("T")
@@ -16,6 +27,9 @@ T = TypeVar("T")
 if TYPE_CHECKING:
     import pyarrow
 
+# Maximum number of sorted runs fetched at once by a merge task.
+_MAX_NUM_RUNS_FETCHED_AT_ONCE = 4
+
 
 class SortKey:
     """SortKey class to convert between different sort args formats."""
@@ -227,5 +241,350 @@ class SortTaskSpec(ExchangeTaskSpec):
         return [samples_list[i] for i in quantile_indices[1:-1]]
 
 
+class ExternalMergeSortTaskSpec(SortTaskSpec):
+    """
+    The implementation for distributed sort tasks, merging sorted blocks with
+    bounded memory.
+
+    It differs from `SortTaskSpec` in the following ways:
+
+    Sorting (`map`): each block is sorted into a run of Arrow record batches.
+    When the sampled boundaries contain duplicates (i.e., a single key takes up
+    more than one range of the sample), rows with that key are spread evenly
+    across all of the corresponding partitions instead of all landing in one of
+    them. Since these rows are equal with respect to the sort key, this doesn't
+    affect the order of the result.
+
+    Merging (`reduce`): instead of concatenating and sorting all of its inputs at
+    once, a merge task fetches the sorted runs a few at a time (rather than having
+    Ray fetch all of them before the task starts), writing these to Arrow IPC files
+    on the local disk. It then performs a k-way streaming merge of the runs
+    memory-mapped from these files, taking a bounded window of rows from every run
+    at a time, and yields output blocks of up to `target_max_block_size` bytes as
+    soon as they're produced. Hence neither the merge task nor the object store of
+    its node hold the whole partition in memory.
+    """
+
+    REDUCE_YIELDS_BLOCKS = True
+    REDUCE_FETCHES_INPUTS = True
+
+    def __init__(
+        self,
+        boundaries: List[T],
+        sort_key: SortKey,
+        batch_format: str,
+        target_max_block_size: int,
+    ):
+        super().__init__(
+            boundaries=boundaries, sort_key=sort_key, batch_format=batch_format
+        )
+        self._reduce_args.append(target_max_block_size)
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        boundaries: List[T],
+        sort_key: SortKey,
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        table = TableBlockAccessor.try_convert_block_type(block, BlockType.ARROW)
+
+        if table.num_rows == 0:
+            out = [table] * (len(boundaries) + 1)
+        else:
+            # NOTE: Runs are sorted with Arrow (rather than the configured sort
+            #       transform), to sort them consistently with the merge
+            table = transform_pyarrow.sort(table, sort_key)
+            if len(boundaries) == 0:
+                out = [table]
+            else:
+                out = BlockAccessor.for_block(table)._find_partitions_sorted(
+                    boundaries, sort_key
+                )
+                out = _spread_duplicate_boundary_rows(out, boundaries, sort_key)
+
+        meta = BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+        return out + [meta]
+
+    @staticmethod
+    def reduce(
+        sort_key: SortKey,
+        batch_format: str,
+        target_max_block_size: int,
+        run_refs: List[ObjectRef[Block]],
+        partial_reduce: bool = False,
+    ) -> Iterator[Union[Block, BlockMetadata]]:
+        runs_dir = tempfile.mkdtemp(prefix="ray_data_sort_")
+        try:
+            runs, empty_runs = _fetch_runs(run_refs, runs_dir)
+            yield from ExternalMergeSortTaskSpec._merge_runs(
+                runs, empty_runs, sort_key, batch_format, target_max_block_size
+            )
+        finally:
+            shutil.rmtree(runs_dir, ignore_errors=True)
+
+    @staticmethod
+    def _merge_runs(
+        runs: List["pyarrow.Table"],
+        empty_runs: List["pyarrow.Table"],
+        sort_key: SortKey,
+        batch_format: str,
+        target_max_block_size: int,
+    ) -> Iterator[Union[Block, BlockMetadata]]:
+        target_block_type = ExchangeTaskSpec._derive_target_block_type(batch_format)
+
+        def _finalize_block(tables: List["pyarrow.Table"]) -> Block:
+            block = transform_pyarrow.concat(tables, promote_types=True)
+            if target_block_type is not None:
+                block = TableBlockAccessor.try_convert_block_type(
+                    block, target_block_type
+                )
+            return block
+
+        stats = BlockExecStats.builder()
+
+        if len(runs) == 0:
+            block = _finalize_block(empty_runs[:1])
+            yield block
+            yield BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+            return
+
+        # Size the merge window such that windows of all runs together take up
+        # about a single output block
+        total_num_rows = sum(run.num_rows for run in runs)
+        avg_row_size_bytes = max(1, sum(run.nbytes for run in runs) // total_num_rows)
+        window_num_rows = max(
+            1, target_max_block_size // (avg_row_size_bytes * len(runs))
+        )
+
+        pending: List["pyarrow.Table"] = []
+        pending_size_bytes = 0
+
+        for merged in _merge_sorted_runs(runs, sort_key, window_num_rows):
+            pending.append(merged)
+            pending_size_bytes += merged.nbytes
+
+            if pending_size_bytes >= target_max_block_size:
+                block = _finalize_block(pending)
+                yield block
+                yield BlockAccessor.for_block(block).get_metadata(
+                    exec_stats=stats.build()
+                )
+
+                pending, pending_size_bytes = [], 0
+                stats = BlockExecStats.builder()
+
+        if pending:
+            block = _finalize_block(pending)
+            yield block
+            yield BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+
+
+def _fetch_runs(
+    run_refs: List[ObjectRef[Block]], runs_dir: str
+) -> Tuple[List["pyarrow.Table"], List["pyarrow.Table"]]:
+    """Fetches the sorted runs, at most `_MAX_NUM_RUNS_FETCHED_AT_ONCE` of them at a
+    time, and writes the non-empty ones to Arrow IPC files in `runs_dir`.
+
+    Returns the non-empty runs memory-mapped from the files (so that only the
+    windows of the runs being merged are paged in), and the empty runs, both in
+    the order of `run_refs`.
+    """
+    import pyarrow as pa
+
+    run_idxs = {ref: idx for idx, ref in enumerate(run_refs)}
+    runs_by_idx, empty_runs_by_idx = {}, {}
+    pending_refs = list(run_refs)
+    fetching_refs = []
+    while pending_refs or fetching_refs:
+        num_refs_to_fetch = _MAX_NUM_RUNS_FETCHED_AT_ONCE - len(fetching_refs)
+        fetching_refs += pending_refs[:num_refs_to_fetch]
+        del pending_refs[:num_refs_to_fetch]
+
+        [ready_ref], fetching_refs = ray.wait(
+            fetching_refs, num_returns=1, fetch_local=True
+        )
+        idx = run_idxs[ready_ref]
+        block = TableBlockAccessor.try_convert_block_type(
+            ray.get(ready_ref), BlockType.ARROW
+        )
+        if block.num_rows == 0:
+            empty_runs_by_idx[idx] = block
+            continue
+
+        path = os.path.join(runs_dir, f"{idx}.arrow")
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, block.schema) as writer:
+                writer.write_table(block)
+        # Release the fetched run, which is read back from the file instead.
+        del block
+        runs_by_idx[idx] = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+    return (
+        [runs_by_idx[idx] for idx in sorted(runs_by_idx)],
+        [empty_runs_by_idx[idx] for idx in sorted(empty_runs_by_idx)],
+    )
+
+
+def _merge_sorted_runs(
+    runs: List["pyarrow.Table"], sort_key: SortKey, window_num_rows: int
+) -> Iterator["pyarrow.Table"]:
+    """Merges sorted tables, yielding sorted tables whose concatenation is the
+    sorted concatenation of `runs`.
+
+    Every step takes a window of (at most) `window_num_rows` rows following the
+    cursor of every run, and sorts the windows together. Rows of the sorted
+    windows are safe to output up to (and including) the first row that is the
+    last row of a window not reaching the end of its run, since the rows of that
+    run that aren't in the window can't sort before it. Since sorting is stable,
+    output rows of every run form a prefix of its window, and the cursors are
+    advanced by the number of rows output from every run.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pac
+
+    cursors = [0] * len(runs)
+
+    while True:
+        active_run_idxs = [i for i, run in enumerate(runs) if cursors[i] < len(run)]
+        if not active_run_idxs:
+            return
+
+        windows = []
+        window_offsets = []
+        # Positions (within the concatenated windows) of the last rows of the
+        # windows that don't reach the end of their runs
+        bounding_row_idxs = []
+        num_window_rows = 0
+        for i in active_run_idxs:
+            window = runs[i].slice(cursors[i], window_num_rows)
+            windows.append(window)
+            window_offsets.append(num_window_rows)
+            num_window_rows += window.num_rows
+            if cursors[i] + window.num_rows < runs[i].num_rows:
+                bounding_row_idxs.append(num_window_rows - 1)
+
+        combined = transform_pyarrow.concat(windows, promote_types=True)
+        indices = pac.sort_indices(
+            combined, sort_keys=sort_key.to_arrow_sort_args()
+        ).to_numpy()
+
+        if bounding_row_idxs:
+            ranks = np.empty_like(indices)
+            ranks[indices] = np.arange(len(indices))
+            num_output_rows = int(ranks[bounding_row_idxs].min()) + 1
+        else:
+            num_output_rows = len(indices)
+
+        output_indices = indices[:num_output_rows]
+
+        yield transform_pyarrow.take_table(combined, pa.array(output_indices))
+
+        # Advance cursors by the number of rows output from every run
+        output_window_idxs = (
+            np.searchsorted(window_offsets, output_indices, side="right") - 1
+        )
+        num_output_rows_per_window = np.bincount(
+            output_window_idxs, minlength=len(active_run_idxs)
+        )
+        for window_idx, run_idx in enumerate(active_run_idxs):
+            cursors[run_idx] += int(num_output_rows_per_window[window_idx])
+
+
+def _spread_duplicate_boundary_rows(
+    partitions: List["pyarrow.Table"], boundaries: List[Tuple[Any]], sort_key: SortKey
+) -> List["pyarrow.Table"]:
+    """Spreads rows equal to a boundary repeated in `boundaries` evenly across
+    all partitions adjacent to the repeated boundary.
+
+    Partitions between repeated boundaries are empty, while rows equal to the
+    boundary are at the end of the partition preceding, or at the start of the
+    partition following them. These rows (and the partitions around them) are
+    re-split evenly, preserving their order.
+    """
+    partitions = list(partitions)
+
+    start = 0
+    while start < len(boundaries):
+        end = start
+        while end + 1 < len(boundaries) and boundaries[end + 1] == boundaries[start]:
+            end += 1
+
+        if end > start:
+            boundary = boundaries[start]
+            before, after = partitions[start], partitions[end + 1]
+
+            num_equal_before = _count_rows_equal_to(
+                before, boundary, sort_key, from_end=True
+            )
+            num_equal_after = _count_rows_equal_to(
+                after, boundary, sort_key, from_end=False
+            )
+
+            equal_rows = [
+                before.slice(before.num_rows - num_equal_before),
+                after.slice(0, num_equal_after),
+            ]
+            equal_rows = transform_pyarrow.concat(
+                [t for t in equal_rows if t.num_rows > 0] or equal_rows[:1]
+            )
+
+            # Split equal rows evenly across partitions `start`..`end + 1`
+            num_splits = end - start + 2
+            split_idxs = np.linspace(0, equal_rows.num_rows, num_splits + 1).astype(int)
+            splits = [
+                equal_rows.slice(lo, hi - lo)
+                for lo, hi in zip(split_idxs[:-1], split_idxs[1:])
+            ]
+
+            partitions[start] = transform_pyarrow.concat(
+                [before.slice(0, before.num_rows - num_equal_before), splits[0]]
+            )
+            for offset, split in enumerate(splits[1:-1]):
+                partitions[start + 1 + offset] = split
+            partitions[end + 1] = transform_pyarrow.concat(
+                [splits[-1], after.slice(num_equal_after)]
+            )
+
+        start = end + 1
+
+    return partitions
+
+
+def _count_rows_equal_to(
+    table: "pyarrow.Table",
+    boundary: Tuple[Any],
+    sort_key: SortKey,
+    *,
+    from_end: bool,
+) -> int:
+    """Counts consecutive rows equal to `boundary` (on the sort key columns) at the
+    start (or the end) of the sorted table."""
+    import pyarrow.compute as pac
+
+    if table.num_rows == 0:
+        return 0
+
+    is_equal = None
+    for column, value in zip(sort_key.get_columns(), boundary):
+        if value is None:
+            column_is_equal = pac.is_null(table[column])
+        else:
+            column_is_equal = pac.fill_null(pac.equal(table[column], value), False)
+        is_equal = (
+            column_is_equal if is_equal is None else pac.and_(is_equal, column_is_equal)
+        )
+
+    is_equal = is_equal.to_numpy(zero_copy_only=False)
+    if from_end:
+        is_equal = is_equal[::-1]
+
+    if is_equal.all():
+        return len(is_equal)
+    return int(np.argmin(is_equal))
+
+
 def _sample_block(block: Block, n_samples: int, sort_key: SortKey) -> Block:
     return BlockAccessor.for_block(block).sample(n_samples, sort_key)
@@ -7,6 +7,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
 from ray.data._internal.logical.operators.all_to_all_operator import (
     AbstractAllToAll,
     Aggregate,
+    Distinct,
     RandomizeBlocks,
     RandomShuffle,
     Repartition,
@@ -72,6 +73,29 @@ def _plan_hash_shuffle_aggregate(
     )
 
 
+def _plan_hash_shuffle_distinct(
+    data_context: DataContext,
+    logical_op: Distinct,
+    input_physical_op: PhysicalOperator,
+) -> PhysicalOperator:
+    from ray.data._internal.execution.operators.hash_distinct import (
+        HashDistinctOperator,
+    )
+
+    return HashDistinctOperator(
+        input_physical_op,
+        data_context,
+        key_columns=tuple(logical_op._keys) if logical_op._keys else None,
+        # NOTE: In case number of partitions is not specified, we fall back to
+        #       default min parallelism configured
+        num_partitions=(
+            logical_op._num_partitions or data_context.default_hash_shuffle_parallelism
+        ),
+        order_by=logical_op._order_by,
+        descending=logical_op._descending,
+    )
+
+
 def plan_all_to_all_op(
     op: AbstractAllToAll,
     physical_children: List[PhysicalOperator],
@@ -107,16 +131,9 @@ def plan_all_to_all_op(
 
     elif isinstance(op, Repartition):
         if op._keys:
-            if data_context.shuffle_strategy == ShuffleStrategy.HASH_SHUFFLE:
-                return _plan_hash_shuffle_repartition(
-                    data_context, op, input_physical_dag
-                )
-            else:
-                raise ValueError(
-                    "Key-based repartitioning only supported for "
-                    f"`DataContext.shuffle_strategy=HASH_SHUFFLE` "
-                    f"(got {data_context.shuffle_strategy})"
-                )
+            # NOTE: Key-based repartitioning is always performed using
+            #       hash-shuffling (regardless of the configured shuffle strategy)
+            return _plan_hash_shuffle_repartition(data_context, op, input_physical_dag)
 
         elif op._shuffle:
             target_max_block_size = data_context.target_shuffle_max_block_size
@@ -145,6 +162,11 @@ def plan_all_to_all_op(
         )
         target_max_block_size = data_context.target_shuffle_max_block_size
 
+    elif isinstance(op, Distinct):
+        # NOTE: Distinct is always performed using hash-shuffling (regardless of
+        #       the configured shuffle strategy)
+        return _plan_hash_shuffle_distinct(data_context, op, input_physical_dag)
+
     elif isinstance(op, Aggregate):
         if data_context.shuffle_strategy == ShuffleStrategy.HASH_SHUFFLE:
             return _plan_hash_shuffle_aggregate(data_context, op, input_physical_dag)
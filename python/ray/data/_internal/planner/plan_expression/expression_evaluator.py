@@ -1,5 +1,6 @@
 import ast
 import logging
+from typing import Dict, List, Optional, Set
 
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -36,6 +37,126 @@ class ExpressionEvaluator:
             logger.exception(f"Error processing expression: {e}")
             raise
 
+    @staticmethod
+    def get_conjuncts(expression: str) -> List[str]:
+        """Split the expression into the expressions combined by top-level ``and``.
+
+        For example, ``"a > 1 and (b == 2 and c < 3)"`` is split into
+        ``["a > 1", "b == 2", "c < 3"]``. Each conjunct can be filtered on
+        independently, which is useful for pushing parts of a filter into a read.
+
+        Args:
+            expression: A string representing the filter expression to split.
+
+        Returns:
+            A list of expression strings whose conjunction is equivalent to
+            ``expression``.
+        """
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid syntax in the expression: {expression}") from e
+
+        conjuncts = []
+        nodes = [tree.body]
+        while nodes:
+            node = nodes.pop(0)
+            if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+                nodes = list(node.values) + nodes
+            else:
+                conjuncts.append(ast.unparse(node))
+        return conjuncts
+
+    @staticmethod
+    def join_conjuncts(conjuncts: List[str]) -> str:
+        """Combine expressions with ``and``. This is the inverse of
+        :meth:`get_conjuncts`.
+        """
+        return " and ".join(f"({conjunct})" for conjunct in conjuncts)
+
+    @staticmethod
+    def get_referenced_columns(expression: str) -> Set[str]:
+        """Return the names of the columns that the expression reads.
+
+        Args:
+            expression: A string representing the filter expression.
+
+        Returns:
+            The set of column names referenced in ``expression``.
+        """
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid syntax in the expression: {expression}") from e
+
+        visitor = _ReferencedColumnsVisitor()
+        visitor.visit(tree.body)
+        return visitor.columns
+
+    @staticmethod
+    def rename_columns(expression: str, names: Dict[str, str]) -> Optional[str]:
+        """Rename the columns that the expression reads.
+
+        Args:
+            expression: A string representing the filter expression.
+            names: Mapping from the column names to their new names. Every column
+                referenced in ``expression`` has to be in the mapping.
+
+        Returns:
+            The expression reading the renamed columns, or ``None`` if some of its
+            columns aren't in ``names`` or can't be referenced by name.
+        """
+        referenced_columns = ExpressionEvaluator.get_referenced_columns(expression)
+        if not referenced_columns.issubset(names) or not all(
+            part.isidentifier()
+            for column in referenced_columns
+            for part in names[column].split(".")
+        ):
+            return None
+
+        tree = ast.parse(expression, mode="eval")
+        return ast.unparse(_RenameColumnsTransformer(names).visit(tree.body))
+
+
+class _ReferencedColumnsVisitor(ast.NodeVisitor):
+    """Collects the column names used by an expression.
+
+    Column names are resolved the same way as in
+    ``_ConvertToArrowExpressionVisitor``: names and dotted attribute chains are
+    columns, and the callee of a function call isn't.
+    """
+
+    def __init__(self):
+        self.columns: Set[str] = set()
+
+    def visit_Name(self, node: ast.Name):
+        self.columns.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        self.columns.add(ast.unparse(node))
+
+    def visit_Call(self, node: ast.Call):
+        for arg in node.args:
+            self.visit(arg)
+
+
+class _RenameColumnsTransformer(ast.NodeTransformer):
+    """Renames the columns used by an expression (resolved the same way as in
+    ``_ReferencedColumnsVisitor``)."""
+
+    def __init__(self, names: Dict[str, str]):
+        self._names = names
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.Name(id=self._names[node.id], ctx=node.ctx)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        return ast.Name(id=self._names[ast.unparse(node)], ctx=node.ctx)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
 
 class _ConvertToArrowExpressionVisitor(ast.NodeVisitor):
     def visit_Compare(self, node: ast.Compare) -> ds.Expression:
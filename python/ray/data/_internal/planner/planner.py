@@ -1,7 +1,10 @@
 from typing import Callable, Dict, List, Tuple, Type, TypeVar
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
-from ray.data._internal.execution.operators.join import JoinOperator
+from ray.data._internal.execution.operators.join import (
+    BroadcastJoinOperator,
+    JoinOperator,
+)
 from ray.data._internal.logical.interfaces import (
     LogicalOperator,
     LogicalPlan,
@@ -131,6 +134,24 @@ def _register_default_plan_logical_op_fns():
         data_context: DataContext,
     ) -> PhysicalOperator:
         assert len(physical_children) == 2
+
+        broadcast_input_index = logical_op.get_broadcast_input_index(
+            data_context.broadcast_join_threshold_bytes
+        )
+
+        if broadcast_input_index is not None:
+            return BroadcastJoinOperator(
+                data_context=data_context,
+                left_input_op=physical_children[0],
+                right_input_op=physical_children[1],
+                join_type=logical_op._join_type,
+                left_key_columns=logical_op._left_key_columns,
+                right_key_columns=logical_op._right_key_columns,
+                broadcast_input_index=broadcast_input_index,
+                left_columns_suffix=logical_op._left_columns_suffix,
+                right_columns_suffix=logical_op._right_columns_suffix,
+            )
+
         assert logical_op._num_outputs is not None
 
         return JoinOperator(
@@ -12,7 +12,11 @@ from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler impor
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
     PushBasedShuffleTaskScheduler,
 )
-from ray.data._internal.planner.exchange.sort_task_spec import SortKey, SortTaskSpec
+from ray.data._internal.planner.exchange.sort_task_spec import (
+    ExternalMergeSortTaskSpec,
+    SortKey,
+    SortTaskSpec,
+)
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.context import DataContext, ShuffleStrategy
@@ -60,13 +64,23 @@ def generate_sort_fn(
             if sort_key.get_descending()[0]:
                 boundaries = boundaries[::-1]
             num_outputs = len(boundaries) + 1
-        sort_spec = SortTaskSpec(
-            boundaries=boundaries, sort_key=sort_key, batch_format=batch_format
-        )
-
         if data_context.shuffle_strategy == ShuffleStrategy.SORT_SHUFFLE_PUSH_BASED:
+            sort_spec = SortTaskSpec(
+                boundaries=boundaries, sort_key=sort_key, batch_format=batch_format
+            )
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
         else:
+            if data_context.use_external_merge_sort:
+                sort_spec = ExternalMergeSortTaskSpec(
+                    boundaries=boundaries,
+                    sort_key=sort_key,
+                    batch_format=batch_format,
+                    target_max_block_size=data_context.target_max_block_size,
+                )
+            else:
+                sort_spec = SortTaskSpec(
+                    boundaries=boundaries, sort_key=sort_key, batch_format=batch_format
+                )
             scheduler = PullBasedShuffleTaskScheduler(sort_spec)
 
         return scheduler.execute(
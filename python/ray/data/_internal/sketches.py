@@ -0,0 +1,369 @@
+"""Mergeable sketches backing the approximate aggregations of
+``ray.data.aggregate`` (and the near-duplicate detection of
+``Dataset.drop_near_duplicates``).
+
+The sketches have a bounded size (independent of the number of values they
+summarize), and are (de)serialized to and from compact byte strings, which are
+stored as the partial aggregation states in blocks.
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+
+class TDigest:
+    """A (merging) t-digest summarizing the distribution of numeric values, used to
+    estimate quantiles.
+
+    Values are summarized into centroids (means and weights), sized such that
+    centroids near the tails of the distribution (where quantile estimates need to
+    be precise) hold fewer values than the ones near the median. The number of
+    centroids is bounded by about ``compression / 2``.
+
+    See "Computing Extremely Accurate Quantiles Using t-Digests" (Dunning & Ertl).
+    """
+
+    def __init__(
+        self,
+        compression: float,
+        means: np.ndarray,
+        weights: np.ndarray,
+        min_: float = math.inf,
+        max_: float = -math.inf,
+    ):
+        self.compression = compression
+        self.means = means
+        self.weights = weights
+        self.min = min_
+        self.max = max_
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, compression: float) -> "TDigest":
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return cls(compression, np.empty(0), np.empty(0))
+
+        return cls(
+            compression, values, np.ones(len(values)), values.min(), values.max()
+        )._compress()
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        return TDigest(
+            self.compression,
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+            min(self.min, other.min),
+            max(self.max, other.max),
+        )._compress()
+
+    def _compress(self) -> "TDigest":
+        if not len(self.means):
+            return self
+
+        order = np.argsort(self.means, kind="stable")
+        means, weights = self.means[order], self.weights[order]
+
+        # Group the (sorted) centroids by the integer part of the scale function
+        # `k(q) = compression / (2 * pi) * asin(2 * q - 1)` at their mid-points,
+        # so that each of the new centroids spans at most a unit of `k`.
+        cum_weights = np.cumsum(weights)
+        q = (cum_weights - weights / 2) / cum_weights[-1]
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q - 1)
+        _, groups = np.unique(np.floor(k), return_inverse=True)
+
+        merged_weights = np.bincount(groups, weights=weights)
+        merged_means = np.bincount(groups, weights=means * weights) / merged_weights
+
+        return TDigest(
+            self.compression, merged_means, merged_weights, self.min, self.max
+        )
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not len(self.means):
+            return None
+
+        # Interpolate between the centroids, positioned at the center of their
+        # weights (and the min and max values, at the ends).
+        cum_weights = np.cumsum(self.weights)
+        positions = np.concatenate(
+            [[0], cum_weights - self.weights / 2, [cum_weights[-1]]]
+        )
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * cum_weights[-1], positions, values))
+
+    def to_bytes(self) -> bytes:
+        header = np.array([self.compression, self.min, self.max])
+        return np.concatenate([header, self.means, self.weights]).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TDigest":
+        array = np.frombuffer(data, dtype=np.float64)
+        compression, min_, max_ = array[:3]
+        means, weights = np.split(array[3:], 2)
+        return cls(compression, means, weights, min_, max_)
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch estimating the number of distinct values.
+
+    Uses ``2 ** precision`` registers of a byte each, with a relative standard error
+    of about ``1.04 / sqrt(2 ** precision)``.
+
+    See "HyperLogLog: the analysis of a near-optimal cardinality estimation
+    algorithm" (Flajolet et al.).
+    """
+
+    def __init__(self, registers: np.ndarray):
+        self.registers = registers
+
+    @property
+    def precision(self) -> int:
+        return int(math.log2(len(self.registers)))
+
+    @classmethod
+    def empty(cls, precision: int) -> "HyperLogLog":
+        if not 4 <= precision <= 18:
+            raise ValueError(
+                f"Precision must be between 4 and 18 (inclusive), got {precision}"
+            )
+        return cls(np.zeros(2**precision, dtype=np.uint8))
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, precision: int) -> "HyperLogLog":
+        import pandas as pd
+
+        sketch = cls.empty(precision)
+        if not len(values):
+            return sketch
+
+        hashes = pd.util.hash_array(np.asarray(values))
+
+        # The first `precision` bits of the hashes select the register, which holds
+        # the max position of the first set bit in the remaining bits.
+        num_remaining_bits = 64 - precision
+        indices = (hashes >> np.uint64(num_remaining_bits)).astype(np.int64)
+        remaining_bits = hashes & np.uint64((1 << num_remaining_bits) - 1)
+        ranks = num_remaining_bits - _bit_length(remaining_bits) + 1
+
+        np.maximum.at(sketch.registers, indices, ranks.astype(np.uint8))
+        return sketch
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if len(self.registers) != len(other.registers):
+            raise ValueError(
+                "Can't merge HyperLogLog sketches of different precisions "
+                f"({self.precision} and {other.precision})"
+            )
+        return HyperLogLog(np.maximum(self.registers, other.registers))
+
+    def count(self) -> int:
+        num_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = (
+            alpha
+            * num_registers**2
+            / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        )
+
+        num_empty_registers = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * num_registers and num_empty_registers:
+            # Use linear counting for small cardinalities.
+            estimate = num_registers * math.log(num_registers / num_empty_registers)
+
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        return self.registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        return cls(np.frombuffer(data, dtype=np.uint8).copy())
+
+
+class SpaceSaving:
+    """A Space-Saving summary of the most frequent values.
+
+    Keeps the (over-estimated) counts of at most ``capacity`` values, along with the
+    max over-estimation (error) of every count. Values whose counts are dropped to
+    stay within the capacity are accounted for by the ``floor`` of the summary,
+    i.e. the max count of a value missing from the summary.
+
+    See "Efficient Computation of Frequent and Top-k Elements in Data Streams"
+    (Metwally et al.) and "Mergeable Summaries" (Agarwal et al.).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        counts: Dict[Any, Tuple[int, int]],
+        floor: int = 0,
+    ):
+        self.capacity = capacity
+        # Value to its (count, error).
+        self.counts = counts
+        self.floor = floor
+
+    @classmethod
+    def from_value_counts(
+        cls, values: List[Any], counts: List[int], capacity: int
+    ) -> "SpaceSaving":
+        return cls(
+            capacity, {value: (count, 0) for value, count in zip(values, counts)}
+        )._truncate()
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        counts = {}
+        for value in self.counts.keys() | other.counts.keys():
+            count, error = self.counts.get(value, (self.floor, self.floor))
+            other_count, other_error = other.counts.get(
+                value, (other.floor, other.floor)
+            )
+            counts[value] = (count + other_count, error + other_error)
+
+        return SpaceSaving(self.capacity, counts, self.floor + other.floor)._truncate()
+
+    def _truncate(self) -> "SpaceSaving":
+        if len(self.counts) <= self.capacity:
+            return self
+
+        items = sorted(self.counts.items(), key=lambda item: -item[1][0])
+        return SpaceSaving(
+            self.capacity,
+            dict(items[: self.capacity]),
+            max(self.floor, items[self.capacity][1][0]),
+        )
+
+    def top_k(self, k: int) -> List[Dict[str, Any]]:
+        items = sorted(self.counts.items(), key=lambda item: -item[1][0])
+        return [
+            {"value": value, "count": count, "error": error}
+            for value, (count, error) in items[:k]
+        ]
+
+    def to_bytes(self) -> bytes:
+        values = list(self.counts.keys())
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(values),
+                pa.array([self.counts[value][0] for value in values], pa.int64()),
+                pa.array([self.counts[value][1] for value in values], pa.int64()),
+            ],
+            names=["value", "count", "error"],
+        )
+        schema = batch.schema.with_metadata(
+            {"capacity": str(self.capacity), "floor": str(self.floor)}
+        )
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpaceSaving":
+        reader = pa.ipc.open_stream(data)
+        table = reader.read_all()
+        metadata = reader.schema.metadata
+
+        counts = {
+            value: (count, error)
+            for value, count, error in zip(
+                table.column("value").to_pylist(),
+                table.column("count").to_pylist(),
+                table.column("error").to_pylist(),
+            )
+        }
+        return cls(int(metadata[b"capacity"]), counts, int(metadata[b"floor"]))
+
+
+class MinHash:
+    """MinHash signatures of texts (as sets of their word n-grams), estimating the
+    Jaccard similarity of the texts by the fraction of equal signature values.
+
+    Signatures are banded for locality-sensitive hashing (LSH): texts whose
+    signatures are equal in all the rows of any of the bands are candidate
+    near-duplicates.
+
+    See "On the resemblance and containment of documents" (Broder) and "Mining of
+    Massive Datasets" (Leskovec et al., chapter 3).
+    """
+
+    # Mersenne prime used by the universal hash functions permuting hashes.
+    _PRIME = np.uint64((1 << 61) - 1)
+    _MAX_HASH = np.uint64((1 << 32) - 1)
+
+    def __init__(self, num_perm: int, ngram_size: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.ngram_size = ngram_size
+        self._a = rng.integers(1, int(self._PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(self._PRIME), size=num_perm, dtype=np.uint64)
+
+    def signatures(self, texts: List[Optional[str]]) -> np.ndarray:
+        """Returns the signatures (of ``num_perm`` values) of the texts.
+
+        Null and empty texts have the same signatures.
+        """
+        signatures = np.full((len(texts), self.num_perm), self._MAX_HASH)
+        for i, text in enumerate(texts):
+            hashes = self._hash_ngrams(text)
+            if len(hashes):
+                # NOTE: Hashes are permuted with `(a * x + b) mod prime`, wrapping
+                #       around on (uint64) overflow.
+                permuted = (
+                    (hashes[:, None] * self._a + self._b) % self._PRIME
+                ) & self._MAX_HASH
+                signatures[i] = permuted.min(axis=0)
+        return signatures
+
+    def _hash_ngrams(self, text: Optional[str]) -> np.ndarray:
+        import pandas as pd
+
+        words = text.split() if text else []
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+
+        num_ngrams = max(len(words) - self.ngram_size + 1, 1)
+        ngrams = {" ".join(words[i : i + self.ngram_size]) for i in range(num_ngrams)}
+        hashes = pd.util.hash_array(np.array(list(ngrams), dtype=object))
+        return hashes & self._MAX_HASH
+
+    @staticmethod
+    def band_hashes(signatures: np.ndarray, num_bands: int) -> np.ndarray:
+        """Returns the hashes of the values in every band of the signatures."""
+        rows_per_band = signatures.shape[1] // num_bands
+        hashes = np.zeros((len(signatures), num_bands), dtype=np.uint64)
+        for band in range(num_bands):
+            start = band * rows_per_band
+            for values in signatures[:, start : start + rows_per_band].T:
+                hashes[:, band] = hashes[:, band] * np.uint64(1000003) ^ values
+        return hashes
+
+    @staticmethod
+    def optimal_num_bands(threshold: float, num_perm: int) -> int:
+        """Returns the number of bands minimizing the (equally weighted) probabilities
+        of texts with similarities below the threshold being candidates (false
+        positives), and of ones above it not being candidates (false negatives)."""
+        similarities = np.linspace(0, 1, 1001)
+        is_below = similarities < threshold
+
+        def get_error(num_bands: int) -> float:
+            rows_per_band = num_perm // num_bands
+            # Probability of texts being candidates, by their similarity.
+            probabilities = 1 - (1 - similarities**rows_per_band) ** num_bands
+            return np.mean(np.where(is_below, probabilities, 1 - probabilities))
+
+        return min(range(1, num_perm + 1), key=get_error)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns the number of bits needed to represent the (uint64) values."""
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        lengths[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    return lengths + (values > 0)
@@ -22,7 +22,7 @@ from ray.data._internal.execution.interfaces.op_runtime_metrics import (
     OpRuntimeMetrics,
 )
 from ray.data._internal.metadata_exporter import Topology, get_dataset_metadata_exporter
-from ray.data._internal.util import capfirst
+from ray.data._internal.util import capfirst, convert_bytes_to_human_readable_str
 from ray.data.block import BlockStats
 from ray.data.context import DataContext
 from ray.util.annotations import DeveloperAPI
@@ -880,6 +880,13 @@ class DatasetStats:
         self.iter_total_s: Timer = Timer()
         self.extra_metrics = {}
 
+        # Tensor buffer stats of the default collate function of
+        # `iter_torch_batches`, if buffers are reused across batches.
+        self.iter_collate_num_allocations: int = 0
+        self.iter_collate_bytes_allocated: int = 0
+        self.iter_collate_bytes_copied: int = 0
+        self.iter_collate_num_fallbacks: int = 0
+
         # Block fetch stats during iteration.
         # These are stats about locations of blocks when the iterator is trying to
         # consume them. The iteration performance will be affected depending on
@@ -937,6 +944,10 @@ class DatasetStats:
             self.iter_blocks_local,
             self.iter_blocks_remote,
             self.iter_unknown_location,
+            self.iter_collate_num_allocations,
+            self.iter_collate_bytes_allocated,
+            self.iter_collate_bytes_copied,
+            self.iter_collate_num_fallbacks,
         )
         stats_summary_parents = []
         if self.parents is not None:
@@ -1582,6 +1593,14 @@ class IterStatsSummary:
     iter_blocks_remote: int
     # Num of blocks with unknown locations
     iter_unknown_location: int
+    # Num of tensors allocated by the collate fn buffers
+    collate_num_allocations: int = 0
+    # Bytes allocated by the collate fn buffers
+    collate_bytes_allocated: int = 0
+    # Bytes copied into the collate fn buffers
+    collate_bytes_copied: int = 0
+    # Num of columns not copied into the collate fn buffers
+    collate_num_fallbacks: int = 0
 
     def __str__(self) -> str:
         return self.to_string()
@@ -1651,6 +1670,18 @@ class IterStatsSummary:
                     fmt(self.collate_time.avg()),
                     fmt(self.collate_time.get()),
                 )
+            if self.collate_num_allocations or self.collate_num_fallbacks:
+                out += (
+                    "    * In collate_fn buffers: {} allocations ({}), {} copied, "
+                    "{} batch columns not buffered\n".format(
+                        self.collate_num_allocations,
+                        convert_bytes_to_human_readable_str(
+                            self.collate_bytes_allocated
+                        ),
+                        convert_bytes_to_human_readable_str(self.collate_bytes_copied),
+                        self.collate_num_fallbacks,
+                    )
+                )
             if self.finalize_batch_time.get():
                 format_str = (
                     "    * In host->device transfer: {} min, {} max, {} avg, {} total\n"
@@ -9,6 +9,8 @@ from ray.data.block import AggType, Block, BlockAccessor, KeyType, T, U
 from ray.util.annotations import Deprecated, PublicAPI
 
 if TYPE_CHECKING:
+    import pyarrow
+
     from ray.data import Schema
 
 
@@ -880,6 +882,301 @@ class Unique(AggregateFnV2):
             return {x}
 
 
+@PublicAPI(stability="alpha")
+class ApproxQuantile(AggregateFnV2):
+    """Defines approximate quantile aggregation.
+
+    Unlike :class:`Quantile`, which collects all the values of every group, this
+    summarizes the values with a mergeable
+    `t-digest <https://arxiv.org/abs/1902.04023>`_ of bounded size, so that it can
+    be computed on large groups with bounded memory.
+
+    Example:
+
+        .. testcode::
+
+            import ray
+            from ray.data.aggregate import ApproxQuantile
+
+            ds = ray.data.range(100)
+            # Schema: {'id': int64}
+            ds = ds.add_column("group_key", lambda x: x % 3)
+            # Schema: {'id': int64, 'group_key': int64}
+
+            # Estimating the 90th percentile per group:
+            result = ds.groupby("group_key").aggregate(
+                ApproxQuantile(on="id", q=0.9)
+            ).take_all()
+            # result: [{'group_key': 0, 'approx_quantile(id)': ...},
+            #          {'group_key': 1, 'approx_quantile(id)': ...},
+            #          {'group_key': 2, 'approx_quantile(id)': ...}]
+
+    Args:
+        on: The name of the numerical column to estimate the quantile of. Must be
+            provided.
+        q: The quantile to estimate, which must be between 0 and 1 inclusive.
+        compression: The compression of the t-digest. Higher values give more
+            accurate estimates, with a sketch of (at most) about ``compression / 2``
+            centroids per group.
+        ignore_nulls: Whether to ignore null values. Default is True.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        q: float = 0.5,
+        compression: float = 200,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import TDigest
+
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to aggregate on has to be provided (got {on})")
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1 (got {q})")
+
+        self._q = q
+        self._compression = compression
+
+        super().__init__(
+            alias_name if alias_name else f"approx_quantile({str(on)})",
+            on=on,
+            ignore_nulls=ignore_nulls,
+            zero_factory=lambda: TDigest.from_values([], compression).to_bytes(),
+        )
+
+    def aggregate_block(self, block: Block) -> AggType:
+        from ray.data._internal.sketches import TDigest
+
+        values = _get_values_to_sketch(block, self._target_col_name, self._ignore_nulls)
+        if values is None:
+            return None
+
+        return TDigest.from_values(values.to_numpy(), self._compression).to_bytes()
+
+    def combine(self, current_accumulator: bytes, new: bytes) -> bytes:
+        from ray.data._internal.sketches import TDigest
+
+        return (
+            TDigest.from_bytes(current_accumulator)
+            .merge(TDigest.from_bytes(new))
+            .to_bytes()
+        )
+
+    def finalize(self, accumulator: bytes) -> Optional[U]:
+        from ray.data._internal.sketches import TDigest
+
+        return TDigest.from_bytes(accumulator).quantile(self._q)
+
+
+@PublicAPI(stability="alpha")
+class ApproxCountDistinct(AggregateFnV2):
+    """Defines approximate distinct count aggregation.
+
+    Unlike counting the values collected by :class:`Unique`, this summarizes the
+    values with a mergeable `HyperLogLog <https://en.wikipedia.org/wiki/HyperLogLog>`_
+    sketch of ``2 ** precision`` bytes, so that it can be computed on groups with
+    many distinct values with bounded memory.
+
+    Example:
+
+        .. testcode::
+
+            import ray
+            from ray.data.aggregate import ApproxCountDistinct
+
+            ds = ray.data.range(100)
+            # Schema: {'id': int64}
+            ds = ds.add_column("group_key", lambda x: x % 3)
+            # Schema: {'id': int64, 'group_key': int64}
+
+            # Estimating the number of distinct values per group:
+            result = ds.groupby("group_key").aggregate(
+                ApproxCountDistinct(on="id")
+            ).take_all()
+            # result: [{'group_key': 0, 'approx_count_distinct(id)': ...},
+            #          {'group_key': 1, 'approx_count_distinct(id)': ...},
+            #          {'group_key': 2, 'approx_count_distinct(id)': ...}]
+
+    Args:
+        on: The name of the column to count the distinct values of. Must be provided.
+        precision: The precision of the HyperLogLog sketch, between 4 and 18. The
+            relative standard error of the estimates is about
+            ``1.04 / sqrt(2 ** precision)`` (0.8% with the default precision).
+        ignore_nulls: Whether to ignore null values. Default is True.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        precision: int = 14,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import HyperLogLog
+
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to aggregate on has to be provided (got {on})")
+        # Validate the precision.
+        HyperLogLog.empty(precision)
+
+        self._precision = precision
+
+        super().__init__(
+            alias_name if alias_name else f"approx_count_distinct({str(on)})",
+            on=on,
+            ignore_nulls=ignore_nulls,
+            zero_factory=lambda: HyperLogLog.empty(precision).to_bytes(),
+        )
+
+    def aggregate_block(self, block: Block) -> AggType:
+        from ray.data._internal.sketches import HyperLogLog
+
+        values = _get_values_to_sketch(block, self._target_col_name, self._ignore_nulls)
+        if values is None:
+            return None
+
+        return HyperLogLog.from_values(values.to_numpy(), self._precision).to_bytes()
+
+    def combine(self, current_accumulator: bytes, new: bytes) -> bytes:
+        from ray.data._internal.sketches import HyperLogLog
+
+        return (
+            HyperLogLog.from_bytes(current_accumulator)
+            .merge(HyperLogLog.from_bytes(new))
+            .to_bytes()
+        )
+
+    def finalize(self, accumulator: bytes) -> Optional[U]:
+        from ray.data._internal.sketches import HyperLogLog
+
+        return HyperLogLog.from_bytes(accumulator).count()
+
+
+@PublicAPI(stability="alpha")
+class ApproxTopK(AggregateFnV2):
+    """Defines approximate top-k (most frequent values) aggregation.
+
+    The counts of (at most) ``capacity`` values per group are tracked with a
+    mergeable Space-Saving summary, so that it can be computed on groups with many
+    distinct values with bounded memory. The counts are over-estimated by at most
+    the returned errors.
+
+    Example:
+
+        .. testcode::
+
+            import ray
+            from ray.data.aggregate import ApproxTopK
+
+            ds = ray.data.range(100)
+            # Schema: {'id': int64}
+            ds = ds.add_column("group_key", lambda x: x % 3)
+            ds = ds.add_column("value", lambda x: x % 7)
+
+            # Finding the 2 most frequent values per group:
+            result = ds.groupby("group_key").aggregate(
+                ApproxTopK(on="value", k=2)
+            ).take_all()
+            # result: [{'group_key': 0,
+            #           'approx_top_k(value)': [{'value': ..., 'count': ...,
+            #                                    'error': ...}, ...]},
+            #          ...]
+
+    Args:
+        on: The name of the column to find the most frequent values of. Must be
+            provided.
+        k: The number of most frequent values to return.
+        capacity: The number of values whose counts are tracked. Higher values give
+            more accurate results. Defaults to ``max(100, 10 * k)``.
+        ignore_nulls: Whether to ignore null values. Default is True.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        k: int = 10,
+        capacity: Optional[int] = None,
+        ignore_nulls: bool = True,
+        alias_name: Optional[str] = None,
+    ):
+        from ray.data._internal.sketches import SpaceSaving
+
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to aggregate on has to be provided (got {on})")
+        if capacity is None:
+            capacity = max(100, 10 * k)
+        if not 0 < k <= capacity:
+            raise ValueError(
+                f"`k` must be positive and at most `capacity` (got {k} and "
+                f"{capacity})"
+            )
+
+        self._k = k
+        self._capacity = capacity
+
+        super().__init__(
+            alias_name if alias_name else f"approx_top_k({str(on)})",
+            on=on,
+            ignore_nulls=ignore_nulls,
+            zero_factory=lambda: SpaceSaving(capacity, {}).to_bytes(),
+        )
+
+    def aggregate_block(self, block: Block) -> AggType:
+        import pyarrow.compute as pac
+
+        from ray.data._internal.sketches import SpaceSaving
+
+        values = _get_values_to_sketch(block, self._target_col_name, self._ignore_nulls)
+        if values is None:
+            return None
+
+        value_counts = pac.value_counts(values)
+        return SpaceSaving.from_value_counts(
+            value_counts.field("values").to_pylist(),
+            value_counts.field("counts").to_pylist(),
+            self._capacity,
+        ).to_bytes()
+
+    def combine(self, current_accumulator: bytes, new: bytes) -> bytes:
+        from ray.data._internal.sketches import SpaceSaving
+
+        return (
+            SpaceSaving.from_bytes(current_accumulator)
+            .merge(SpaceSaving.from_bytes(new))
+            .to_bytes()
+        )
+
+    def finalize(self, accumulator: bytes) -> Optional[U]:
+        from ray.data._internal.sketches import SpaceSaving
+
+        return SpaceSaving.from_bytes(accumulator).top_k(self._k)
+
+
+def _get_values_to_sketch(
+    block: Block, column: str, ignore_nulls: bool
+) -> Optional["pyarrow.ChunkedArray"]:
+    """Returns the values of the column to summarize with a sketch, or None if the
+    partial aggregation is null (i.e. if there are no values when ignoring nulls, or
+    if there are nulls when not ignoring them)."""
+    import pyarrow.compute as pac
+
+    values = BlockAccessor.for_block(block).to_arrow().column(column)
+    if values.null_count:
+        if not ignore_nulls:
+            return None
+        values = pac.drop_null(values)
+
+    if not len(values) and ignore_nulls:
+        return None
+
+    return values
+
+
 def _null_safe_zero_factory(zero_factory, ignore_nulls: bool):
     """NOTE: PLEASE READ CAREFULLY BEFORE CHANGING
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     import pyarrow
     import torch
 
+    from ray.data._internal.stats import DatasetStats
     from ray.data.dataset import CollatedData
 
 
@@ -227,6 +228,7 @@ class DefaultCollateFn(ArrowBatchCollateFn):
         self,
         dtypes: Optional[Union["torch.dtype", Dict[str, "torch.dtype"]]] = None,
         device: Optional[Union[str, "torch.device"]] = None,
+        num_buffers: int = 0,
     ):
         """Initialize the collate function.
 
@@ -235,6 +237,10 @@ class DefaultCollateFn(ArrowBatchCollateFn):
                 will be inferred from the tensor data.
             device: The device on which the tensor should be placed. Can be a string
                 (e.g. "cpu", "cuda:0") or a torch.device object.
+            num_buffers: If greater than 0, the batches are copied into a ring of
+                this many sets of preallocated host tensors, which are reused across
+                batches of the same shapes (see `TensorBufferRing`). The tensors are
+                allocated in pinned memory if the device is a CUDA device.
         """
         import torch
 
@@ -245,6 +251,15 @@ class DefaultCollateFn(ArrowBatchCollateFn):
         else:
             self.device = device
 
+        self._buffers = None
+        if num_buffers > 0:
+            from ray.air._internal.torch_utils import TensorBufferRing
+
+            self._buffers = TensorBufferRing(
+                num_buffers,
+                pin_memory=(self.device.type == "cuda" and torch.cuda.is_available()),
+            )
+
     def __call__(self, batch: "pyarrow.Table") -> Dict[str, List["torch.Tensor"]]:
         """Convert an Arrow batch to PyTorch tensors.
 
@@ -264,6 +279,39 @@ class DefaultCollateFn(ArrowBatchCollateFn):
         # However, for CPU transfer, we need to combine the chunked arrays first
         # before converting to numpy format and then to Tensors.
         combine_chunks = self.device.type == "cpu"
-        return arrow_batch_to_tensors(
-            batch, dtypes=self.dtypes, combine_chunks=combine_chunks
+        if self._buffers is None:
+            return arrow_batch_to_tensors(
+                batch, dtypes=self.dtypes, combine_chunks=combine_chunks
+            )
+
+        # Columns that can't be copied into the buffers are converted as above.
+        tensors, fallback_columns = self._buffers.arrow_batch_to_tensors(
+            batch, dtypes=self.dtypes
         )
+        if not combine_chunks:
+            tensors = {col_name: [tensor] for col_name, tensor in tensors.items()}
+        if fallback_columns:
+            tensors.update(
+                arrow_batch_to_tensors(
+                    batch.select(fallback_columns),
+                    dtypes=self.dtypes,
+                    combine_chunks=combine_chunks,
+                )
+            )
+        return {col_name: tensors[col_name] for col_name in batch.column_names}
+
+    def _record_stats(self, stats: "DatasetStats"):
+        """Adds the allocations and copies of the buffers to the iteration stats."""
+        if self._buffers is None:
+            return
+
+        (
+            num_allocations,
+            bytes_allocated,
+            bytes_copied,
+            num_fallbacks,
+        ) = self._buffers.pop_stats()
+        stats.iter_collate_num_allocations += num_allocations
+        stats.iter_collate_bytes_allocated += bytes_allocated
+        stats.iter_collate_bytes_copied += bytes_copied
+        stats.iter_collate_num_fallbacks += num_fallbacks
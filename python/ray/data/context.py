@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import ray
-from ray._private.ray_constants import env_bool, env_integer
+from ray._private.ray_constants import env_bool, env_float, env_integer
 from ray._private.worker import WORKER_MODE
 from ray.data._internal.logging import update_dataset_logger_for_worker
 from ray.util.annotations import DeveloperAPI
@@ -35,6 +35,17 @@ class ShuffleStrategy(str, enum.Enum):
     HASH_SHUFFLE = "hash_shuffle"
 
 
+@DeveloperAPI(stability="alpha")
+class BundleQueueType(str, enum.Enum):
+    """Bundle queue type determines the order in which input bundles are dispatched
+    to the actors of an actor pool"""
+
+    FIFO = "fifo"
+    LOCALITY_AWARE = "locality_aware"
+    LARGEST_FIRST = "largest_first"
+    ORDERED_LOOKAHEAD = "ordered_lookahead"
+
+
 # We chose 128MiB for default: With streaming execution and num_cpus many concurrent
 # tasks, the memory footprint will be about 2 * num_cpus * target_max_block_size ~= RAM
 # * DEFAULT_OBJECT_STORE_MEMORY_LIMIT_FRACTION * 0.3 (default object store memory
@@ -75,14 +86,44 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+DEFAULT_USE_EXTERNAL_MERGE_SORT = env_bool("RAY_DATA_USE_EXTERNAL_MERGE_SORT", False)
+
 DEFAULT_SHUFFLE_STRATEGY = os.environ.get(
     "RAY_DATA_DEFAULT_SHUFFLE_STRATEGY", ShuffleStrategy.SORT_SHUFFLE_PULL_BASED
 )
 
+DEFAULT_ACTOR_POOL_BUNDLE_QUEUE_TYPE = os.environ.get(
+    "RAY_DATA_ACTOR_POOL_BUNDLE_QUEUE_TYPE", BundleQueueType.FIFO
+)
+
+DEFAULT_ACTOR_POOL_BUNDLE_QUEUE_LOOKAHEAD = env_integer(
+    "RAY_DATA_ACTOR_POOL_BUNDLE_QUEUE_LOOKAHEAD", 16
+)
+
 DEFAULT_MAX_HASH_SHUFFLE_AGGREGATORS = env_integer(
     "RAY_DATA_MAX_HASH_SHUFFLE_AGGREGATORS", 64
 )
 
+# Per-aggregator budget (in bytes) for partition shards held in memory by hash-shuffle
+# aggregators, after which shards are spilled to local disk. Unset by default
+# (shards are never spilled).
+DEFAULT_HASH_SHUFFLE_AGGREGATOR_SPILL_THRESHOLD_BYTES = env_integer(
+    "RAY_DATA_HASH_SHUFFLE_AGGREGATOR_SPILL_THRESHOLD_BYTES", None
+)
+
+# Partitions of a hash-shuffled sequence larger than this factor times the average
+# partition size are split across multiple aggregators (when supported by the
+# operator). Unset by default (partitions are never split).
+DEFAULT_HASH_SHUFFLE_SKEWED_PARTITION_FACTOR = env_float(
+    "RAY_DATA_HASH_SHUFFLE_SKEWED_PARTITION_FACTOR", None
+)
+
+# Joins broadcast an input instead of hash-shuffling both inputs if the estimated
+# in-memory size of that input doesn't exceed this threshold (disabled by default).
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = env_integer(
+    "RAY_DATA_BROADCAST_JOIN_THRESHOLD_BYTES", None
+)
+
 DEFAULT_SCHEDULING_STRATEGY = "SPREAD"
 
 # This default enables locality-based scheduling in Ray for tasks where arg data
@@ -195,6 +236,19 @@ DEFAULT_WAIT_FOR_MIN_ACTORS_S = env_integer(
     "RAY_DATA_DEFAULT_WAIT_FOR_MIN_ACTORS_S", -1
 )
 
+# Max total size (in bytes) of the datasets persisted to disk (by the same job),
+# after which the least recently used ones are evicted. Unset by default (persisted
+# datasets are never evicted).
+DEFAULT_PERSIST_MAX_BYTES = env_integer("RAY_DATA_PERSIST_MAX_BYTES", None)
+
+DEFAULT_FILE_METADATA_CACHE_DIR = os.environ.get(
+    "RAY_DATA_FILE_METADATA_CACHE_DIR", None
+)
+
+DEFAULT_FILE_METADATA_CACHE_TTL_S = env_float(
+    "RAY_DATA_FILE_METADATA_CACHE_TTL_S", None
+)
+
 # Enable per node metrics reporting for Ray Data, disabled by default.
 DEFAULT_ENABLE_PER_NODE_METRICS = bool(
     int(os.environ.get("RAY_DATA_PER_NODE_METRICS", "0"))
@@ -260,6 +314,12 @@ class DataContext:
         actor_prefetcher_enabled: Whether to use actor based block prefetcher.
         use_push_based_shuffle: Whether to use push-based shuffle.
         pipeline_push_based_shuffle_reduce_tasks:
+        use_external_merge_sort: Whether ``Dataset.sort`` merges sorted blocks with a
+            streaming k-way merge that yields output blocks of up to
+            ``target_max_block_size`` bytes, instead of merging all of a partition in
+            memory at once. Rows with a key that spans multiple sampled ranges are
+            also spread across those ranges. Only applies to the pull-based sort
+            shuffle.
         scheduling_strategy: The global scheduling strategy. For tasks with large args,
             ``scheduling_strategy_large_args`` takes precedence.
         scheduling_strategy_large_args: Scheduling strategy for tasks with large args.
@@ -328,11 +388,27 @@ class DataContext:
             call is made with a S3 URI.
         wait_for_min_actors_s: The default time to wait for minimum requested
             actors to start before raising a timeout, in seconds.
+        actor_pool_bundle_queue_type: Order in which input bundles are dispatched
+            to the actors of actor pools (see ``BundleQueueType``). Defaults to FIFO.
+        actor_pool_bundle_queue_lookahead: Number of queued bundles (from the head
+            of the queue) considered by the ``ORDERED_LOOKAHEAD`` bundle queue.
         retried_io_errors: A list of substrings of error messages that should
             trigger a retry when reading or writing files. This is useful for handling
             transient errors when reading from remote storage systems.
         enable_per_node_metrics: Enable per node metrics reporting for Ray Data,
             disabled by default.
+        persist_max_bytes: Max total size of the datasets persisted to disk by the
+            job, after which the least recently used ones are evicted. Unset by
+            default (persisted datasets are never evicted).
+        persist_dir: Local directory (on every node) datasets are persisted into.
+            Defaults to the system's temporary directory.
+        file_metadata_cache_dir: Directory (on local disk or on a filesystem shared
+            by the cluster) file listings and Parquet footer metadata are cached
+            in across reads. Unset by default (the cache is disabled).
+        file_metadata_cache_ttl_s: For filesystems without directory modification
+            times (like object stores), the number of seconds cached listings of
+            directories are reused for. Unset by default (listings of such
+            directories are never reused).
         memory_usage_poll_interval_s: The interval to poll the USS of map tasks. If `None`,
             map tasks won't record memory stats.
     """
@@ -354,6 +430,8 @@ class DataContext:
 
     pipeline_push_based_shuffle_reduce_tasks: bool = True
 
+    use_external_merge_sort: bool = DEFAULT_USE_EXTERNAL_MERGE_SORT
+
     ################################################################
     # Hash-based shuffling configuration
     ################################################################
@@ -374,8 +452,41 @@ class DataContext:
     #
     # When unset defaults to `DataContext.max_hash_shuffle_aggregators`
     max_hash_shuffle_finalization_batch_size: Optional[int] = None
+    # Max total size (in bytes) of partition shards accumulated in memory by a single
+    # hash-shuffle aggregator (joining or repartitioning the dataset). Once exceeded,
+    # aggregator spills accumulated shards to local disk (as Arrow IPC files) and
+    # reads them back (memory-mapped) when finalizing corresponding partitions,
+    # allowing to process datasets that don't fit into the aggregators' memory.
+    #
+    # When unset shards are never spilled
+    hash_shuffle_aggregator_spill_threshold_bytes: Optional[
+        int
+    ] = DEFAULT_HASH_SHUFFLE_AGGREGATOR_SPILL_THRESHOLD_BYTES
+    # Local directory hash-shuffle aggregators spill partition shards into
+    #
+    # When unset defaults to the system's temporary directory
+    hash_shuffle_aggregator_spill_dir: Optional[str] = None
+    # Partitions (of an input sequence) larger than this factor times the average
+    # partition size (and target max block size) are considered skewed. Subsequent
+    # shards of the skewed partitions are spread across multiple aggregators,
+    # rather than all being handled by a single one. Currently only supported by
+    # joins (replicating corresponding partition of the other input to all of
+    # these aggregators), for join types that preserve rows of at most one input.
+    #
+    # When unset partitions are never split
+    hash_shuffle_skewed_partition_factor: Optional[
+        float
+    ] = DEFAULT_HASH_SHUFFLE_SKEWED_PARTITION_FACTOR
 
     join_operator_actor_num_cpus_per_partition_override: float = None
+    # Max estimated size (in bytes) of a join input for the join to broadcast it to
+    # the tasks processing the other input, instead of hash-shuffling both inputs.
+    #
+    # When unset (default) inputs are only broadcast if requested explicitly through
+    # `Dataset.join(..., broadcast=True)`
+    broadcast_join_threshold_bytes: Optional[
+        int
+    ] = DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
     hash_shuffle_operator_actor_num_cpus_per_partition_override: float = None
     hash_aggregate_operator_actor_num_cpus_per_partition_override: float = None
 
@@ -431,10 +542,48 @@ class DataContext:
     # Setting non-positive value here (ie <= 0) disables this functionality
     # (defaults to -1).
     wait_for_min_actors_s: int = DEFAULT_WAIT_FOR_MIN_ACTORS_S
+    # Type of the queue holding input bundles of the Actor Pool operators until
+    # they're dispatched to actors (see ``BundleQueueType``):
+    #
+    #   - FIFO: dispatches bundles in the order they were received
+    #   - LOCALITY_AWARE: prefers bundles whose blocks are on the nodes of
+    #   the least loaded available actors (requires actor locality to be enabled)
+    #   - LARGEST_FIRST: dispatches the largest bundles first, reducing stragglers
+    #   when bundle sizes are heterogeneous
+    #   - ORDERED_LOOKAHEAD: dispatches bundles in order, except for preferring
+    #   local bundles among the next ``actor_pool_bundle_queue_lookahead`` ones
+    #
+    # NOTE: Order of the outputs is preserved (when requested) regardless of the
+    #       order bundles are dispatched in
+    actor_pool_bundle_queue_type: BundleQueueType = DEFAULT_ACTOR_POOL_BUNDLE_QUEUE_TYPE
+    actor_pool_bundle_queue_lookahead: int = DEFAULT_ACTOR_POOL_BUNDLE_QUEUE_LOOKAHEAD
     retried_io_errors: List[str] = field(
         default_factory=lambda: list(DEFAULT_RETRIED_IO_ERRORS)
     )
     enable_per_node_metrics: bool = DEFAULT_ENABLE_PER_NODE_METRICS
+    # Max total size (in bytes) of the Arrow IPC files holding the blocks of the
+    # datasets persisted to disk by the job (see ``Dataset.persist``). Once
+    # exceeded, files of the least recently used datasets are deleted, and
+    # re-written (re-executing these datasets) upon their next execution.
+    #
+    # When unset persisted datasets are never evicted
+    persist_max_bytes: Optional[int] = DEFAULT_PERSIST_MAX_BYTES
+    # Local directory (on every node) datasets are persisted into
+    #
+    # When unset defaults to the system's temporary directory
+    persist_dir: Optional[str] = None
+    # Directory (on local disk or on a filesystem shared by the cluster) file
+    # listings and Parquet footer metadata are cached in (see `FileMetadataCache`).
+    # Listings of directories are reused until the modification times of the
+    # directories change.
+    #
+    # When unset the cache is disabled
+    file_metadata_cache_dir: Optional[str] = DEFAULT_FILE_METADATA_CACHE_DIR
+    # Number of seconds cached listings of directories without modification times
+    # (like prefixes of object stores) are reused for
+    #
+    # When unset listings of such directories are never reused
+    file_metadata_cache_ttl_s: Optional[float] = DEFAULT_FILE_METADATA_CACHE_TTL_S
     override_object_store_memory_limit_fraction: float = None
     memory_usage_poll_interval_s: Optional[float] = 1
     dataset_logger_id: Optional[str] = None
@@ -1442,6 +1442,7 @@ class Dataset:
             fn_constructor_args=fn_constructor_args,
             fn_constructor_kwargs=fn_constructor_kwargs,
             filter_expr=resolved_expr,
+            filter_expr_str=expr,
             compute=compute,
             ray_remote_args_fn=ray_remote_args_fn,
             ray_remote_args=ray_remote_args,
@@ -1510,9 +1511,9 @@ class Dataset:
                 minimizing data movement.
             keys: List of key columns repartitioning will use to determine which
                 partition will row belong to after repartitioning (by applying
-                hash-partitioning algorithm to the whole dataset). Note that, this
-                config is only relevant when `DataContext.use_hash_based_shuffle`
-                is set to True.
+                hash-partitioning algorithm to the whole dataset). Key-based
+                repartitioning always hash-shuffles the dataset (regardless of
+                `DataContext.shuffle_strategy`).
             sort: Whether the blocks should be sorted after repartitioning. Note,
                 that by default blocks will be sorted in the ascending order.
 
@@ -1734,6 +1735,8 @@ class Dataset:
         *,
         equal: bool = False,
         locality_hints: Optional[List["NodeIdStr"]] = None,
+        shuffle_seed: Optional[int] = None,
+        shuffle_window_blocks: int = 8,
     ) -> List[DataIterator]:
         """Returns ``n`` :class:`DataIterators <ray.data.DataIterator>` that can
         be used to read disjoint subsets of the dataset in parallel.
@@ -1797,16 +1800,46 @@ class Dataset:
 
                 ray.get(train.remote(it1))
 
+            Shuffle the data across the iterators in every epoch, without a full
+            :meth:`~Dataset.random_shuffle`.
+
+            .. testcode::
+
+                it1, it2 = ds.streaming_split(2, equal=True, shuffle_seed=42)
+
+            Change the number of iterators between epochs (for elastic training).
+            The previous iterators can't be used anymore afterwards.
+
+            .. testcode::
+
+                it1, it2, it3 = it1.resize(3)
+
         Args:
             n: Number of output iterators to return.
             equal: If ``True``, each output iterator sees an exactly equal number
                 of rows, dropping data if necessary. If ``False``, some iterators may
-                see slightly more or less rows than others, but no data is dropped.
+                see slightly more or less rows than others, but no data is dropped,
+                and iterators running out of data take over data queued for the
+                slowest iterator.
             locality_hints: Specify the node ids corresponding to each iterator
                 location. Dataset will try to minimize data movement based on the
                 iterator output locations. This list must have length ``n``. You can
                 get the current node id of a task or actor by calling
-                ``ray.get_runtime_context().get_node_id()``.
+                ``ray.get_runtime_context().get_node_id()``. If not provided, the
+                nodes the iterators are consumed on are used from the second epoch.
+            shuffle_seed: [Alpha] If not ``None``, the data is shuffled by a windowed
+                global shuffle in every epoch. Blocks are dispatched to the iterators
+                in rounds following a random permutation of the iterators, and the
+                rows are shuffled across every ``shuffle_window_blocks`` consecutive
+                blocks of each iterator. Both are seeded by this seed and the epoch,
+                such that the batches of the iterators are reproducible for a given
+                seed and epoch. The Dataset is executed with ``preserve_order``
+                (ignoring ``locality_hints``) to make the order of the blocks
+                deterministic.
+            shuffle_window_blocks: The number of consecutive blocks of each iterator
+                to shuffle the rows across, if ``shuffle_seed`` is set. Larger
+                windows improve the randomness of the shuffle but increase the
+                latency to the first batch of every window. Defaults to 8.
 
         Returns:
             The output iterator splits. These iterators are Ray-serializable and can
@@ -1818,7 +1851,20 @@ class Dataset:
                 Unlike :meth:`~Dataset.streaming_split`, :meth:`~Dataset.split`
                 materializes the dataset in memory.
         """
-        return StreamSplitDataIterator.create(self, n, equal, locality_hints)
+        if shuffle_window_blocks < 1:
+            raise ValueError(
+                "shuffle_window_blocks must be at least 1, got "
+                f"{shuffle_window_blocks}."
+            )
+
+        return StreamSplitDataIterator.create(
+            self,
+            n,
+            equal,
+            locality_hints,
+            shuffle_seed=shuffle_seed,
+            shuffle_window_blocks=shuffle_window_blocks,
+        )
 
     @ConsumptionAPI
     @PublicAPI(api_group=SMJ_API_GROUP)
@@ -2323,13 +2369,17 @@ class Dataset:
         partition_size_hint: Optional[int] = None,
         aggregator_ray_remote_args: Optional[Dict[str, Any]] = None,
         validate_schemas: bool = False,
+        broadcast: Optional[bool] = None,
     ) -> "Dataset":
         """Join :class:`Datasets <ray.data.Dataset>` on join keys.
 
         Args:
             ds: Other dataset to join against
             join_type: The kind of join that should be performed, one of ("inner",
-                "left_outer", "right_outer", "full_outer")
+                "left_outer", "right_outer", "full_outer", "left_semi", "left_anti").
+                Semi and anti joins only return columns of the left operand,
+                keeping rows that have (or, for anti joins, don't have) a matching
+                key in the right operand.
             num_partitions: Total number of "partitions" input sequences will be split
                 into with each partition being joined independently. Increasing number
                 of partitions allows to reduce individual partition size, hence reducing
@@ -2356,6 +2406,17 @@ class Dataset:
             validate_schemas: (Optional) Controls whether validation of provided
                 configuration against input schemas will be performed (defaults to
                 false, since obtaining schemas could be prohibitively expensive).
+            broadcast: (Optional) Controls whether one of the operands is broadcast
+                to the tasks processing the other operand, instead of hash-shuffling
+                both operands. Broadcasting avoids shuffling the (large) other
+                operand, but requires the broadcast operand to fit into the memory
+                of a single worker. When true, the right operand is broadcast for
+                "inner", "left_outer", "left_semi" and "left_anti" joins, and the
+                left one for "right_outer" joins ("full_outer" joins can't be
+                broadcast). When broadcasting, ``num_partitions`` is ignored. When
+                none (default), an operand is broadcast if its estimated size
+                doesn't exceed ``DataContext.broadcast_join_threshold_bytes`` (which
+                is unset, hence disabling automatic broadcasting, by default).
 
         Returns:
             A :class:`Dataset` that holds rows of input left Dataset joined with the
@@ -2429,6 +2490,7 @@ class Dataset:
             right_columns_suffix=right_suffix,
             partition_size_hint=partition_size_hint,
             aggregator_ray_remote_args=aggregator_ray_remote_args,
+            broadcast=broadcast,
         )
 
         return Dataset(plan, LogicalPlan(op, self.context))
@@ -2539,6 +2601,163 @@ class Dataset:
         ret = self._aggregate_on(Unique, column)
         return self._aggregate_result(ret)
 
+    @AllToAllAPI
+    @PublicAPI(api_group=GGA_API_GROUP, stability="alpha")
+    def distinct(
+        self,
+        subset: Optional[Union[str, List[str]]] = None,
+        *,
+        keep: Literal["any", "first", "last"] = "any",
+        order_by: Optional[str] = None,
+        num_partitions: Optional[int] = None,
+    ) -> "Dataset":
+        """Drop duplicate rows of this :class:`Dataset`.
+
+        Rows are duplicates if they have the same values of the ``subset`` columns
+        (or of all the columns, if not provided), with nulls being equal to each
+        other.
+
+        Rows are hash-partitioned by 128-bit fingerprints of these values, and every
+        partition is deduplicated as its rows are shuffled, keeping only the rows
+        with fingerprints not seen before (along with the set of these
+        fingerprints). Rows are also deduplicated within every block before being
+        shuffled. Unlike grouping the rows, this doesn't require copying (or
+        sorting) entire groups of rows.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.from_items(
+            ...     [
+            ...         {"url": "a", "crawled_at": 1},
+            ...         {"url": "b", "crawled_at": 2},
+            ...         {"url": "a", "crawled_at": 3},
+            ...     ]
+            ... )
+            >>> ds.distinct("url", keep="last", order_by="crawled_at").sort(
+            ...     "url"
+            ... ).take_all()
+            [{'url': 'a', 'crawled_at': 3}, {'url': 'b', 'crawled_at': 2}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            subset: The column or list of columns to compare the rows by. Defaults
+                to all the columns.
+            keep: Which row of the duplicates to keep: ``"any"`` of them (default),
+                or the ``"first"`` or the ``"last"`` one by the ``order_by`` column.
+                Keeping the first or last rows defers deduplicating the partitions
+                until they're entirely shuffled.
+            order_by: The column ordering the duplicates when keeping the
+                ``"first"`` or the ``"last"`` of them.
+            num_partitions: The number of partitions the rows are hash-partitioned
+                into (and the number of output blocks). Defaults to
+                ``DataContext.default_hash_shuffle_parallelism``.
+
+        Returns:
+            A :class:`Dataset` without duplicate rows.
+        """
+        from ray.data._internal.logical.operators.all_to_all_operator import Distinct
+
+        if keep not in ("any", "first", "last"):
+            raise ValueError(
+                f"`keep` has to be one of 'any', 'first' or 'last' (got '{keep}')"
+            )
+        if (keep == "any") != (order_by is None):
+            raise ValueError(
+                "`order_by` has to be provided if, and only if, the first or the "
+                f"last duplicates are kept (got keep='{keep}', order_by={order_by})"
+            )
+        if num_partitions is not None and num_partitions <= 0:
+            raise ValueError("`num_partitions` must be a positive integer")
+
+        if isinstance(subset, str):
+            subset = [subset]
+
+        plan = self._plan.copy()
+        op = Distinct(
+            self._logical_plan.dag,
+            keys=subset,
+            order_by=order_by,
+            descending=keep == "last",
+            num_partitions=num_partitions,
+        )
+        return Dataset(plan, LogicalPlan(op, self.context))
+
+    @AllToAllAPI
+    @PublicAPI(api_group=GGA_API_GROUP, stability="alpha")
+    def drop_near_duplicates(
+        self,
+        column: str,
+        *,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        ngram_size: int = 5,
+        seed: int = 0,
+        num_partitions: Optional[int] = None,
+    ) -> "Dataset":
+        """Drop rows with near-duplicate texts in the given column.
+
+        Texts are near-duplicates if the Jaccard similarity of their sets of word
+        n-grams is about the ``threshold`` or above. Similarities are estimated by
+        MinHash signatures of the texts, with locality-sensitive hashing: the
+        signatures are split into bands (chosen to best separate the similarities
+        below and above the threshold), and rows having the same hash of any of the
+        bands as a row kept are dropped. Rows with null (or empty) texts are
+        near-duplicates of each other.
+
+        Every band is deduplicated with :meth:`~Dataset.distinct`, hence this
+        shuffles the dataset once per band.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.from_items(
+            ...     [
+            ...         {"text": "the quick brown fox jumps over the lazy dog"},
+            ...         {"text": "the quick brown fox jumps over the lazy dog again"},
+            ...         {"text": "lorem ipsum dolor sit amet consectetur elit"},
+            ...     ]
+            ... )
+            >>> ds.drop_near_duplicates("text", threshold=0.5, ngram_size=1).count()
+            2
+
+        Args:
+            column: The name of the column holding the texts.
+            threshold: The Jaccard similarity above which texts are near-duplicates.
+            num_perm: The number of hash functions (permutations) of the MinHash
+                signatures.
+            ngram_size: The number of words of the n-grams of the texts.
+            seed: The seed of the hash functions.
+            num_partitions: The number of partitions the rows are hash-partitioned
+                into (see :meth:`~Dataset.distinct`).
+
+        Returns:
+            A :class:`Dataset` without near-duplicate rows.
+        """
+        from ray.data._internal.sketches import MinHash
+
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Threshold has to be in (0, 1] (got {threshold})")
+
+        minhash = MinHash(num_perm, ngram_size, seed=seed)
+        num_bands = MinHash.optimal_num_bands(threshold, num_perm)
+        band_columns = [f"__ray_minhash_band_{band}" for band in range(num_bands)]
+
+        def add_band_hashes(table: "pyarrow.Table") -> "pyarrow.Table":
+            import pyarrow as pa
+
+            signatures = minhash.signatures(table.column(column).to_pylist())
+            band_hashes = MinHash.band_hashes(signatures, num_bands)
+            for band_column, hashes in zip(band_columns, band_hashes.T):
+                table = table.append_column(band_column, pa.array(hashes))
+            return table
+
+        ds = self.map_batches(
+            add_band_hashes, batch_format="pyarrow", zero_copy_batch=True
+        )
+        for band_column in band_columns:
+            ds = ds.distinct(band_column, num_partitions=num_partitions)
+        return ds.drop_columns(band_columns)
+
     @AllToAllAPI
     @ConsumptionAPI
     @PublicAPI(api_group=GGA_API_GROUP)
@@ -3336,6 +3555,9 @@ class Dataset:
         concurrency: Optional[int] = None,
         num_rows_per_file: Optional[int] = None,
         mode: SaveMode = SaveMode.APPEND,
+        shuffle_partition_cols: bool = False,
+        target_file_size_bytes: Optional[int] = None,
+        sort_within_files_by: Optional[Union[str, List[str]]] = None,
         **arrow_parquet_args,
     ) -> None:
         """Writes the :class:`~ray.data.Dataset` to parquet files under the provided ``path``.
@@ -3417,6 +3639,18 @@ class Dataset:
                 "ignore", "append". Defaults to "append".
                 NOTE: This method isn't atomic. "Overwrite" first deletes all the data
                 before writing to `path`.
+            shuffle_partition_cols: [Experimental] Whether to hash-shuffle the rows by
+                ``partition_cols`` before writing them, such that all the rows of every
+                partition are written by a single task. Otherwise, every write task
+                writes a file to every partition it has rows of (resulting in up to
+                the number of tasks times the number of partitions files).
+            target_file_size_bytes: [Experimental] The target (in-memory) size of the
+                rows written to every file. Rows written by a task (to a partition)
+                are split into files of about this size. If ``None``, every task
+                writes a single file (to every partition).
+            sort_within_files_by: [Experimental] The column or list of columns to sort
+                the rows of every file by (in ascending order), narrowing the ranges
+                of the values of its row groups for readers filtering by them.
         """  # noqa: E501
         if arrow_parquet_args_fn is None:
             arrow_parquet_args_fn = lambda: {}  # noqa: E731
@@ -3427,6 +3661,26 @@ class Dataset:
                 "argument is specified"
             )
 
+        if shuffle_partition_cols and not partition_cols:
+            raise ValueError(
+                "`partition_cols` has to be specified when `shuffle_partition_cols` "
+                "is set"
+            )
+
+        if isinstance(sort_within_files_by, str):
+            sort_within_files_by = [sort_within_files_by]
+
+        if sort_within_files_by and partition_cols:
+            sorted_partition_cols = set(sort_within_files_by) & set(partition_cols)
+            if sorted_partition_cols:
+                raise ValueError(
+                    "Files can't be sorted by the partition columns "
+                    f"(got {sorted(sorted_partition_cols)})"
+                )
+
+        if target_file_size_bytes is not None and target_file_size_bytes <= 0:
+            raise ValueError("`target_file_size_bytes` must be a positive integer")
+
         effective_min_rows = _validate_rows_per_file_args(
             num_rows_per_file=num_rows_per_file, min_rows_per_file=min_rows_per_file
         )
@@ -3437,6 +3691,8 @@ class Dataset:
             arrow_parquet_args_fn=arrow_parquet_args_fn,
             arrow_parquet_args=arrow_parquet_args,
             min_rows_per_file=effective_min_rows,  # Pass through to datasink
+            target_file_size_bytes=target_file_size_bytes,
+            sort_within_files_by=sort_within_files_by,
             filesystem=filesystem,
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
@@ -3444,11 +3700,26 @@ class Dataset:
             dataset_uuid=self._uuid,
             mode=mode,
         )
-        self.write_datasink(
+
+        if not shuffle_partition_cols:
+            self.write_datasink(
+                datasink,
+                ray_remote_args=ray_remote_args,
+                concurrency=concurrency,
+            )
+            return
+
+        # Hash-shuffle the rows by the partition columns, such that every partition
+        # ends up in a single block (written by a single task)
+        ds = self.repartition(
+            self.context.default_hash_shuffle_parallelism, keys=partition_cols
+        )
+        ds.write_datasink(
             datasink,
             ray_remote_args=ray_remote_args,
             concurrency=concurrency,
         )
+        self._write_ds = ds._write_ds
 
     @ConsumptionAPI
     @PublicAPI(api_group=IOC_API_GROUP)
@@ -3849,6 +4120,7 @@ class Dataset:
         concurrency: Optional[int] = None,
         num_rows_per_file: Optional[int] = None,
         mode: SaveMode = SaveMode.APPEND,
+        write_index: bool = False,
     ) -> None:
         """Write the :class:`~ray.data.Dataset` to TFRecord files.
 
@@ -3920,6 +4192,10 @@ class Dataset:
                 "ignore", "append". Defaults to "append".
                 NOTE: This method isn't atomic. "Overwrite" first deletes all the data
                 before writing to `path`.
+            write_index: If ``True``, write an index of the record offsets
+                alongside every (uncompressed) file, which allows
+                :func:`~ray.data.read_tfrecords` to split large files into multiple
+                read tasks.
         """
         effective_min_rows = _validate_rows_per_file_args(
             num_rows_per_file=num_rows_per_file, min_rows_per_file=min_rows_per_file
@@ -3928,6 +4204,7 @@ class Dataset:
         datasink = TFRecordDatasink(
             path=path,
             tf_schema=tf_schema,
+            write_index=write_index,
             min_rows_per_file=effective_min_rows,
             filesystem=filesystem,
             try_create_dir=try_create_dir,
@@ -4731,6 +5008,7 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
     ) -> Iterable[TorchBatchType]:
         """Return an iterable over batches of data represented as Torch tensors.
 
@@ -4806,6 +5084,15 @@ class Dataset:
                 the buffer, the remaining rows in the buffer are drained.
                 ``batch_size`` must also be specified when using local shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: [Alpha] Whether to copy the batches into a ring of
+                preallocated host tensors (per column), which are reused across
+                batches of the same shapes rather than allocating new tensors for
+                every batch. The tensors are allocated in pinned memory if the
+                device is a CUDA device. Columns with nulls, non-numeric or
+                variable-shaped values, and batches of varying shapes are converted
+                as usual. Tensors of the batches (and views of these) must not be
+                used after the batches are released; clone them otherwise. You
+                can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -4823,6 +5110,7 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            reuse_buffers=reuse_buffers,
         )
 
     @ConsumptionAPI
@@ -5584,6 +5872,8 @@ class Dataset:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        hash_index: bool = False,
+        cache_size: int = 0,
     ) -> RandomAccessDataset:
         """Convert this dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -5604,10 +5894,21 @@ class Dataset:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            hash_index: Whether workers should build a hash index of the keys of
+                every block, speeding up lookups at the cost of extra worker memory.
+            cache_size: The max number of records looked up via ``multiget()`` to
+                keep in a (least recently used) cache on the caller, which serves
+                subsequent lookups of these keys. Disabled by default.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self,
+            key,
+            num_workers=num_workers,
+            hash_index=hash_index,
+            cache_size=cache_size,
+        )
 
     @ConsumptionAPI(pattern="store memory.", insert_after=True)
     @PublicAPI(api_group=E_API_GROUP)
@@ -5659,6 +5960,57 @@ class Dataset:
         output._plan.execute()  # No-op that marks the plan as fully executed.
         return output
 
+    @ConsumptionAPI
+    @PublicAPI(api_group=E_API_GROUP, stability="alpha")
+    def persist(self, storage_level: str = "disk") -> "Dataset":
+        """Execute and persist this dataset, so that subsequent executions (e.g.,
+        epochs of ``iter_batches`` or ``streaming_split``) read its blocks back
+        rather than re-executing it.
+
+        With ``storage_level="disk"`` (default), every block is written (by the task
+        producing it) to an Arrow IPC file on the local disk of its node, and is read
+        back memory-mapped. Unlike :meth:`~Dataset.materialize`, this doesn't pin the
+        blocks in object store memory, allowing to persist datasets larger than the
+        object store.
+
+        Datasets persisted to disk by the same job are evicted in least recently
+        used order once their total size exceeds
+        ``DataContext.persist_max_bytes``. Evicted datasets are re-executed (and
+        persisted again) upon their next execution. Files of persisted datasets are
+        deleted once the datasets are garbage collected.
+
+        With ``storage_level="memory"``, this is the same as
+        :meth:`~Dataset.materialize`.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(10).map_batches(lambda batch: batch)
+            >>> persisted_ds = ds.persist()
+            >>> persisted_ds.count()
+            10
+
+        Args:
+            storage_level: Where to store the blocks, either ``"disk"`` (node-local
+                disk) or ``"memory"`` (object store).
+
+        Returns:
+            A dataset reading the persisted blocks.
+        """
+        from ray.data._internal.persist import StorageLevel, persist_dataset
+
+        try:
+            storage_level = StorageLevel(storage_level)
+        except ValueError:
+            valid_levels = [level.value for level in StorageLevel]
+            raise ValueError(
+                f"Storage level has to be one of {valid_levels} (got {storage_level})"
+            ) from None
+
+        if storage_level == StorageLevel.MEMORY:
+            return self.materialize()
+
+        return persist_dataset(self)
+
     @PublicAPI(api_group=IM_API_GROUP)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
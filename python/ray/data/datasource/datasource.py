@@ -79,6 +79,63 @@ class Datasource:
         """If ``False``, only launch read tasks on the driver's node."""
         return True
 
+    def supports_projection_pushdown(self) -> bool:
+        """Whether this datasource can skip reading columns that aren't needed.
+
+        If ``True``, the logical optimizer may call :meth:`apply_projection` to
+        push a downstream column selection (for example,
+        :meth:`~ray.data.Dataset.select_columns`) into the read.
+        """
+        return False
+
+    def get_current_projection(self) -> Optional[List[str]]:
+        """Return the columns this datasource reads, or ``None`` if it reads all
+        columns.
+        """
+        return None
+
+    def apply_projection(self, columns: List[str]) -> "Datasource":
+        """Return a datasource that only reads the specified columns.
+
+        Implementations must not modify ``self``, because the same datasource can
+        back several datasets. If the projection can't be applied (for example,
+        because a column isn't known to the datasource), return ``self`` so that
+        the downstream operator surfaces the usual error.
+
+        Args:
+            columns: The columns required by downstream operators.
+
+        Returns:
+            A datasource that reads at least ``columns``.
+        """
+        raise NotImplementedError
+
+    def supports_predicate_pushdown(self) -> bool:
+        """Whether this datasource can skip data that doesn't match a filter.
+
+        If ``True``, the logical optimizer may call :meth:`apply_predicate` to push
+        an expression passed to :meth:`~ray.data.Dataset.filter` into the read.
+        """
+        return False
+
+    def apply_predicate(self, expression: str) -> "Datasource":
+        """Return a datasource that skips data that can't match ``expression``.
+
+        The returned datasource may still produce rows that don't match
+        ``expression``, because Ray Data filters the rows again after reading.
+        Implementations must not modify ``self``, because the same datasource can
+        back several datasets. If nothing can be pushed down, or if ``expression``
+        was already applied, return ``self``.
+
+        Args:
+            expression: A filter expression in the syntax accepted by
+                ``Dataset.filter(expr=...)``.
+
+        Returns:
+            A datasource that reads a superset of the rows matching ``expression``.
+        """
+        raise NotImplementedError
+
 
 @Deprecated
 class Reader:
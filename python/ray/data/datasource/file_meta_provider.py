@@ -424,14 +424,20 @@ def _get_file_infos(
     """Get the file info for all files at or under the provided path."""
     from pyarrow.fs import FileType
 
+    from ray.data._internal.file_metadata_cache import get_file_metadata_cache
+
     file_infos = []
     try:
         file_info = filesystem.get_file_info(path)
     except OSError as e:
         _handle_read_os_error(e, path)
     if file_info.type == FileType.Directory:
-        for file_path, file_size in _expand_directory(path, filesystem):
-            file_infos.append((file_path, file_size))
+        cache = get_file_metadata_cache(filesystem)
+        if cache is not None:
+            file_infos.extend(cache.expand_directory(filesystem, file_info))
+        else:
+            for file_path, file_size in _expand_directory(path, filesystem):
+                file_infos.append((file_path, file_size))
     elif file_info.type == FileType.File:
         file_infos.append((path, file_info.size))
     elif file_info.type == FileType.NotFound and ignore_missing_path:
@@ -462,24 +468,35 @@ def _expand_directory(
     Returns:
         An iterator of (file_path, file_size) tuples.
     """
-    if exclude_prefixes is None:
-        exclude_prefixes = [".", "_"]
-
     from pyarrow.fs import FileSelector
 
     selector = FileSelector(path, recursive=True, allow_not_found=ignore_missing_path)
     files = filesystem.get_file_info(selector)
-    base_path = selector.base_dir
+    out = _filter_excluded_paths(
+        selector.base_dir,
+        [(file_.path, file_.size) for file_ in files if file_.is_file],
+        exclude_prefixes,
+    )
+    # We sort the paths to guarantee a stable order.
+    return sorted(out)
+
+
+def _filter_excluded_paths(
+    base_path: str,
+    files: List[Tuple[str, int]],
+    exclude_prefixes: Optional[List[str]] = None,
+) -> List[Tuple[str, int]]:
+    """Filters out the files (under the base path) with relative paths starting with
+    any of the excluded prefixes ("." and "_" by default)."""
+    if exclude_prefixes is None:
+        exclude_prefixes = [".", "_"]
+
     out = []
-    for file_ in files:
-        if not file_.is_file:
-            continue
-        file_path = file_.path
+    for file_path, file_size in files:
         if not file_path.startswith(base_path):
             continue
         relative = file_path[len(base_path) :]
         if any(relative.startswith(prefix) for prefix in exclude_prefixes):
             continue
-        out.append((file_path, file_.size))
-    # We sort the paths to guarantee a stable order.
-    return sorted(out)
+        out.append((file_path, file_size))
+    return out
@@ -13,6 +13,7 @@ from ray.data.block import (
 )
 from ray.data.context import ShuffleStrategy
 from ray.data.dataset import Dataset
+from ray.data.window import WindowFn, _apply_window_fns
 from ray.util.annotations import PublicAPI
 
 CDS_API_GROUP = "Computations or Descriptive Stats"
@@ -214,29 +215,7 @@ class GroupedData:
                 Use this method for common aggregation use cases.
         """
 
-        # Prior to applying map operation we have to shuffle the data based on provided
-        # key and (optionally) number of partitions
-        #
-        #   - In case key is none, we repartition into a single block
-        #   - In case when hash-shuffle strategy is employed -- perform `repartition_and_sort`
-        #   - Otherwise we perform "global" sort of the dataset (to co-locate rows with the
-        #     same key values)
-        if self._key is None:
-            shuffled_ds = self._dataset.repartition(1)
-        elif self._dataset.context.shuffle_strategy == ShuffleStrategy.HASH_SHUFFLE:
-            num_partitions = (
-                self._num_partitions
-                or self._dataset.context.default_hash_shuffle_parallelism
-            )
-            shuffled_ds = self._dataset.repartition(
-                num_partitions,
-                keys=self._key,
-                # Blocks must be sorted after repartitioning, such that group
-                # of rows sharing the same key values are co-located
-                sort=True,
-            )
-        else:
-            shuffled_ds = self._dataset.sort(self._key)
+        shuffled_ds = self._shuffle_by_key()
 
         # The batch is the entire block, because we have batch_size=None for
         # map_batches() below.
@@ -244,17 +223,7 @@ class GroupedData:
             block = BlockAccessor.batch_to_block(batch)
             block_accessor = BlockAccessor.for_block(block)
 
-            if self._key is None:
-                keys = []
-            elif isinstance(self._key, str):
-                keys = [self._key]
-            elif isinstance(self._key, List):
-                keys = self._key
-            else:
-                raise ValueError(
-                    f"Group-by keys are expected to either be a single column (str) "
-                    f"or a list of columns (got '{self._key}')"
-                )
+            keys = self._get_key_columns()
 
             boundaries = block_accessor._get_group_boundaries_sorted(keys)
 
@@ -309,6 +278,118 @@ class GroupedData:
             **ray_remote_args,
         )
 
+    @PublicAPI(api_group=FA_API_GROUP, stability="alpha")
+    def window(
+        self,
+        *window_fns: WindowFn,
+        order_by: Union[str, List[str], None] = None,
+        descending: bool = False,
+    ) -> Dataset:
+        """Compute window functions (e.g., rolling means, lags or ranks) over the
+        rows of every group, ordered by the ``order_by`` columns.
+
+        Unlike aggregations, window functions produce a value for every row, which
+        are appended to the rows as new columns.
+
+        Examples:
+            >>> import ray
+            >>> from ray.data.window import Lag, RollingMean
+            >>> ds = ray.data.from_items([
+            ...     {"sensor": s, "time": t, "value": float(t * (s + 1))}
+            ...     for s in range(2) for t in range(4)
+            ... ])
+            >>> ds.groupby("sensor").window(
+            ...     RollingMean("value", preceding=1),
+            ...     Lag("value"),
+            ...     order_by="time",
+            ... ).sort(["sensor", "time"]).take(4)  # doctest: +SKIP
+            [{'sensor': 0, 'time': 0, 'value': 0.0, 'rolling_mean(value)': 0.0, 'lag(value)': None},
+             {'sensor': 0, 'time': 1, 'value': 1.0, 'rolling_mean(value)': 0.5, 'lag(value)': 0.0},
+             {'sensor': 0, 'time': 2, 'value': 2.0, 'rolling_mean(value)': 1.5, 'lag(value)': 1.0},
+             {'sensor': 0, 'time': 3, 'value': 3.0, 'rolling_mean(value)': 2.5, 'lag(value)': 2.0}]
+
+        Time complexity: O(dataset size * log(dataset size / parallelism))
+
+        Args:
+            *window_fns: The window functions to compute (see
+                :mod:`ray.data.window`).
+            order_by: The column(s) to order the rows of every group by.
+            descending: Whether to order the rows by the ``order_by`` columns in
+                descending order.
+
+        Returns:
+            A new dataset holding the rows with the results of the window functions
+            appended as columns. The order of the rows isn't preserved.
+
+        .. seealso::
+
+            :meth:`GroupedData.map_groups`
+                Use this method to apply arbitrary functions to every (whole)
+                group.
+        """  # noqa: E501
+
+        if not window_fns:
+            raise ValueError("At least one window function must be provided")
+
+        keys = self._get_key_columns()
+        if order_by is None:
+            order_by = []
+        elif isinstance(order_by, str):
+            order_by = [order_by]
+        window_fns = list(window_fns)
+
+        # NOTE: The window functions are computed for all the groups of a block at
+        #       once, with vectorized kernels (rather than for every group).
+        def apply_window_fns(table):
+            return _apply_window_fns(table, keys, order_by, descending, window_fns)
+
+        return self._shuffle_by_key().map_batches(
+            apply_window_fns,
+            batch_size=None,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+        )
+
+    def _shuffle_by_key(self) -> Dataset:
+        """Shuffle the dataset, such that every block holds entire groups (sorted by
+        the key)."""
+        # Prior to applying map operation we have to shuffle the data based on provided
+        # key and (optionally) number of partitions
+        #
+        #   - In case key is none, we repartition into a single block
+        #   - In case when hash-shuffle strategy is employed -- perform `repartition_and_sort`
+        #   - Otherwise we perform "global" sort of the dataset (to co-locate rows with the
+        #     same key values)
+        if self._key is None:
+            return self._dataset.repartition(1)
+        elif self._dataset.context.shuffle_strategy == ShuffleStrategy.HASH_SHUFFLE:
+            num_partitions = (
+                self._num_partitions
+                or self._dataset.context.default_hash_shuffle_parallelism
+            )
+            return self._dataset.repartition(
+                num_partitions,
+                keys=self._key,
+                # Blocks must be sorted after repartitioning, such that group
+                # of rows sharing the same key values are co-located
+                sort=True,
+            )
+        else:
+            return self._dataset.sort(self._key)
+
+    def _get_key_columns(self) -> List[str]:
+        if self._key is None:
+            return []
+        elif isinstance(self._key, str):
+            return [self._key]
+        elif isinstance(self._key, List):
+            return self._key
+        else:
+            raise ValueError(
+                f"Group-by keys are expected to either be a single column (str) "
+                f"or a list of columns (got '{self._key}')"
+            )
+
     @PublicAPI(api_group=CDS_API_GROUP)
     def count(self) -> Dataset:
         """Compute count aggregation.
@@ -278,6 +278,7 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
     ) -> Iterable["TorchBatchType"]:
         """Return a batched iterable of Torch Tensors over the dataset.
 
@@ -365,6 +366,15 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: [Alpha] Whether to copy the batches into a ring of
+                preallocated host tensors (per column), which are reused across
+                batches of the same shapes rather than allocating new tensors for
+                every batch. The tensors are allocated in pinned memory if the
+                device is a CUDA device. Columns with nulls, non-numeric or
+                variable-shaped values, and batches of varying shapes are converted
+                as usual. Tensors of the batches (and views of these) must not be
+                used after the batches are released; clone them otherwise. You
+                can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -378,6 +388,8 @@ class DataIterator(abc.ABC):
                 "You should manually move the output Torch tensors to the"
                 "desired dtype and device outside of collate_fn."
             )
+        if collate_fn is not None and reuse_buffers:
+            raise ValueError("collate_fn cannot be used with reuse_buffers.")
 
         if device == "auto":
             # Use the appropriate device for Ray Train, or falls back to CPU if
@@ -420,6 +432,9 @@ class DataIterator(abc.ABC):
             collate_fn = DefaultCollateFn(
                 dtypes=dtypes,
                 device=device,
+                # Batches are held (at most) while being collated by the prefetch
+                # threads, finalized, and used by the user thread.
+                num_buffers=prefetch_batches + 2 if reuse_buffers else 0,
             )
             batch_format = "pyarrow"
         elif isinstance(collate_fn, ArrowBatchCollateFn):
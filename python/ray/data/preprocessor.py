@@ -12,6 +12,7 @@ from ray.util.annotations import DeveloperAPI, PublicAPI
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import pyarrow as pa
 
     from ray.air.data_batch_type import DataBatchType
     from ray.data import Dataset
@@ -44,7 +45,11 @@ class Preprocessor(abc.ABC):
       ``_is_fittable=False``.
     * ``_transform_pandas`` and/or ``_transform_numpy`` for best performance,
       implement both. Otherwise, the data will be converted to the match the
-      implemented method.
+      implemented method. ``_transform_arrow`` can additionally be implemented
+      (with ``preferred_batch_format`` returning ``BatchFormat.ARROW``) to
+      transform the Arrow blocks of datasets natively, without converting them to
+      pandas. ``transform_batch`` only uses it if no other transform is
+      implemented, so that the type of the batches it returns doesn't change.
     """
 
     class FitStatus(str, Enum):
@@ -224,34 +229,41 @@ class Preprocessor(abc.ABC):
         """Sub-classes should override this instead of fit()."""
         raise NotImplementedError()
 
+    def _get_implemented_batch_formats(self) -> List[BatchFormat]:
+        """Returns the batch formats of the implemented ``_transform_*`` methods."""
+        transforms = {
+            BatchFormat.PANDAS: "_transform_pandas",
+            BatchFormat.NUMPY: "_transform_numpy",
+            BatchFormat.ARROW: "_transform_arrow",
+        }
+        return [
+            batch_format
+            for batch_format, transform in transforms.items()
+            if getattr(self.__class__, transform) != getattr(Preprocessor, transform)
+        ]
+
     def _determine_transform_to_use(self) -> BatchFormat:
         """Determine which batch format to use based on Preprocessor implementation.
 
         * If only `_transform_pandas` is implemented, then use ``pandas`` batch format.
         * If only `_transform_numpy` is implemented, then use ``numpy`` batch format.
-        * If both are implemented, then use the Preprocessor defined preferred batch
-        format.
+        * If only `_transform_arrow` is implemented, then use ``pyarrow`` batch format.
+        * If more are implemented, then use the Preprocessor defined preferred batch
+        format (falling back to ``pandas``, and then ``numpy``, if the preferred one
+        isn't implemented).
         """
+        batch_formats = self._get_implemented_batch_formats()
 
-        has_transform_pandas = (
-            self.__class__._transform_pandas != Preprocessor._transform_pandas
-        )
-        has_transform_numpy = (
-            self.__class__._transform_numpy != Preprocessor._transform_numpy
-        )
-
-        if has_transform_numpy and has_transform_pandas:
-            return self.preferred_batch_format()
-        elif has_transform_numpy:
-            return BatchFormat.NUMPY
-        elif has_transform_pandas:
-            return BatchFormat.PANDAS
-        else:
+        if not batch_formats:
             raise NotImplementedError(
-                "None of `_transform_numpy` or `_transform_pandas` are implemented. "
-                "At least one of these transform functions must be implemented "
-                "for Preprocessor transforms."
+                "None of `_transform_numpy`, `_transform_pandas` or `_transform_arrow` "
+                "are implemented. At least one of these transform functions must be "
+                "implemented for Preprocessor transforms."
             )
+        elif self.preferred_batch_format() in batch_formats:
+            return self.preferred_batch_format()
+        else:
+            return batch_formats[0]
 
     def _transform(
         self,
@@ -283,10 +295,14 @@ class Preprocessor(abc.ABC):
             return ds.map_batches(
                 self._transform_numpy, batch_format=BatchFormat.NUMPY, **kwargs
             )
+        elif transform_type == BatchFormat.ARROW:
+            return ds.map_batches(
+                self._transform_arrow, batch_format="pyarrow", **kwargs
+            )
         else:
             raise ValueError(
                 "Invalid transform type returned from _determine_transform_to_use; "
-                f'"pandas" and "numpy" allowed, but got: {transform_type}'
+                f'"pandas", "numpy" and "arrow" allowed, but got: {transform_type}'
             )
 
     def _get_transform_config(self) -> Dict[str, Any]:
@@ -321,11 +337,30 @@ class Preprocessor(abc.ABC):
             )
 
         transform_type = self._determine_transform_to_use()
+        if transform_type == BatchFormat.ARROW:
+            # NOTE: To preserve the type of the returned batches (for batches of all
+            #       formats), these are only transformed with Arrow if no other
+            #       transform is implemented
+            batch_formats = [
+                batch_format
+                for batch_format in self._get_implemented_batch_formats()
+                if batch_format != BatchFormat.ARROW
+            ]
+            if batch_formats:
+                transform_type = batch_formats[0]
 
         if transform_type == BatchFormat.PANDAS:
             return self._transform_pandas(_convert_batch_type_to_pandas(data))
         elif transform_type == BatchFormat.NUMPY:
             return self._transform_numpy(_convert_batch_type_to_numpy(data))
+        elif transform_type == BatchFormat.ARROW:
+            from ray.data.block import BlockAccessor
+
+            if not isinstance(data, pyarrow.Table):
+                data = BlockAccessor.for_block(
+                    _convert_batch_type_to_pandas(data)
+                ).to_arrow()
+            return self._transform_arrow(data)
 
     @classmethod
     def _derive_and_validate_output_columns(
@@ -360,13 +395,18 @@ class Preprocessor(abc.ABC):
         """Run the transformation on a data batch in a NumPy ndarray format."""
         raise NotImplementedError()
 
+    @DeveloperAPI
+    def _transform_arrow(self, table: "pa.Table") -> "pa.Table":
+        """Run the transformation on a data batch in a PyArrow Table format."""
+        raise NotImplementedError()
+
     @classmethod
     @DeveloperAPI
     def preferred_batch_format(cls) -> BatchFormat:
         """Batch format hint for upstream producers to try yielding best block format.
 
-        The preferred batch format to use if both `_transform_pandas` and
-        `_transform_numpy` are implemented. Defaults to Pandas.
+        The preferred batch format to use if more than one of `_transform_pandas`,
+        `_transform_numpy` and `_transform_arrow` are implemented. Defaults to Pandas.
 
         Can be overriden by Preprocessor classes depending on which transform
         path is the most optimal.
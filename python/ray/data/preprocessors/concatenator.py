@@ -3,8 +3,15 @@ from typing import List, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from ray.air.util.data_batch_conversion import BatchFormat
+from ray.air.util.tensor_extensions.arrow import ArrowTensorArray
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import (
+    _set_arrow_columns,
+    _transform_arrow_with_pandas,
+)
 from ray.util.annotations import PublicAPI
 
 logger = logging.getLogger(__name__)
@@ -137,6 +144,36 @@ class Concatenator(Preprocessor):
         df.loc[:, self.output_column_name] = pd.Series(list(concatenated))
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        if self.flatten or not all(
+            column in table.column_names
+            and (
+                pa.types.is_integer(table.schema.field(column).type)
+                or pa.types.is_floating(table.schema.field(column).type)
+                or pa.types.is_boolean(table.schema.field(column).type)
+            )
+            for column in self.columns
+        ):
+            # Nested (and missing) columns are handled by pandas.
+            return _transform_arrow_with_pandas(self, table)
+
+        concatenated = np.column_stack(
+            [table.column(column).to_numpy() for column in self.columns]
+        )
+        if self.dtype is not None:
+            concatenated = concatenated.astype(self.dtype, copy=False)
+
+        table = table.drop(self.columns)
+        return _set_arrow_columns(
+            table,
+            [self.output_column_name],
+            [ArrowTensorArray.from_numpy(concatenated)],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         default_values = {
             "output_column_name": "concat_out",
@@ -1,14 +1,21 @@
 from collections import Counter, OrderedDict
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 import pandas.api.types
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ray.air.util.data_batch_conversion import BatchFormat
+from ray.air.util.tensor_extensions.arrow import ArrowTensorArray
 from ray.data import Dataset
 from ray.data.preprocessor import Preprocessor, PreprocessorNotFittedException
+from ray.data.preprocessors.utils import (
+    _set_arrow_columns,
+    _transform_arrow_with_pandas,
+)
 from ray.util.annotations import PublicAPI
 
 
@@ -144,6 +151,25 @@ class OrdinalEncoder(Preprocessor):
         df[self.output_columns] = df[self.columns].apply(column_ordinal_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        _validate_arrow_table(table, *self.columns)
+
+        output_arrays = []
+        for column in self.columns:
+            encoded = _encode_arrow_column(
+                table.column(column), self.stats_[f"unique_values({column})"]
+            )
+            if encoded is None:
+                # Columns of lists are handled by pandas.
+                return _transform_arrow_with_pandas(self, table)
+            output_arrays.append(encoded)
+
+        return _set_arrow_columns(table, self.output_columns, output_arrays)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -289,6 +315,29 @@ class OneHotEncoder(Preprocessor):
             df.loc[:, output_column] = pd.Series(list(concatenated))
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        _validate_arrow_table(table, *self.columns)
+
+        output_arrays = []
+        for column in self.columns:
+            column_values = self.stats_[f"unique_values({column})"]
+            indices = _encode_arrow_column(table.column(column), column_values)
+            if indices is None:
+                # Columns of lists are handled by pandas.
+                return _transform_arrow_with_pandas(self, table)
+
+            indices = pc.fill_null(indices, -1).to_numpy()
+            rows = np.flatnonzero(indices >= 0)
+            one_hot = np.zeros((table.num_rows, len(column_values)), dtype=np.int64)
+            one_hot[rows, indices[rows]] = 1
+            output_arrays.append(ArrowTensorArray.from_numpy(one_hot))
+
+        return _set_arrow_columns(table, self.output_columns, output_arrays)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -419,6 +468,46 @@ class MultiHotEncoder(Preprocessor):
 
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        _validate_arrow_table(table, *self.columns)
+
+        output_arrays = []
+        for column in self.columns:
+            lists = table.column(column).combine_chunks()
+            if not (pa.types.is_list(lists.type) or pa.types.is_large_list(lists.type)):
+                # Columns of scalars and tensors are handled by pandas.
+                return _transform_arrow_with_pandas(self, table)
+
+            column_values = self.stats_[f"unique_values({column})"]
+            indices = _encode_arrow_column(
+                pa.chunked_array([pc.list_flatten(lists)]), column_values
+            )
+            if indices is None:
+                return _transform_arrow_with_pandas(self, table)
+
+            indices = pc.fill_null(indices, -1).to_numpy()
+            rows = np.repeat(
+                np.arange(len(lists)),
+                pc.fill_null(pc.list_value_length(lists), 0).to_numpy(),
+            )
+            is_known = indices >= 0
+            counts = np.zeros((len(lists), len(column_values)), dtype=np.int64)
+            np.add.at(counts, (rows[is_known], indices[is_known]), 1)
+            output_arrays.append(
+                pa.ListArray.from_arrays(
+                    pa.array(
+                        np.arange(len(lists) + 1, dtype=np.int32) * len(column_values)
+                    ),
+                    pa.array(counts.ravel()),
+                )
+            )
+
+        return _set_arrow_columns(table, self.output_columns, output_arrays)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -511,6 +600,22 @@ class LabelEncoder(Preprocessor):
         df[self.output_column] = df[self.label_column].transform(column_label_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        _validate_arrow_table(table, self.label_column)
+
+        encoded = _encode_arrow_column(
+            table.column(self.label_column),
+            self.stats_[f"unique_values({self.label_column})"],
+        )
+        if encoded is None:
+            return _transform_arrow_with_pandas(self, table)
+
+        return _set_arrow_columns(table, [self.output_column], [encoded])
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def inverse_transform(self, ds: "Dataset") -> "Dataset":
         """Inverse transform the given dataset.
 
@@ -655,6 +760,37 @@ class Categorizer(Preprocessor):
         df[self.output_columns] = df[self.columns].astype(self.stats_)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        output_arrays = []
+        for column in self.columns:
+            dtype = self.stats_[column]
+            if dtype.categories is None:
+                return _transform_arrow_with_pandas(self, table)
+
+            categories = list(dtype.categories)
+            indices = _encode_arrow_column(
+                table.column(column),
+                {value: index for index, value in enumerate(categories)},
+            )
+            if indices is None:
+                return _transform_arrow_with_pandas(self, table)
+
+            # The categories are only stored once (in the dictionary), rather than
+            # for every row.
+            output_arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    pc.cast(indices, pa.int32()).combine_chunks(),
+                    pa.array(categories),
+                    ordered=bool(dtype.ordered),
+                )
+            )
+
+        return _set_arrow_columns(table, self.output_columns, output_arrays)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -760,6 +896,73 @@ def _validate_df(df: pd.DataFrame, *columns: str) -> None:
         )
 
 
+def _validate_arrow_table(table: pa.Table, *columns: str) -> None:
+    null_columns = [
+        column
+        for column in columns
+        if pc.any(pc.is_null(table.column(column), nan_is_null=True)).as_py()
+    ]
+    if null_columns:
+        raise ValueError(
+            f"Unable to transform columns {null_columns} because they contain "
+            f"null values. Consider imputing missing values first."
+        )
+
+
+def _encode_arrow_column(
+    column: pa.ChunkedArray, values_indices: Dict[Any, int]
+) -> Optional[pa.ChunkedArray]:
+    """Map the values of the column to their indices (or to nulls for the values
+    missing from ``values_indices``).
+
+    Returns None if the column can't be encoded with Arrow kernels (e.g. if it
+    contains lists, or if its type doesn't match the type of the values), in
+    which case it should be encoded with pandas instead.
+    """
+    value_type = column.type
+    if pa.types.is_dictionary(value_type):
+        value_type = value_type.value_type
+    if pa.types.is_nested(value_type) or isinstance(value_type, pa.ExtensionType):
+        return None
+
+    try:
+        value_set = pa.array(list(values_indices.keys()))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    # NOTE: `index_in` casts the values to the type of the column, so e.g. the
+    #       integer 1 would otherwise match the string "1".
+    if _get_arrow_type_kind(value_set.type) != _get_arrow_type_kind(value_type):
+        return None
+    indices = pa.array(list(values_indices.values()), type=pa.int64())
+
+    def encode(array: pa.Array) -> pa.Array:
+        if pa.types.is_dictionary(array.type):
+            # Only encode the dictionary, rather than every value.
+            return pc.take(encode(array.dictionary), array.indices)
+        return pc.take(indices, pc.index_in(array, value_set=value_set))
+
+    try:
+        return pa.chunked_array(
+            [encode(chunk) for chunk in column.chunks], type=pa.int64()
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return None
+
+
+def _get_arrow_type_kind(type: pa.DataType) -> Optional[str]:
+    if pa.types.is_string(type) or pa.types.is_large_string(type):
+        return "string"
+    elif pa.types.is_binary(type) or pa.types.is_large_binary(type):
+        return "binary"
+    elif pa.types.is_boolean(type):
+        return "boolean"
+    elif pa.types.is_integer(type) or pa.types.is_floating(type):
+        return "number"
+    elif pa.types.is_temporal(type):
+        return "temporal"
+    return None
+
+
 def _is_series_composed_of_lists(series: pd.Series) -> bool:
     # we assume that all elements are a list here
     first_not_none_element = next(
@@ -1,10 +1,14 @@
 import collections
 from typing import List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from ray.air.util.data_batch_conversion import BatchFormat
+from ray.air.util.tensor_extensions.arrow import ArrowTensorArray
 from ray.data.preprocessor import Preprocessor
-from ray.data.preprocessors.utils import simple_hash
+from ray.data.preprocessors.utils import _set_arrow_columns, simple_hash
 from ray.util.annotations import PublicAPI
 
 
@@ -110,6 +114,24 @@ class FeatureHasher(Preprocessor):
 
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        # The hashes only depend on the column names, so every column is added to
+        # its feature as a whole (rather than hashing every row).
+        columns = [table.column(column).to_numpy() for column in self.columns]
+        features = np.zeros(
+            (table.num_rows, self.num_features), dtype=np.result_type(*columns)
+        )
+        for column, values in zip(self.columns, columns):
+            features[:, simple_hash(column, self.num_features)] += values
+
+        return _set_arrow_columns(
+            table, [self.output_column], [ArrowTensorArray.from_numpy(features)]
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -4,11 +4,18 @@ from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api.types import is_categorical_dtype
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset
 from ray.data.aggregate import Mean
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import (
+    _set_arrow_columns,
+    _transform_arrow_with_pandas,
+)
 from ray.util.annotations import PublicAPI
 
 
@@ -170,6 +177,52 @@ class SimpleImputer(Preprocessor):
 
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        output_arrays = []
+        for column in self.columns:
+            value = self._get_fill_value(column)
+
+            if value is None:
+                raise ValueError(
+                    f"Column {column} has no fill value. "
+                    "Check the data used to fit the SimpleImputer."
+                )
+
+            if column not in table.column_names:
+                # Create the column with the fill_value if it doesn't exist
+                output_arrays.append(pa.repeat(value, table.num_rows))
+                continue
+
+            array = table.column(column)
+            if pa.types.is_dictionary(array.type) or pa.types.is_nested(array.type):
+                # Categorical and list columns are handled by pandas.
+                return _transform_arrow_with_pandas(self, table)
+
+            is_missing = pc.is_null(array, nan_is_null=True)
+            if not pc.any(is_missing).as_py():
+                # Nothing to fill, so the column is kept as is (without copying it).
+                output_arrays.append(array)
+                continue
+
+            if pa.types.is_integer(array.type):
+                # Like for pandas, integer columns with missing values are floats.
+                array = pc.cast(array, pa.float64())
+
+            try:
+                fill_value = pa.scalar(value).cast(array.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # The fill value has a different type than the column, which pandas
+                # handles by creating an object column.
+                return _transform_arrow_with_pandas(self, table)
+
+            output_arrays.append(pc.if_else(is_missing, fill_value, array))
+
+        return _set_arrow_columns(table, self.output_columns, output_arrays)
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def _get_fill_value(self, column):
         if self.strategy == "mean":
             return self.stats_[f"mean({column})"]
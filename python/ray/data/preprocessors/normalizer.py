@@ -1,9 +1,14 @@
+import functools
 from typing import List, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_columns
 from ray.util.annotations import PublicAPI
 
 
@@ -94,6 +99,20 @@ class Normalizer(Preprocessor):
         "max": lambda cols: np.max(abs(cols), axis=1),
     }
 
+    # Element-wise reductions of the absolute values of the columns to their norms.
+    # Like for pandas, nulls are skipped.
+    _arrow_norm_fns = {
+        "l1": lambda cols: functools.reduce(
+            pc.add, [pc.fill_null(col, 0) for col in cols]
+        ),
+        "l2": lambda cols: pc.sqrt(
+            functools.reduce(
+                pc.add, [pc.fill_null(pc.multiply(col, col), 0) for col in cols]
+            )
+        ),
+        "max": lambda cols: pc.max_element_wise(*cols),
+    }
+
     _is_fittable = False
 
     def __init__(
@@ -123,6 +142,24 @@ class Normalizer(Preprocessor):
         df[self.output_columns] = columns.div(column_norms, axis=0)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        columns = [
+            pc.cast(table.column(column), pa.float64()) for column in self.columns
+        ]
+        column_norms = self._arrow_norm_fns[self.norm](
+            [pc.abs(column) for column in columns]
+        )
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [pc.divide(column, column_norms) for column in columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
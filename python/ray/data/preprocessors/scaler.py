@@ -2,10 +2,14 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset
 from ray.data.aggregate import AbsMax, Max, Mean, Min, Std
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_columns
 from ray.util.annotations import PublicAPI
 
 
@@ -109,6 +113,32 @@ class StandardScaler(Preprocessor):
         df[self.output_columns] = df[self.columns].transform(column_standard_scaler)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        def column_standard_scaler(column: str):
+            s = _to_float64(table.column(column))
+            s_mean = self.stats_[f"mean({column})"]
+            s_std = self.stats_[f"std({column})"]
+
+            if s_std is None or s_mean is None:
+                return pa.array(np.full(len(s), np.nan))
+
+            # Handle division by zero.
+            # TODO: extend this to handle near-zero values.
+            if s_std == 0:
+                s_std = 1
+
+            return pc.divide(pc.subtract(s, s_mean), s_std)
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [column_standard_scaler(column) for column in self.columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r}, output_columns={self.output_columns!r})"
 
@@ -205,6 +235,30 @@ class MinMaxScaler(Preprocessor):
         df[self.output_columns] = df[self.columns].transform(column_min_max_scaler)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        def column_min_max_scaler(column: str):
+            s = _to_float64(table.column(column))
+            s_min = self.stats_[f"min({column})"]
+            s_max = self.stats_[f"max({column})"]
+            diff = s_max - s_min
+
+            # Handle division by zero.
+            # TODO: extend this to handle near-zero values.
+            if diff == 0:
+                diff = 1
+
+            return pc.divide(pc.subtract(s, s_min), diff)
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [column_min_max_scaler(column) for column in self.columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r}, output_columns={self.output_columns!r})"
 
@@ -295,6 +349,28 @@ class MaxAbsScaler(Preprocessor):
         df[self.output_columns] = df[self.columns].transform(column_abs_max_scaler)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        def column_abs_max_scaler(column: str):
+            s = _to_float64(table.column(column))
+            s_abs_max = self.stats_[f"abs_max({column})"]
+
+            # Handle division by zero.
+            # All values are 0.
+            if s_abs_max == 0:
+                s_abs_max = 1
+
+            return pc.divide(s, s_abs_max)
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [column_abs_max_scaler(column) for column in self.columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r}, output_columns={self.output_columns!r})"
 
@@ -433,9 +509,41 @@ class RobustScaler(Preprocessor):
         df[self.output_columns] = df[self.columns].transform(column_robust_scaler)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        def column_robust_scaler(column: str):
+            s = _to_float64(table.column(column))
+            s_low_q = self.stats_[f"low_quantile({column})"]
+            s_median = self.stats_[f"median({column})"]
+            s_high_q = self.stats_[f"high_quantile({column})"]
+            diff = s_high_q - s_low_q
+
+            # Handle division by zero.
+            # Return all zeros.
+            if diff == 0:
+                return pa.array(np.zeros(len(s)))
+
+            return pc.divide(pc.subtract(s, s_median), diff)
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [column_robust_scaler(column) for column in self.columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
             f"quantile_range={self.quantile_range!r}), "
             f"output_columns={self.output_columns!r})"
         )
+
+
+def _to_float64(s: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast the (numeric) column to float64, as done by pandas arithmetic."""
+    if s.type == pa.float64():
+        return s
+    return pc.cast(s, pa.float64())
@@ -2,8 +2,12 @@ from typing import List, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_columns
 from ray.util.annotations import PublicAPI
 
 
@@ -93,6 +97,49 @@ class PowerTransformer(Preprocessor):
         df[self.output_columns] = df[self.columns].transform(column_power_transformer)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        def column_power_transformer(column: str):
+            s = pc.cast(table.column(column), pa.float64())
+            if self.method == "yeo-johnson":
+                if self.power != 0:
+                    pos_result = pc.divide(
+                        pc.subtract(pc.power(pc.add(s, 1), self.power), 1),
+                        self.power,
+                    )
+                else:
+                    pos_result = pc.ln(pc.add(s, 1))
+
+                neg_s = pc.add(pc.negate(s), 1)
+                if self.power != 2:
+                    neg_result = pc.negate(
+                        pc.divide(
+                            pc.subtract(pc.power(neg_s, 2 - self.power), 1),
+                            2 - self.power,
+                        )
+                    )
+                else:
+                    neg_result = pc.negate(pc.ln(neg_s))
+
+                return pc.if_else(pc.greater_equal(s, 0), pos_result, neg_result)
+
+            else:  # box-cox
+                if self.power != 0:
+                    return pc.divide(
+                        pc.subtract(pc.power(s, self.power), 1), self.power
+                    )
+                else:
+                    return pc.ln(s)
+
+        return _set_arrow_columns(
+            table,
+            self.output_columns,
+            [column_power_transformer(column) for column in self.columns],
+        )
+
+    @classmethod
+    def preferred_batch_format(cls) -> BatchFormat:
+        return BatchFormat.ARROW
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
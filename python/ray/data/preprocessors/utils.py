@@ -1,8 +1,13 @@
 import hashlib
-from typing import List
+from typing import TYPE_CHECKING, List, Union
 
 from ray.util.annotations import DeveloperAPI
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ray.data.preprocessor import Preprocessor
+
 
 @DeveloperAPI
 def simple_split_tokenizer(value: str) -> List[str]:
@@ -17,3 +22,36 @@ def simple_hash(value: object, num_features: int) -> int:
     hashed_value = hashlib.sha1(encoded_value)
     hashed_value_int = int(hashed_value.hexdigest(), 16)
     return hashed_value_int % num_features
+
+
+def _set_arrow_columns(
+    table: "pa.Table",
+    columns: List[str],
+    arrays: List[Union["pa.Array", "pa.ChunkedArray"]],
+) -> "pa.Table":
+    """Set the columns of the table to the arrays, replacing the existing columns
+    (in place) and appending the others.
+
+    The arrays of the other columns aren't copied.
+    """
+    for column, array in zip(columns, arrays):
+        index = table.schema.get_field_index(column)
+        if index >= 0:
+            table = table.set_column(index, column, array)
+        else:
+            table = table.append_column(column, array)
+    return table
+
+
+def _transform_arrow_with_pandas(
+    preprocessor: "Preprocessor", table: "pa.Table"
+) -> "pa.Table":
+    """Transform the table with the pandas implementation of the preprocessor.
+
+    Used by the Arrow implementations for the (column) types they don't support
+    natively.
+    """
+    from ray.data.block import BlockAccessor
+
+    df = preprocessor._transform_pandas(BlockAccessor.for_block(table).to_pandas())
+    return BlockAccessor.for_block(df).to_arrow()
@@ -2,8 +2,8 @@ import bisect
 import logging
 import random
 import time
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -40,6 +40,8 @@ class RandomAccessDataset:
         ds: "Dataset",
         key: str,
         num_workers: int,
+        hash_index: bool = False,
+        cache_size: int = 0,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -68,13 +70,18 @@ class RandomAccessDataset:
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+        # Upper bounds as an array, for looking up blocks of many keys at once.
+        self._upper_bounds_array = np.array(self._upper_bounds)
+        # Number of lookups of each block, used to find hot blocks to replicate.
+        self._block_access_counts = np.zeros(len(self._non_empty_blocks), dtype=int)
+        self._cache = _LRUCache(cache_size) if cache_size > 0 else None
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
         scheduling_strategy = ctx.scheduling_strategy
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, hash_index
             )
             for _ in range(num_workers)
         ]
@@ -141,9 +148,14 @@ class RandomAccessDataset:
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
+        if self._cache is not None:
+            found, value = self._cache.get(key)
+            if found:
+                return ray.put(value)
         block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
+        self._block_access_counts[block_index] += 1
         return self._worker_for(block_index).get.remote(block_index, key)
 
     def multiget(self, keys: List[Any]) -> List[Optional[Any]]:
@@ -155,24 +167,113 @@ class RandomAccessDataset:
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
-                continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+        results: List[Optional[Any]] = [None] * len(keys)
+
+        # Positions of the keys that have to be looked up by the workers.
+        positions = []
+        for i, k in enumerate(keys):
+            if self._cache is not None:
+                found, value = self._cache.get(k)
+                if found:
+                    results[i] = value
+                    continue
+            positions.append(i)
+
+        if not positions:
+            return results
+
+        positions = np.array(positions)
+        block_indices = self._find_le_batch([keys[i] for i in positions])
+        positions = positions[block_indices >= 0]
+        block_indices = block_indices[block_indices >= 0]
+        self._block_access_counts += np.bincount(
+            block_indices, minlength=len(self._block_access_counts)
+        )
+
+        # Group the keys by block, and then the blocks by the worker to look them up
+        # with, so that every worker is only sent a single request.
+        order = np.argsort(block_indices, kind="stable")
+        positions = positions[order]
+        block_indices = block_indices[order]
+        unique_block_indices, offsets = np.unique(block_indices, return_index=True)
+        worker_to_positions = defaultdict(list)
+        for block_index, block_positions in zip(
+            unique_block_indices.tolist(), np.split(positions, offsets[1:])
+        ):
+            worker = self._worker_for(block_index)
+            worker_to_positions[worker].append((block_index, block_positions))
+
+        worker_positions, futures = [], []
+        for worker, batches in worker_to_positions.items():
+            batch_positions = np.concatenate([p for _, p in batches])
+            batch_block_indices = np.concatenate(
+                [np.full(len(p), block_index) for block_index, p in batches]
+            )
+            worker_positions.append(batch_positions)
+            futures.append(
+                worker.multiget.remote(
+                    batch_block_indices.tolist(),
+                    [keys[i] for i in batch_positions],
+                )
+            )
+
+        for batch_positions, values in zip(worker_positions, ray.get(futures)):
+            for i, value in zip(batch_positions, values):
+                results[i] = value
+
+        if self._cache is not None:
+            for i in np.sort(positions):
+                self._cache.put(keys[i], results[i])
+
+        return results
+
+    def replicate_hot_blocks(self, num_blocks: int, num_replicas: int = 2) -> int:
+        """Replicate the most frequently looked up blocks across more workers.
+
+        Lookups of a replicated block are spread randomly across the workers holding
+        it, relieving workers of hot blocks (for ex, under skewed key distributions).
+
+        Args:
+            num_blocks: The (max) number of most frequently looked up blocks to
+                replicate. Blocks that were never looked up aren't replicated.
+            num_replicas: The number of workers each of these blocks should be held
+                by. Replicas are added to the workers holding the fewest blocks.
+
+        Returns:
+            The number of added block replicas.
+        """
+        hot_block_indices = np.argsort(-self._block_access_counts, kind="stable")[
+            :num_blocks
+        ]
+
+        num_blocks_per_worker = {
+            w: len(self._worker_to_blocks_map[w]) for w in self._workers
+        }
+        new_assignments = defaultdict(dict)
+        for block_index in hot_block_indices.tolist():
+            if self._block_access_counts[block_index] == 0:
+                break
+            holders = self._block_to_workers_map[block_index]
+            candidates = sorted(
+                (w for w in self._workers if w not in holders),
+                key=lambda w: num_blocks_per_worker[w],
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            for worker in candidates[: max(0, num_replicas - len(holders))]:
+                holders.append(worker)
+                self._worker_to_blocks_map[worker].append(block_index)
+                num_blocks_per_worker[worker] += 1
+                new_assignments[worker][block_index] = self._non_empty_blocks[
+                    block_index
+                ]
+
+        ray.get(
+            [
+                worker.assign_blocks.remote(blocks)
+                for worker, blocks in new_assignments.items()
+            ]
+        )
+
+        return sum(len(blocks) for blocks in new_assignments.values())
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -192,6 +293,10 @@ class RandomAccessDataset:
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        if self._cache is not None:
+            msg += "- Cache: {} hits, {} misses\n".format(
+                self._cache.num_hits, self._cache.num_misses
+            )
         return msg
 
     def _worker_for(self, block_index: int):
@@ -203,17 +308,67 @@ class RandomAccessDataset:
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> np.ndarray:
+        """Vectorized version of ``_find_le``, returning -1 for keys not found."""
+        if self._lower_bound is None:
+            return np.full(len(keys), -1)
+        keys = np.asarray(keys)
+        indices = np.searchsorted(self._upper_bounds_array, keys, side="left")
+        indices[
+            (indices >= len(self._upper_bounds_array)) | (keys < self._lower_bound)
+        ] = -1
+        return indices
+
+
+class _LRUCache:
+    """Least recently used cache of the records looked up by key."""
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._records: "OrderedDict[Any, Any]" = OrderedDict()
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def get(self, key: Any):
+        """Returns whether the key is cached, along with the cached record."""
+        try:
+            record = self._records[key]
+        except KeyError:
+            self.num_misses += 1
+            return False, None
+        self._records.move_to_end(key)
+        self.num_hits += 1
+        return True, record
+
+    def put(self, key: Any, record: Any):
+        self._records[key] = record
+        self._records.move_to_end(key)
+        if len(self._records) > self._capacity:
+            self._records.popitem(last=False)
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
-        self.blocks = None
+    def __init__(self, key_field, hash_index=False):
+        self.blocks = {}
         self.key_field = key_field
+        self.hash_index = hash_index
+        # Key columns of the blocks as numpy arrays, for vectorized lookups.
+        self.key_columns: Dict[int, np.ndarray] = {}
+        # Row index of each key of the blocks (when hash index is enabled).
+        self.key_indices: Dict[int, Dict[Any, int]] = {}
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
-        self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        for k, ref in block_ref_dict.items():
+            block = ray.get(ref)
+            self.blocks[k] = block
+            self.key_columns[k] = block[self.key_field].to_numpy()
+            if self.hash_index:
+                self.key_indices[k] = {
+                    key: i for i, key in enumerate(self.key_columns[k].tolist())
+                }
 
     def get(self, block_index, key):
         start = time.perf_counter()
@@ -224,22 +379,21 @@ class _RandomAccessWorker:
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
+        result = [None] * len(keys)
+        # Look up the keys of each block at once.
+        block_indices = np.asarray(block_indices)
+        order = np.argsort(block_indices, kind="stable")
+        unique_block_indices, offsets = np.unique(
+            block_indices[order], return_index=True
+        )
+        for block_index, positions in zip(
+            unique_block_indices.tolist(), np.split(order, offsets[1:])
         ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [
-                acc._get_row(i) if k1.as_py() == k2 else None
-                for i, k1, k2 in zip(indices, col.take(indices), keys)
-            ]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+            rows = self._find_rows(block_index, [keys[i] for i in positions])
+            acc = BlockAccessor.for_block(self.blocks[block_index])
+            for i, row in zip(positions, rows):
+                if row >= 0:
+                    result[i] = acc._get_row(row)
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -258,15 +412,31 @@ class _RandomAccessWorker:
         if block_index is None:
             return None
         block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
+        if self.hash_index:
+            i = self.key_indices[block_index].get(key)
+        else:
+            column = block[self.key_field]
+            if isinstance(block, pa.Table):
+                column = _ArrowListWrapper(column)
+            i = _binary_search_find(column, key)
         if i is None:
             return None
         acc = BlockAccessor.for_block(block)
         return acc._get_row(i)
 
+    def _find_rows(self, block_index: int, keys: List[Any]) -> np.ndarray:
+        """Returns the row indices of the keys in the block (-1 if not found)."""
+        if self.hash_index:
+            key_index = self.key_indices[block_index]
+            return np.array([key_index.get(k, -1) for k in keys])
+
+        column = self.key_columns[block_index]
+        keys = np.asarray(keys)
+        indices = np.searchsorted(column, keys)
+        found = indices < len(column)
+        found[found] = column[indices[found]] == keys[found]
+        return np.where(found, indices, -1)
+
 
 def _binary_search_find(column, x):
     i = bisect.bisect_left(column, x)
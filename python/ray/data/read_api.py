@@ -1930,6 +1930,7 @@ def read_tfrecords(
     concurrency: Optional[int] = None,
     override_num_blocks: Optional[int] = None,
     tfx_read_options: Optional["TFXReadOptions"] = None,
+    build_index: bool = False,
 ) -> Dataset:
     """Create a :class:`~ray.data.Dataset` from TFRecord files that contain
     `tf.train.Example <https://www.tensorflow.org/api_docs/python/tf/train/Example>`_
@@ -2012,6 +2013,12 @@ def read_tfrecords(
         tfx_read_options: Specifies read options when reading TFRecord files with TFX.
             When no options are provided, the default version without tfx-bsl will
             be used to read the tfrecords.
+        build_index: Large uncompressed TFRecord files with index files (written by
+            :meth:`~ray.data.Dataset.write_tfrecords` with ``write_index=True``)
+            are split into multiple read tasks when there are fewer files than
+            read tasks. If ``True``, large files without index files are indexed by
+            scanning them once (per driver process), so that these can be split
+            as well. Ignored if ``tfx_read_options`` are provided.
     Returns:
         A :class:`~ray.data.Dataset` that contains the example features.
 
@@ -2052,6 +2059,7 @@ def read_tfrecords(
         include_paths=include_paths,
         file_extensions=file_extensions,
         tfx_read_options=tfx_read_options,
+        build_index=build_index,
     )
     ds = read_datasource(
         datasource,
@@ -2299,6 +2307,7 @@ def read_sql(
     *,
     shard_keys: Optional[list[str]] = None,
     shard_hash_fn: str = "MD5",
+    partition_column: Optional[str] = None,
     parallelism: int = -1,
     ray_remote_args: Optional[Dict[str, Any]] = None,
     concurrency: Optional[int] = None,
@@ -2317,8 +2326,14 @@ def read_sql(
         The default is ``MD5``, but other common alternatives include ``hash``,
         ``unicode``, and ``SHA``.
 
-        If the database does not support sharding, the read operation will be
-        executed in a single task.
+        If the database does not support sharding, the data is paginated (by
+        ``LIMIT`` and ``OFFSET``) ordered by the shard keys instead, which then have
+        to uniquely identify the rows. Without shard keys, the read operation will
+        be executed in a single task.
+
+        Alternatively, you can use ``partition_column`` to read ranges of the values
+        of a numeric or timestamp column in parallel, which only requires the
+        database to support ``MIN`` and ``MAX``.
 
     Examples:
 
@@ -2375,6 +2390,10 @@ def read_sql(
         shard_hash_fn: The hash function string to use for sharding. Defaults to "MD5".
             For other databases, common alternatives include "hash" and "SHA".
             This is applied to the shard keys.
+        partition_column: A numeric or timestamp column to partition the data by.
+            If specified, the min and max values of the column are queried, and
+            every read task reads an (equally wide) range of the values. Can't be
+            used together with ``shard_keys``.
         parallelism: This argument is deprecated. Use ``override_num_blocks`` argument.
         ray_remote_args: kwargs passed to :func:`ray.remote` in the read tasks.
         concurrency: The maximum number of Ray tasks to run concurrently. Set this
@@ -2382,7 +2401,7 @@ def read_sql(
             total number of tasks run or the total number of output blocks. By default,
             concurrency is dynamically decided based on the available resources.
         override_num_blocks: Override the number of output blocks from all read tasks.
-            This is used for sharding when shard_keys is provided.
+            This is used for sharding when shard_keys or partition_column is provided.
             By default, the number of output blocks is dynamically decided based on
             input data size and available resources. You shouldn't manually set this
             value in most cases.
@@ -2390,19 +2409,21 @@ def read_sql(
     Returns:
         A :class:`Dataset` containing the queried data.
     """
+    if shard_keys is not None and partition_column is not None:
+        raise ValueError("Only one of shard_keys and partition_column can be provided")
+
     datasource = SQLDatasource(
         sql=sql,
         shard_keys=shard_keys,
         shard_hash_fn=shard_hash_fn,
+        partition_column=partition_column,
         connection_factory=connection_factory,
     )
     if override_num_blocks and override_num_blocks > 1:
-        if shard_keys is None:
-            raise ValueError("shard_keys must be provided when override_num_blocks > 1")
-
-        if not datasource.supports_sharding(override_num_blocks):
+        if shard_keys is None and partition_column is None:
             raise ValueError(
-                "Database does not support sharding. Please set override_num_blocks to 1."
+                "shard_keys or partition_column must be provided when "
+                "override_num_blocks > 1"
             )
 
     return read_datasource(
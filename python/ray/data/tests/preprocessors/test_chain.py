@@ -187,7 +187,7 @@ def test_determine_transform_to_use():
     preprocessor = SimpleImputer(["A"])
     chain1 = Chain(preprocessor)
     format1 = chain1._determine_transform_to_use()
-    assert format1 == BatchFormat.PANDAS
+    assert format1 == BatchFormat.ARROW
 
     chain2 = Chain(chain1)
     format2 = chain2._determine_transform_to_use()
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -734,6 +735,74 @@ def test_categorizer(predefined_dtypes):
     assert pred_out_df.dtypes["C_categorized"] == expected_dtypes["C"]
 
 
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        OrdinalEncoder(["A", "B"]),
+        OneHotEncoder(["A", "B"]),
+        MultiHotEncoder(["D"]),
+        LabelEncoder("B", output_column="B_encoded"),
+        Categorizer(["A", "B"]),
+    ],
+)
+def test_encoder_arrow(encoder):
+    """Tests that the Arrow and pandas transforms of the encoders are the same."""
+    in_df = pd.DataFrame.from_dict(
+        {
+            "A": ["red", "green", "blue", "red"],
+            "B": [1, 2, 2, 3],
+            "D": [["a", "b"], ["b", "b"], [], ["c"]],
+        }
+    )
+    encoder.fit(ray.data.from_pandas(in_df))
+
+    pred_df = pd.DataFrame.from_dict(
+        {
+            "A": ["red", "yellow", "blue"],
+            "B": [3, 2, 4],
+            "D": [["b", "d"], ["a"], ["c", "c"]],
+        }
+    )
+    expected_rows = _to_rows(
+        ray.data.from_pandas(encoder.transform_batch(pred_df.copy())).to_pandas()
+    )
+
+    pred_table = pa.Table.from_pandas(pred_df)
+    # Dictionary-encoded columns are encoded through their dictionaries.
+    pred_table = pred_table.set_column(
+        0, "A", pred_table.column("A").dictionary_encode()
+    )
+    out_table = encoder._transform_arrow(pred_table)
+    assert isinstance(out_table, pa.Table)
+    # Batches transformed by `transform_batch` are still pandas DataFrames.
+    assert isinstance(encoder.transform_batch(pred_table), pd.DataFrame)
+
+    assert _to_rows(ray.data.from_arrow(out_table).to_pandas()) == expected_rows
+
+
+def _to_rows(df: pd.DataFrame):
+    def to_value(value):
+        if hasattr(value, "__array__"):
+            value = np.asarray(value).tolist()
+        if isinstance(value, float) and np.isnan(value):
+            return None
+        return value
+
+    return [
+        {column: to_value(value) for column, value in row.items()}
+        for row in df.to_dict("records")
+    ]
+
+
+def test_encoder_arrow_null_values():
+    """Tests that the Arrow transform raises on null values, like pandas."""
+    in_df = pd.DataFrame.from_dict({"A": ["red", "green"]})
+    encoder = OrdinalEncoder(["A"]).fit(ray.data.from_pandas(in_df))
+
+    with pytest.raises(ValueError, match="null values"):
+        encoder._transform_arrow(pa.table({"A": ["red", None]}))
+
+
 if __name__ == "__main__":
     import sys
 
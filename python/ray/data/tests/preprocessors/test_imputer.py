@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -208,6 +209,37 @@ def test_imputer_constant_categorical():
         np.testing.assert_array_equal(transformed_df[column].values, expected[column])
 
 
+@pytest.mark.parametrize(
+    "strategy,fill_value", [("mean", None), ("most_frequent", None), ("constant", 0)]
+)
+def test_simple_imputer_arrow(strategy, fill_value):
+    """Tests that the Arrow and pandas transforms of the SimpleImputer are the same."""
+    in_df = pd.DataFrame.from_dict(
+        {"A": [1, 1, 2, None], "B": [1.0, np.nan, 3.0, 3.0], "C": [1, 2, 3, 4]}
+    )
+    imputer = SimpleImputer(["A", "B", "C"], strategy=strategy, fill_value=fill_value)
+    imputer.fit(ray.data.from_pandas(in_df))
+
+    in_table = pa.Table.from_pandas(in_df)
+    out_table = imputer._transform_arrow(in_table)
+    assert isinstance(out_table, pa.Table)
+    # Batches transformed by `transform_batch` are still pandas DataFrames.
+    assert isinstance(imputer.transform_batch(in_table), pd.DataFrame)
+    # Columns without missing values aren't copied.
+    assert (
+        out_table.column("C").chunks[0].buffers()[1].address
+        == in_table.column("C").chunks[0].buffers()[1].address
+    )
+
+    pd.testing.assert_frame_equal(
+        out_table.to_pandas(), imputer.transform_batch(in_df.copy())
+    )
+
+    # Missing columns are created with the fill value.
+    out_table = imputer._transform_arrow(pa.table({"A": [1, 2], "B": [1.0, 2.0]}))
+    assert out_table.column("C").to_pylist() == [imputer._get_fill_value("C")] * 2
+
+
 if __name__ == "__main__":
     import sys
 
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -365,6 +366,32 @@ def test_standard_scaler():
     pd.testing.assert_frame_equal(pred_out_df, pred_expected_df, check_like=True)
 
 
+@pytest.mark.parametrize(
+    "scaler",
+    [
+        MinMaxScaler(["B", "C"]),
+        MaxAbsScaler(["B", "C"]),
+        RobustScaler(["B", "C"]),
+        StandardScaler(["B", "C"], output_columns=["B_scaled", "C_scaled"]),
+    ],
+)
+def test_scaler_arrow(scaler):
+    """Tests that the Arrow and pandas transforms of the scalers are the same."""
+    in_df = pd.DataFrame.from_dict(
+        {"A": [-1, 0, 1, 2], "B": [1, 3, 5, 7], "C": [1.5, 1.5, None, 0.0]}
+    )
+    scaler.fit(ray.data.from_pandas(in_df))
+
+    out_table = scaler._transform_arrow(pa.Table.from_pandas(in_df))
+    assert isinstance(out_table, pa.Table)
+    # Batches transformed by `transform_batch` are still pandas DataFrames.
+    assert isinstance(scaler.transform_batch(pa.Table.from_pandas(in_df)), pd.DataFrame)
+
+    pd.testing.assert_frame_equal(
+        out_table.to_pandas(), scaler.transform_batch(in_df.copy())
+    )
+
+
 if __name__ == "__main__":
     import sys
 
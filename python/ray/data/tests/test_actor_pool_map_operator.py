@@ -22,6 +22,7 @@ from ray.data._internal.execution.operators.actor_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.util import make_ref_bundles
+from ray.data.context import BundleQueueType
 from ray.tests.conftest import *  # noqa
 from ray.types import ObjectRef
 
@@ -523,6 +524,46 @@ class TestActorPool(unittest.TestCase):
         res3 = pool.pick_actor(bundles[0])
         assert res3 is None
 
+    def test_get_available_actor_locations(self):
+        pool = self._create_actor_pool(max_tasks_in_flight=2)
+
+        actor1 = self._add_ready_actor(pool, node_id="node1")
+        actor2 = self._add_ready_actor(pool, node_id="node2")
+        actor3 = self._add_ready_actor(pool, node_id="node2")
+
+        # Locations are ordered by their least loaded actor.
+        pool._running_actors[actor1].num_tasks_in_flight = 1
+        pool._running_actors[actor2].num_tasks_in_flight = 1
+        assert pool.get_available_actor_locations() == ["node2", "node1"]
+
+        # Actors at capacity are excluded.
+        pool._running_actors[actor3].num_tasks_in_flight = 2
+        pool._running_actors[actor2].num_tasks_in_flight = 2
+        assert pool.get_available_actor_locations() == ["node1"]
+
+
+@pytest.mark.parametrize("bundle_queue_type", list(BundleQueueType))
+def test_bundle_queue_type_preserves_order(
+    ray_start_regular_shared, restore_data_context, bundle_queue_type
+):
+    ctx = ray.data.DataContext.get_current()
+    ctx.actor_pool_bundle_queue_type = bundle_queue_type
+    ctx.actor_pool_bundle_queue_lookahead = 4
+    ctx.execution_options.preserve_order = True
+
+    class UDFClass:
+        def __call__(self, batch):
+            return batch
+
+    # Blocks of heterogeneous sizes.
+    ds = ray.data.from_items(
+        [{"id": i, "data": "x" * (i % 7) * 1024} for i in range(100)],
+        override_num_blocks=20,
+    )
+    ds = ds.map_batches(UDFClass, compute=ray.data.ActorPoolStrategy(size=2))
+
+    assert [row["id"] for row in ds.take_all()] == list(range(100))
+
 
 def test_min_max_resource_requirements(restore_data_context):
     data_context = ray.data.DataContext.get_current()
@@ -23,6 +23,9 @@ from ray.data._internal.util import is_nan
 from ray.data.aggregate import (
     AbsMax,
     AggregateFn,
+    ApproxCountDistinct,
+    ApproxQuantile,
+    ApproxTopK,
     Count,
     Max,
     Mean,
@@ -1406,6 +1409,70 @@ def test_groupby_arrow_multi_agg(
     assert _round_to_13_digits(expected_row) == _round_to_13_digits(result_row)
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+def test_groupby_approx_aggregations(
+    ray_start_regular_shared_2_cpus,
+    num_parts,
+    configure_shuffle_method,
+):
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "A": np.arange(30_000) % 3,
+            "B": rng.normal(size=30_000),
+            "C": rng.zipf(2.0, size=30_000) % 1_000,
+        }
+    )
+
+    agg_df = (
+        ray.data.from_pandas(df)
+        .repartition(num_parts)
+        .groupby("A")
+        .aggregate(
+            ApproxQuantile("B", q=0.9),
+            ApproxCountDistinct("C"),
+            ApproxTopK("C", k=3, capacity=50),
+        )
+        .to_pandas()
+        .sort_values(by="A")
+        .reset_index(drop=True)
+    )
+
+    for _, row in agg_df.iterrows():
+        group = df[df["A"] == row["A"]]
+
+        assert row["approx_quantile(B)"] == pytest.approx(
+            group["B"].quantile(0.9), abs=0.02
+        )
+        assert row["approx_count_distinct(C)"] == pytest.approx(
+            group["C"].nunique(), rel=0.05
+        )
+
+        top_k = list(row["approx_top_k(C)"])
+        value_counts = group["C"].value_counts()
+        assert [item["value"] for item in top_k] == value_counts.index[:3].tolist()
+        for item in top_k:
+            # Counts are over-estimated by at most their errors.
+            assert (
+                item["count"] - item["error"]
+                <= value_counts[item["value"]]
+                <= item["count"]
+            )
+
+
+def test_approx_aggregations_ignore_nulls(ray_start_regular_shared_2_cpus):
+    ds = ray.data.from_items([{"A": 1.0}, {"A": None}, {"A": 3.0}])
+
+    assert ds.aggregate(ApproxQuantile("A"), ApproxCountDistinct("A")) == {
+        "approx_quantile(A)": 2.0,
+        "approx_count_distinct(A)": 2,
+    }
+    assert ds.aggregate(
+        ApproxQuantile("A", ignore_nulls=False),
+        ApproxCountDistinct("A", ignore_nulls=False),
+    ) == {"approx_quantile(A)": None, "approx_count_distinct(A)": None}
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["pandas", "pyarrow"])
 @pytest.mark.parametrize("ignore_nulls", [True, False])
@@ -3,7 +3,7 @@ import math
 import time
 import unittest
 from collections import defaultdict
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -11,8 +11,10 @@ import ray
 from ray.data._internal.execution.backpressure_policy import (
     ENABLED_BACKPRESSURE_POLICIES_CONFIG_KEY,
     ConcurrencyCapBackpressurePolicy,
+    ConsumptionRateBackpressurePolicy,
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.task_pool_map_operator import (
     TaskPoolMapOperator,
 )
@@ -133,6 +135,86 @@ class TestConcurrencyCapBackpressurePolicy(unittest.TestCase):
         assert start1 < start2 < end1 < end2, (start1, start2, end1, end2)
 
 
+class TestConsumptionRateBackpressurePolicy(unittest.TestCase):
+    """Tests for ConsumptionRateBackpressurePolicy."""
+
+    def setUp(self):
+        data_context = ray.data.DataContext.get_current()
+        data_context.set_config(
+            ConsumptionRateBackpressurePolicy.TARGET_BUFFER_SECONDS_CONFIG_KEY, 1
+        )
+        data_context.set_config(
+            ConsumptionRateBackpressurePolicy.MIN_BUFFER_BYTES_CONFIG_KEY, 100
+        )
+
+    def tearDown(self):
+        data_context = ray.data.DataContext.get_current()
+        data_context.remove_config(
+            ConsumptionRateBackpressurePolicy.TARGET_BUFFER_SECONDS_CONFIG_KEY
+        )
+        data_context.remove_config(
+            ConsumptionRateBackpressurePolicy.MIN_BUFFER_BYTES_CONFIG_KEY
+        )
+
+    def _create_op(self, output_dependencies, spec=None):
+        op = MagicMock(spec=spec)
+        op.output_dependencies = output_dependencies
+        op.metrics = MagicMock()
+        op.metrics.obj_store_mem_internal_inqueue = 0
+        op.metrics.obj_store_mem_internal_outqueue = 0
+        op.metrics.obj_store_mem_pending_task_outputs = None
+        op.metrics.average_bytes_outputs_per_task = 10
+        op.metrics.bytes_inputs_of_submitted_tasks = 0
+        op.metrics.num_tasks_running = 1
+        return op
+
+    def test_basic(self):
+        downstream_op = self._create_op([], spec=MapOperator)
+        upstream_op = self._create_op([downstream_op])
+        upstream_state = MagicMock()
+        topology = {upstream_op: upstream_state, downstream_op: MagicMock()}
+
+        module = (
+            "ray.data._internal.execution.backpressure_policy."
+            "consumption_rate_backpressure_policy"
+        )
+        with patch(f"{module}.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            policy = ConsumptionRateBackpressurePolicy(topology)
+
+            # Operators without downstream map operators aren't backpressured.
+            self.assertTrue(policy.can_add_input(downstream_op))
+
+            # Nothing consumed yet, buffer is capped by the min buffer size.
+            upstream_state.outqueue_memory_usage.return_value = 50
+            self.assertTrue(policy.can_add_input(upstream_op))
+            upstream_state.outqueue_memory_usage.return_value = 95
+            self.assertFalse(policy.can_add_input(upstream_op))
+
+            # Pending outputs and downstream's internal inqueue are buffered too.
+            upstream_state.outqueue_memory_usage.return_value = 50
+            downstream_op.metrics.obj_store_mem_internal_inqueue = 45
+            self.assertFalse(policy.can_add_input(upstream_op))
+            downstream_op.metrics.obj_store_mem_internal_inqueue = 0
+            upstream_op.metrics.obj_store_mem_pending_task_outputs = 45
+            self.assertFalse(policy.can_add_input(upstream_op))
+            upstream_op.metrics.obj_store_mem_pending_task_outputs = None
+
+            # Idle downstream operators are never starved.
+            upstream_state.outqueue_memory_usage.return_value = 1000
+            downstream_op.metrics.num_tasks_running = 0
+            self.assertTrue(policy.can_add_input(upstream_op))
+            downstream_op.metrics.num_tasks_running = 1
+
+            # Downstream consumes 500 bytes/s, buffer target grows accordingly.
+            monotonic.return_value = 2
+            downstream_op.metrics.bytes_inputs_of_submitted_tasks = 1000
+            upstream_state.outqueue_memory_usage.return_value = 450
+            self.assertTrue(policy.can_add_input(upstream_op))
+            upstream_state.outqueue_memory_usage.return_value = 495
+            self.assertFalse(policy.can_add_input(upstream_op))
+
+
 if __name__ == "__main__":
     import sys
 
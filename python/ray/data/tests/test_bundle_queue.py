@@ -7,6 +7,7 @@ import ray
 from ray.data._internal.execution.bundle_queue import create_bundle_queue
 from ray.data._internal.execution.interfaces import RefBundle
 from ray.data.block import BlockAccessor
+from ray.data.context import BundleQueueType
 
 
 def _create_bundle(data: Any) -> RefBundle:
@@ -122,6 +123,55 @@ def test_estimate_size_bytes():
     assert queue.estimate_size_bytes() == bundle1.size_bytes() + bundle2.size_bytes()
 
 
+def test_largest_first_bundle_queue():
+    queue = create_bundle_queue(BundleQueueType.LARGEST_FIRST)
+    small = _create_bundle("a")
+    large = _create_bundle("a" * 1024)
+    medium1 = _create_bundle("a" * 128)
+    medium2 = _create_bundle("b" * 128)
+    for bundle in [small, medium1, large, medium2]:
+        queue.add(bundle)
+
+    assert queue.peek() is large
+    # Bundles of the same size are returned in the order they were added.
+    assert [queue.pop() for _ in range(3)] == [large, medium1, medium2]
+    assert queue.get_stats() == {"num_reordered_bundles": 3}
+
+    queue.add(medium1)
+    queue.remove(small)
+    assert queue.pop() is medium1
+    assert queue.is_empty()
+
+
+@pytest.mark.parametrize(
+    "queue_type", [BundleQueueType.LOCALITY_AWARE, BundleQueueType.ORDERED_LOOKAHEAD]
+)
+def test_peek_for_locations(queue_type):
+    queue = create_bundle_queue(queue_type, lookahead=2)
+    bundles = [_create_bundle(f"test{i}") for i in range(4)]
+    locations = ["node1", "node2", "node1", "node3"]
+    for bundle, node_id in zip(bundles, locations):
+        bundle._cached_preferred_locations = {node_id: bundle.size_bytes()}
+        queue.add(bundle)
+
+    # Without local bundles, the head of the queue is returned.
+    assert queue.peek_for_locations([]) is bundles[0]
+    assert queue.peek_for_locations(["node4"]) is bundles[0]
+    assert queue.peek_for_locations(["node2"]) is bundles[1]
+
+    queue.remove(bundles[1])
+    assert queue.get_stats() == {"num_reordered_bundles": 1}
+    assert queue.peek_for_locations(["node1"]) is bundles[0]
+    if queue_type == BundleQueueType.LOCALITY_AWARE:
+        assert queue.peek_for_locations(["node3"]) is bundles[3]
+    else:
+        # Bundle is beyond the lookahead.
+        assert queue.peek_for_locations(["node3"]) is bundles[0]
+
+    queue.clear()
+    assert queue.is_empty()
+
+
 # CVGA-end
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import ray
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+@pytest.mark.parametrize("num_partitions", [1, 4])
+def test_distinct(ray_start_regular_shared_2_cpus, num_partitions):
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "url": rng.choice(["a", "b", "c", None], size=200),
+            "status": rng.integers(2, size=200),
+            "crawled_at": rng.permutation(200),
+        }
+    )
+    ds = ray.data.from_pandas(df).repartition(10)
+
+    # Distinct rows (by all the columns) of the dataset with duplicated rows.
+    out_df = ds.union(ds).distinct(num_partitions=num_partitions).to_pandas()
+    pd.testing.assert_frame_equal(
+        out_df.sort_values("crawled_at", ignore_index=True),
+        df.sort_values("crawled_at", ignore_index=True),
+    )
+
+    # Distinct rows by a subset of the columns (nulls being equal).
+    out_df = ds.distinct(["url", "status"], num_partitions=num_partitions).to_pandas()
+    assert len(out_df) == len(df.drop_duplicates(["url", "status"]))
+    assert not out_df.duplicated(["url", "status"]).any()
+
+    for keep in ["first", "last"]:
+        out_df = (
+            ds.distinct("url", keep=keep, order_by="crawled_at")
+            .to_pandas()
+            .sort_values("url", ignore_index=True)
+        )
+        expected_df = (
+            df.sort_values("crawled_at")
+            .drop_duplicates("url", keep=keep)
+            .sort_values("url", ignore_index=True)
+        )
+        pd.testing.assert_frame_equal(out_df, expected_df)
+
+    with pytest.raises(ValueError, match="order_by"):
+        ds.distinct("url", keep="first")
+
+
+def test_distinct_integer_keys_with_nulls(ray_start_regular_shared_2_cpus):
+    # Blocks of the same integer keys, with and without nulls (which turn integers
+    # into floats when converted to Pandas), and with integers not representable
+    # as floats.
+    big = 2**53
+    ds = ray.data.from_arrow(
+        [
+            pa.table({"key": pa.array([1, None, big + 1], type=pa.int64())}),
+            pa.table({"key": pa.array([1, big, big + 1], type=pa.int64())}),
+            pa.table({"key": pa.array([None, big], type=pa.int64())}),
+        ]
+    )
+
+    keys = [row["key"] for row in ds.distinct("key", num_partitions=2).take_all()]
+    assert sorted(keys, key=lambda key: -1 if key is None else key) == [
+        None,
+        1,
+        big,
+        big + 1,
+    ]
+
+
+def test_drop_near_duplicates(ray_start_regular_shared_2_cpus):
+    rng = np.random.default_rng(seed=0)
+    words = [f"word{i}" for i in range(1000)]
+    texts = [" ".join(rng.choice(words, size=100)) for _ in range(20)]
+    # Near-duplicates of the texts, differing by a single (trailing) word.
+    near_duplicates = [text + " extra" for text in texts]
+
+    ds = ray.data.from_items(
+        [{"id": i, "text": text} for i, text in enumerate(texts + near_duplicates)]
+    )
+    out_ds = ds.drop_near_duplicates("text", threshold=0.8)
+
+    assert out_ds.columns() == ["id", "text"]
+    assert sorted(row["id"] % len(texts) for row in out_ds.take_all()) == list(
+        range(len(texts))
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
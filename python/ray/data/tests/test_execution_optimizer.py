@@ -42,6 +42,8 @@ from ray.data._internal.logical.operators.map_operator import (
     Project,
 )
 from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import PhysicalOptimizer
 from ray.data._internal.logical.rules.configure_map_task_memory import (
@@ -355,6 +357,238 @@ def test_project_operator_rename(ray_start_regular_shared_2_cpus):
     assert isinstance(physical_op.input_dependency, TaskPoolMapOperator)
 
 
+def test_projection_pushdown_rule():
+    from ray.data._internal.logical.rules.projection_pushdown import (
+        ProjectionPushdownRule,
+    )
+
+    ctx = DataContext.get_current()
+
+    class ProjectableDatasource(Datasource):
+        def __init__(self, columns=None):
+            self.columns = columns
+
+        def estimate_inmemory_data_size(self) -> Optional[int]:
+            return None
+
+        def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+            return []
+
+        def supports_projection_pushdown(self) -> bool:
+            return True
+
+        def get_current_projection(self) -> Optional[List[str]]:
+            return self.columns
+
+        def apply_projection(self, columns: List[str]) -> Datasource:
+            return ProjectableDatasource(columns)
+
+    def read_op():
+        datasource = ProjectableDatasource()
+        return Read(datasource, datasource, parallelism=1, mem_size=None)
+
+    rule = ProjectionPushdownRule()
+
+    # Selecting columns directly after a read.
+    original_read = read_op()
+    plan = LogicalPlan(Project(original_read, cols=["b", "a"]), ctx)
+    optimized_plan = rule.apply(plan)
+    new_read = optimized_plan.dag.input_dependency
+    assert isinstance(optimized_plan.dag, Project)
+    assert new_read._datasource.columns == ["b", "a"]
+    # The original operators must not be modified.
+    assert original_read._datasource.columns is None
+    assert plan.dag.input_dependency is original_read
+
+    # Applying the rule again doesn't change the plan.
+    assert rule.apply(optimized_plan).dag is optimized_plan.dag
+
+    # Renames and limits between the read and the selection.
+    op = Project(read_op(), cols=None, cols_rename={"a": "x"})
+    op = Limit(op, 10)
+    op = Project(op, cols=["x", "b"])
+    optimized_plan = rule.apply(LogicalPlan(op, ctx))
+    new_read = optimized_plan.dag.input_dependency.input_dependency.input_dependency
+    assert new_read._datasource.columns == ["a", "b"]
+
+    # UDFs can use any column, so the projection isn't pushed past them.
+    original_read = read_op()
+    op = MapBatches(original_read, fn=lambda batch: batch)
+    op = Project(op, cols=["a"])
+    optimized_plan = rule.apply(LogicalPlan(op, ctx))
+    assert optimized_plan.dag.input_dependency.input_dependency is original_read
+
+
+def test_projection_pushdown_e2e(ray_start_regular_shared_2_cpus, tmp_path):
+    import pyarrow.parquet as pq
+
+    table = pa.table({"a": [0, 1], "b": [2, 3], "c": [4, 5]})
+    pq.write_table(table, tmp_path / "data.parquet")
+
+    ds = ray.data.read_parquet(tmp_path).select_columns(["c", "a"])
+    assert ds.take_all() == [{"c": 4, "a": 0}, {"c": 5, "a": 1}]
+
+    read_op = ds._plan._logical_plan.dag.input_dependency
+    assert isinstance(read_op, Read)
+    assert read_op._datasource.get_current_projection() == ["c", "a"]
+    assert read_op._datasource._data_columns == ["c", "a"]
+
+    ds = (
+        ray.data.read_parquet(tmp_path).rename_columns({"a": "x"}).select_columns(["x"])
+    )
+    assert ds.take_all() == [{"x": 0}, {"x": 1}]
+
+
+def test_predicate_pushdown_rule():
+    from ray.data._internal.logical.rules.predicate_pushdown import (
+        PredicatePushdownRule,
+    )
+
+    ctx = DataContext.get_current()
+
+    class FilterableDatasource(Datasource):
+        def __init__(self, predicates=()):
+            self.predicates = predicates
+
+        def estimate_inmemory_data_size(self) -> Optional[int]:
+            return None
+
+        def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+            return []
+
+        def supports_predicate_pushdown(self) -> bool:
+            return True
+
+        def apply_predicate(self, expression: str) -> Datasource:
+            if expression in self.predicates:
+                return self
+            return FilterableDatasource(self.predicates + (expression,))
+
+    def read_op():
+        datasource = FilterableDatasource()
+        return Read(datasource, datasource, parallelism=1, mem_size=None)
+
+    def filter_op(input_op, expression):
+        import pyarrow.dataset as pds
+
+        return Filter(
+            input_op,
+            filter_expr=pds.field("a") > 1,
+            filter_expr_str=expression,
+        )
+
+    rule = PredicatePushdownRule()
+
+    # Filtering directly after a read, and after selecting columns.
+    original_read = read_op()
+    op = Project(original_read, cols=["a", "b"])
+    op = filter_op(op, "a > 1")
+    plan = LogicalPlan(op, ctx)
+    optimized_plan = rule.apply(plan)
+    assert isinstance(optimized_plan.dag, Filter)
+    new_read = optimized_plan.dag.input_dependency.input_dependency
+    assert new_read._datasource.predicates == ("a > 1",)
+    # The original operators must not be modified.
+    assert original_read._datasource.predicates == ()
+    assert plan.dag.input_dependency.input_dependency is original_read
+
+    # Applying the rule again doesn't change the plan.
+    assert rule.apply(optimized_plan).dag is optimized_plan.dag
+
+    # Filters aren't pushed past limits or renames.
+    for op in [
+        Limit(read_op(), 10),
+        Project(read_op(), cols=None, cols_rename={"b": "a"}),
+    ]:
+        op = filter_op(op, "a > 1")
+        optimized_plan = rule.apply(LogicalPlan(op, ctx))
+        assert optimized_plan.dag is op
+
+    # Filters with UDFs can't be pushed down.
+    op = Filter(read_op(), fn=lambda row: row["a"] > 1)
+    optimized_plan = rule.apply(LogicalPlan(op, ctx))
+    assert optimized_plan.dag is op
+
+
+def test_join_key_filter_propagation_rule():
+    from ray.data._internal.logical.operators.join_operator import Join
+    from ray.data._internal.logical.rules.join_key_filter_propagation import (
+        JoinKeyFilterPropagationRule,
+    )
+    from ray.data._internal.planner.plan_expression.expression_evaluator import (
+        ExpressionEvaluator,
+    )
+
+    ctx = DataContext.get_current()
+
+    class EmptyDatasource(Datasource):
+        def estimate_inmemory_data_size(self) -> Optional[int]:
+            return None
+
+        def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
+            return []
+
+    def read_op():
+        datasource = EmptyDatasource()
+        return Read(datasource, datasource, parallelism=1, mem_size=None)
+
+    def filter_op(input_op, expression):
+        return Filter(
+            input_op,
+            filter_expr=ExpressionEvaluator.get_filters(expression),
+            filter_expr_str=expression,
+        )
+
+    def join_op(left, right, join_type):
+        return Join(
+            left,
+            right,
+            join_type,
+            left_key_columns=("user_id",),
+            right_key_columns=("id",),
+            num_partitions=1,
+        )
+
+    rule = JoinKeyFilterPropagationRule()
+
+    # Conjuncts on the keys are propagated to the other input (through limits).
+    left = filter_op(Limit(read_op(), 10), "user_id < 100 and score > 1")
+    original_right = read_op()
+    op = join_op(left, original_right, "inner")
+    optimized_plan = rule.apply(LogicalPlan(op, ctx))
+    new_right = optimized_plan.dag.input_dependencies[1]
+    assert isinstance(new_right, Filter)
+    assert new_right._filter_expr_str == "(id < 100)"
+    assert new_right.input_dependency._datasource is original_right._datasource
+    assert optimized_plan.dag.input_dependencies[0] is left
+    # The original operators must not be modified.
+    assert op.input_dependencies == [left, original_right]
+    assert left.output_dependencies == [op]
+    assert original_right.output_dependencies == [op]
+
+    # Applying the rule again doesn't change the plan.
+    assert rule.apply(optimized_plan).dag is optimized_plan.dag
+
+    # Filters on the right input are propagated to the left one.
+    op = join_op(read_op(), filter_op(read_op(), "id > 5"), "left_semi")
+    optimized_plan = rule.apply(LogicalPlan(op, ctx))
+    assert optimized_plan.dag.input_dependencies[0]._filter_expr_str == (
+        "(user_id > 5)"
+    )
+
+    # Filters aren't propagated to inputs whose unmatched rows are preserved, nor
+    # propagated if reading non-key columns.
+    for op in [
+        join_op(read_op(), filter_op(read_op(), "id > 5"), "left_outer"),
+        join_op(filter_op(read_op(), "user_id > 5"), read_op(), "right_outer"),
+        join_op(filter_op(read_op(), "user_id > 5"), read_op(), "full_outer"),
+        join_op(read_op(), filter_op(read_op(), "id > 5"), "left_anti"),
+        join_op(filter_op(read_op(), "user_id > score"), read_op(), "inner"),
+    ]:
+        optimized_plan = rule.apply(LogicalPlan(op, ctx))
+        assert optimized_plan.dag is op
+
+
 def test_flat_map(ray_start_regular_shared_2_cpus):
     ctx = DataContext.get_current()
 
@@ -338,3 +338,45 @@ def test_filter_bad_expression(sample_data):
     sample_data_path, _ = sample_data
     with pytest.raises(pa.ArrowInvalid):
         pq.read_table(sample_data_path, filters=filters)
+
+
+def test_get_conjuncts():
+    assert ExpressionEvaluator.get_conjuncts("a > 1") == ["a > 1"]
+    assert ExpressionEvaluator.get_conjuncts("a > 1 and (b == 2 and c < 3)") == [
+        "a > 1",
+        "b == 2",
+        "c < 3",
+    ]
+    # Disjunctions can't be split.
+    assert ExpressionEvaluator.get_conjuncts("a > 1 or b == 2 and c < 3") == [
+        "a > 1 or (b == 2 and c < 3)"
+    ]
+
+    conjuncts = ExpressionEvaluator.get_conjuncts("a > 1 and (b == 2 or c < 3)")
+    assert ExpressionEvaluator.join_conjuncts(conjuncts) == (
+        "(a > 1) and (b == 2 or c < 3)"
+    )
+
+    with pytest.raises(ValueError, match="Invalid syntax in the expression"):
+        ExpressionEvaluator.get_conjuncts("bad filter")
+
+
+def test_get_referenced_columns():
+    assert ExpressionEvaluator.get_referenced_columns("age > 30") == {"age"}
+    assert ExpressionEvaluator.get_referenced_columns(
+        "is_null(city) and (age in [1, 2] or nested.field == -1)"
+    ) == {"city", "age", "nested.field"}
+    assert ExpressionEvaluator.get_referenced_columns("1 == 1") == set()
+
+
+def test_rename_columns():
+    assert (
+        ExpressionEvaluator.rename_columns(
+            "is_in(user_id, [1, 2]) and nested.id > 1",
+            {"user_id": "id", "nested.id": "other.id"},
+        )
+        == "is_in(id, [1, 2]) and other.id > 1"
+    )
+    # Every referenced column has to be renamed, to a name that can be referenced.
+    assert ExpressionEvaluator.rename_columns("a > b", {"a": "x"}) is None
+    assert ExpressionEvaluator.rename_columns("a > 1", {"a": "x y"}) is None
@@ -7,9 +7,14 @@ import pytest
 import ray
 from ray.data import DataContext, Dataset
 from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.hash_shuffle import (
+    PartitionShardStore,
+    _PartitionStats,
+)
 from ray.data._internal.execution.operators.join import JoinOperator
-from ray.data._internal.logical.operators.join_operator import JoinType
-from ray.data._internal.util import GiB, MiB
+from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.logical.operators.join_operator import Join, JoinType
+from ray.data._internal.util import GiB, KiB, MiB
 from ray.exceptions import RayTaskError
 from ray.tests.conftest import *  # noqa
 
@@ -263,6 +268,390 @@ def test_simple_self_join(ray_start_regular_shared_2_cpus, left_suffix, right_su
         pd.testing.assert_frame_equal(expected_pd, joined_pd_sorted)
 
 
+def test_inner_join_with_spilling(
+    ray_start_regular_shared_2_cpus,
+    nullify_shuffle_aggregator_num_cpus,
+    restore_data_context,
+    tmp_path,
+):
+    ctx = DataContext.get_current()
+    # NOTE: Spill every shard received by aggregators
+    ctx.hash_shuffle_aggregator_spill_threshold_bytes = 0
+    ctx.hash_shuffle_aggregator_spill_dir = str(tmp_path)
+
+    doubles = ray.data.range(64).map(
+        lambda row: {"id": row["id"], "double": int(row["id"]) * 2}
+    )
+
+    squares = ray.data.range(32).map(
+        lambda row: {"id": row["id"], "square": int(row["id"]) ** 2}
+    )
+
+    joined: Dataset = doubles.join(
+        squares,
+        join_type="inner",
+        num_partitions=4,
+        on=("id",),
+        broadcast=False,
+    )
+
+    joined_pd = pd.DataFrame(joined.take_all())
+    joined_pd_sorted = joined_pd.sort_values(by=["id"]).reset_index(drop=True)
+
+    expected_pd = doubles.to_pandas().join(
+        squares.to_pandas().set_index("id"), on="id", how="inner"
+    )
+    expected_pd_sorted = expected_pd.sort_values(by=["id"]).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(expected_pd_sorted, joined_pd_sorted)
+
+
+@pytest.mark.parametrize(
+    "join_type", ["inner", "left_outer", "right_outer", "left_semi", "left_anti"]
+)
+def test_skewed_join(
+    ray_start_regular_shared_2_cpus,
+    nullify_shuffle_aggregator_num_cpus,
+    restore_data_context,
+    join_type,
+):
+    ctx = DataContext.get_current()
+    ctx.hash_shuffle_skewed_partition_factor = 2.0
+    ctx.target_max_block_size = 1
+    ctx.max_hash_shuffle_aggregators = 4
+
+    # NOTE: Most of the rows of the left dataset share the same key
+    left = ray.data.range(256, override_num_blocks=32).map(
+        lambda row: {"id": 0 if row["id"] % 4 else row["id"] % 16, "left": row["id"]}
+    )
+    right = ray.data.range(6, override_num_blocks=2).map(
+        lambda row: {"id": row["id"], "right": row["id"] * 10}
+    )
+
+    joined: Dataset = left.join(
+        right,
+        join_type=join_type,
+        num_partitions=8,
+        on=("id",),
+        broadcast=False,
+    )
+
+    joined_pd = pd.DataFrame(joined.take_all())
+
+    how = {"inner": "inner", "left_outer": "left", "right_outer": "right"}.get(
+        join_type, "left"
+    )
+    expected_pd = left.to_pandas().merge(
+        right.to_pandas(), on="id", how=how, indicator=True
+    )
+    if join_type == "left_semi":
+        expected_pd = expected_pd[expected_pd["_merge"] == "both"][["id", "left"]]
+    elif join_type == "left_anti":
+        expected_pd = expected_pd[expected_pd["_merge"] == "left_only"][["id", "left"]]
+    expected_pd = expected_pd.drop(columns=["_merge"], errors="ignore")
+
+    sort_by = ["id", "left"] if "left" in expected_pd else ["id", "right"]
+    expected_pd_sorted = expected_pd.sort_values(by=sort_by).reset_index(drop=True)
+    joined_pd_sorted = (
+        joined_pd[expected_pd.columns].sort_values(by=sort_by).reset_index(drop=True)
+    )
+
+    pd.testing.assert_frame_equal(
+        expected_pd_sorted, joined_pd_sorted, check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "join_type,expected_splittable_input_seq_ids",
+    [
+        (JoinType.INNER, [1, 0]),
+        (JoinType.LEFT_OUTER, [0]),
+        (JoinType.RIGHT_OUTER, [1]),
+        (JoinType.FULL_OUTER, []),
+        (JoinType.LEFT_ANTI, [0]),
+    ],
+)
+def test_skewed_partition_splitting(
+    ray_start_regular_shared_2_cpus,
+    restore_data_context,
+    join_type,
+    expected_splittable_input_seq_ids,
+):
+    ctx = DataContext.get_current()
+    ctx.hash_shuffle_skewed_partition_factor = 2.0
+    ctx.target_max_block_size = 1 * KiB
+    ctx.max_hash_shuffle_aggregators = 4
+
+    parent_op_mock = MagicMock(PhysicalOperator)
+    parent_op_mock._output_dependencies = []
+
+    op = JoinOperator(
+        left_input_op=parent_op_mock,
+        right_input_op=parent_op_mock,
+        data_context=ctx,
+        left_key_columns=("id",),
+        right_key_columns=("id",),
+        join_type=join_type,
+        num_partitions=8,
+    )
+
+    assert sorted(op._get_splittable_input_seq_ids()) == sorted(
+        expected_splittable_input_seq_ids
+    )
+
+    def _shuffle(input_seq_id, partition_byte_sizes):
+        op._handle_shuffled_block_metadata(
+            input_seq_id,
+            MagicMock(),
+            {
+                partition_id: _PartitionStats(num_rows=1, byte_size=byte_size)
+                for partition_id, byte_size in partition_byte_sizes.items()
+            },
+        )
+
+    # Partitions smaller than target max block size aren't split
+    _shuffle(0, {0: 512, 1: 1})
+    _shuffle(1, {0: 512, 1: 1})
+    assert op._split_partitions == {}
+
+    # Skewed partition is split (by the first input sequence exceeding the
+    # threshold)
+    _shuffle(0, {0: 16 * KiB, 1: 1 * KiB, 2: 1 * KiB})
+    _shuffle(1, {0: 16 * KiB, 1: 1 * KiB, 2: 1 * KiB})
+
+    if not expected_splittable_input_seq_ids:
+        assert op._split_partitions == {}
+    else:
+        split_input_seq_id = 0 if 0 in expected_splittable_input_seq_ids else 1
+        assert op._split_partitions == {0: (split_input_seq_id, [0, 1, 2, 3])}
+
+
+def test_partition_shard_store_spilling(tmp_path):
+    import pyarrow as pa
+
+    store = PartitionShardStore(spill_threshold_bytes=1 * KiB, spill_dir=str(tmp_path))
+
+    small_shard = pa.table({"id": [1, 2, 3]})
+    large_shard = pa.table({"id": list(range(1000))})
+
+    store.add(0, small_shard)
+    # Below the threshold, shards are held in memory
+    assert not list(tmp_path.rglob("*.arrow"))
+
+    store.add(1, large_shard)
+    # Only the largest partition is spilled
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+
+    store.add(1, small_shard)
+
+    assert store.build(0) == small_shard
+    assert store.build(1) == pa.concat_tables([large_shard, small_shard])
+
+    store.clear(1)
+
+    assert not list(tmp_path.rglob("*.arrow"))
+    assert store.build(0) == small_shard
+
+
+@pytest.mark.parametrize("join_type", ["left_semi", "left_anti"])
+@pytest.mark.parametrize("broadcast", [False, True])
+@pytest.mark.parametrize(
+    "num_rows_left,num_rows_right",
+    [
+        (32, 16),
+        (16, 32),
+        # "Degenerate" case with empty right side
+        (32, 0),
+    ],
+)
+def test_semi_anti_join(
+    ray_start_regular_shared_2_cpus,
+    nullify_shuffle_aggregator_num_cpus,
+    join_type,
+    broadcast,
+    num_rows_left,
+    num_rows_right,
+):
+    DataContext.get_current().target_max_block_size = 1 * MiB
+
+    doubles = ray.data.range(num_rows_left).map(
+        lambda row: {"id": row["id"], "double": int(row["id"]) * 2}
+    )
+
+    # NOTE: Right side contains duplicate keys, that shouldn't duplicate
+    #       rows of the left side
+    squares = ray.data.range(num_rows_right).map(
+        lambda row: {"id": row["id"] // 2 * 2, "square": int(row["id"]) ** 2}
+    )
+
+    joined: Dataset = doubles.join(
+        squares,
+        join_type=join_type,
+        num_partitions=16,
+        on=("id",),
+        broadcast=broadcast,
+    )
+
+    joined_pd = pd.DataFrame(joined.take_all(), columns=["id", "double"])
+    joined_pd_sorted = joined_pd.sort_values(by=["id"]).reset_index(drop=True)
+
+    # Semi/anti join using Pandas (to assert against)
+    doubles_pd = doubles.to_pandas()
+    right_keys = set(range(0, num_rows_right, 2))
+
+    is_matched = doubles_pd["id"].isin(right_keys)
+    expected_pd = doubles_pd[is_matched if join_type == "left_semi" else ~is_matched]
+    expected_pd_sorted = expected_pd.sort_values(by=["id"]).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(
+        expected_pd_sorted, joined_pd_sorted, check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "join_type,pd_join_type",
+    [
+        ("inner", "inner"),
+        ("left_outer", "left"),
+        ("right_outer", "right"),
+    ],
+)
+@pytest.mark.parametrize(
+    "num_rows_left,num_rows_right",
+    [
+        (32, 8),
+        (8, 32),
+        # "Degenerate" case with empty broadcast side
+        (32, 0),
+    ],
+)
+def test_broadcast_join(
+    ray_start_regular_shared_2_cpus,
+    join_type,
+    pd_join_type,
+    num_rows_left,
+    num_rows_right,
+):
+    doubles = ray.data.range(num_rows_left, override_num_blocks=4).map(
+        lambda row: {"id": row["id"], "double": int(row["id"]) * 2}
+    )
+
+    squares = ray.data.range(num_rows_right).map(
+        lambda row: {"id": row["id"], "square": int(row["id"]) ** 2}
+    )
+
+    joined: Dataset = doubles.join(
+        squares,
+        join_type=join_type,
+        num_partitions=16,
+        on=("id",),
+        broadcast=True,
+    )
+
+    joined_pd = pd.DataFrame(joined.take_all())
+
+    # Join using Pandas (to assert against)
+    doubles_pd = doubles.to_pandas()
+    squares_pd = squares.to_pandas()
+
+    if num_rows_right == 0:
+        # NOTE: Only left outer join preserves rows of the left side, when the
+        #       right side is empty
+        expected_num_rows = num_rows_left if join_type == "left_outer" else 0
+        assert len(joined_pd) == expected_num_rows
+        return
+
+    if join_type == "right_outer":
+        expected_pd = doubles_pd.set_index("id").join(
+            squares_pd.set_index("id"), how=pd_join_type
+        )
+        expected_pd = expected_pd.reset_index()
+    else:
+        expected_pd = doubles_pd.join(
+            squares_pd.set_index("id"), on="id", how=pd_join_type
+        )
+
+    expected_pd_sorted = (
+        expected_pd[joined_pd.columns].sort_values(by=["id"]).reset_index(drop=True)
+    )
+    joined_pd_sorted = joined_pd.sort_values(by=["id"]).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(
+        expected_pd_sorted, joined_pd_sorted, check_dtype=False
+    )
+
+
+def test_broadcast_join_empty_broadcast_side(ray_start_regular_shared_2_cpus):
+    doubles = ray.data.range(8, override_num_blocks=2).map(
+        lambda row: {"id": row["id"], "double": int(row["id"]) * 2}
+    )
+
+    # NOTE: Broadcast side is empty, but its schema is known
+    squares = (
+        ray.data.range(8)
+        .map(lambda row: {"id": row["id"], "square": int(row["id"]) ** 2})
+        .filter(expr="id < 0")
+    )
+
+    joined: Dataset = doubles.join(
+        squares,
+        join_type="left_outer",
+        num_partitions=2,
+        on=("id",),
+        broadcast=True,
+    )
+
+    joined_pd = joined.to_pandas().sort_values(by=["id"]).reset_index(drop=True)
+
+    # Columns of the broadcast side are preserved (holding nulls)
+    assert sorted(joined_pd.columns) == ["double", "id", "square"]
+    assert joined_pd["id"].tolist() == list(range(8))
+    assert joined_pd["square"].isna().all()
+
+
+def test_broadcast_join_input_selection():
+    def _make_input_op(size_bytes: Optional[int]):
+        op = MagicMock(LogicalOperator)
+        op._output_dependencies = []
+        op.aggregate_output_metadata.return_value.size_bytes = size_bytes
+        return op
+
+    def _get_broadcast_input_index(
+        join_type, left_size, right_size, broadcast=None, threshold=10 * MiB
+    ):
+        op = Join(
+            _make_input_op(left_size),
+            _make_input_op(right_size),
+            join_type,
+            ("id",),
+            ("id",),
+            num_partitions=16,
+            broadcast=broadcast,
+        )
+        return op.get_broadcast_input_index(threshold)
+
+    # Smaller input under the threshold is broadcast
+    assert _get_broadcast_input_index("inner", 1 * GiB, 1 * MiB) == 1
+    assert _get_broadcast_input_index("inner", 1 * MiB, 1 * GiB) == 0
+    assert _get_broadcast_input_index("inner", 1 * MiB, 2 * MiB) == 0
+    # Unknown or large inputs aren't broadcast
+    assert _get_broadcast_input_index("inner", None, None) is None
+    assert _get_broadcast_input_index("inner", 1 * GiB, 1 * GiB) is None
+    assert _get_broadcast_input_index("inner", 1 * MiB, 1 * MiB, threshold=None) is None
+    # Inputs aren't broadcast automatically by default
+    assert DataContext().broadcast_join_threshold_bytes is None
+    # Only the input not preserving unmatched rows can be broadcast
+    assert _get_broadcast_input_index("left_outer", 1 * MiB, 1 * GiB) is None
+    assert _get_broadcast_input_index("right_outer", 1 * MiB, 1 * GiB) == 0
+    assert _get_broadcast_input_index("full_outer", 1 * MiB, 1 * MiB) is None
+    # Explicit hints take precedence over size estimates
+    assert _get_broadcast_input_index("inner", None, None, broadcast=True) == 1
+    assert _get_broadcast_input_index("inner", 1, 1, broadcast=False) is None
+
+    with pytest.raises(ValueError, match="doesn't support broadcasting"):
+        _get_broadcast_input_index("full_outer", None, None, broadcast=True)
+
+
 def test_invalid_join_config(ray_start_regular_shared_2_cpus):
     ds = ray.data.range(32)
 
@@ -1,6 +1,7 @@
 import logging
 import os
 import posixpath
+import time
 import urllib.parse
 from functools import partial
 from unittest.mock import patch
@@ -12,6 +13,9 @@ import pytest
 from pyarrow.fs import LocalFileSystem
 from pytest_lazy_fixtures import lf as lazy_fixture
 
+import ray
+from ray.data._internal.file_metadata_cache import FileMetadataCache
+from ray.data.context import DataContext
 from ray.data.datasource import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -496,6 +500,52 @@ def test_fast_file_metadata_provider_ignore_missing():
             pass
 
 
+def test_file_metadata_cache(ray_start_regular_shared, tmp_path, restore_data_context):
+    DataContext.get_current().file_metadata_cache_dir = str(tmp_path / "cache")
+    data_path = tmp_path / "data"
+    for partition in ["a", "b"]:
+        os.makedirs(data_path / f"part={partition}")
+        pq.write_table(
+            pa.table({"id": [1, 2, 3]}), data_path / f"part={partition}" / "0.parquet"
+        )
+    (data_path / "_SUCCESS").touch()
+    # Listings of directories modified right before are never reused.
+    for path in [data_path, data_path / "part=a", data_path / "part=b"]:
+        os.utime(path, (time.time() - 10, time.time() - 10))
+
+    paths, fs = _resolve_paths_and_filesystem([str(data_path)], LocalFileSystem())
+    meta_provider = DefaultFileMetadataProvider()
+
+    def expand_paths():
+        return sorted(path for path, _ in meta_provider.expand_paths(paths, fs))
+
+    with patch.object(
+        FileMetadataCache, "_list", wraps=FileMetadataCache._list
+    ) as mock_list:
+        expected_paths = expand_paths()
+        assert len(expected_paths) == 2
+        assert mock_list.call_count == 1
+
+        # Listings of unchanged directories are reused.
+        assert expand_paths() == expected_paths
+        assert mock_list.call_count == 1
+
+        # Only directories with added (or removed) files are listed again.
+        pq.write_table(pa.table({"id": [4]}), data_path / "part=b" / "1.parquet")
+        assert expand_paths() == sorted(
+            expected_paths + [str(data_path / "part=b" / "1.parquet")]
+        )
+        assert mock_list.call_count == 2
+
+    # Footer metadata of Parquet files are cached as well.
+    assert ray.data.read_parquet(str(data_path)).count() == 7
+    with patch(
+        "ray.data.datasource.parquet_meta_provider._fetch_metadata"
+    ) as mock_fetch_metadata:
+        assert ray.data.read_parquet(str(data_path)).count() == 7
+        mock_fetch_metadata.assert_not_called()
+
+
 if __name__ == "__main__":
     import sys
 
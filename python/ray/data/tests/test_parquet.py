@@ -97,6 +97,42 @@ def test_write_parquet_partition_cols(ray_start_regular_shared, tmp_path):
         assert row1_dict["d"] == row2_dict["d"]
 
 
+def test_write_parquet_shuffle_partition_cols(ray_start_regular_shared, tmp_path):
+    num_rows = 1000
+    df = pd.DataFrame(
+        {
+            "a": np.arange(num_rows) % 4,
+            "b": np.random.default_rng(0).permutation(num_rows),
+        }
+    )
+
+    ds = ray.data.from_pandas(df).repartition(20)
+    ds.write_parquet(
+        tmp_path,
+        partition_cols=["a"],
+        shuffle_partition_cols=True,
+        target_file_size_bytes=1000,
+        sort_within_files_by="b",
+    )
+
+    for i in range(4):
+        partition = os.path.join(tmp_path, f"a={i}")
+        files = sorted(os.listdir(partition))
+        # Every partition is written by a single task, into files of about the
+        # target size (instead of a file per input block).
+        assert len(files) == 2
+        assert len({file.rsplit("_", 1)[0] for file in files}) == 1
+        for file in files:
+            values = pq.read_table(os.path.join(partition, file))["b"].to_pylist()
+            assert values == sorted(values)
+
+    out_df = ray.data.read_parquet(tmp_path).to_pandas()
+    assert sorted(out_df["b"].tolist()) == list(range(num_rows))
+
+    with pytest.raises(ValueError, match="partition_cols"):
+        ds.write_parquet(tmp_path, shuffle_partition_cols=True)
+
+
 def test_include_paths(ray_start_regular_shared, tmp_path):
     path = os.path.join(tmp_path, "test.txt")
     table = pa.Table.from_pydict({"animals": ["cat", "dog"]})
@@ -574,6 +610,37 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds.count() == 2
 
 
+def test_parquet_read_partitioned_with_filter_pushdown(
+    ray_start_regular_shared, tmp_path
+):
+    table = pa.table(
+        {
+            "date": ["2026-09-30", "2026-10-01", "2026-10-01", "2026-10-02"],
+            "value": [0, 1, 2, 3],
+        }
+    )
+    pq.write_to_dataset(table, root_path=str(tmp_path), partition_cols=["date"])
+
+    ds = ray.data.read_parquet(str(tmp_path)).filter(
+        expr="date >= '2026-10-01' and value < 3"
+    )
+    assert sorted(row["value"] for row in ds.take_all()) == [1, 2]
+
+    # The partition filter prunes files, and the data filter is evaluated while
+    # reading.
+    read_op = ds._plan._logical_plan.dag.input_dependency
+    datasource = read_op._datasource
+    assert len(datasource._pq_paths) == 2
+    assert all("2026-09-30" not in path for path in datasource._pq_paths)
+    assert datasource._to_batches_kwargs["filter"] is not None
+
+    # Filters that mix partition and data columns are evaluated after reading.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(
+        expr="date == '2026-09-30' or value == 3"
+    )
+    assert sorted(row["value"] for row in ds.take_all()) == [0, 3]
+
+
 @pytest.mark.parametrize(
     "fs,data_path",
     [
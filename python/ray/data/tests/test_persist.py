@@ -0,0 +1,118 @@
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import ray
+from ray._private.test_utils import wait_for_condition
+from ray.data._internal.persist import PersistedCache
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _make_dataset(num_rows, calls_path):
+    def fn(batch):
+        # Count the executions of the transformation.
+        with open(calls_path, "a") as f:
+            f.write(".")
+        return batch
+
+    return ray.data.range(num_rows, override_num_blocks=5).map_batches(fn)
+
+
+def _get_cache(ds):
+    return ds._logical_plan.dag._datasource._cache
+
+
+def test_persist(ray_start_regular_shared, tmp_path, restore_data_context):
+    DataContext.get_current().persist_dir = str(tmp_path / "persist")
+    calls_path = tmp_path / "calls"
+    calls_path.write_text("")
+
+    ds = _make_dataset(100, calls_path).persist()
+    num_calls = len(calls_path.read_text())
+    assert num_calls > 0
+
+    # Epochs (and transformations) of the persisted dataset read the files back,
+    # rather than re-executing the transformation.
+    for _ in range(2):
+        assert sorted(row["id"] for row in ds.iter_rows()) == list(range(100))
+    assert ds.map(lambda row: {"id": row["id"] * 2}).sum("id") == 2 * 4950
+    assert ds.count() == 100
+    assert len(calls_path.read_text()) == num_calls
+
+    files = _get_cache(ds).get_files()
+    assert sum(file.num_rows for file in files) == 100
+    assert all(os.path.exists(file.path) for file in files)
+
+    with pytest.raises(ValueError, match="Storage level"):
+        ds.persist(storage_level="gpu")
+
+
+def test_persist_lru_eviction(ray_start_regular_shared, tmp_path, restore_data_context):
+    ctx = DataContext.get_current()
+    ctx.persist_dir = str(tmp_path / "persist")
+    calls_path = tmp_path / "calls"
+    calls_path.write_text("")
+
+    ds1 = _make_dataset(100, calls_path).persist()
+    ctx.persist_max_bytes = _get_cache(ds1).size_bytes
+    files = _get_cache(ds1).get_files()
+
+    # Persisting another dataset evicts the least recently used one.
+    ds2 = _make_dataset(100, calls_path).persist()
+    assert not _get_cache(ds1).is_persisted
+    assert _get_cache(ds2).is_persisted
+
+    # Evicted datasets are re-executed (evicting the other one).
+    num_calls = len(calls_path.read_text())
+    assert sorted(row["id"] for row in ds1.iter_rows()) == list(range(100))
+    assert len(calls_path.read_text()) > num_calls
+    assert _get_cache(ds1).is_persisted
+    assert not _get_cache(ds2).is_persisted
+    wait_for_condition(lambda: not any(os.path.exists(file.path) for file in files))
+
+
+def test_persist_concurrent_write(
+    ray_start_regular_shared, tmp_path, restore_data_context
+):
+    DataContext.get_current().persist_dir = str(tmp_path / "persist")
+    calls_path = tmp_path / "calls"
+    calls_path.write_text("")
+
+    ds = _make_dataset(100, calls_path).persist()
+
+    # Writing a cache doesn't block getting the files of other caches.
+    write_started, write_released = threading.Event(), threading.Event()
+
+    def write():
+        write_started.set()
+        assert write_released.wait(timeout=60)
+        return [], None
+
+    cache = PersistedCache(ds, str(tmp_path / "other"))
+    with patch.object(cache, "_write", side_effect=write):
+        thread = threading.Thread(target=cache.get_files)
+        thread.start()
+        assert write_started.wait(timeout=60)
+
+        files = []
+        get_thread = threading.Thread(
+            target=lambda: files.extend(_get_cache(ds).get_files())
+        )
+        get_thread.start()
+        get_thread.join(timeout=60)
+        assert sum(file.num_rows for file in files) == 100
+
+        write_released.set()
+        thread.join(timeout=60)
+
+    assert cache.is_persisted
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pyarrow
 import pytest
 
@@ -32,6 +34,54 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None] * 10 + [None]
 
 
+@pytest.mark.parametrize("hash_index", [False, True])
+def test_multiget_many_blocks(ray_start_regular_shared, hash_index):
+    ds = ray.data.range(1000, override_num_blocks=10)
+    ds = ds.add_column("key", lambda b: b["id"] * 2)
+
+    rad = ds.to_random_access_dataset(
+        "key", num_workers=3, hash_index=hash_index, cache_size=1000
+    )
+
+    keys = [-1, 2000] + list(range(0, 2000, 3)) + [10, 10]
+    expected = [{"id": k // 2, "key": k} if k % 2 == 0 else None for k in keys]
+    expected[:2] = [None, None]
+    assert rad.multiget(keys) == expected
+    assert ray.get(rad.get_async(4)) == {"id": 2, "key": 4}
+    assert ray.get(rad.get_async(5)) is None
+
+    # Lookups are served from the cache.
+    assert rad.multiget([10, 12]) == [{"id": 5, "key": 10}, {"id": 6, "key": 12}]
+    assert "Cache: 2 hits" in rad.stats(), rad.stats()
+
+
+def test_replicate_hot_blocks(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=10)
+    # Make every block be assigned to a single (random) worker, rather than to all
+    # workers on the (same) node holding it.
+    with patch(
+        "ray.experimental.get_object_locations",
+        lambda refs: {ref: {} for ref in refs},
+    ):
+        rad = ds.to_random_access_dataset("id", num_workers=4)
+
+    # Blocks that were never looked up aren't replicated.
+    assert rad.replicate_hot_blocks(num_blocks=2) == 0
+
+    for _ in range(3):
+        rad.multiget([1, 2, 3, 95])
+    assert rad.multiget([55]) == [{"id": 55}]
+
+    assert rad.replicate_hot_blocks(num_blocks=2, num_replicas=3) == 4
+    for key in [1, 95]:
+        workers = rad._block_to_workers_map[rad._find_le(key)]
+        assert len(set(workers)) == 3
+
+    # Replicated blocks can be looked up from any of the workers holding them.
+    for _ in range(10):
+        assert rad.multiget([1, 95]) == [{"id": 1}, {"id": 95}]
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range(10).repartition(20)
     assert ds._plan.initial_num_blocks() == 20
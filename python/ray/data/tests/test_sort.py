@@ -1,4 +1,5 @@
 import logging
+import os
 import random
 from collections import defaultdict
 
@@ -268,6 +269,67 @@ def test_sort_with_multiple_keys(ray_start_regular, descending, batch_format):
     )
 
 
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("batch_format", ["pyarrow", "pandas"])
+def test_external_merge_sort(
+    ray_start_regular, restore_data_context, descending, batch_format
+):
+    ctx = DataContext.get_current()
+    ctx.use_external_merge_sort = True
+    ctx.target_max_block_size = 1024
+
+    num_items = 2000
+    num_blocks = 10
+    # Most of the rows share a single key
+    xs = [7 if i % 10 else i for i in range(num_items)]
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"a": x, "b": i} for i, x in enumerate(xs)])
+    ds = ds.map_batches(lambda t: t, batch_format=batch_format, batch_size=None)
+
+    sorted_ds = ds.repartition(num_blocks).sort("a", descending=descending)
+
+    assert extract_values("a", sorted_ds.take_all()) == sorted(xs, reverse=descending)
+    block_num_rows = sorted_ds._block_num_rows()
+    # Merged partitions are split into multiple blocks
+    assert len(block_num_rows) > num_blocks
+    # Rows with the skewed key are spread across multiple partitions
+    assert max(block_num_rows) < num_items * 0.9
+
+
+def test_external_merge_sort_fetch_runs(ray_start_regular_shared, tmp_path):
+    from ray.data._internal.planner.exchange.sort_task_spec import _fetch_runs
+
+    tables = [pa.table({"a": [i, i + 1]}) for i in range(10)]
+    tables.insert(3, pa.table({"a": pa.array([], pa.int64())}))
+
+    runs, empty_runs = _fetch_runs([ray.put(t) for t in tables], str(tmp_path))
+
+    # Non-empty runs are read back from local files, in the order of the refs.
+    assert [run.to_pydict() for run in runs] == [
+        t.to_pydict() for t in tables if t.num_rows > 0
+    ]
+    assert len(empty_runs) == 1
+    assert len(os.listdir(tmp_path)) == 10
+
+
+def test_merge_sorted_runs():
+    from ray.data._internal.planner.exchange.sort_task_spec import (
+        _merge_sorted_runs,
+    )
+
+    sort_key = SortKey(["a", "b"], descending=[False, True])
+    runs = [
+        pa.table({"a": [0, 1, 1, 5], "b": [0, 3, 1, 0]}),
+        pa.table({"a": [1, 2, 3], "b": [2, 0, 0]}),
+        pa.table({"a": [4], "b": [0]}),
+    ]
+    expected = pa.concat_tables(runs).sort_by([("a", "ascending"), ("b", "descending")])
+
+    for window_num_rows in [1, 2, 10]:
+        merged = pa.concat_tables(_merge_sorted_runs(runs, sort_key, window_num_rows))
+        assert merged.equals(expected)
+
+
 @pytest.mark.parametrize("num_items,parallelism", [(100, 1), (1000, 4)])
 def test_sort_pandas(
     ray_start_regular, num_items, parallelism, configure_shuffle_method
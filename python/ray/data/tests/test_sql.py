@@ -69,6 +69,51 @@ def test_read_sql_with_parallelism_fallback(temp_database: str):
     assert sorted(actual_values) == sorted(expected_values)
 
 
+def test_read_sql_with_partition_column(temp_database: str):
+    connection = sqlite3.connect(temp_database)
+    connection.execute("CREATE TABLE grade(name, id, score)")
+    expected_values = [(f"xiaoming{i}", i, 8.2 + i) for i in range(500)]
+    expected_values.append(("nobody", None, 0.0))
+    connection.executemany("INSERT INTO grade VALUES (?, ?, ?)", expected_values)
+    connection.commit()
+    connection.close()
+
+    dataset = ray.data.read_sql(
+        "SELECT * FROM grade",
+        lambda: sqlite3.connect(temp_database),
+        override_num_blocks=4,
+        partition_column="id",
+    )
+    read_tasks = dataset._logical_plan.dag._datasource.get_read_tasks(4)
+    assert len(read_tasks) == 4
+
+    actual_values = [tuple(record.values()) for record in dataset.take_all()]
+    assert sorted(actual_values, key=str) == sorted(expected_values, key=str)
+
+
+def test_read_sql_with_limit_offset_fallback(temp_database: str, restore_data_context):
+    connection = sqlite3.connect(temp_database)
+    connection.execute("CREATE TABLE grade(name, id, score)")
+    expected_values = [(f"xiaoming{i}", i, 8.2 + i) for i in range(5000)]
+    connection.executemany("INSERT INTO grade VALUES (?, ?, ?)", expected_values)
+    connection.commit()
+    connection.close()
+
+    # Blocks are streamed by the read tasks at the target max block size.
+    ray.data.DataContext.get_current().target_max_block_size = 1024
+    # SQLite doesn't support MD5, hence rows are paginated (ordered by the key).
+    dataset = ray.data.read_sql(
+        "SELECT * FROM grade",
+        lambda: sqlite3.connect(temp_database),
+        override_num_blocks=2,
+        shard_keys=["id"],
+    ).materialize()
+    assert dataset.num_blocks() > 2
+
+    actual_values = [tuple(record.values()) for record in dataset.take_all()]
+    assert sorted(actual_values) == expected_values
+
+
 # for mysql test
 @pytest.mark.skip(reason="skip this test because mysql env is not ready")
 def test_read_sql_with_parallelism_mysql(temp_database: str):
@@ -227,6 +227,58 @@ def test_streaming_split_e2e(ray_start_10_cpus_shared):
                 assert lengths == [300, 300, 400], lengths
 
 
+def test_streaming_split_shuffle(ray_start_10_cpus_shared):
+    ds = ray.data.range(1000, override_num_blocks=20)
+
+    @ray.remote
+    def consume(it, num_epochs):
+        return [[row["id"] for row in it.iter_rows()] for _ in range(num_epochs)]
+
+    def get_epochs(shuffle_seed):
+        iterators = ds.streaming_split(
+            2, equal=True, shuffle_seed=shuffle_seed, shuffle_window_blocks=4
+        )
+        # Rows of every split (by epoch).
+        return ray.get([consume.remote(it, 2) for it in iterators])
+
+    splits = get_epochs(42)
+    for epoch in range(2):
+        rows = splits[0][epoch] + splits[1][epoch]
+        assert sorted(rows) == list(range(1000))
+        assert splits[0][epoch] != sorted(splits[0][epoch])
+    assert splits[0][0] != splits[0][1]
+
+    # Splits are reproducible for a given seed (and epoch).
+    assert get_epochs(42) == splits
+    assert get_epochs(43) != splits
+
+
+def test_streaming_split_resize(ray_start_10_cpus_shared):
+    ds = ray.data.range(1000, override_num_blocks=20)
+
+    @ray.remote
+    def consume(it):
+        return [row["id"] for row in it.iter_rows()]
+
+    iterators = ds.streaming_split(2)
+    old_iterators = []
+    for n in [2, 3, 1]:
+        if n != len(iterators):
+            old_iterators = iterators
+            iterators = iterators[0].resize(n)
+        assert [it.world_size() for it in iterators] == [n] * n
+        # All the rows are read (once) by the resized splits.
+        splits = ray.get([consume.remote(it) for it in iterators])
+        assert sorted(sum(splits, [])) == list(range(1000))
+
+    # Epochs are numbered on across the resized splits.
+    assert ray.get(iterators[0]._coord_actor.get_next_epoch.remote()) == 3
+
+    # The iterators of the previous splits can't be used anymore.
+    with pytest.raises(ray.exceptions.RayActorError):
+        list(old_iterators[0].iter_rows())
+
+
 def test_streaming_split_barrier(ray_start_10_cpus_shared):
     ds = ray.data.range(20, override_num_blocks=20)
     (
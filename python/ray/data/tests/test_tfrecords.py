@@ -10,7 +10,10 @@ from pandas.api.types import is_float_dtype, is_int64_dtype, is_object_dtype
 
 import ray
 from ray.data import Dataset
-from ray.data._internal.datasource.tfrecords_datasource import TFXReadOptions
+from ray.data._internal.datasource.tfrecords_datasource import (
+    TFRecordDatasource,
+    TFXReadOptions,
+)
 from ray.tests.conftest import *  # noqa: F401,F403
 
 if TYPE_CHECKING:
@@ -787,6 +790,29 @@ def test_write_min_rows_per_file(tmp_path, ray_start_regular_shared, min_rows_pe
         assert len(list(dataset)) == min_rows_per_file
 
 
+@pytest.mark.parametrize("write_index", [True, False])
+def test_read_tfrecords_split_files(
+    ray_start_regular_shared, tmp_path, monkeypatch, write_index
+):
+    monkeypatch.setattr(TFRecordDatasource, "_MIN_FILE_SPLIT_SIZE_BYTES", 0)
+    ray.data.range(1000, override_num_blocks=1).write_tfrecords(
+        tmp_path, write_index=write_index
+    )
+
+    def get_read_tasks(ds, parallelism):
+        return ds._logical_plan.dag._datasource.get_read_tasks(parallelism)
+
+    # Files without index files aren't split (unless indexed upon reading).
+    ds = ray.data.read_tfrecords(tmp_path, override_num_blocks=4)
+    assert len(get_read_tasks(ds, 4)) == (4 if write_index else 1)
+
+    ds = ray.data.read_tfrecords(tmp_path, override_num_blocks=4, build_index=True)
+    read_tasks = get_read_tasks(ds, 4)
+    assert len(read_tasks) == 4
+    assert sum(read_task.metadata.num_rows for read_task in read_tasks) == 1000
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(1000))
+
+
 def read_tfrecords_with_tfx_read_override(paths, tfx_read=False, **read_opts):
     infer_schema = read_opts.pop("tfx_read_auto_infer_schema", tfx_read)
 
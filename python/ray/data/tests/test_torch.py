@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -308,6 +310,37 @@ def test_iter_torch_batches_tensor_ds(ray_start_10_cpus_shared):
         np.testing.assert_array_equal(arr, combined_iterations)
 
 
+def test_iter_torch_batches_reuse_buffers(ray_start_10_cpus_shared):
+    import torch
+
+    ds = ray.data.from_items(
+        [
+            {"id": i, "tensor": np.full(4, i), "maybe_null": i if i % 2 else None}
+            for i in range(1000)
+        ],
+        override_num_blocks=4,
+    )
+
+    num_epochs = 2
+    for _ in range(num_epochs):
+        ids = []
+        for batch in ds.iter_torch_batches(batch_size=64, reuse_buffers=True):
+            assert torch.equal(batch["tensor"], batch["id"].unsqueeze(1).expand(-1, 4))
+            assert torch.isnan(batch["maybe_null"][batch["id"] % 2 == 0]).all()
+            ids.extend(batch["id"].tolist())
+        assert sorted(ids) == list(range(1000))
+
+    # Buffers are reused across the batches, except for the column with nulls (and
+    # the last, smaller batch).
+    match = re.search(
+        r"In collate_fn buffers: (\d+) allocations .* (\d+) batch columns not buffered",
+        ds.stats(),
+    )
+    assert match is not None
+    assert int(match.group(1)) < 1000 // 64
+    assert int(match.group(2)) >= 1000 // 64
+
+
 # This test catches an error in stream_split_iterator dealing with empty blocks,
 # which is difficult to reproduce outside of TorchTrainer.
 def test_torch_trainer_crash(ray_start_10_cpus_shared):
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ray
+from ray.data.tests.conftest import *  # noqa
+from ray.data.window import CumSum, Lag, Lead, Rank, RollingMean, RowNumber
+from ray.tests.conftest import *  # noqa
+
+
+@pytest.mark.parametrize("num_parts", [1, 10])
+def test_window(ray_start_regular_shared_2_cpus, num_parts, configure_shuffle_method):
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "key": rng.integers(5, size=200),
+            "time": rng.permutation(200),
+            "value": rng.normal(size=200),
+        }
+    )
+    df.loc[rng.choice(200, size=10, replace=False), "value"] = np.nan
+
+    out_df = (
+        ray.data.from_pandas(df)
+        .repartition(num_parts)
+        .groupby("key")
+        .window(
+            RollingMean("value", preceding=2),
+            CumSum("value"),
+            Lag("value"),
+            Lead("value", offset=2, default=0.0),
+            RowNumber(),
+            order_by="time",
+        )
+        .to_pandas()
+        .sort_values(by=["key", "time"])
+        .reset_index(drop=True)
+    )
+
+    expected_df = df.sort_values(by=["key", "time"]).reset_index(drop=True)
+    groups = expected_df.groupby("key")["value"]
+    expected_df["rolling_mean(value)"] = groups.transform(
+        lambda s: s.rolling(3, min_periods=1).mean()
+    )
+    expected_df["cum_sum(value)"] = groups.transform(lambda s: s.fillna(0).cumsum())
+    expected_df["lag(value)"] = groups.shift(1)
+    expected_df["lead(value)"] = groups.transform(
+        lambda s: s.shift(-2).where(np.arange(len(s)) < len(s) - 2, 0.0)
+    )
+    expected_df["row_number()"] = expected_df.groupby("key").cumcount() + 1
+
+    pd.testing.assert_frame_equal(out_df, expected_df, check_dtype=False)
+
+
+def test_window_rank(ray_start_regular_shared_2_cpus):
+    ds = ray.data.from_items(
+        [
+            {"key": key, "score": score}
+            for key, scores in [("a", [3, 1, 3, 2]), ("b", [5, 5])]
+            for score in scores
+        ]
+    )
+
+    rows = (
+        ds.groupby("key")
+        .window(Rank(), Rank(dense=True), order_by="score", descending=True)
+        .sort(["key", "score"], descending=[False, True])
+        .take_all()
+    )
+
+    assert [(row["rank()"], row["dense_rank()"]) for row in rows] == [
+        (1, 1),
+        (1, 1),
+        (3, 2),
+        (4, 3),
+        (1, 1),
+        (1, 1),
+    ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
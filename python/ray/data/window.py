@@ -0,0 +1,398 @@
+import abc
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import numpy as np
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+@PublicAPI(stability="alpha")
+class WindowFn(abc.ABC):
+    """Provides an interface to implement window functions, computed for every row
+    of a dataset over the rows of its group (partition), in the order given by
+    ``GroupedData.window(..., order_by=...)``.
+
+    Window functions are computed on Arrow tables holding entire groups, sorted by
+    the group keys and the ``order_by`` columns, with vectorized kernels (rather
+    than per group).
+
+    Args:
+        name: The name of the column holding the result of the window function.
+        on: The name of the column to compute the window function on, or `None` for
+            functions that don't apply to a column (e.g., `RowNumber()`).
+    """
+
+    def __init__(self, name: str, *, on: Optional[str]):
+        if not name:
+            raise ValueError(
+                f"Non-empty string has to be provided as name (got {name})"
+            )
+
+        self.name = name
+        self._target_col_name = on
+
+    def get_target_column(self) -> Optional[str]:
+        return self._target_col_name
+
+    @abc.abstractmethod
+    def compute(
+        self,
+        table: "pyarrow.Table",
+        group_starts: np.ndarray,
+        group_ends: np.ndarray,
+        order_by: List[str],
+    ) -> "pyarrow.Array":
+        """Computes the window function for every row of the table.
+
+        Args:
+            table: A table of entire groups, sorted by the group keys and the
+                ``order_by`` columns.
+            group_starts: The index of the first row of the group of every row.
+            group_ends: The index past the last row of the group of every row.
+            order_by: The columns the rows of every group are ordered by.
+
+        Returns:
+            An array with the result for every row of the table.
+        """
+        ...
+
+
+@PublicAPI(stability="alpha")
+class RowNumber(WindowFn):
+    """Defines the (1-based) row number within the group.
+
+    Args:
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(self, alias_name: Optional[str] = None):
+        super().__init__(alias_name if alias_name else "row_number()", on=None)
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        import pyarrow as pa
+
+        return pa.array(np.arange(len(group_starts)) - group_starts + 1)
+
+
+@PublicAPI(stability="alpha")
+class Rank(WindowFn):
+    """Defines the (1-based) rank of the rows within the group, by the ``order_by``
+    columns.
+
+    Rows with the same values of the ``order_by`` columns have the same rank. With
+    ``dense=False`` (default), ranks are skipped after such ties (e.g., 1, 1, 3),
+    while with ``dense=True`` they aren't (e.g., 1, 1, 2).
+
+    Args:
+        dense: Whether to compute dense ranks.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(self, dense: bool = False, alias_name: Optional[str] = None):
+        self._dense = dense
+
+        super().__init__(
+            alias_name if alias_name else ("dense_rank()" if dense else "rank()"),
+            on=None,
+        )
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        import pyarrow as pa
+
+        indices = np.arange(len(group_starts))
+        # Rows starting a run of equal values (within their group).
+        is_run_start = _get_run_starts(table, order_by) | (indices == group_starts)
+
+        if self._dense:
+            num_runs = np.cumsum(is_run_start)
+            return pa.array(num_runs - num_runs[group_starts] + 1)
+
+        run_starts = np.maximum.accumulate(np.where(is_run_start, indices, 0))
+        return pa.array(run_starts - group_starts + 1)
+
+
+@PublicAPI(stability="alpha")
+class Lag(WindowFn):
+    """Defines the value of the column ``offset`` rows before the row within the
+    group (or ``default`` if there is no such row).
+
+    Args:
+        on: The name of the column to get the values of. Must be provided.
+        offset: The number of rows before the row to get the value of.
+        default: The value for the rows without a row ``offset`` rows before them
+            in their group. Defaults to null.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        offset: int = 1,
+        default: Any = None,
+        alias_name: Optional[str] = None,
+    ):
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to compute on has to be provided (got {on})")
+
+        self._offset = offset
+        self._default = default
+
+        super().__init__(alias_name if alias_name else f"lag({on})", on=on)
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        return _shift(
+            table.column(self._target_col_name),
+            -self._offset,
+            group_starts,
+            group_ends,
+            self._default,
+        )
+
+
+@PublicAPI(stability="alpha")
+class Lead(WindowFn):
+    """Defines the value of the column ``offset`` rows after the row within the
+    group (or ``default`` if there is no such row).
+
+    Args:
+        on: The name of the column to get the values of. Must be provided.
+        offset: The number of rows after the row to get the value of.
+        default: The value for the rows without a row ``offset`` rows after them
+            in their group. Defaults to null.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        offset: int = 1,
+        default: Any = None,
+        alias_name: Optional[str] = None,
+    ):
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to compute on has to be provided (got {on})")
+
+        self._offset = offset
+        self._default = default
+
+        super().__init__(alias_name if alias_name else f"lead({on})", on=on)
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        return _shift(
+            table.column(self._target_col_name),
+            self._offset,
+            group_starts,
+            group_ends,
+            self._default,
+        )
+
+
+@PublicAPI(stability="alpha")
+class RollingSum(WindowFn):
+    """Defines the sum of the (non-null) values of the column over a frame of rows
+    around the row, within the group.
+
+    The frame of a row spans from ``preceding`` rows before it (or from the first
+    row of the group if ``preceding`` is `None`) to ``following`` rows after it.
+
+    Args:
+        on: The name of the numerical column to sum. Must be provided.
+        preceding: The number of rows before the row in its frame, or `None` for all
+            the rows before it (i.e., a cumulative sum).
+        following: The number of rows after the row in its frame.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(
+        self,
+        on: Optional[str] = None,
+        preceding: Optional[int] = None,
+        following: int = 0,
+        alias_name: Optional[str] = None,
+    ):
+        if on is None or not isinstance(on, str):
+            raise ValueError(f"Column to compute on has to be provided (got {on})")
+        if (preceding is not None and preceding < 0) or following < 0:
+            raise ValueError(
+                "The numbers of preceding and following rows must be non-negative "
+                f"(got {preceding} and {following})"
+            )
+
+        self._preceding = preceding
+        self._following = following
+
+        super().__init__(
+            alias_name if alias_name else f"{self._default_name_prefix()}({on})",
+            on=on,
+        )
+
+    def _default_name_prefix(self) -> str:
+        return "rolling_sum"
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        import pyarrow as pa
+
+        sums, _ = self._compute_frame_sums_and_counts(table, group_starts, group_ends)
+        return pa.array(sums)
+
+    def _compute_frame_sums_and_counts(self, table, group_starts, group_ends):
+        """Returns the sums and the numbers of the non-null values of the frames of
+        every row."""
+        import pyarrow.compute as pc
+
+        column = table.column(self._target_col_name)
+        is_valid = pc.is_valid(column).to_numpy()
+        values = pc.fill_null(column, 0).to_numpy()
+        if values.dtype.kind == "f":
+            # Like nulls, NaNs are skipped.
+            is_valid &= ~np.isnan(values)
+            values = np.where(is_valid, values, 0)
+
+        # The frame sums are the differences of the prefix sums at the frame ends.
+        prefix_sums = np.concatenate([[0], np.cumsum(values)])
+        prefix_counts = np.concatenate([[0], np.cumsum(is_valid)])
+
+        indices = np.arange(len(group_starts))
+        frame_starts = (
+            group_starts
+            if self._preceding is None
+            else np.maximum(group_starts, indices - self._preceding)
+        )
+        frame_ends = np.minimum(group_ends, indices + self._following + 1)
+
+        return (
+            prefix_sums[frame_ends] - prefix_sums[frame_starts],
+            prefix_counts[frame_ends] - prefix_counts[frame_starts],
+        )
+
+
+@PublicAPI(stability="alpha")
+class RollingMean(RollingSum):
+    """Defines the mean of the (non-null) values of the column over a frame of rows
+    around the row, within the group (or null if there are none).
+
+    The frame of a row spans from ``preceding`` rows before it (or from the first
+    row of the group if ``preceding`` is `None`) to ``following`` rows after it.
+
+    Args:
+        on: The name of the numerical column to average. Must be provided.
+        preceding: The number of rows before the row in its frame, or `None` for all
+            the rows before it (i.e., a cumulative mean).
+        following: The number of rows after the row in its frame.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def _default_name_prefix(self) -> str:
+        return "rolling_mean"
+
+    def compute(self, table, group_starts, group_ends, order_by):
+        import pyarrow as pa
+
+        sums, counts = self._compute_frame_sums_and_counts(
+            table, group_starts, group_ends
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+        return pa.array(means, mask=counts == 0)
+
+
+@PublicAPI(stability="alpha")
+class CumSum(RollingSum):
+    """Defines the cumulative sum of the (non-null) values of the column, from the
+    first row of the group to the row.
+
+    Args:
+        on: The name of the numerical column to sum. Must be provided.
+        alias_name: Optional name for the resulting column.
+    """
+
+    def __init__(self, on: Optional[str] = None, alias_name: Optional[str] = None):
+        super().__init__(on, preceding=None, following=0, alias_name=alias_name)
+
+    def _default_name_prefix(self) -> str:
+        return "cum_sum"
+
+
+def _apply_window_fns(
+    table: "pyarrow.Table",
+    keys: List[str],
+    order_by: List[str],
+    descending: bool,
+    window_fns: List[WindowFn],
+) -> "pyarrow.Table":
+    """Sorts the table (holding entire groups) by the keys and the ``order_by``
+    columns, and appends the columns of the window functions to it."""
+    import pyarrow.compute as pc
+
+    order = "descending" if descending else "ascending"
+    sort_keys = [(key, "ascending") for key in keys] + [
+        (column, order) for column in order_by
+    ]
+    if sort_keys:
+        table = table.take(pc.sort_indices(table, sort_keys=sort_keys))
+
+    indices = np.arange(table.num_rows)
+    is_group_start = _get_run_starts(table, keys)
+    if table.num_rows:
+        is_group_start[0] = True
+    group_start_indices = np.flatnonzero(is_group_start)
+    group_ids = np.cumsum(is_group_start) - 1
+
+    group_starts = np.maximum.accumulate(np.where(is_group_start, indices, 0))
+    group_ends = np.append(group_start_indices[1:], table.num_rows)[group_ids]
+
+    for window_fn in window_fns:
+        table = table.append_column(
+            window_fn.name,
+            window_fn.compute(table, group_starts, group_ends, order_by),
+        )
+
+    return table
+
+
+def _get_run_starts(table: "pyarrow.Table", columns: List[str]) -> np.ndarray:
+    """Returns whether the values of any of the columns differ from the ones of the
+    preceding row, for every row (nulls being equal to each other)."""
+    import pyarrow.compute as pc
+
+    is_run_start = np.zeros(table.num_rows, dtype=bool)
+    if table.num_rows == 0:
+        return is_run_start
+
+    for column in columns:
+        values = table.column(column)
+        current, previous = values.slice(1), values.slice(0, len(values) - 1)
+
+        is_different = pc.fill_null(pc.not_equal(current, previous), True)
+        both_null = pc.and_(pc.is_null(current), pc.is_null(previous))
+        is_different = pc.and_(is_different, pc.invert(both_null))
+
+        is_run_start[1:] |= is_different.to_numpy()
+
+    return is_run_start
+
+
+def _shift(
+    column: "pyarrow.ChunkedArray",
+    offset: int,
+    group_starts: np.ndarray,
+    group_ends: np.ndarray,
+    default: Any,
+) -> "pyarrow.Array":
+    """Returns the values of the column ``offset`` rows after every row (or the
+    default value if that's outside of the group of the row)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    indices = np.arange(len(group_starts)) + offset
+    is_outside = (indices < group_starts) | (indices >= group_ends)
+
+    shifted = column.take(pa.array(np.where(is_outside, 0, indices), mask=is_outside))
+    if default is not None:
+        shifted = pc.if_else(
+            pa.array(is_outside), pa.scalar(default, type=column.type), shifted
+        )
+    return shifted
@@ -8,10 +8,12 @@ import subprocess
 from unittest.mock import Mock, patch
 import unittest
 
+import psutil
 import pytest
 
 import ray
 import ray.cluster_utils
+from ray._common.test_utils import wait_for_condition
 from ray._private.test_utils import (
     run_string_as_driver,
     wait_for_pid_to_exit,
@@ -327,6 +329,76 @@ def test_preload_workers(ray_start_cluster, preload):
     ray.get(futures)
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Fork isn't supported")
+def test_worker_zygote(ray_start_cluster):
+    """Verify workers are forked from the zygote with the preload modules imported,
+    once it's started (by the first workers, which are started cold)."""
+    cluster = ray_start_cluster
+    node = cluster.add_node(
+        num_cpus=1,
+        _system_config={
+            "worker_zygote_enabled": True,
+            "preload_python_modules": ["html.parser"],
+        },
+    )
+    ray.init(address=cluster.address)
+
+    # New workers are started for each task.
+    @ray.remote(max_calls=1)
+    def get_worker_info(x):
+        return (
+            os.environ.get("RAY_WORKER_ZYGOTE_FORKED"),
+            "html.parser" in sys.modules,
+            x * 2,
+        )
+
+    def forked_worker_started():
+        forked, preloaded, result = ray.get(get_worker_info.remote(21))
+        assert preloaded and result == 42
+        return forked == "1"
+
+    wait_for_condition(forked_worker_started, timeout=60)
+
+    # Forked workers run actors as well.
+    @ray.remote
+    class Actor:
+        def get_pid(self):
+            return os.getpid()
+
+    actor = Actor.remote()
+    pid = ray.get(actor.get_pid.remote())
+    ray.kill(actor)
+    wait_for_pid_to_exit(pid)
+
+    # The zygote exits once the raylet exits.
+    zygote_pids = [
+        proc.pid
+        for proc in psutil.process_iter(["cmdline"])
+        if any("zygote.py" in arg for arg in proc.info["cmdline"] or [])
+        and any(node.get_session_dir_path() in arg for arg in proc.info["cmdline"])
+    ]
+    assert zygote_pids
+    ray.shutdown()
+    cluster.remove_node(node)
+    for zygote_pid in zygote_pids:
+        wait_for_pid_to_exit(zygote_pid)
+
+
+def test_worker_zygote_socket_path(monkeypatch):
+    """Verify workers are only forked from zygotes with the same Ray environment
+    variables (except for the ones set per worker)."""
+    from ray._private.workers.zygote import get_zygote_socket_path
+
+    argv = ["default_worker.py", "--object-store-name=/tmp/session/sockets/plasma"]
+    socket_path = get_zygote_socket_path(argv)
+    assert os.path.dirname(socket_path) == "/tmp/session/sockets"
+
+    monkeypatch.setenv("RAY_JOB_ID", "02000000")
+    assert get_zygote_socket_path(argv) == socket_path
+    monkeypatch.setenv("RAY_TEST_WORKER_ZYGOTE_SETTING", "1")
+    assert get_zygote_socket_path(argv) != socket_path
+
+
 @pytest.mark.skipif(client_test_enabled(), reason="only server mode")
 def test_gcs_port_env(shutdown_only):
     try:
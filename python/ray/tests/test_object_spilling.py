@@ -147,6 +147,12 @@ def test_url_generation_and_parse():
     assert parsed_result.base_url == url
     assert parsed_result.offset == offset
     assert parsed_result.size == size
+    assert parsed_result.compression is None
+
+    url_with_offset = create_url_with_offset(
+        url=url, offset=offset, size=size, compression="lz4"
+    )
+    assert parse_url_with_offset(url_with_offset) == (url, offset, size, "lz4")
 
 
 def test_default_config(shutdown_only):
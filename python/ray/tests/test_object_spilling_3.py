@@ -91,6 +91,48 @@ def test_multiple_directories(tmp_path, shutdown_only):
         wait_for_condition(lambda: is_dir_empty(temp_dir, ray_context["node_id"]))
 
 
+@pytest.mark.skipif(platform.system() in ["Windows"], reason="Failing on Windows.")
+def test_spill_compression(tmp_path, shutdown_only):
+    temp_dirs = [tmp_path / f"spill_{i}" for i in range(2)]
+    for temp_dir in temp_dirs:
+        temp_dir.mkdir()
+    object_spilling_config = json.dumps(
+        {
+            "type": "filesystem",
+            "params": {
+                "directory_path": [str(temp_dir) for temp_dir in temp_dirs],
+                "compression": "lz4",
+                "readahead_size": 64 * 1024 * 1024,
+            },
+        }
+    )
+    ray.init(
+        object_store_memory=75 * 1024 * 1024,
+        _system_config={
+            "object_store_full_delay_ms": 100,
+            "object_spilling_config": object_spilling_config,
+            "min_spilling_size": 0,
+        },
+    )
+
+    # Compressible (and incompressible) objects of 20 MiB.
+    arrs = [np.full(20 * 1024 * 1024, i, dtype=np.uint8) for i in range(10)]
+    arrs.append(np.random.randint(256, size=20 * 1024 * 1024, dtype=np.uint8))
+    refs = [ray.put(arr) for arr in arrs]
+
+    spilled_bytes = sum(
+        path.stat().st_size
+        for temp_dir in temp_dirs
+        for spilled_objects_dir in temp_dir.iterdir()
+        for path in spilled_objects_dir.iterdir()
+    )
+    # Objects are spilled compressed, except for the incompressible one.
+    assert 0 < spilled_bytes < 25 * 1024 * 1024
+
+    for ref, arr in zip(refs, arrs):
+        assert np.array_equal(ray.get(ref), arr)
+
+
 def _check_spilled(num_objects_spilled=0):
     def ok():
         s = ray._private.internal_api.memory_summary(stats_only=True)
@@ -203,6 +245,53 @@ def test_pull_spilled_object(
         assert hash_value == hash_value1
 
 
+@pytest.mark.skipif(platform.system() in ["Windows"], reason="Failing on Windows.")
+def test_pull_compressed_spilled_object(ray_start_cluster_enabled, tmp_path):
+    cluster = ray_start_cluster_enabled
+    object_spilling_config = json.dumps(
+        {
+            "type": "filesystem",
+            "params": {"directory_path": str(tmp_path), "compression": "lz4"},
+        }
+    )
+
+    # Head node.
+    cluster.add_node(
+        num_cpus=1,
+        resources={"custom": 0},
+        object_store_memory=75 * 1024 * 1024,
+        _system_config={
+            "min_spilling_size": 0,
+            "object_store_full_delay_ms": 100,
+            "object_spilling_config": object_spilling_config,
+        },
+    )
+    ray.init(cluster.address)
+
+    # add 1 worker node
+    cluster.add_node(
+        num_cpus=1, resources={"custom": 1}, object_store_memory=75 * 1024 * 1024
+    )
+    cluster.wait_for_nodes()
+
+    @ray.remote(num_cpus=1, resources={"custom": 1})
+    def create_objects():
+        # Compressible objects, spilled (compressed) on the worker node.
+        return [
+            [ray.put(np.full(20 * 1024 * 1024, i, dtype=np.uint8))] for i in range(8)
+        ]
+
+    @ray.remote(num_cpus=1, resources={"custom": 0})
+    def get_object(arr):
+        return int(arr[0]), len(arr)
+
+    # Compressed spilled objects are restored on the worker node before these are
+    # pushed to the head node.
+    refs = ray.get(create_objects.remote())
+    for i, (ref,) in enumerate(refs):
+        assert ray.get(get_object.remote(ref), timeout=60) == (i, 20 * 1024 * 1024)
+
+
 # TODO(chenshen): fix error handling when spilled file
 # missing/corrupted
 @pytest.mark.skipif(True, reason="Currently hangs.")
@@ -7,6 +7,7 @@ import string
 import sys
 import weakref
 from dataclasses import make_dataclass
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -315,6 +316,35 @@ def test_numpy_serialization(ray_start_regular):
     assert len(buffers) == 1
 
 
+def test_fast_path_serialization(ray_start_regular):
+    import pyarrow as pa
+
+    context = ray._private.worker.global_worker.get_serialization_context()
+    arr = np.arange(12, dtype=np.int32).reshape(3, 4)
+    table = pa.table({"a": [1, 2, 3], "b": ["x", None, "z"]}).slice(1)
+    value = {
+        "c": arr,
+        "f": np.asfortranarray(arr),
+        "s": np.float32(1.5),
+        "t": table,
+        "l": [1, 2.0, b"3"],
+    }
+
+    # Common payloads are serialized without pickling, and deserialized to
+    # zero-copy views of the object.
+    with patch.object(context, "_serialize_to_pickle5", side_effect=AssertionError):
+        result = ray.get(ray.put(value))
+    assert np.array_equal(result["c"], arr) and not result["c"].flags.writeable
+    assert np.array_equal(result["f"], arr) and result["f"].flags.f_contiguous
+    assert type(result["s"]) is np.float32 and result["s"] == 1.5
+    assert result["t"].equals(table)
+    assert result["l"] == [1, 2.0, b"3"]
+
+    # Other payloads fall back to pickling.
+    objects = np.array([None, "a"], dtype=object)
+    assert list(ray.get(ray.put({"o": objects, "c": arr}))["o"]) == [None, "a"]
+
+
 def test_numpy_subclass_serialization_pickle(ray_start_regular):
     class MyNumpyConstant(np.ndarray):
         def __init__(self, value):
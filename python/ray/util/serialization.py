@@ -53,3 +53,8 @@ class StandaloneSerializationContext:
 
         # construct a reducer
         pickle.CloudPickler.dispatch[cls] = _CloudPicklerReducer
+
+    def _register_fast_path_serializer(self, type_name, tag, serializer, deserializer):
+        # Fast-path serializers are only used for Ray objects, so there's nothing to
+        # register outside of Ray workers.
+        pass
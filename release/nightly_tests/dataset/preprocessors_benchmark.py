@@ -0,0 +1,78 @@
+import argparse
+
+import numpy as np
+
+import ray
+from benchmark import Benchmark
+from ray.data.preprocessors import (
+    MinMaxScaler,
+    OneHotEncoder,
+    OrdinalEncoder,
+    SimpleImputer,
+    StandardScaler,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pandas and Arrow transforms of preprocessors"
+    )
+    parser.add_argument("--num-rows", type=int, default=2_000_000)
+    parser.add_argument(
+        "--num-columns",
+        type=int,
+        default=200,
+        help="Number of numeric (and of categorical) columns of the wide table.",
+    )
+    parser.add_argument("--num-categories", type=int, default=20)
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace):
+    benchmark = Benchmark()
+
+    numeric_columns = [f"num_{i}" for i in range(args.num_columns)]
+    categorical_columns = [f"cat_{i}" for i in range(args.num_columns)]
+    categories = np.array([f"category_{i}" for i in range(args.num_categories)])
+
+    def generate_batch(batch):
+        rng = np.random.default_rng(seed=int(batch["id"][0]))
+        num_rows = len(batch["id"])
+        for column in numeric_columns:
+            values = rng.normal(size=num_rows)
+            # Make 1% of the values missing, to be imputed.
+            values[rng.random(num_rows) < 0.01] = np.nan
+            batch[column] = values
+        for column in categorical_columns:
+            batch[column] = categories[rng.integers(len(categories), size=num_rows)]
+        return batch
+
+    ds = ray.data.range(args.num_rows).map_batches(generate_batch).materialize()
+
+    for name, preprocessor in [
+        ("simple_imputer", SimpleImputer(numeric_columns)),
+        ("standard_scaler", StandardScaler(numeric_columns)),
+        ("min_max_scaler", MinMaxScaler(numeric_columns)),
+        ("ordinal_encoder", OrdinalEncoder(categorical_columns)),
+        ("one_hot_encoder", OneHotEncoder(categorical_columns[:10])),
+    ]:
+        preprocessor.fit(ds)
+
+        benchmark.run_materialize_ds(
+            f"{name}_pandas",
+            lambda: ds.map_batches(
+                preprocessor._transform_pandas, batch_format="pandas"
+            ),
+        )
+        benchmark.run_materialize_ds(
+            f"{name}_arrow",
+            lambda: ds.map_batches(
+                preprocessor._transform_arrow, batch_format="pyarrow"
+            ),
+        )
+
+    benchmark.write_result()
+
+
+if __name__ == "__main__":
+    main(parse_args())
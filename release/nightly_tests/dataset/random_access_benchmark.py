@@ -0,0 +1,126 @@
+import argparse
+import time
+
+import numpy as np
+
+import ray
+from benchmark import Benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Random access benchmark")
+    parser.add_argument("--num-rows", type=int, default=10_000_000)
+    parser.add_argument("--num-blocks", type=int, default=200)
+    parser.add_argument("--num-workers", type=int, default=None)
+    parser.add_argument(
+        "--num-lookups",
+        type=int,
+        default=100_000,
+        help="Number of keys to look up in every case.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Number of keys looked up by each 'multiget' call.",
+    )
+    parser.add_argument(
+        "--zipf-exponent",
+        type=float,
+        default=1.2,
+        help=(
+            "Exponent of the Zipf distribution keys are drawn from (simulating "
+            "hot keys of online lookups)."
+        ),
+    )
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace):
+    benchmark = Benchmark()
+
+    ds = ray.data.range(args.num_rows, override_num_blocks=args.num_blocks)
+    ds = ds.add_column("value", lambda batch: batch["id"] * 2).materialize()
+
+    rng = np.random.default_rng(seed=0)
+
+    def sample_keys(num_keys):
+        # Every run looks up freshly drawn keys, so that later runs don't only hit
+        # the keys cached by the earlier ones.
+        keys = (rng.zipf(args.zipf_exponent, size=num_keys) - 1) % args.num_rows
+        return keys.tolist()
+
+    for case, rad_kwargs in [
+        ("default", {}),
+        ("hash_index", {"hash_index": True}),
+        ("hash_index_cached", {"hash_index": True, "cache_size": 100_000}),
+    ]:
+        rad = ds.to_random_access_dataset(
+            "id", num_workers=args.num_workers, **rad_kwargs
+        )
+
+        benchmark.run_fn(
+            f"get_async_{case}", benchmark_get_async, rad, sample_keys(10_000)
+        )
+        benchmark.run_fn(
+            f"multiget_{case}",
+            benchmark_multiget,
+            rad,
+            sample_keys(args.num_lookups),
+            args.batch_size,
+        )
+
+        # Replicate the hot blocks, and look up (other) keys again.
+        rad.replicate_hot_blocks(num_blocks=max(1, args.num_blocks // 10))
+        benchmark.run_fn(
+            f"multiget_{case}_replicated",
+            benchmark_multiget,
+            rad,
+            sample_keys(args.num_lookups),
+            args.batch_size,
+        )
+
+    benchmark.write_result()
+
+
+def benchmark_get_async(rad, keys):
+    latencies = []
+    for key in keys:
+        start = time.perf_counter()
+        ray.get(rad.get_async(key))
+        latencies.append(time.perf_counter() - start)
+
+    return _summarize(latencies, num_lookups=len(keys))
+
+
+def benchmark_multiget(rad, keys, batch_size):
+    cache = rad._cache
+    if cache is not None:
+        num_hits, num_misses = cache.num_hits, cache.num_misses
+
+    latencies = []
+    for i in range(0, len(keys), batch_size):
+        start = time.perf_counter()
+        rad.multiget(keys[i : i + batch_size])
+        latencies.append(time.perf_counter() - start)
+
+    result = _summarize(latencies, num_lookups=len(keys))
+    if cache is not None:
+        # Report the hit rate of the cache in this run, since cache hits (of hot
+        # keys) dominate the throughput of the cached cases.
+        num_hits = cache.num_hits - num_hits
+        num_misses = cache.num_misses - num_misses
+        result["cache_hit_rate"] = num_hits / max(1, num_hits + num_misses)
+    return result
+
+
+def _summarize(latencies, num_lookups):
+    return {
+        "lookups_per_second": num_lookups / sum(latencies),
+        "p50_latency_ms": np.percentile(latencies, 50) * 1000,
+        "p99_latency_ms": np.percentile(latencies, 99) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -900,6 +900,11 @@ RAY_CONFIG(bool, raylet_core_dump_exclude_plasma_store, true)
 // Example: RAY_preload_python_modules=tensorflow,pytorch
 RAY_CONFIG(std::vector<std::string>, preload_python_modules, {})
 
+// If enabled, Python default workers are forked from a zygote process of the
+// node (per runtime env), which has ray and the preload_python_modules imported
+// already. Workers are started cold while the zygote isn't running.
+RAY_CONFIG(bool, worker_zygote_enabled, false)
+
 // By default, raylet send a self liveness check to GCS every 60s
 RAY_CONFIG(int64_t, raylet_liveness_self_check_interval_ms, 60000)
 
@@ -361,7 +361,23 @@ void ObjectManager::Push(const ObjectID &object_id, const NodeID &node_id) {
   // Push from spilled object directly if the object is on local disk.
   auto object_url = get_spilled_object_url_(object_id);
   if (!object_url.empty() && RayConfig::instance().is_external_storage_type_fs()) {
-    return PushFromFilesystem(object_id, node_id, object_url);
+    if (!SpilledObjectReader::IsCompressedObjectURL(object_url)) {
+      return PushFromFilesystem(object_id, node_id, object_url);
+    }
+    // Compressed objects can't be read from the disk directly, hence these are
+    // restored into the local object store first. The push request is then fulfilled
+    // once the object is added (see HandleObjectAdded).
+    RAY_LOG(DEBUG).WithField(object_id)
+        << "Restoring compressed spilled object before pushing it to " << node_id;
+    restore_spilled_object_(object_id,
+                            /*object_size=*/0,
+                            object_url,
+                            [object_id](const ray::Status &status) {
+                              if (!status.ok()) {
+                                RAY_LOG(ERROR) << "Object restore for " << object_id
+                                               << " failed: " << status;
+                              }
+                            });
   }
 
   // Avoid setting duplicated timer for the same object and node pair.
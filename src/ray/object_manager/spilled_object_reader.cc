@@ -89,6 +89,11 @@ SpilledObjectReader::SpilledObjectReader(std::string file_path,
       metadata_size_(metadata_size),
       owner_address_(std::move(owner_address)) {}
 
+/* static */ bool SpilledObjectReader::IsCompressedObjectURL(
+    const std::string &object_url) {
+  return object_url.find("&compression=") != std::string::npos;
+}
+
 /* static */ bool SpilledObjectReader::ParseObjectURL(const std::string &object_url,
                                                       std::string &file_path,
                                                       uint64_t &object_offset,
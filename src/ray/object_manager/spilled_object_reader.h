@@ -33,6 +33,13 @@ class SpilledObjectReader : public IObjectReader {
   static std::optional<SpilledObjectReader> CreateSpilledObjectReader(
       const std::string &object_url);
 
+  /// Whether the object in the object_url is compressed (with the url in the form of
+  /// {path}?offset={offset}&size={size}&compression={codec}). Compressed objects can't
+  /// be read by this class, and have to be restored by the IO workers instead.
+  ///
+  /// \param object_url the object url.
+  static bool IsCompressedObjectURL(const std::string &object_url);
+
   uint64_t GetDataSize() const override;
 
   uint64_t GetMetadataSize() const override;
@@ -28,6 +28,13 @@
 
 namespace ray {
 
+TEST(SpilledObjectReaderTest, IsCompressedObjectURL) {
+  ASSERT_FALSE(SpilledObjectReader::IsCompressedObjectURL(
+      "file://path/to/file?offset=123&size=456"));
+  ASSERT_TRUE(SpilledObjectReader::IsCompressedObjectURL(
+      "file://path/to/file?offset=123&size=456&compression=zstd"));
+}
+
 TEST(SpilledObjectReaderTest, ParseObjectURL) {
   auto assert_parse_success = [](const std::string &object_url,
                                  const std::string &expected_file_path,
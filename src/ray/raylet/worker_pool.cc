@@ -437,6 +437,11 @@ WorkerPool::BuildProcessCommandArgs(const Language &language,
                                   serialized_preload_python_modules);
   }
 
+  if (language == Language::PYTHON && worker_type == rpc::WorkerType::WORKER &&
+      RayConfig::instance().worker_zygote_enabled()) {
+    worker_command_args.push_back("--worker-zygote");
+  }
+
   // Pass resource isolation flag to python worker.
   if (language == Language::PYTHON && worker_type == rpc::WorkerType::WORKER) {
     worker_command_args.emplace_back(absl::StrFormat(